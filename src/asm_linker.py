@@ -0,0 +1,319 @@
+# asm_linker.py
+from __future__ import annotations
+
+import os
+import struct
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from prg_builder import LOAD_ADDR, _le16, build_basic_sys_stub
+
+# ---------- Objektdatei ----------
+#
+# Ein Modul besteht aus Segmenten. Absolute Segmente (.ORG / .SEGMENT name,$addr)
+# haben eine feste Adresse, relozierbare Segmente (.SEGMENT name) bekommen ihre
+# Adresse erst beim Linken. Relocation = Stelle im Segment, die beim Linken mit
+#   Ziel + Addend  (Ziel: ("seg", segmentname) | ("ext", importiertes Symbol))
+# überschrieben wird: "w" = 16 Bit (lo/hi), "lo"/"hi" = ein Byte.
+
+RELOC_KINDS = ("w", "lo", "hi")
+OBJ_MAGIC   = b"C6O\x01"
+
+@dataclass
+class Relocation:
+    offset: int; kind: str; target: Tuple[str, str]; addend: int = 0
+
+@dataclass
+class ObjSegment:
+    name: str
+    org: Optional[int] = None          # None = relozierbar
+    data: bytearray = field(default_factory=bytearray)
+    relocs: List[Relocation] = field(default_factory=list)
+
+    @property
+    def relocatable(self) -> bool:
+        return self.org is None
+
+@dataclass
+class ObjectFile:
+    segments: List[ObjSegment] = field(default_factory=list)
+    exports: Dict[str, Tuple[Optional[str], int]] = field(default_factory=dict)  # name -> (segment|None, wert)
+    imports: List[str] = field(default_factory=list)
+    name: str = ""
+
+    def segment(self, name: str) -> ObjSegment:
+        for seg in self.segments:
+            if seg.name == name: return seg
+        raise KeyError(name)
+
+    # --- Binärformat ---
+    # Magic, Stringtabelle, Segmente (Daten + Relocations), Exporte, Importe.
+    # Alle Zahlen little endian; Addend/Exportwert als int32 (Differenzen erlaubt).
+    def to_bytes(self) -> bytes:
+        strings: List[str] = []; index: Dict[str, int] = {}
+        def sid(s: str) -> int:
+            i = index.get(s)
+            if i is None:
+                i = index[s] = len(strings); strings.append(s)
+            return i
+        body = bytearray()
+        body += struct.pack("<H", len(self.segments))
+        seg_index = {}
+        for n, seg in enumerate(self.segments):
+            seg_index[seg.name] = n
+            body += struct.pack("<HBHH", sid(seg.name), 0 if seg.org is None else 1,
+                                seg.org or 0, len(seg.data))
+            body += seg.data
+            body += struct.pack("<H", len(seg.relocs))
+            for r in seg.relocs:
+                kind = RELOC_KINDS.index(r.kind) | (0x10 if r.target[0] == "ext" else 0)
+                body += struct.pack("<HBHi", r.offset, kind, sid(r.target[1]), r.addend)
+        body += struct.pack("<H", len(self.exports))
+        for name, (seg, value) in self.exports.items():
+            body += struct.pack("<HHi", sid(name), 0xFFFF if seg is None else seg_index[seg], value)
+        body += struct.pack("<H", len(self.imports))
+        for name in self.imports:
+            body += struct.pack("<H", sid(name))
+        head = bytearray(OBJ_MAGIC)
+        head += struct.pack("<H", len(strings))
+        for s in strings:
+            raw = s.encode("utf-8"); head += bytes([len(raw)]) + raw
+        return bytes(head + body)
+
+    @classmethod
+    def from_bytes(cls, blob: bytes, name: str = "") -> "ObjectFile":
+        if blob[:4] != OBJ_MAGIC: raise ValueError("Keine Objektdatei (Magic)")
+        pos = 4
+        def take(fmt: str):
+            nonlocal pos
+            vals = struct.unpack_from(fmt, blob, pos); pos += struct.calcsize(fmt)
+            return vals
+        (nstr,) = take("<H"); strings = []
+        for _ in range(nstr):
+            n = blob[pos]; strings.append(blob[pos+1:pos+1+n].decode("utf-8")); pos += 1 + n
+        obj = cls(name=name)
+        (nseg,) = take("<H")
+        for _ in range(nseg):
+            sname, flags, org, size = take("<HBHH")
+            seg = ObjSegment(strings[sname], org if flags & 1 else None, bytearray(blob[pos:pos+size]))
+            pos += size
+            (nrel,) = take("<H")
+            for _ in range(nrel):
+                off, kind, target, addend = take("<HBHi")
+                seg.relocs.append(Relocation(off, RELOC_KINDS[kind & 0x0F],
+                                             ("ext" if kind & 0x10 else "seg", strings[target]), addend))
+            obj.segments.append(seg)
+        (nexp,) = take("<H")
+        for _ in range(nexp):
+            sname, seg, value = take("<HHi")
+            obj.exports[strings[sname]] = (None if seg == 0xFFFF else obj.segments[seg].name, value)
+        (nimp,) = take("<H")
+        for _ in range(nimp):
+            obj.imports.append(strings[take("<H")[0]])
+        return obj
+
+    def save(self, path: str):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "ObjectFile":
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read(), name=os.path.basename(path))
+
+def load_or_assemble(src_path: str, spec, obj_path: Optional[str] = None) -> ObjectFile:
+    """Objektdatei aus dem Cache, neu assembliert nur wenn die Quelle neuer ist."""
+    from mini_assembler import ObjectAssembler
+    obj_path = obj_path or os.path.splitext(src_path)[0] + ".o"
+    try:
+        if os.path.getmtime(obj_path) >= os.path.getmtime(src_path):
+            return ObjectFile.load(obj_path)
+    except (OSError, ValueError, struct.error):
+        pass
+    with open(src_path, "r", encoding="utf-8") as f:
+        obj = ObjectAssembler(spec).assemble_object(f.read())
+    obj.name = os.path.basename(src_path)
+    obj.save(obj_path)
+    return obj
+
+# ---------- Linker ----------
+
+@dataclass
+class LinkedImage:
+    chunks: List[Tuple[int, bytes]]          # (adresse, bytes), nach Adresse sortiert
+    symbols: Dict[str, int]
+    entry: Optional[int] = None
+    segments: Dict[str, int] = field(default_factory=dict)   # relozierbares Segment -> Adresse
+
+    @property
+    def start(self) -> int:
+        return self.chunks[0][0] if self.chunks else 0
+
+    @property
+    def end(self) -> int:
+        return max((a + len(d) for a, d in self.chunks), default=0)
+
+    def to_raw(self, fill: int = 0x00) -> bytes:
+        """Speicherabbild von der niedrigsten bis zur höchsten Adresse, Lücken gefüllt."""
+        start = self.start
+        out = bytearray([fill & 0xFF]) * (self.end - start)
+        for addr, data in self.chunks:
+            out[addr - start:addr - start + len(data)] = data
+        return bytes(out)
+
+    def to_prg(self, fill: int = 0x00) -> bytes:
+        return _le16(self.start) + self.to_raw(fill)
+
+def chunks_from_rows(rows) -> List[Tuple[int, bytes]]:
+    """MiniAssembler.rows -> zusammenhängende Speicherbereiche (adresse, bytes)."""
+    parts: List[Tuple[int, bytearray]] = []
+    ends: Dict[int, int] = {}            # Endadresse -> Index in parts
+    for addr_str, bytes_list, _text, _src in rows:
+        addr = int(addr_str, 16)
+        i = ends.pop(addr, None)
+        if i is None:
+            i = len(parts); parts.append((addr, bytearray()))
+        start, data = parts[i]
+        data.extend(bytes_list)
+        ends[start + len(data)] = i
+    return sorted((a, bytes(d)) for a, d in parts)
+
+def _merge_adjacent(chunks: List[Tuple[int, bytes]]) -> List[Tuple[int, bytes]]:
+    out: List[Tuple[int, bytes]] = []
+    for addr, data in chunks:
+        if out and out[-1][0] + len(out[-1][1]) == addr:
+            out[-1] = (out[-1][0], out[-1][1] + data)
+        else:
+            out.append((addr, data))
+    return out
+
+def _check_overlap(chunks: List[Tuple[int, bytes]]):
+    for (a, da), (b, _db) in zip(chunks, chunks[1:]):
+        if a + len(da) > b:
+            raise ValueError(f"Segmente überlappen: ${a:04X}-${a + len(da) - 1:04X} und ${b:04X}")
+
+def link_chunks(chunks: List[Tuple[int, bytes]]) -> LinkedImage:
+    """Absolute Bereiche (z. B. aus chunks_from_rows) zu einem Abbild."""
+    chunks = sorted(chunks)
+    _check_overlap(chunks)
+    return LinkedImage(_merge_adjacent(chunks), {})
+
+def link(objects: List[ObjectFile], base: int = 0x1000, layout: Optional[Dict[str, int]] = None,
+         entry: Optional[str] = None) -> LinkedImage:
+    """
+    Legt die Segmente aller Module an und löst Relocations auf.
+      - absolute Segmente bleiben an ihrer Adresse,
+      - gleichnamige relozierbare Segmente werden in Modulreihenfolge
+        aneinandergehängt; layout[name] legt die Startadresse fest, sonst folgt
+        das Segment direkt auf das vorherige (Beginn bei base),
+      - entry: exportiertes Symbol für den Einsprung (sonst Beginn des ersten
+        relozierbaren Segments bzw. niedrigste Adresse).
+    """
+    layout = layout or {}
+    groups: Dict[str, List[Tuple[int, ObjSegment]]] = {}
+    for m, obj in enumerate(objects):
+        for seg in obj.segments:
+            if seg.relocatable: groups.setdefault(seg.name, []).append((m, seg))
+
+    # Adressen: (modul, segment) -> Basis
+    bases: Dict[Tuple[int, str], int] = {}
+    seg_addr: Dict[str, int] = {}
+    cursor = base
+    for name, pieces in groups.items():
+        addr = seg_addr[name] = layout.get(name, cursor)
+        for m, seg in pieces:
+            bases[(m, name)] = addr; addr += len(seg.data)
+        cursor = addr
+    for m, obj in enumerate(objects):
+        for seg in obj.segments:
+            if not seg.relocatable: bases[(m, seg.name)] = seg.org
+
+    # globale Symbole
+    symbols: Dict[str, int] = {}
+    for m, obj in enumerate(objects):
+        for name, (seg, value) in obj.exports.items():
+            if name in symbols:
+                raise ValueError(f"Symbol doppelt exportiert: {name} ({obj.name or m})")
+            symbols[name] = (value if seg is None else bases[(m, seg)] + value) & 0xFFFF
+
+    # Relocations anwenden
+    chunks: List[Tuple[int, bytes]] = []
+    for m, obj in enumerate(objects):
+        for seg in obj.segments:
+            data = bytearray(seg.data)
+            for r in seg.relocs:
+                kind, name = r.target
+                if kind == "seg": target = bases[(m, name)]
+                else:
+                    target = symbols.get(name)
+                    if target is None:
+                        raise ValueError(f"Unaufgelöstes Symbol: {name} ({obj.name or m})")
+                v = (target + r.addend) & 0xFFFF
+                if r.kind == "w": data[r.offset] = v & 0xFF; data[r.offset+1] = v >> 8
+                elif r.kind == "lo": data[r.offset] = v & 0xFF
+                else: data[r.offset] = v >> 8
+            if data: chunks.append((bases[(m, seg.name)], bytes(data)))
+    chunks.sort()
+    _check_overlap(chunks)
+    chunks = _merge_adjacent(chunks)
+
+    if entry is not None:
+        if entry not in symbols: raise ValueError(f"Einsprung nicht exportiert: {entry}")
+        start = symbols[entry]
+    elif groups:
+        start = seg_addr[next(iter(groups))]
+    else:
+        start = chunks[0][0] if chunks else None
+    return LinkedImage(chunks, symbols, start, seg_addr)
+
+def link_prg_with_basic_autostart(objects: List[ObjectFile], layout: Optional[Dict[str, int]] = None,
+                                  entry: Optional[str] = None) -> Tuple[bytes, LinkedImage]:
+    """
+    BASIC-Zeile "10 SYS <einsprung>" ab $0801, relozierbare Segmente direkt dahinter.
+    Die Länge der SYS-Zeile hängt an der Einsprungadresse -> bis zum Fixpunkt linken.
+    """
+    base = LOAD_ADDR + len(build_basic_sys_stub(0))
+    for _ in range(8):
+        image = link(objects, base=base, layout=layout, entry=entry)
+        stub = build_basic_sys_stub(image.entry if image.entry is not None else base)
+        if LOAD_ADDR + len(stub) == base: break
+        base = LOAD_ADDR + len(stub)
+    chunks = sorted(image.chunks + [(LOAD_ADDR, stub)])
+    _check_overlap(chunks)
+    image.chunks = _merge_adjacent(chunks)
+    return image.to_prg(), image
+
+def main(argv=None):
+    import argparse
+    from c6510_spec import C6510Spec
+    from c6510_cpu import SPEC_JSON
+
+    ap = argparse.ArgumentParser(description="Module (.asm/.o) zu PRG oder Rohabbild linken")
+    ap.add_argument("inputs", nargs="+", help=".asm (wird als Objekt gecacht) oder .o")
+    ap.add_argument("-o", "--output", required=True)
+    ap.add_argument("--raw", action="store_true", help="Rohabbild ohne Ladeadresse")
+    ap.add_argument("--autostart", action="store_true", help="BASIC-SYS-Zeile ab $0801")
+    ap.add_argument("--base", type=lambda s: int(s.replace("$", "0x"), 0), default=0x1000)
+    ap.add_argument("--segment", action="append", default=[], metavar="NAME=ADDR")
+    ap.add_argument("--entry")
+    args = ap.parse_args(argv)
+
+    spec = C6510Spec.from_json(SPEC_JSON)
+    objects = [ObjectFile.load(p) if p.endswith(".o") else load_or_assemble(p, spec) for p in args.inputs]
+    layout = {}
+    for item in args.segment:
+        name, addr = item.split("=", 1)
+        layout[name] = int(addr.replace("$", "0x"), 0)
+
+    if args.autostart:
+        out, image = link_prg_with_basic_autostart(objects, layout, args.entry)
+    else:
+        image = link(objects, base=args.base, layout=layout, entry=args.entry)
+        out = image.to_raw() if args.raw else image.to_prg()
+    with open(args.output, "wb") as f:
+        f.write(out)
+    print(f"{args.output}: ${image.start:04X}-${image.end - 1:04X}, {len(out)} Bytes, "
+          f"Einsprung ${image.entry or 0:04X}")
+
+if __name__ == "__main__":
+    main()
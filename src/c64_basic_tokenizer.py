@@ -0,0 +1,140 @@
+# c64_basic_tokenizer.py
+from __future__ import annotations
+
+import re
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+
+# ---------- Tokentabelle CBM BASIC V2 ----------
+#
+# Schlüsselwort -> Token-Byte, wie sie im C64-ROM stehen. Einmal gebaut und
+# von allen Parsern geteilt (MappingProxyType: nur lesend).
+
+C64_BASIC_TOKENS = MappingProxyType({
+    "END": 0x80, "FOR": 0x81, "NEXT": 0x82, "DATA": 0x83, "INPUT#": 0x84, "INPUT": 0x85,
+    "DIM": 0x86, "READ": 0x87, "LET": 0x88, "GOTO": 0x89, "RUN": 0x8A, "IF": 0x8B,
+    "RESTORE": 0x8C, "GOSUB": 0x8D, "RETURN": 0x8E, "REM": 0x8F, "STOP": 0x90, "ON": 0x91,
+    "WAIT": 0x92, "LOAD": 0x93, "SAVE": 0x94, "VERIFY": 0x95, "DEF": 0x96, "POKE": 0x97,
+    "PRINT#": 0x98, "PRINT": 0x99, "CONT": 0x9A, "LIST": 0x9B, "CLR": 0x9C, "CMD": 0x9D,
+    "SYS": 0x9E, "OPEN": 0x9F, "CLOSE": 0xA0, "GET": 0xA1, "NEW": 0xA2, "TAB(": 0xA3,
+    "TO": 0xA4, "FN": 0xA5, "SPC(": 0xA6, "THEN": 0xA7, "NOT": 0xA8, "STEP": 0xA9,
+    "+": 0xAA, "-": 0xAB, "*": 0xAC, "/": 0xAD, "^": 0xAE, "AND": 0xAF, "OR": 0xB0,
+    ">": 0xB1, "=": 0xB2, "<": 0xB3, "SGN": 0xB4, "INT": 0xB5, "ABS": 0xB6, "USR": 0xB7,
+    "FRE": 0xB8, "POS": 0xB9, "SQR": 0xBA, "RND": 0xBB, "LOG": 0xBC, "EXP": 0xBD,
+    "COS": 0xBE, "SIN": 0xBF, "TAN": 0xC0, "ATN": 0xC1, "PEEK": 0xC2, "LEN": 0xC3,
+    "STR$": 0xC4, "VAL": 0xC5, "ASC": 0xC6, "CHR$": 0xC7, "LEFT$": 0xC8, "RIGHT$": 0xC9,
+    "MID$": 0xCA, "GO": 0xCB,
+    "?": 0x99,                                  # Abkürzung für PRINT
+})
+BASIC_TOKEN_REM, BASIC_TOKEN_DATA = 0x8F, 0x83
+
+# Trie über die Schlüsselwörter: Zeichen -> Knoten, "" -> (Länge, Token)
+def _build_basic_trie(tokens) -> Dict[str, dict]:
+    root: Dict[str, dict] = {}
+    for word, tok in tokens.items():
+        node = root
+        for ch in word: node = node.setdefault(ch, {})
+        node[""] = (len(word), tok)
+    return root
+
+BASIC_KEYWORD_TRIE = _build_basic_trie(C64_BASIC_TOKENS)
+
+def match_basic_keyword(text: str, pos: int) -> Optional[Tuple[int, int]]:
+    """Längstes Schlüsselwort ab pos (text in Großbuchstaben) -> (Länge, Token) oder None."""
+    node = BASIC_KEYWORD_TRIE; hit = None; n = len(text)
+    while pos < n:
+        node = node.get(text[pos])
+        if node is None: break
+        hit = node.get("", hit); pos += 1
+    return hit
+
+# ---------- Tokenizer für C64BasicParser ----------
+#
+# Eine Master-Regex mit benannten Gruppen; die Reihenfolge der Alternativen ist
+# die Priorität (wie vorher: erstes passendes Muster gewinnt). Jede Zeile wird
+# einmal von links nach rechts gelesen, ohne den Rest neu zu schneiden.
+
+BASIC_TOKEN_PATTERNS = MappingProxyType({
+    "NUMBER":       r"\d+",
+    "COMMAND":      r"[a-zA-Z]+",
+    "STRING":       r'\"[^"]*\"',
+    "VARIABLE":     r"[a-zA-Z][0-9a-zA-Z]*",
+    "SYMBOL":       r"[=,+\-*/()]",
+})
+BASIC_TOKEN_REGEX = re.compile(r"\s*(?:" + "|".join(f"(?P<{name}>{pat})" for name, pat in BASIC_TOKEN_PATTERNS.items()) + ")")
+BASIC_LINE_NUMBER_REGEX = re.compile(r"\d+")
+
+def basic_tokenize(code: str) -> List[Tuple[str, str]]:
+    """Eine Zeile (ohne Zeilennummer) -> [(Art, Text), ...]."""
+    tokens = []; pos = 0; match = BASIC_TOKEN_REGEX.match
+    while True:
+        m = match(code, pos)
+        if m is None:
+            rest = code[pos:].lstrip()
+            if rest: raise SyntaxError(f"Unbekanntes Token: {rest}")
+            return tokens
+        kind = m.lastgroup
+        tokens.append((kind, m.group(kind))); pos = m.end()
+
+def basic_tokenize_program(code: str) -> List[dict]:
+    """
+    Ganzes Programm -> [{"line_number", "tokens", "text"}, ...]
+    text = Zeile ohne Zeilennummer (für basic_crunch()).
+    """
+    program = []
+    for line in code.splitlines():
+        line = line.strip()
+        if not line: continue
+        m = BASIC_LINE_NUMBER_REGEX.match(line)
+        if not m: raise SyntaxError(f"Fehlende Zeilennummer: {line}")
+        rest = line[m.end():].strip()
+        program.append({"line_number": int(m.group(0)), "tokens": basic_tokenize(rest), "text": rest})
+    return program
+
+# ---------- Crunch: Zeilentext -> Token-Bytes (wie CRUNCH im C64-ROM) ----------
+
+_BASIC_UPPER = {c: c - 32 for c in range(ord("a"), ord("z") + 1)}
+
+def basic_crunch(text: str) -> bytearray:
+    """
+    Schlüsselwörter außerhalb von Strings durch Token-Bytes ersetzen; nach DATA
+    bis ':' und nach REM bis Zeilenende bleibt der Text unverändert.
+    Kleinbuchstaben werden wie in ascii_to_petscii zu Großbuchstaben.
+    """
+    up = text.translate(_BASIC_UPPER); out = bytearray(); i = 0; n = len(up)
+    quote = data = rem = False
+    while i < n:
+        c = up[i]
+        if not (quote or data or rem):
+            hit = match_basic_keyword(up, i)
+            if hit:
+                size, tok = hit; out.append(tok); i += size
+                if tok == BASIC_TOKEN_REM: rem = True
+                elif tok == BASIC_TOKEN_DATA: data = True
+                continue
+        code = ord(c)
+        if not 0x20 <= code <= 0x5F:
+            raise ValueError(f"Zeichen '{text[i]}' kann nicht in PETSCII konvertiert werden.")
+        if c == '"': quote = not quote
+        elif c == ":" and data and not quote: data = False
+        out.append(code); i += 1
+    return out
+
+def basic_crunch_program(program: List[dict], load_addr: int = 0x0801) -> bytes:
+    """
+    Tokenisiertes Programm im C64-Speicherformat (ohne Ladeadresse):
+    je Zeile Link auf die nächste Zeile, Zeilennummer, Token-Bytes, $00; Ende $00 $00.
+    """
+    output = bytearray()
+    for line in program:
+        text = line.get("text")
+        if text is None: text = " ".join(tok for _kind, tok in line["tokens"])
+        body = basic_crunch(text)
+        link = load_addr + len(output) + 4 + len(body) + 1
+        if not 0 <= line["line_number"] <= 63999:
+            raise ValueError(f"Zeilennummer außerhalb 0..63999: {line['line_number']}")
+        if link > 0xFFFF: raise ValueError("Programm zu groß für den C64-Speicher")
+        output += link.to_bytes(2, "little") + line["line_number"].to_bytes(2, "little") + body
+        output.append(0x00)
+    output += b"\x00\x00"
+    return bytes(output)
@@ -0,0 +1,687 @@
+# c6510_cpu.py
+from __future__ import annotations
+from typing import Callable, Dict, List, Optional, Tuple
+
+import os
+
+from c6510_spec import C6510Spec, OpInfo
+
+SPEC_JSON = os.path.join(os.path.dirname(os.path.abspath(__file__)), "6510_with_illegal_flags.json")
+
+# Modes whose spec entry may carry a page_cross_penalty (extra read cycle)
+PENALTY_MODES = {"absx", "absy", "indy"}
+
+# Vectors
+NMI_VECTOR   = 0xFFFA
+RESET_VECTOR = 0xFFFC
+IRQ_VECTOR   = 0xFFFE
+
+# Constant the unstable XAA/ANE opcode ORs into A (chip dependent, $EE is common)
+XAA_MAGIC = 0xEE
+
+class CPUHalted(Exception):
+    """Raised when the CPU executes KIL/JAM or an opcode the spec does not define."""
+    def __init__(self, pc: int, opcode: int, reason: str):
+        super().__init__(f"{reason} at ${pc:04X} (opcode ${opcode:02X})")
+        self.pc = pc
+        self.opcode = opcode
+
+class CPU6510:
+    """
+    Table-driven 6510 execution engine.
+
+    Every opcode of C6510Spec.opcode_table is translated once into a handler
+    closure (addressing mode + operation); run() then only fetches the opcode,
+    adds the base cycles from the spec and calls dispatch[opcode]. Handlers add
+    page-cross and branch-taken cycles themselves.
+
+    Memory is a flat bytearray(65536) without banking or I/O; the processor
+    port at $00/$01 is plain RAM.
+
+    Flags: C, I, D, V are stored as 0/1. N and Z share one field "nz":
+    Z = (nz & 0xFF) == 0, N = nz & 0x180. Normal operations just store the
+    result byte; bit 8 allows N=1/Z=1 together (BIT, PLP).
+    """
+    __slots__ = ("spec", "mem", "a", "x", "y", "sp", "pc", "nz", "c", "i", "d", "v",
+                 "cycles", "instructions", "halted", "dispatch", "base_cycles")
+
+    def __init__(self, spec: Optional[C6510Spec] = None, memory: Optional[bytearray] = None):
+        self.spec = spec if spec is not None else C6510Spec.from_json(SPEC_JSON)
+        self.mem = memory if memory is not None else bytearray(0x10000)
+        if len(self.mem) != 0x10000:
+            raise ValueError("memory must be 65536 bytes")
+        self.cycles = 0
+        self.instructions = 0
+        self.reset_registers()
+        self.dispatch: List[Callable[[], None]] = []
+        self.base_cycles: List[int] = []
+        self._build_dispatch()
+
+    # ---------- Register state ----------
+    def reset_registers(self, pc: int = 0x0000) -> None:
+        self.a = self.x = self.y = 0
+        self.sp = 0xFD
+        self.pc = pc & 0xFFFF
+        self.nz = 1
+        self.c = self.d = self.v = 0
+        self.i = 1
+        self.halted = False
+
+    def reset(self) -> None:
+        """Power-on reset: registers cleared, PC from the reset vector."""
+        self.reset_registers(self.read_word(RESET_VECTOR))
+        self.cycles += 7
+
+    @property
+    def p(self) -> int:
+        nz = self.nz
+        return ((0x80 if nz & 0x180 else 0) | (0x40 if self.v else 0) | 0x20 |
+                (0x08 if self.d else 0) | (0x04 if self.i else 0) |
+                (0 if nz & 0xFF else 0x02) | (0x01 if self.c else 0))
+
+    @p.setter
+    def p(self, value: int) -> None:
+        self.c = value & 0x01
+        self.i = (value >> 2) & 1
+        self.d = (value >> 3) & 1
+        self.v = (value >> 6) & 1
+        n = value & 0x80
+        if value & 0x02:
+            self.nz = 0x100 if n else 0
+        else:
+            self.nz = 0x80 if n else 1
+
+    def flags(self) -> str:
+        """Status register as 'NV-BDIZC' string (set flags upper case)."""
+        p = self.p
+        return "".join(ch if p & (0x80 >> k) else ch.lower() for k, ch in enumerate("NV-BDIZC"))
+
+    def registers(self) -> Dict[str, int]:
+        return {"A": self.a, "X": self.x, "Y": self.y, "SP": self.sp, "PC": self.pc, "P": self.p}
+
+    # ---------- Memory helpers ----------
+    def read_word(self, addr: int) -> int:
+        mem = self.mem
+        return mem[addr & 0xFFFF] | (mem[(addr + 1) & 0xFFFF] << 8)
+
+    def write_word(self, addr: int, value: int) -> None:
+        self.mem[addr & 0xFFFF] = value & 0xFF
+        self.mem[(addr + 1) & 0xFFFF] = (value >> 8) & 0xFF
+
+    def load(self, addr: int, data: bytes) -> int:
+        """Copy data to addr; returns the first address after the block."""
+        end = addr + len(data)
+        if end > 0x10000:
+            raise ValueError(f"block ${addr:04X}+{len(data)} exceeds 64K")
+        self.mem[addr:end] = data
+        return end
+
+    def load_prg(self, prg: bytes) -> Tuple[int, int]:
+        """Load a .prg (2-byte load address header). Returns (start, end)."""
+        if len(prg) < 2:
+            raise ValueError("PRG too short")
+        start = prg[0] | (prg[1] << 8)
+        return start, self.load(start, prg[2:])
+
+    def push(self, value: int) -> None:
+        self.mem[0x100 | self.sp] = value & 0xFF
+        self.sp = (self.sp - 1) & 0xFF
+
+    def pull(self) -> int:
+        self.sp = (self.sp + 1) & 0xFF
+        return self.mem[0x100 | self.sp]
+
+    # ---------- Interrupts ----------
+    def _interrupt(self, vector: int) -> None:
+        self.push(self.pc >> 8); self.push(self.pc)
+        self.push(self.p & ~0x10)
+        self.i = 1
+        self.pc = self.read_word(vector)
+        self.cycles += 7
+
+    def irq(self) -> bool:
+        if self.i:
+            return False
+        self._interrupt(IRQ_VECTOR)
+        return True
+
+    def nmi(self) -> None:
+        self._interrupt(NMI_VECTOR)
+
+    # ---------- Execution ----------
+    def step(self) -> int:
+        """Execute one instruction; returns the cycles it took."""
+        before = self.cycles
+        op = self.mem[self.pc]
+        self.pc = (self.pc + 1) & 0xFFFF
+        self.cycles += self.base_cycles[op]
+        self.dispatch[op]()
+        self.instructions += 1
+        return self.cycles - before
+
+    def run(self, cycles: int) -> int:
+        """
+        Execute until at least `cycles` cycles have elapsed (the last instruction
+        is completed). Returns the number of cycles actually executed.
+        Raises CPUHalted on KIL/JAM or undefined opcodes.
+        """
+        mem = self.mem; dispatch = self.dispatch; base = self.base_cycles
+        start = self.cycles
+        stop = start + cycles
+        n = 0
+        try:
+            while self.cycles < stop:
+                pc = self.pc
+                op = mem[pc]
+                self.pc = (pc + 1) & 0xFFFF
+                self.cycles += base[op]
+                dispatch[op]()
+                n += 1
+        finally:
+            self.instructions += n
+        return self.cycles - start
+
+    def run_until(self, stop_pc: int, max_cycles: int = 10_000_000) -> bool:
+        """Execute until PC == stop_pc (checked before each instruction). False on timeout."""
+        mem = self.mem; dispatch = self.dispatch; base = self.base_cycles
+        stop = self.cycles + max_cycles
+        n = 0
+        try:
+            while self.pc != stop_pc:
+                if self.cycles >= stop:
+                    return False
+                pc = self.pc
+                op = mem[pc]
+                self.pc = (pc + 1) & 0xFFFF
+                self.cycles += base[op]
+                dispatch[op]()
+                n += 1
+        finally:
+            self.instructions += n
+        return True
+
+    def call(self, addr: int, max_cycles: int = 10_000_000, a: int = 0, x: int = 0, y: int = 0) -> bool:
+        """
+        JSR-like call of a subroutine: pushes a return address to a sentinel
+        ($FFFF is never executed) and runs until the final RTS returns there.
+        """
+        sentinel = 0xFFFF
+        self.a, self.x, self.y = a & 0xFF, x & 0xFF, y & 0xFF
+        ret = (sentinel - 1) & 0xFFFF
+        self.push(ret >> 8); self.push(ret)
+        self.pc = addr & 0xFFFF
+        return self.run_until(sentinel, max_cycles)
+
+    # ---------- Dispatch table ----------
+    def _build_dispatch(self) -> None:
+        modes = self._address_modes()
+        ops = self._operations()
+        dispatch: List[Callable[[], None]] = []
+        base: List[int] = []
+        for opcode, info in enumerate(self.spec.opcode_table):
+            if info is None:
+                dispatch.append(self._undefined(opcode))
+                base.append(0)
+                continue
+            dispatch.append(self._make_handler(opcode, info, modes, ops))
+            base.append(info.cycles)
+        self.dispatch = dispatch
+        self.base_cycles = base
+
+    def _make_handler(self, opcode: int, info: OpInfo, modes, ops) -> Callable[[], None]:
+        mnem, mode = info.mnem, info.mode
+        if mode == "imm2":
+            mode = "imm"
+        if mnem == "KIL":
+            return self._undefined(opcode, "CPU jammed (KIL)")
+        if mode == "rel":
+            return ops["branch"][mnem](info.page_cross_penalty)
+        if mode == "acc":
+            return ops["acc"][mnem]
+        if mode == "imp":
+            return ops["imp"][mnem]
+        if mnem == "JMP":
+            return ops["jmp"][mode]
+        if mnem == "JSR":
+            return ops["jsr"]
+        key = mode + "_p" if info.page_cross_penalty and mode in PENALTY_MODES else mode
+        factory = ops["mem"].get(mnem)
+        if factory is None:
+            raise KeyError(f"no handler for {mnem} {mode} (opcode 0x{opcode:02X})")
+        return factory(modes[key], mode)
+
+    def _undefined(self, opcode: int, reason: str = "undefined opcode") -> Callable[[], None]:
+        cpu = self
+        def h():
+            cpu.pc = (cpu.pc - 1) & 0xFFFF
+            cpu.halted = True
+            raise CPUHalted(cpu.pc, opcode, reason)
+        return h
+
+    def _address_modes(self) -> Dict[str, Callable[[], int]]:
+        """Effective-address closures; each consumes its operand bytes at PC."""
+        cpu = self; mem = self.mem
+
+        def imm():
+            pc = cpu.pc; cpu.pc = (pc + 1) & 0xFFFF
+            return pc
+        def zp():
+            pc = cpu.pc; cpu.pc = (pc + 1) & 0xFFFF
+            return mem[pc]
+        def zpx():
+            pc = cpu.pc; cpu.pc = (pc + 1) & 0xFFFF
+            return (mem[pc] + cpu.x) & 0xFF
+        def zpy():
+            pc = cpu.pc; cpu.pc = (pc + 1) & 0xFFFF
+            return (mem[pc] + cpu.y) & 0xFF
+        def abs_():
+            pc = cpu.pc; cpu.pc = (pc + 2) & 0xFFFF
+            return mem[pc] | (mem[(pc + 1) & 0xFFFF] << 8)
+        def absx():
+            pc = cpu.pc; cpu.pc = (pc + 2) & 0xFFFF
+            return ((mem[pc] | (mem[(pc + 1) & 0xFFFF] << 8)) + cpu.x) & 0xFFFF
+        def absy():
+            pc = cpu.pc; cpu.pc = (pc + 2) & 0xFFFF
+            return ((mem[pc] | (mem[(pc + 1) & 0xFFFF] << 8)) + cpu.y) & 0xFFFF
+        def absx_p():
+            pc = cpu.pc; cpu.pc = (pc + 2) & 0xFFFF
+            base = mem[pc] | (mem[(pc + 1) & 0xFFFF] << 8)
+            ea = base + cpu.x
+            if (ea ^ base) & 0xFF00:
+                cpu.cycles += 1
+            return ea & 0xFFFF
+        def absy_p():
+            pc = cpu.pc; cpu.pc = (pc + 2) & 0xFFFF
+            base = mem[pc] | (mem[(pc + 1) & 0xFFFF] << 8)
+            ea = base + cpu.y
+            if (ea ^ base) & 0xFF00:
+                cpu.cycles += 1
+            return ea & 0xFFFF
+        def indx():
+            pc = cpu.pc; cpu.pc = (pc + 1) & 0xFFFF
+            ptr = (mem[pc] + cpu.x) & 0xFF
+            return mem[ptr] | (mem[(ptr + 1) & 0xFF] << 8)
+        def indy():
+            pc = cpu.pc; cpu.pc = (pc + 1) & 0xFFFF
+            ptr = mem[pc]
+            return ((mem[ptr] | (mem[(ptr + 1) & 0xFF] << 8)) + cpu.y) & 0xFFFF
+        def indy_p():
+            pc = cpu.pc; cpu.pc = (pc + 1) & 0xFFFF
+            ptr = mem[pc]
+            base = mem[ptr] | (mem[(ptr + 1) & 0xFF] << 8)
+            ea = base + cpu.y
+            if (ea ^ base) & 0xFF00:
+                cpu.cycles += 1
+            return ea & 0xFFFF
+
+        return {"imm": imm, "zp": zp, "zpx": zpx, "zpy": zpy, "abs": abs_,
+                "absx": absx, "absy": absy, "absx_p": absx_p, "absy_p": absy_p,
+                "indx": indx, "indy": indy, "indy_p": indy_p}
+
+    def _operations(self):
+        cpu = self; mem = self.mem
+
+        # ----- ALU helpers (shared by official and illegal opcodes) -----
+        def adc(v):
+            a = cpu.a; c = cpu.c
+            if cpu.d:
+                lo = (a & 0x0F) + (v & 0x0F) + c
+                if lo > 0x09:
+                    lo += 0x06
+                hi = (a >> 4) + (v >> 4) + (1 if lo > 0x0F else 0)
+                z = (a + v + c) & 0xFF
+                n = (hi << 4) & 0x80
+                cpu.v = 1 if (~(a ^ v) & (a ^ (hi << 4)) & 0x80) else 0
+                if hi > 0x09:
+                    hi += 0x06
+                cpu.c = 1 if hi > 0x0F else 0
+                cpu.a = ((hi << 4) | (lo & 0x0F)) & 0xFF
+                cpu.nz = (0x100 if n else 0) if z == 0 else (0x80 if n else 1)
+                return
+            s = a + v + c
+            r = s & 0xFF
+            cpu.c = s >> 8
+            cpu.v = ((a ^ r) & (v ^ r) & 0x80) >> 7
+            cpu.a = cpu.nz = r
+
+        def sbc(v):
+            if not cpu.d:
+                adc(v ^ 0xFF)
+                return
+            a = cpu.a; borrow = 1 - cpu.c
+            s = a - v - borrow
+            r = s & 0xFF
+            lo = (a & 0x0F) - (v & 0x0F) - borrow
+            hi = (a >> 4) - (v >> 4)
+            if lo & 0x10:
+                lo -= 0x06
+                hi -= 1
+            if hi & 0x10:
+                hi -= 0x06
+            cpu.c = 1 if s >= 0 else 0
+            cpu.v = 1 if ((a ^ v) & (a ^ r) & 0x80) else 0
+            cpu.nz = r
+            cpu.a = ((hi << 4) | (lo & 0x0F)) & 0xFF
+
+        def cmp(reg, v):
+            t = reg - v
+            cpu.c = 1 if t >= 0 else 0
+            cpu.nz = t & 0xFF
+
+        def asl(v):
+            cpu.c = v >> 7
+            return (v << 1) & 0xFF
+        def lsr(v):
+            cpu.c = v & 1
+            return v >> 1
+        def rol(v):
+            r = ((v << 1) | cpu.c) & 0xFF
+            cpu.c = v >> 7
+            return r
+        def ror(v):
+            r = (v >> 1) | (cpu.c << 7)
+            cpu.c = v & 1
+            return r
+
+        # ----- memory operand operations: factory(ea, mode) -> handler -----
+        def LDA(ea, mode):
+            def h(): cpu.a = cpu.nz = mem[ea()]
+            return h
+        def LDX(ea, mode):
+            def h(): cpu.x = cpu.nz = mem[ea()]
+            return h
+        def LDY(ea, mode):
+            def h(): cpu.y = cpu.nz = mem[ea()]
+            return h
+        def STA(ea, mode):
+            def h(): mem[ea()] = cpu.a
+            return h
+        def STX(ea, mode):
+            def h(): mem[ea()] = cpu.x
+            return h
+        def STY(ea, mode):
+            def h(): mem[ea()] = cpu.y
+            return h
+        def ORA(ea, mode):
+            def h(): cpu.a = cpu.nz = cpu.a | mem[ea()]
+            return h
+        def AND(ea, mode):
+            def h(): cpu.a = cpu.nz = cpu.a & mem[ea()]
+            return h
+        def EOR(ea, mode):
+            def h(): cpu.a = cpu.nz = cpu.a ^ mem[ea()]
+            return h
+        def ADC(ea, mode):
+            def h(): adc(mem[ea()])
+            return h
+        def SBC(ea, mode):
+            def h(): sbc(mem[ea()])
+            return h
+        def CMP(ea, mode):
+            def h(): cmp(cpu.a, mem[ea()])
+            return h
+        def CPX(ea, mode):
+            def h(): cmp(cpu.x, mem[ea()])
+            return h
+        def CPY(ea, mode):
+            def h(): cmp(cpu.y, mem[ea()])
+            return h
+        def BIT(ea, mode):
+            def h():
+                v = mem[ea()]
+                cpu.v = (v >> 6) & 1
+                if cpu.a & v:
+                    cpu.nz = 0x80 if v & 0x80 else 1
+                else:
+                    cpu.nz = 0x100 if v & 0x80 else 0
+            return h
+
+        def rmw(fn):
+            def factory(ea, mode):
+                def h():
+                    addr = ea()
+                    mem[addr] = cpu.nz = fn(mem[addr])
+                return h
+            return factory
+        def INC_(v): return (v + 1) & 0xFF
+        def DEC_(v): return (v - 1) & 0xFF
+
+        def NOP(ea, mode):
+            def h(): ea()
+            return h
+
+        # ----- illegal (undocumented) opcodes -----
+        def LAX(ea, mode):
+            def h(): cpu.a = cpu.x = cpu.nz = mem[ea()]
+            return h
+        def SAX(ea, mode):
+            def h(): mem[ea()] = cpu.a & cpu.x
+            return h
+        def SLO(ea, mode):
+            def h():
+                addr = ea(); r = asl(mem[addr]); mem[addr] = r
+                cpu.a = cpu.nz = cpu.a | r
+            return h
+        def RLA(ea, mode):
+            def h():
+                addr = ea(); r = rol(mem[addr]); mem[addr] = r
+                cpu.a = cpu.nz = cpu.a & r
+            return h
+        def SRE(ea, mode):
+            def h():
+                addr = ea(); r = lsr(mem[addr]); mem[addr] = r
+                cpu.a = cpu.nz = cpu.a ^ r
+            return h
+        def RRA(ea, mode):
+            def h():
+                addr = ea(); r = ror(mem[addr]); mem[addr] = r
+                adc(r)
+            return h
+        def DCP(ea, mode):
+            def h():
+                addr = ea(); r = (mem[addr] - 1) & 0xFF; mem[addr] = r
+                cmp(cpu.a, r)
+            return h
+        def ISC(ea, mode):
+            def h():
+                addr = ea(); r = (mem[addr] + 1) & 0xFF; mem[addr] = r
+                sbc(r)
+            return h
+        def ANC(ea, mode):
+            def h():
+                r = cpu.a & mem[ea()]
+                cpu.a = cpu.nz = r
+                cpu.c = r >> 7
+            return h
+        def ALR(ea, mode):
+            def h(): cpu.a = cpu.nz = lsr(cpu.a & mem[ea()])
+            return h
+        def ARR(ea, mode):
+            def h():
+                r = ((cpu.a & mem[ea()]) >> 1) | (cpu.c << 7)
+                cpu.a = cpu.nz = r
+                cpu.c = (r >> 6) & 1
+                cpu.v = ((r >> 6) ^ (r >> 5)) & 1
+            return h
+        def AXS(ea, mode):
+            def h():
+                t = (cpu.a & cpu.x) - mem[ea()]
+                cpu.c = 1 if t >= 0 else 0
+                cpu.x = cpu.nz = t & 0xFF
+            return h
+        def XAA(ea, mode):
+            def h(): cpu.a = cpu.nz = (cpu.a | XAA_MAGIC) & cpu.x & mem[ea()]
+            return h
+        def LXA(ea, mode):
+            def h(): cpu.a = cpu.x = cpu.nz = cpu.a & mem[ea()]
+            return h
+        def LAS(ea, mode):
+            def h(): cpu.a = cpu.x = cpu.sp = cpu.nz = mem[ea()] & cpu.sp
+            return h
+
+        # SHA/SHX/SHY/TAS store "value & (high byte of base address + 1)"
+        def index_of(mode):
+            return (lambda: cpu.x) if mode == "absx" else (lambda: cpu.y)
+        def high_and(value_fn):
+            def factory(ea, mode):
+                idx = index_of(mode)
+                def h():
+                    addr = ea()
+                    hi = (((addr - idx()) & 0xFFFF) >> 8) + 1
+                    mem[addr] = value_fn() & hi & 0xFF
+                return h
+            return factory
+        def TAS(ea, mode):
+            store = high_and(lambda: cpu.a & cpu.x)(ea, mode)
+            def h():
+                cpu.sp = cpu.a & cpu.x
+                store()
+            return h
+
+        mem_ops = {
+            "LDA": LDA, "LDX": LDX, "LDY": LDY, "STA": STA, "STX": STX, "STY": STY,
+            "ORA": ORA, "AND": AND, "EOR": EOR, "ADC": ADC, "SBC": SBC,
+            "CMP": CMP, "CPX": CPX, "CPY": CPY, "BIT": BIT,
+            "ASL": rmw(asl), "LSR": rmw(lsr), "ROL": rmw(rol), "ROR": rmw(ror),
+            "INC": rmw(INC_), "DEC": rmw(DEC_), "NOP": NOP,
+            "LAX": LAX, "SAX": SAX, "SLO": SLO, "RLA": RLA, "SRE": SRE, "RRA": RRA,
+            "DCP": DCP, "ISC": ISC, "ANC": ANC, "ALR": ALR, "ARR": ARR, "AXS": AXS,
+            "XAA": XAA, "LXA": LXA, "LAS": LAS, "TAS": TAS,
+            "AHX": high_and(lambda: cpu.a & cpu.x),
+            "SHX": high_and(lambda: cpu.x),
+            "SHY": high_and(lambda: cpu.y),
+        }
+
+        # ----- accumulator mode -----
+        def ASL_A(): cpu.a = cpu.nz = asl(cpu.a)
+        def LSR_A(): cpu.a = cpu.nz = lsr(cpu.a)
+        def ROL_A(): cpu.a = cpu.nz = rol(cpu.a)
+        def ROR_A(): cpu.a = cpu.nz = ror(cpu.a)
+        acc_ops = {"ASL": ASL_A, "LSR": LSR_A, "ROL": ROL_A, "ROR": ROR_A}
+
+        # ----- implied -----
+        def push(v):
+            mem[0x100 | cpu.sp] = v & 0xFF
+            cpu.sp = (cpu.sp - 1) & 0xFF
+        def pull():
+            cpu.sp = (cpu.sp + 1) & 0xFF
+            return mem[0x100 | cpu.sp]
+
+        def TAX(): cpu.x = cpu.nz = cpu.a
+        def TAY(): cpu.y = cpu.nz = cpu.a
+        def TXA(): cpu.a = cpu.nz = cpu.x
+        def TYA(): cpu.a = cpu.nz = cpu.y
+        def TSX(): cpu.x = cpu.nz = cpu.sp
+        def TXS(): cpu.sp = cpu.x
+        def INX(): cpu.x = cpu.nz = (cpu.x + 1) & 0xFF
+        def INY(): cpu.y = cpu.nz = (cpu.y + 1) & 0xFF
+        def DEX(): cpu.x = cpu.nz = (cpu.x - 1) & 0xFF
+        def DEY(): cpu.y = cpu.nz = (cpu.y - 1) & 0xFF
+        def CLC(): cpu.c = 0
+        def SEC(): cpu.c = 1
+        def CLI(): cpu.i = 0
+        def SEI(): cpu.i = 1
+        def CLD(): cpu.d = 0
+        def SED(): cpu.d = 1
+        def CLV(): cpu.v = 0
+        def PHA(): push(cpu.a)
+        def PLA(): cpu.a = cpu.nz = pull()
+        def PHP(): push(cpu.p | 0x10)
+        def PLP(): cpu.p = pull()
+        def RTS():
+            lo = pull(); hi = pull()
+            cpu.pc = (((hi << 8) | lo) + 1) & 0xFFFF
+        def RTI():
+            cpu.p = pull()
+            lo = pull(); hi = pull()
+            cpu.pc = (hi << 8) | lo
+        def BRK():
+            ret = (cpu.pc + 1) & 0xFFFF       # skip the padding byte
+            push(ret >> 8); push(ret)
+            push(cpu.p | 0x10)
+            cpu.i = 1
+            cpu.pc = mem[IRQ_VECTOR] | (mem[IRQ_VECTOR + 1] << 8)
+        def NOP_(): pass
+
+        imp_ops = {
+            "TAX": TAX, "TAY": TAY, "TXA": TXA, "TYA": TYA, "TSX": TSX, "TXS": TXS,
+            "INX": INX, "INY": INY, "DEX": DEX, "DEY": DEY,
+            "CLC": CLC, "SEC": SEC, "CLI": CLI, "SEI": SEI, "CLD": CLD, "SED": SED, "CLV": CLV,
+            "PHA": PHA, "PLA": PLA, "PHP": PHP, "PLP": PLP,
+            "RTS": RTS, "RTI": RTI, "BRK": BRK, "NOP": NOP_,
+        }
+
+        # ----- jumps -----
+        def JMP_abs():
+            pc = cpu.pc
+            cpu.pc = mem[pc] | (mem[(pc + 1) & 0xFFFF] << 8)
+        def JMP_ind():
+            pc = cpu.pc
+            ptr = mem[pc] | (mem[(pc + 1) & 0xFFFF] << 8)
+            # 6502 bug: the high byte is fetched from the same page
+            cpu.pc = mem[ptr] | (mem[(ptr & 0xFF00) | ((ptr + 1) & 0xFF)] << 8)
+        def JSR():
+            pc = cpu.pc
+            ret = (pc + 1) & 0xFFFF
+            push(ret >> 8); push(ret)
+            cpu.pc = mem[pc] | (mem[(pc + 1) & 0xFFFF] << 8)
+
+        # ----- branches: +1 cycle if taken, +penalty on page cross -----
+        def branch(test):
+            def factory(penalty):
+                def h():
+                    pc = cpu.pc
+                    off = mem[pc]
+                    pc = (pc + 1) & 0xFFFF
+                    if test():
+                        target = (pc + off - 256 if off & 0x80 else pc + off) & 0xFFFF
+                        cpu.cycles += 1 + penalty if (target ^ pc) & 0xFF00 else 1
+                        cpu.pc = target
+                    else:
+                        cpu.pc = pc
+                return h
+            return factory
+
+        branch_ops = {
+            "BPL": branch(lambda: not cpu.nz & 0x180),
+            "BMI": branch(lambda: cpu.nz & 0x180),
+            "BVC": branch(lambda: not cpu.v),
+            "BVS": branch(lambda: cpu.v),
+            "BCC": branch(lambda: not cpu.c),
+            "BCS": branch(lambda: cpu.c),
+            "BNE": branch(lambda: cpu.nz & 0xFF),
+            "BEQ": branch(lambda: not cpu.nz & 0xFF),
+        }
+
+        return {"mem": mem_ops, "acc": acc_ops, "imp": imp_ops, "branch": branch_ops,
+                "jmp": {"abs": JMP_abs, "ind": JMP_ind}, "jsr": JSR}
+
+# ---- Tiny CLI: run a PRG headless ----
+def _demo():
+    import argparse
+    import time
+    p = argparse.ArgumentParser(description="Run a 6510 PRG headless")
+    p.add_argument("prg", help="PRG file (2-byte load address header)")
+    p.add_argument("--json", default=SPEC_JSON, help="Path to spec JSON")
+    p.add_argument("--start", type=lambda x: int(x, 0), help="Start address (default: load address)")
+    p.add_argument("--cycles", type=int, default=10_000_000, help="Max. cycles")
+    args = p.parse_args()
+
+    cpu = CPU6510(C6510Spec.from_json(args.json))
+    with open(args.prg, "rb") as f:
+        start, end = cpu.load_prg(f.read())
+    entry = args.start if args.start is not None else start
+    t0 = time.perf_counter()
+    try:
+        done = cpu.call(entry, args.cycles)
+        state = "returned" if done else "cycle limit"
+    except CPUHalted as e:
+        state = str(e)
+    dt = time.perf_counter() - t0
+    print(f"${start:04X}-${end - 1:04X} entry ${entry:04X}: {state}")
+    print(" ".join(f"{k}=${v:02X}" for k, v in cpu.registers().items()), cpu.flags())
+    print(f"{cpu.instructions} instructions, {cpu.cycles} cycles, "
+          f"{dt:.3f} s, {cpu.cycles / dt / 1e6:.2f} MHz")
+
+if __name__ == "__main__":
+    _demo()
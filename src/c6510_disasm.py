@@ -0,0 +1,270 @@
+# c6510_disasm.py
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from c6510_spec import C6510Spec
+
+# ---------- Disassembler auf Basis der Spec-JSON ----------
+#
+# Dekodiertabellen (Größe, Mnemonic, Modus, Kontrollfluss) werden einmal aus
+# C6510Spec.opcode_table gebaut - alle 256 Opcodes inkl. illegaler.
+# Code/Daten-Trennung: rekursiver Abstieg ab den Einsprungpunkten; JSR und
+# Branches verzweigen, JMP abs springt, RTS/RTI/BRK/KIL/JMP (ind) beenden
+# einen Pfad. Alles, was nie erreicht wird, ist Daten (.BYTE).
+# Ausgabe ist wieder MiniAssembler-Quelltext (assembliert zu denselben Bytes).
+
+FLOW_NEXT, FLOW_BRANCH, FLOW_CALL, FLOW_JUMP, FLOW_STOP, FLOW_INVALID = range(6)
+
+# Markierung je Byte im Analyseergebnis
+DATA, CODE, OPERAND = 0, 1, 2
+
+OPERAND_FMT = {
+    "imp": "", "acc": "A",
+    "imm": "#${0:02X}", "imm2": "#${0:02X}",
+    "zp": "${0:02X}", "zpx": "${0:02X},X", "zpy": "${0:02X},Y",
+    "abs": "${0:04X}", "absx": "${0:04X},X", "absy": "${0:04X},Y",
+    "ind": "(${0:04X})", "indx": "(${0:02X},X)", "indy": "(${0:02X}),Y",
+    "rel": "${0:04X}",
+}
+_WORD_MODES  = {"abs", "absx", "absy", "ind"}
+_LABEL_MODES = {"abs", "absx", "absy", "ind", "rel"}   # nur hier Labels (zp bleibt zp)
+_STOP_MNEMS  = {"RTS", "RTI", "BRK", "KIL"}
+_ASM_MODES   = set(OPERAND_FMT) - {"imm2"}                # Modi, die MiniAssembler wählen kann
+
+@dataclass
+class Analysis:
+    """Ergebnis des rekursiven Abstiegs für einen Speicherbereich."""
+    base: int
+    kind: bytearray                                     # DATA / CODE / OPERAND je Byte
+    labels: Dict[int, str] = field(default_factory=dict)
+    calls: set = field(default_factory=set)             # JSR-Ziele
+    external: set = field(default_factory=set)          # Sprungziele außerhalb des Bereichs
+    rows: Dict[int, list] = field(default_factory=dict)  # Disassembler.lines() je data_per_line
+
+    def is_code(self, addr: int) -> bool:
+        i = addr - self.base
+        return 0 <= i < len(self.kind) and self.kind[i] == CODE
+
+class _Decoded:
+    # Gecachte Dekodierung eines Speicherbereichs: Größe/Fluss je Offset
+    # (bytes.translate über die 256er-Tabellen) + Analysen je Einsprung-Satz.
+    __slots__ = ("sizes", "flows", "analyses")
+
+    def __init__(self, data: bytes, size_table: bytes, flow_table: bytes):
+        self.sizes = data.translate(size_table)
+        self.flows = data.translate(flow_table)
+        self.analyses: "OrderedDict[Tuple[int, ...], Analysis]" = OrderedDict()
+
+class Disassembler:
+    """
+    6510-Disassembler mit Code/Daten-Trennung.
+
+        dis = Disassembler(spec)
+        src = dis.listing(data, base=0x0801, entries=[0x080D])
+
+    allow_illegal: illegale Opcodes beim Abstieg als Code akzeptieren
+                   (sonst beenden sie den Pfad - meist sind es Daten).
+    """
+    CACHE_RANGES = 4      # Speicherbereiche im Cache
+    CACHE_ANALYSES = 8    # Analysen je Bereich (verschiedene Einsprungpunkte)
+
+    def __init__(self, spec: C6510Spec, allow_illegal: bool = False):
+        self.spec = spec
+        self.allow_illegal = allow_illegal
+        self._cache: "OrderedDict[Tuple[int, bytes], _Decoded]" = OrderedDict()
+        size, flow = bytearray(256), bytearray(256)
+        self.mnem: List[Optional[str]] = [None] * 256
+        self.mode: List[Optional[str]] = [None] * 256
+        self.verbatim = [True] * 256    # MiniAssembler würde einen anderen Opcode wählen
+        legal = {info.mnem for info in spec.opcode_table if info and not info.illegal}
+        for op, info in enumerate(spec.opcode_table):
+            if info is None:
+                size[op] = 1; flow[op] = FLOW_INVALID; continue
+            size[op] = info.size
+            mi = spec.mnemonics.get(info.mnem, {}).get(info.mode)
+            self.verbatim[op] = mi is None or mi.opcode != op or info.mode not in _ASM_MODES
+            # illegal, außer MiniAssembler erzeugt ihn selbst für ein dokumentiertes
+            # Mnemonic (NOP -> $FA laut Spec)
+            if info.illegal and not allow_illegal and (self.verbatim[op] or info.mnem not in legal):
+                flow[op] = FLOW_INVALID
+            else:
+                flow[op] = (FLOW_BRANCH if info.mode == "rel" else
+                            FLOW_CALL   if info.mnem == "JSR" else
+                            FLOW_JUMP   if info.mnem == "JMP" and info.mode == "abs" else
+                            FLOW_STOP   if info.mnem in _STOP_MNEMS or info.mnem == "JMP" else FLOW_NEXT)
+            self.mnem[op] = info.mnem; self.mode[op] = info.mode
+        self.size = list(size)
+        self._size_table = bytes(size); self._flow_table = bytes(flow)
+
+    # ---------- Dekodierung / Cache ----------
+    def _decoded(self, data: bytes, base: int) -> _Decoded:
+        key = (base, data)
+        dec = self._cache.get(key)
+        if dec is None:
+            dec = self._cache[key] = _Decoded(data, self._size_table, self._flow_table)
+            if len(self._cache) > self.CACHE_RANGES: self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        return dec
+
+    @staticmethod
+    def _target(data: bytes, i: int, flow: int, pc: int) -> int:
+        if flow == FLOW_BRANCH:
+            off = data[i + 1]
+            return (pc + 2 + (off - 0x100 if off & 0x80 else off)) & 0xFFFF
+        return data[i + 1] | (data[i + 2] << 8)
+
+    # ---------- Code/Daten-Trennung ----------
+    def analyze(self, data: bytes, base: int = 0x0000, entries: Optional[Iterable[int]] = None) -> Analysis:
+        data = bytes(data)
+        entries = tuple(sorted(set(entries))) if entries is not None else (base,)
+        dec = self._decoded(data, base)
+        an = dec.analyses.get(entries)
+        if an is not None:
+            dec.analyses.move_to_end(entries); return an
+
+        n = len(data); sizes = dec.sizes; flows = dec.flows
+        kind = bytearray(n); calls = set(); external = set(); jumps = set()
+        work = list(entries)
+        while work:
+            pc = work.pop(); i = pc - base
+            while 0 <= i < n and kind[i] == DATA:
+                sz = sizes[i]; flow = flows[i]
+                # gültiger Opcode, passt in den Bereich, überdeckt keine Code-Bytes
+                if flow == FLOW_INVALID or i + sz > n or any(kind[i + 1:i + sz]): break
+                kind[i] = CODE
+                for k in range(i + 1, i + sz): kind[k] = OPERAND
+                if flow != FLOW_NEXT and flow != FLOW_STOP:
+                    t = self._target(data, i, flow, pc)
+                    (calls if flow == FLOW_CALL else jumps).add(t)
+                    if 0 <= t - base < n: work.append(t)
+                    else: external.add(t)
+                if flow == FLOW_JUMP or flow == FLOW_STOP: break
+                pc += sz; i += sz
+
+        an = Analysis(base, kind, calls=calls, external=external)
+        an.labels = self._labels(data, an, jumps)
+        dec.analyses[entries] = an
+        if len(dec.analyses) > self.CACHE_ANALYSES: dec.analyses.popitem(last=False)
+        return an
+
+    def _labels(self, data: bytes, an: Analysis, jumps: set) -> Dict[int, str]:
+        # S_xxxx = JSR-Ziel, L_xxxx = Sprung-/Branch-Ziel, D_xxxx = Datenzugriff
+        base, kind, n = an.base, an.kind, len(data)
+        labels: Dict[int, str] = {}
+        for t in sorted(jumps):
+            if 0 <= t - base < n and kind[t - base] == CODE: labels[t] = f"L_{t:04X}"
+        for t in sorted(an.calls):
+            if 0 <= t - base < n and kind[t - base] == CODE: labels[t] = f"S_{t:04X}"
+        i = kind.find(CODE)
+        while i >= 0:
+            op = data[i]; mode = self.mode[op]
+            if mode in _WORD_MODES and not (mode == "abs" and self.mnem[op] in ("JMP", "JSR")):
+                t = data[i + 1] | (data[i + 2] << 8)
+                j = t - base
+                if 0 <= j < n and t not in labels and kind[j] != OPERAND:
+                    labels[t] = f"D_{t:04X}" if kind[j] == DATA else f"L_{t:04X}"
+            i = kind.find(CODE, i + self.size[op])
+        return labels
+
+    # ---------- Ausgabe ----------
+    def _operand(self, op: int, data: bytes, i: int, pc: int, an: Analysis) -> str:
+        mode = self.mode[op]; sz = self.size[op]
+        if mode == "rel": v = self._target(data, i, FLOW_BRANCH, pc)
+        elif sz == 3:     v = data[i + 1] | (data[i + 2] << 8)
+        elif sz == 2:     v = data[i + 1]
+        else:             return OPERAND_FMT[mode]
+        if mode in _LABEL_MODES:
+            name = self._label_ref(v, an)
+            if name: return OPERAND_FMT[mode].replace("${0:04X}", name)
+        return OPERAND_FMT[mode].format(v)
+
+    @staticmethod
+    def _label_ref(addr: int, an: Analysis) -> Optional[str]:
+        # Label am Ziel oder (Selbstmodifikation: STA L_xxxx+1) an der Instruktion davor
+        name = an.labels.get(addr)
+        if name: return name
+        j = addr - an.base
+        if 0 <= j < len(an.kind) and an.kind[j] == OPERAND:
+            k = j
+            while an.kind[k] == OPERAND: k -= 1
+            name = an.labels.get(an.base + k)
+            if name: return f"{name}+{j - k}"
+        return None
+
+    def lines(self, data: bytes, base: int = 0x0000, entries: Optional[Iterable[int]] = None,
+              data_per_line: int = 8) -> List[Tuple[int, bytes, Optional[str], str, str]]:
+        """
+        Zeilen als (adresse, bytes, label, text, kommentar) - text ist MiniAssembler-Syntax.
+        Datenzeilen werden an Labels und Code-Grenzen umbrochen.
+        """
+        data = bytes(data); an = self.analyze(data, base, entries)
+        out = an.rows.get(data_per_line)
+        if out is not None: return out
+        out = an.rows[data_per_line] = []
+        kind, labels = an.kind, an.labels; n = len(data); i = 0
+        while i < n:
+            pc = base + i
+            if kind[i] == CODE:
+                op = data[i]; sz = self.size[op]; raw = data[i:i + sz]
+                text = f"{self.mnem[op]} {self._operand(op, data, i, pc, an)}".rstrip(); note = ""
+                if self.verbatim[op] or (self.mode[op] in _WORD_MODES and raw[2] == 0):
+                    # nicht eindeutig rückübersetzbar (illegaler Zweitopcode, abs mit $00xx)
+                    text, note = ".BYTE " + ",".join(f"${b:02X}" for b in raw), text
+                out.append((pc, raw, labels.get(pc), text, note)); i += sz
+                continue
+            j = i + 1
+            while j < n and j - i < data_per_line and kind[j] == DATA and base + j not in labels: j += 1
+            raw = data[i:j]
+            out.append((pc, raw, labels.get(pc), ".BYTE " + ",".join(f"${b:02X}" for b in raw), ""))
+            i = j
+        return out
+
+    def listing(self, data: bytes, base: int = 0x0000, entries: Optional[Iterable[int]] = None,
+                show_bytes: bool = True) -> str:
+        """Quelltext mit .ORG, Labels und (optional) Adresse/Bytes als Kommentar."""
+        out = [f"        .ORG ${base:04X}"]
+        for pc, raw, label, text, note in self.lines(data, base, entries):
+            line = f"{label + ':' if label else '':<8}{text}"
+            if note:
+                line = f"{line:<40}; {note}"
+            elif show_bytes and not text.startswith(".BYTE"):
+                line = f"{line:<40}; {pc:04X}: " + " ".join(f"{b:02X}" for b in raw)
+            out.append(line)
+        return "\n".join(out) + "\n"
+
+def basic_sys_entry(data: bytes, base: int) -> Optional[int]:
+    """Einsprung aus einer BASIC-Zeile 'SYS nnnn' (PRG ab $0801), sonst None."""
+    if base != 0x0801 or len(data) < 6: return None
+    end = data.find(b"\x00", 4)
+    line = data[4:end if end >= 0 else len(data)]
+    k = line.find(b"\x9E")
+    if k < 0: return None
+    digits = bytes(c for c in line[k + 1:] if 0x30 <= c <= 0x39 or c == 0x20).strip().split(b" ")[0]
+    return int(digits) if digits else None
+
+def main(argv=None):
+    import argparse
+    from c6510_cpu import SPEC_JSON
+
+    ap = argparse.ArgumentParser(description="6510-Disassembler (PRG oder Rohdaten) mit Code/Daten-Trennung")
+    ap.add_argument("input")
+    ap.add_argument("--raw", action="store_true", help="Rohdaten ohne Ladeadresse")
+    ap.add_argument("--base", type=lambda s: int(s.replace("$", "0x"), 0), default=0x0000)
+    ap.add_argument("--entry", action="append", default=[], type=lambda s: int(s.replace("$", "0x"), 0))
+    ap.add_argument("--illegal", action="store_true", help="illegale Opcodes als Code verfolgen")
+    ap.add_argument("--no-bytes", action="store_true")
+    args = ap.parse_args(argv)
+
+    with open(args.input, "rb") as f:
+        blob = f.read()
+    base, data = (args.base, blob) if args.raw else (blob[0] | (blob[1] << 8), blob[2:])
+    entries = args.entry or [basic_sys_entry(data, base) or base]
+    dis = Disassembler(C6510Spec.from_json(SPEC_JSON), allow_illegal=args.illegal)
+    print(dis.listing(data, base, entries, show_bytes=not args.no_bytes), end="")
+
+if __name__ == "__main__":
+    main()
@@ -206,10 +206,12 @@ LOAD_ADDR = 0x0801  # BASIC-Start in Variante A
 ALIASES = {
     "BNZ":"BNE","BZ":"BEQ",".BYT":".BYTE",".ASC":".TEXT","DB":".BYTE","DW":".WORD",
     "*":".ORG","ORG":".ORG",
-    "EQU":".EQU","SET":".SET"
+    "EQU":".EQU","SET":".SET",
+    "SEGMENT":".SEGMENT",".SECTION":".SEGMENT",".GLOBAL":".EXPORT",".EXTERN":".IMPORT"
 }
 
 BRANCHES = {"BPL","BMI","BVC","BVS","BCC","BCS","BNE","BEQ"}
+_SEGMENT_DIRECTIVES = {".ORG",".SEGMENT",".EXPORT",".IMPORT"}
 
 # --- Ziel-Register/Zero-Page-Konzept ---
 # Variablen A..Z → Zero-Page $02..$1B (anpassbar)
@@ -283,6 +285,7 @@ CREATE TABLE IF NOT EXISTS translations(
     FOREIGN KEY (tgt_term_id) REFERENCES terms(term_id)
 );
 CREATE INDEX IF NOT EXISTS idx_terms_lang_norm ON terms(lang, norm_text);
+CREATE INDEX IF NOT EXISTS idx_terms_lang_len  ON terms(lang, length(norm_text), norm_text);
 """
 # ---------------------------------------------------------------------------
 # standard imports ...
@@ -939,6 +942,7 @@ try:
     import locale         # internal system locale
     import polib          # create .mo locales files from .po files
     import zlib           # de/compression
+    from array import array  # flat int arrays (suggestion index)
     import tempfile
 
     import io             # memory streams
@@ -949,6 +953,7 @@ try:
     import ctypes         # windows ip info
     
     import sqlite3        # database: sqlite
+    import unicodedata    # NFC normalization (translator)
     import configparser   # .ini files
 
     import traceback      # stack exception trace back
@@ -1041,6 +1046,7 @@ try:
     import types
     from   types    import *
     from  typing    import Any, Dict, List, Optional, Tuple, Iterable, Union
+    from collections import OrderedDict
     
     from tempfile   import mkdtemp, TemporaryDirectory
     from contextlib import redirect_stdout
@@ -10535,15 +10541,14 @@ try:
         if b in (0x00,0xA0): return ' '
         return '·'
 
+    _PETSCII_TABLES = {}   # bank -> Übersetzungstabelle (make_text_table)
+
     def hexdump_rows(data: bytes, base_addr: int = 0x0000, bank: str = "upper_graphics") -> List[str]:
-        rows = []
-        for i in range(0, len(data), 8):
-            chunk = data[i:i+8]
-            left = " ".join(f"{b:02X}" for b in chunk[:4]).ljust(11)
-            right = " ".join(f"{b:02X}" for b in chunk[4:8]).ljust(11)
-            txt = "".join(petscii_text_char(b, bank) for b in chunk)
-            rows.append(f"{(base_addr+i):04X}  {left} | {right}  {txt}")
-        return rows
+        table = _PETSCII_TABLES.get(bank)
+        if table is None:
+            table = _PETSCII_TABLES[bank] = make_text_table(lambda b: petscii_text_char(b, bank))
+        return HexDump(data, base_addr, template="{addr:04X}  {left:<11} | {right:<11}  {text}",
+                       text_table=table).rows()
 
     # ===================== Assembler =====================
     @dataclass
@@ -10557,6 +10562,184 @@ try:
     @dataclass
     class AsmLine:
         label: Optional[str]; mnemonic: Optional[str]; operand: Optional[str]; raw: str; lineno: int
+        mnem: Optional[str] = None   # Mnemonic nach ALIASES
+        ast: Any = None              # Operand einmalig geparst (siehe MiniAssembler._line_ast)
+
+    # ---------- Ausdrücke: Tokenizer + Pratt-Parser ----------
+    #
+    # AST-Knoten: int (Konstante, bereits gefaltet) oder Tupel
+    #   ("sym", name) | ("pc",) | ("neg", x) | ("lo", x) | ("hi", x) | ("bin", op, a, b)
+    # Binäre Operatoren (Bindungsstärke): | < ^ < & < + - < * /
+    # Unär: - (Vorzeichen), < (Low-Byte), > (High-Byte) - < und > gelten für den
+    # gesamten folgenden Ausdruck (#<TABELLE+1 = Low-Byte von TABELLE+1).
+    # '*' an Operandenstelle ist der aktuelle PC.
+
+    BINARY_OPS = {"|": 1, "^": 2, "&": 3, "+": 4, "-": 4, "*": 5, "/": 5}
+    UNARY_BP   = 6
+
+    _HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+    _SYM_CHARS  = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_.@")
+    _OP_CHARS   = frozenset("+-*/&|^<>()")
+
+    def tokenize_asm_expr(text: str) -> List[Tuple[str, Any]]:
+        toks: List[Tuple[str, Any]] = []
+        i = 0; n = len(text)
+        while i < n:
+            c = text[i]
+            if c == " " or c == "\t":
+                i += 1; continue
+            if c == "$" or c == "%":
+                j = i + 1
+                digits = _HEX_DIGITS if c == "$" else "01"
+                while j < n and text[j] in digits: j += 1
+                if j == i + 1: raise ValueError(f"Zahl erwartet: {text}")
+                toks.append(("num", int(text[i+1:j], 16 if c == "$" else 2))); i = j; continue
+            if c.isdigit():
+                j = i + 1
+                while j < n and text[j].isdigit(): j += 1
+                toks.append(("num", int(text[i:j]))); i = j; continue
+            if c == "'" and i + 2 < n and text[i+2] == "'":
+                toks.append(("num", ord(text[i+1]))); i += 3; continue
+            if c in _SYM_CHARS:
+                j = i + 1
+                while j < n and text[j] in _SYM_CHARS: j += 1
+                toks.append(("sym", text[i:j])); i = j; continue
+            if c in _OP_CHARS:
+                toks.append(("op", c)); i += 1; continue
+            raise ValueError(f"Unerwartetes Zeichen '{c}' in: {text}")
+        toks.append(("end", None))
+        return toks
+
+    def _fold(op: str, a: int, b: int) -> int:
+        if op == "+": return (a + b) & 0xFFFF
+        if op == "-": return (a - b) & 0xFFFF
+        if op == "*": return (a * b) & 0xFFFF
+        if op == "/":
+            if b == 0: raise ValueError("Division durch 0")
+            return (a // b) & 0xFFFF
+        if op == "&": return a & b
+        if op == "|": return a | b
+        return a ^ b
+
+    class AsmExprParser:
+        """Pratt-Parser über tokenize_asm_expr(); Konstanten werden sofort gefaltet."""
+        def __init__(self, text: str):
+            self.text = text
+            self.toks = tokenize_asm_expr(text)
+            self.i = 0
+
+        def parse(self):
+            node = self.expr(0)
+            if self.toks[self.i][0] != "end":
+                raise ValueError(f"Unerwartetes Ende im Ausdruck: {self.text}")
+            return node
+
+        def expr(self, rbp: int):
+            kind, val = self.toks[self.i]; self.i += 1
+            left = self.nud(kind, val)
+            while True:
+                kind, op = self.toks[self.i]
+                bp = BINARY_OPS.get(op, 0) if kind == "op" else 0
+                if bp <= rbp: return left
+                self.i += 1
+                right = self.expr(bp)
+                if left.__class__ is int and right.__class__ is int:
+                    left = _fold(op, left, right)
+                else:
+                    left = ("bin", op, left, right)
+
+        def nud(self, kind: str, val):
+            if kind == "num": return val
+            if kind == "sym": return ("sym", val)
+            if kind == "op":
+                if val == "(":
+                    node = self.expr(0)
+                    if self.toks[self.i] != ("op", ")"):
+                        raise ValueError(f"')' fehlt: {self.text}")
+                    self.i += 1
+                    return node
+                if val == "*": return ("pc",)
+                if val == "+": return self.expr(UNARY_BP)
+                if val == "-":
+                    x = self.expr(UNARY_BP)
+                    return (-x) & 0xFFFF if x.__class__ is int else ("neg", x)
+                if val == "<" or val == ">":
+                    x = self.expr(0)
+                    if x.__class__ is int:
+                        return x & 0xFF if val == "<" else (x >> 8) & 0xFF
+                    return ("lo" if val == "<" else "hi", x)
+            raise ValueError(f"Ausdruck unvollständig: {self.text}")
+
+    def parse_asm_expr(text: str):
+        """
+        Ausdruck -> AST. Nicht parsebarer Text wird als Symbolname behandelt
+        (Labels mit Sonderzeichen bleiben so nutzbar, sonst Fehler beim Auswerten).
+        """
+        text = text.strip()
+        try:
+            return AsmExprParser(text).parse()
+        except (ValueError, IndexError):
+            return ("sym", text)
+
+    def _top_level_comma(s: str) -> int:
+        """Position des letzten Kommas außerhalb von Klammern/Zeichenliteralen, sonst -1."""
+        depth = 0; pos = -1; i = 0; n = len(s)
+        while i < n:
+            c = s[i]
+            if c == "'" and i + 2 < n and s[i+2] == "'":
+                i += 3; continue
+            if c == "(": depth += 1
+            elif c == ")": depth -= 1
+            elif c == "," and depth == 0: pos = i
+            i += 1
+        return pos
+
+    def _split_index(s: str) -> Tuple[str, Optional[str]]:
+        """'expr,X' -> ('expr', 'X'); ohne Index-Register -> (s, None)."""
+        k = _top_level_comma(s)
+        if k >= 0:
+            reg = s[k+1:].strip().upper()
+            if reg == "X" or reg == "Y":
+                return s[:k].strip(), reg
+        return s, None
+
+    def _matching_paren(s: str, start: int) -> int:
+        depth = 0
+        for i in range(start, len(s)):
+            c = s[i]
+            if c == "(": depth += 1
+            elif c == ")":
+                depth -= 1
+                if depth == 0: return i
+        return -1
+
+    def classify_operand(operand: Optional[str]) -> Tuple[str, Any]:
+        """
+        Operand -> (Art, AST), ohne reguläre Ausdrücke. Art ist eine von
+        imp, acc, imm, indx, indy, ind, x, y, expr.
+        """
+        if operand is None: return "imp", None
+        op = operand.strip()
+        if not op: return "imp", None
+        if op.upper() == "A": return "acc", None
+        if op[0] == "#": return "imm", parse_asm_expr(op[1:])
+        if op[0] == "(":
+            close = _matching_paren(op, 0)
+            if close == len(op) - 1:
+                inner, reg = _split_index(op[1:-1])
+                if reg == "X": return "indx", parse_asm_expr(inner)
+                return "ind", parse_asm_expr(op[1:-1])
+            if close > 0:
+                rest = op[close+1:].strip()
+                if rest[:1] == "," and rest[1:].strip().upper() == "Y":
+                    return "indy", parse_asm_expr(op[1:close])
+        base, reg = _split_index(op)
+        if reg == "X": return "x", parse_asm_expr(base)
+        if reg == "Y": return "y", parse_asm_expr(base)
+        return "expr", parse_asm_expr(op)
+
+    def _is_name(s: str) -> bool:
+        return bool(s) and (s[0].isalpha() or s[0] == "_") and all(c.isalnum() or c == "_" for c in s)
 
     class MiniAssembler:
         def __init__(self, spec: C6510Spec):
@@ -10566,22 +10749,37 @@ try:
             self.symbols: Dict[str,int] = {}
             self.rows: List[Tuple[str, List[int], str, int]] = []  # (addr, bytes, text, srcline)
             self.ignore_org: bool = False
+            self.seg = "CODE"                        # aktuelles Segment
+            self._seg_pc: Dict[str,int] = {}         # Segment -> PC beim Verlassen
+            self._expr_cache: Dict[str, Any] = {}
+            self._operand_cache: Dict[Optional[str], Tuple[str, Any]] = {}
+
+        def parse_line(self, rawline: str, lineno: int) -> Optional[AsmLine]:
+            line = rawline.split(";",1)[0].rstrip()
+            if not line.strip(): return None
+            label=None; mnemonic=None; operand=None
+            if ":" in line:
+                before, after = line.split(":",1)
+                if before.strip(): label = before.strip()
+                line = after.strip()
+            if line:
+                parts = line.split(None,1)
+                mnemonic = parts[0].upper()
+                operand = parts[1].strip() if len(parts)>1 else None
+            ln = AsmLine(label,mnemonic,operand,rawline,lineno)
+            if mnemonic:
+                ln.mnem = ALIASES.get(mnemonic, mnemonic)
+                # "NAME = expr" als .EQU (Name in Originalschreibweise)
+                if (not label and operand and operand.startswith("=")
+                        and ln.mnem != ".ORG" and _is_name(parts[0])):
+                    ln.label = parts[0]; ln.mnem = ".EQU"; ln.operand = operand[1:].strip()
+            return ln
 
         def parse(self, text: str) -> List[AsmLine]:
             lines: List[AsmLine] = []
             for lineno, rawline in enumerate(text.splitlines(), start=1):
-                line = rawline.split(";",1)[0].rstrip()
-                if not line.strip(): continue
-                label=None; mnemonic=None; operand=None
-                if ":" in line:
-                    before, after = line.split(":",1)
-                    if before.strip(): label = before.strip()
-                    line = after.strip()
-                if line:
-                    parts = line.split(None,1)
-                    mnemonic = parts[0].upper()
-                    operand = parts[1].strip() if len(parts)>1 else None
-                lines.append(AsmLine(label,mnemonic,operand,rawline,lineno))
+                ln = self.parse_line(rawline, lineno)
+                if ln is not None: lines.append(ln)
             return lines
 
         def _split_args(self, operand: Optional[str]) -> List[str]:
@@ -10600,46 +10798,88 @@ try:
             if part: out.append(part)
             return out
 
+        # ---------- Ausdrücke ----------
+        def eval_node(self, node) -> int:
+            if node.__class__ is int: return node
+            tag = node[0]
+            if tag == "sym":
+                v = self.symbols.get(node[1])
+                if v is None: raise ValueError(f"Unbekannter Ausdruck/Label: {node[1]}")
+                return v
+            if tag == "bin": return _fold(node[1], self.eval_node(node[2]), self.eval_node(node[3]))
+            if tag == "lo":  return self.eval_node(node[1]) & 0xFF
+            if tag == "hi":  return (self.eval_node(node[1]) >> 8) & 0xFF
+            if tag == "neg": return (-self.eval_node(node[1])) & 0xFFFF
+            return self.pc   # ("pc",)
+
+        def _try_node(self, node):
+            try: return self.eval_node(node)
+            except Exception: return None
+
         def eval_expr(self, expr: str) -> int:
-            expr=expr.strip()
-            m=re.fullmatch(r"'(.)'",expr)
-            if m: return ord(m.group(1))
-            if expr.startswith("$"): return int(expr[1:],16)
-            if expr.startswith("%"): return int(expr[1:],2)
-            if expr.isdigit(): return int(expr,10)
-            if expr in self.symbols: return self.symbols[expr]
-            m=re.fullmatch(r"(.+)\s*([+-])\s*(.+)",expr)
-            if m:
-                a=self.eval_expr(m.group(1)); b=self.eval_expr(m.group(3))
-                return (a+b)&0xFFFF if m.group(2)== '+' else (a-b)&0xFFFF
-            raise ValueError(f"Unbekannter Ausdruck/Label: {expr}")
+            node = self._expr_cache.get(expr)
+            if node is None:
+                if len(self._expr_cache) > 4096: self._expr_cache.clear()
+                node = self._expr_cache[expr] = parse_asm_expr(expr)
+            return self.eval_node(node)
 
         def _try_eval(self, expr: str):
             try: return self.eval_expr(expr)
             except Exception: return None
 
-        def detect_mode_and_operand_bytes(self, mnem: str, operand: Optional[str], pc: int):
-            if operand is None or operand.strip()=="": return "imp", []
-            op = operand.strip()
-            if op.upper() == "A": return "acc", []
-            if op.startswith("#"): v=self.eval_expr(op[1:])&0xFF; return "imm",[v]
-            if re.fullmatch(r"\(\s*[^)]+\s*,\s*X\s*\)", op, flags=re.IGNORECASE):
-                inner=op[1:-1]; lhs=inner.split(",")[0]; v=self._try_eval(lhs); return "indx", [0xFF & (v or 0)]
-            if re.fullmatch(r"\(\s*[^)]+\s*\)\s*,\s*Y", op, flags=re.IGNORECASE):
-                inner=op.split(")")[0][1:]; v=self._try_eval(inner); return "indy", [0xFF & (v or 0)]
-            if re.fullmatch(r"\(\s*[^)]+\s*\)", op):
-                v=self._try_eval(op[1:-1]); vv = v or 0; return "ind", [vv&0xFF,(vv>>8)&0xFF]
-            m = re.fullmatch(r"(.+)\s*,\s*([XY])", op, re.IGNORECASE)
-            if m:
-                val=self._try_eval(m.group(1)); idx=m.group(2).upper()
-                if val is not None and val<=0xFF:
-                    return ("zpx",[val&0xFF]) if idx=="X" else ("zpy",[val&0xFF])
-                vv=val or 0
-                return ("absx",[vv&0xFF,(vv>>8)&0xFF]) if idx=="X" else ("absy",[vv&0xFF,(vv>>8)&0xFF])
-            val=self._try_eval(op)
-            if val is not None and val<=0xFF: return "zp",[val&0xFF]
-            vv=val or 0
-            return "abs",[vv&0xFF,(vv>>8)&0xFF]
+        def detect_mode_and_operand_bytes(self, mnem: str, operand: Optional[str], pc: int,
+                                          parsed=None, strict: bool = True):
+            kind, node = parsed if parsed is not None else classify_operand(operand)
+            if kind == "imp": return "imp", []
+            if kind == "acc": return "acc", []
+            if kind == "imm":
+                # Pass 1 (strict=False): Vorwärtsreferenz (#<label) ändert die Größe nicht
+                v = self.eval_node(node) if strict else (self._try_node(node) or 0)
+                return "imm", [v & 0xFF]
+            v = self._try_node(node)
+            if kind == "indx": return "indx", [0xFF & (v or 0)]
+            if kind == "indy": return "indy", [0xFF & (v or 0)]
+            if kind == "ind":
+                vv = v or 0; return "ind", [vv&0xFF,(vv>>8)&0xFF]
+            if v is not None and v<=0xFF:
+                if kind == "x": return "zpx",[v&0xFF]
+                if kind == "y": return "zpy",[v&0xFF]
+                return "zp",[v&0xFF]
+            vv = v or 0
+            mode = "absx" if kind == "x" else "absy" if kind == "y" else "abs"
+            return mode,[vv&0xFF,(vv>>8)&0xFF]
+
+        def _line_ast(self, ln: AsmLine):
+            """Operand einer Zeile einmalig parsen und an der AsmLine cachen."""
+            if ln.ast is not None: return ln.ast
+            mnem = ln.mnem
+            if mnem in (".BYTE",".TEXT"):
+                ast = []
+                for p in self._split_args(ln.operand):
+                    if p.startswith('"') and p.endswith('"'): ast.append(("str", bytes(p[1:-1],"latin1","replace")))
+                    else: ast.append(("val", parse_asm_expr(p)))
+            elif mnem == ".WORD":
+                ast = [parse_asm_expr(p) for p in self._split_args(ln.operand)]
+            elif mnem == ".SEGMENT":
+                # .SEGMENT name [, adresse]
+                parts = self._split_args(ln.operand)
+                if not parts: raise ValueError(f".SEGMENT ohne Namen (Z{ln.lineno})")
+                ast = (parts[0].strip('"'), parse_asm_expr(parts[1]) if len(parts) > 1 else None)
+            elif mnem in (".EXPORT",".IMPORT"):
+                ast = [p.strip() for p in self._split_args(ln.operand)]
+            elif mnem in (".ORG",".EQU",".SET") or mnem in BRANCHES:
+                op = (ln.operand or "").strip()
+                if mnem == ".ORG" and op.startswith("="):      # * = $1000 / .org = $1000
+                    op = op[1:].strip()
+                ast = parse_asm_expr(op) if op else None
+            else:
+                # gleiche Operanden-Texte ($FB, ($FB),Y, ...) nur einmal klassifizieren
+                ast = self._operand_cache.get(ln.operand)
+                if ast is None:
+                    if len(self._operand_cache) > 4096: self._operand_cache.clear()
+                    ast = self._operand_cache[ln.operand] = classify_operand(ln.operand)
+            ln.ast = ast
+            return ast
 
         @staticmethod
         def rel_branch_offset(pc: int, target: int) -> int:
@@ -10648,105 +10888,524 @@ try:
             if diff < -128 or diff > 127: raise ValueError("Branch außerhalb Reichweite")
             return diff & 0xFF
 
+        # ---------- Segmente ----------
+        def _reset_segments(self):
+            self.seg = "CODE"; self._seg_pc = {}
+
+        def _open_segment(self, name: Optional[str], addr: Optional[int]):
+            """.ORG (name=None) öffnet ein neues Segment, .SEGMENT name setzt ein
+            vorhandenes fort bzw. beginnt es am aktuellen PC."""
+            self._seg_pc[self.seg] = self.pc
+            if name is None:
+                name = base = f"ORG_{addr:04X}"; k = 1
+                while name in self._seg_pc:
+                    k += 1; name = f"{base}_{k}"
+            elif addr is None:
+                addr = self._seg_pc.get(name, self.pc)
+            self.seg = name; self.pc = addr
+
+        def _segment_line(self, ln: AsmLine, ast) -> bool:
+            """Segment-Direktiven (beide Pässe); True wenn die Zeile damit erledigt ist."""
+            mnem = ln.mnem
+            if mnem == ".ORG":
+                if not self.ignore_org:
+                    if ast is None:
+                        raise ValueError(".org ohne Adresse (Z{})".format(ln.lineno))
+                    self.org = self.eval_node(ast)
+                    self._open_segment(None, self.org)
+                return True
+            if mnem == ".SEGMENT":
+                name, node = ast
+                self._open_segment(name, None if node is None else self.eval_node(node))
+                return True
+            return mnem in (".EXPORT",".IMPORT")   # nur für Objektdateien (ObjectAssembler)
+
+        def segments(self) -> List[Tuple[int, bytes]]:
+            """Zusammenhängende Speicherbereiche (adresse, bytes) der letzten Assemblierung."""
+            return chunks_from_rows(self.rows)
+
+        def _layout_line(self, ln: AsmLine):
+            """Pass 1 für eine Zeile: Label setzen, PC um die Größe weiterzählen."""
+            if ln.label:
+                if ln.label in self.symbols: raise ValueError(f"Label doppelt: {ln.label} (Z{ln.lineno})")
+                self.symbols[ln.label]=self.pc
+            mnem = ln.mnem
+            if not mnem: return
+            ast = self._line_ast(ln)
+            if mnem in _SEGMENT_DIRECTIVES:
+                self._segment_line(ln, ast); return
+            if mnem in (".EQU",".SET"):
+                if not ln.label or ast is None: raise ValueError(f"{mnem} braucht Label+Wert (Z{ln.lineno})")
+                self.symbols[ln.label] = self.eval_node(ast)&0xFFFF; return
+            if mnem in (".BYTE",".TEXT"):
+                for kind, v in ast:
+                    self.pc += len(v) if kind == "str" else 1
+                return
+            if mnem == ".WORD":
+                self.pc += 2*len(ast); return
+            if mnem in BRANCHES:
+                self.pc += 2; return
+            try:
+                mode, ob = self.detect_mode_and_operand_bytes(mnem, ln.operand, self.pc, ast, strict=False)
+                _ = self.spec.get_opcode(mnem, mode)
+                self.pc += 1+len(ob)
+            except Exception:
+                self.pc += 3   # worst case
+
+        def _emit_line(self, ln: AsmLine):
+            """Pass 2 für eine Zeile -> (adresse, bytes, text, listingzeile) oder None."""
+            mnem = ln.mnem
+            if not mnem: return None
+            ast = ln.ast
+            if mnem in _SEGMENT_DIRECTIVES:
+                self._segment_line(ln, ast); return None
+            if mnem in (".EQU",".SET"):
+                self.symbols[ln.label] = self.eval_node(ast) & 0xFFFF
+                return None
+            start_pc = self.pc
+            if mnem in (".BYTE",".TEXT"):
+                bytes_here=[]
+                for kind, v in ast:
+                    if kind == "str": bytes_here.extend(v)
+                    else: bytes_here.append(self.eval_node(v)&0xFF)
+                text = f"{mnem} {ln.operand or ''}"
+            elif mnem == ".WORD":
+                bytes_here=[]
+                for node in ast:
+                    v=self.eval_node(node)&0xFFFF; bytes_here.extend([v & 0xFF,(v>>8)&0xFF])
+                text = f"{mnem} {ln.operand or ''}"
+            elif mnem in BRANCHES:
+                opcode = self.spec.get_opcode(mnem,"rel")
+                if ast is None: raise ValueError(f"{mnem} ohne Sprungziel (Z{ln.lineno})")
+                target = self.eval_node(ast)
+                bytes_here = [opcode, MiniAssembler.rel_branch_offset(start_pc, target)]
+                text = f"{mnem} ${target:04X}"
+            else:
+                mode, ob = self.detect_mode_and_operand_bytes(mnem, ln.operand, start_pc, ast)
+                bytes_here = [self.spec.get_opcode(mnem, mode)]+ob
+                text = f"{mnem} {ln.operand or ''}"
+            self.pc += len(bytes_here)
+            return (start_pc, bytes_here, text.strip(),
+                    f"{start_pc:04X}: " + " ".join(f"{b:02X}" for b in bytes_here) + f"    {text}")
+
         def assemble(self, text: str):
-            listing: List[str] = []
             lines = self.parse(text)
             self.rows.clear()
 
             # Pass 1: Adressen/Größen
-            self.pc = self.org; self.symbols.clear()
+            self.pc = self.org; self.symbols.clear(); self._reset_segments()
             for ln in lines:
-                if ln.label:
-                    if ln.label in self.symbols: raise ValueError(f"Label doppelt: {ln.label} (Z{ln.lineno})")
-                    self.symbols[ln.label]=self.pc
-                if not ln.mnemonic: continue
-                mnem = ALIASES.get(ln.mnemonic.upper(), ln.mnemonic.upper())
-                # Pass 1 (in assemble, wo mnem == ".ORG"):
-                if mnem == ".ORG":
-                    if not self.ignore_org:
-                        if not ln.operand:
-                            raise ValueError(".org ohne Adresse (Z{})".format(ln.lineno))
-                        op = ln.operand.strip()
-                        if op.startswith("="):      # <— NEU: * = $1000 / .org = $1000
-                            op = op[1:].strip()
-                        self.org = self.eval_expr(op)
-                        self.pc = self.org
-                    continue
-                if mnem in (".EQU",".SET"):
-                    if not ln.label or not ln.operand: raise ValueError(f"{mnem} braucht Label+Wert (Z{ln.lineno})")
-                    self.symbols[ln.label] = self.eval_expr(ln.operand)&0xFFFF; continue
-                if mnem in (".BYTE",".BYT",".TEXT",".ASC"):
-                    for p in self._split_args(ln.operand):
-                        if p.startswith('"') and p.endswith('"'): self.pc += len(p[1:-1])
-                        else: self.pc += 1
-                    continue
-                if mnem == ".WORD":
-                    self.pc += 2*len(self._split_args(ln.operand)); continue
-                if mnem in {"BPL","BMI","BVC","BVS","BCC","BCS","BNE","BEQ"}:
-                    self.pc += 2; continue
-                try:
-                    mode, ob = self.detect_mode_and_operand_bytes(mnem, ln.operand, self.pc)
-                    _ = self.spec.get_opcode(mnem, mode)
-                    self.pc += 1+len(ob)
-                except Exception:
-                    self.pc += 3   # worst case
+                self._layout_line(ln)
 
-            # Pass 2: Bytes erzeugen
-            self.pc = self.org; out = bytearray()
+            # Pass 2: Bytes erzeugen (Operanden sind geparst, nur Symbole neu auswerten)
+            self.pc = self.org; self._reset_segments(); out = bytearray(); listing: List[str] = []
             for ln in lines:
-                if not ln.mnemonic: continue
-                mnem = ALIASES.get(ln.mnemonic.upper(), ln.mnemonic.upper())
-                # Guard: "NAME = expr" als .EQU behandeln
-                if (ln.operand and ln.operand.lstrip().startswith("=")
-                    and re.fullmatch(r"[A-Za-z_]\w*", mnem)):
-                    mnem = ".EQU"
-                    op_equ = ln.operand.lstrip()[1:].strip()
+                e = self._emit_line(ln)
+                if e is None: continue
+                out.extend(e[1]); listing.append(e[3])
+                self.rows.append((f"{e[0]:04X}", e[1], e[2], ln.lineno))
+
+            return bytes(out), self.org, listing
+
+    def _ast_symbols(node, acc: set):
+        """Alle Symbolnamen eines (Zeilen-)AST sammeln."""
+        if isinstance(node, tuple):
+            if node and node[0] == "sym": acc.add(node[1]); return
+            for x in node[1:]: _ast_symbols(x, acc)
+        elif isinstance(node, list):
+            for x in node: _ast_symbols(x, acc)
+
+    def _ast_uses_pc(node) -> bool:
+        if isinstance(node, tuple):
+            if node and node[0] == "pc": return True
+            return any(_ast_uses_pc(x) for x in node[1:])
+        if isinstance(node, list):
+            return any(_ast_uses_pc(x) for x in node)
+        return False
+
+    _NO_DEPS: frozenset = frozenset()
+
+    class IncrementalAssembler(MiniAssembler):
+        """
+        MiniAssembler für den Editor: hält geparste Zeilen, Adressen, Symbole und
+        erzeugte Bytes zwischen zwei Aufrufen.
+
+        update(text) / replace_lines(start, count, new_lines)
+          - parst nur geänderte Zeilen neu,
+          - Pass 1 ab der ersten geänderten Zeile; bricht ab, sobald PC/ORG wieder
+            mit dem alten Stand übereinstimmen und kein Symbol einen neuen Wert hat,
+          - Pass 2 erzeugt nur Zeilen neu, die neu geparst wurden oder deren Operand
+            ein geändertes Symbol benutzt; verschobene Zeilen bekommen nur die neue
+            Adresse (Branches werden neu berechnet).
+        Ergebnis wie assemble(): (bytes, org, listing); rows wird neu aufgebaut.
+        """
+        def __init__(self, spec: C6510Spec):
+            super().__init__(spec)
+            self.base_org = self.org
+            self.stats: Dict[str, int] = {}
+            self._raw: List[str] = []
+            self._lines: List[Optional[AsmLine]] = []
+            self._deps: List[Optional[frozenset]] = []   # None = immer neu (PC/.ORG/Fehler)
+            self._p1_pc:  List[int] = [self.base_org]    # Zustand *vor* Zeile i, Index n = Ende
+            self._p1_org: List[int] = [self.base_org]
+            self._p1_size: List[int] = []
+            self._p2_pc:  List[int] = [-1]
+            self._emit: List[Any] = []                   # (row, listingzeile, bytes) | None
+            self._sym_line: Dict[str, List[int]] = {}    # Symbol -> definierende Zeilen (>1 = doppelt)
+            self._users: Dict[str, Dict[int, AsmLine]] = {}  # Symbol -> Zeilen, die es benutzen
+            self._always: Dict[int, AsmLine] = {}        # Zeilen ohne feste Abhängigkeiten
+            self._p2_org = self.base_org                 # Start-PC von Pass 2
+            self._n_segment_lines = 0                    # .SEGMENT -> immer komplett (PC je Segment)
+            self._final: Dict[str, int] = {}             # Symboltabelle nach Pass 1
+            self._result: Any = None
+            self._full = True
+            self._layout_key = None
+
+        def reset(self):
+            self.__init__(self.spec)
+
+        def update(self, text: str):
+            new = text.splitlines()
+            old = self._raw
+            if new == old and not self._full and self._result is not None:
+                self.stats = {"parsed": 0, "relaid": 0, "emitted": 0, "shifted": 0}
+                return self._result
+            n = min(len(old), len(new)); p = 0
+            while p < n and old[p] == new[p]: p += 1
+            s = 0
+            while s < n - p and old[-1-s] == new[-1-s]: s += 1
+            return self.replace_lines(p, len(old) - s - p, new[p:len(new) - s])
+
+        def replace_lines(self, start: int, count: int, new_lines: List[str]):
+            end = start + count; k = len(new_lines); delta = k - count
+            removed = set()
+            for ln, d in zip(self._lines[start:end], self._deps[start:end]):
+                if ln is None: continue
+                if ln.label: removed.add(ln.label)
+                self._index(ln, d, add=False)
+
+            # --- neu parsen (nur die geänderten Zeilen) ---
+            parsed: List[Optional[AsmLine]] = []; deps: List[Optional[frozenset]] = []
+            for j, raw in enumerate(new_lines):
+                ln = self.parse_line(raw, start + j + 1)
+                d = self._line_deps(ln)
+                parsed.append(ln); deps.append(d); self._index(ln, d)
+            p1_start = (self._p1_pc[start], self._p1_org[start])
+            p2_start = self._p2_pc[start]
+            self._raw[start:end] = new_lines
+            self._lines[start:end] = parsed
+            self._deps[start:end] = deps
+            self._p1_pc[start:end] = [0] * k
+            self._p1_org[start:end] = [0] * k
+            self._p1_size[start:end] = [0] * k
+            self._p2_pc[start:end] = [-1] * k
+            self._emit[start:end] = [None] * k
+            if delta:
+                for i in range(start + k, len(self._lines)):
+                    ln = self._lines[i]
+                    if ln is not None: ln.lineno = i + 1
+                    e = self._emit[i]
+                    if e is not None: self._emit[i] = (e[0][:3] + (i + 1,),) + e[1:]
+            for name in (list(self._sym_line) if delta else removed):
+                rows = self._sym_line.get(name)
+                if rows is None: continue
+                rows = [i + delta if i >= end else i for i in rows if not start <= i < end]
+                if rows: self._sym_line[name] = rows
+                else: del self._sym_line[name]
+
+            key = (self.base_org, self.ignore_org)
+            if key != self._layout_key:
+                self._full = True; self._layout_key = key
+            full = self._full or self._n_segment_lines > 0
+            self._full = True                             # erst nach Erfolg zurücksetzen
+            if full:
+                self._reset_segments()
+                start = 0; k = len(self._lines); p1_start = (self.base_org, self.base_org)
+                removed = set(self._final); self._sym_line.clear()
+            changed = self._layout(start, start + k, p1_start, removed, full)
+            if self.org != self._p2_org: full = True       # Pass 2 beginnt beim letzten .ORG
+            result = self._generate(start, start + k, changed, full, p2_start)
+            self._full = False
+            self.stats["parsed"] = len(new_lines)
+            return result
+
+        def _index(self, ln: Optional[AsmLine], d: Optional[frozenset], add: bool = True):
+            if ln is None: return
+            key = id(ln)
+            if ln.mnem == ".SEGMENT": self._n_segment_lines += 1 if add else -1
+            if d is None:
+                if add: self._always[key] = ln
+                else: self._always.pop(key, None)
+                return
+            for name in d:
+                if add: self._users.setdefault(name, {})[key] = ln
                 else:
-                    op_equ = ln.operand
-                # Pass 2 (in assemble, wo mnem == ".ORG"):
-                if mnem == ".ORG":
-                    if not self.ignore_org:
-                        if not op_equ: raise ValueError(".org ohne Adresse (Z{})".format(ln.lineno))
-                        self.org = self.eval_expr(op_equ); self.pc = self.org
-                    continue
-                if mnem in (".EQU",".SET"):
-                    if not ln.label or not op_equ: raise ValueError(f"{mnem} braucht Label+Wert (Z{ln.lineno})")
-                    self.symbols[ln.label] = self.eval_expr(op_equ) & 0xFFFF
-                    continue
-                if mnem in (".BYTE",".BYT",".TEXT",".ASC"):
-                    start_pc = self.pc; bytes_here=[]
-                    for p in self._split_args(ln.operand):
-                        if p.startswith('"') and p.endswith('"'):
-                            s=bytes(p[1:-1],"latin1","replace"); out.extend(s); bytes_here.extend(list(s)); self.pc += len(s)
-                        else:
-                            v=self.eval_expr(p)&0xFF; out.append(v); bytes_here.append(v); self.pc += 1
-                    listing.append(f"{start_pc:04X}: " + " ".join(f"{b:02X}" for b in bytes_here) + f"    {mnem} {ln.operand or ''}")
-                    self.rows.append((f"{start_pc:04X}", bytes_here, f"{mnem} {ln.operand or ''}".strip(), ln.lineno))
-                    continue
-                if mnem == ".WORD":
-                    start_pc = self.pc; bytes_here=[]
-                    for p in self._split_args(ln.operand):
-                        v=self.eval_expr(p)&0xFFFF; out.extend([v & 0xFF,(v>>8)&0xFF]); bytes_here.extend([v & 0xFF,(v>>8)&0xFF]); self.pc += 2
-                    listing.append(f"{start_pc:04X}: " + " ".join(f"{b:02X}" for b in bytes_here) + f"    {mnem} {ln.operand or ''}")
-                    self.rows.append((f"{start_pc:04X}", bytes_here, f"{mnem} {ln.operand or ''}".strip(), ln.lineno))
-                    continue
-                if mnem in BRANCHES:
-                    opcode = self.spec.get_opcode(mnem,"rel")
-                    target = self.eval_expr(ln.operand)
-                    off = MiniAssembler.rel_branch_offset(self.pc, target)
-                    out.extend([opcode, off])
-                    listing.append(f"{self.pc:04X}: {opcode:02X} {off:02X}    {mnem} ${target:04X}")
-                    self.rows.append((f"{self.pc:04X}", [opcode, off], f"{mnem} ${target:04X}", ln.lineno))
-                    self.pc += 2
+                    users = self._users.get(name)
+                    if users is not None: users.pop(key, None)
+
+        def _line_deps(self, ln: Optional[AsmLine]) -> Optional[frozenset]:
+            if ln is None or not ln.mnem: return _NO_DEPS
+            if ln.mnem in (".ORG",".SEGMENT"): return None
+            try: ast = self._line_ast(ln)
+            except Exception: return None
+            if _ast_uses_pc(ast): return None
+            acc: set = set(); _ast_symbols(ast, acc)
+            return frozenset(acc) if acc else _NO_DEPS
+
+        def _layout(self, first: int, region_end: int, p1_start, removed: set, full: bool) -> set:
+            """Pass 1 ab Zeile first; liefert die Symbole, deren Wert sich geändert hat."""
+            old_final = self._final; sym_line = self._sym_line
+            lines = self._lines; deps = self._deps; n = len(lines)
+            p1_pc = self._p1_pc; p1_org = self._p1_org; p1_size = self._p1_size
+            self.symbols = {name: old_final[name] for name, rows in sym_line.items() if rows[0] < first}
+            self.pc, self.org = p1_start
+            changed = set(removed); relaid = 0; i = first
+            while i < n:
+                if i >= region_end and not changed and not full \
+                        and self.pc == p1_pc[i] and self.org == p1_org[i]:
+                    break   # ab hier ist alles wie vorher
+                p1_pc[i] = self.pc; p1_org[i] = self.org
+                ln = lines[i]; d = deps[i]
+                if ln is not None:
+                    if i < region_end or full or d is None or ln.mnem in (".EQU",".SET") \
+                            or not d.isdisjoint(changed):
+                        self._layout_line(ln); relaid += 1
+                        p1_size[i] = self.pc - p1_pc[i]
+                    else:
+                        # Größe hängt an keinem geänderten Symbol -> alte Größe
+                        if ln.label:
+                            if ln.label in self.symbols: raise ValueError(f"Label doppelt: {ln.label} (Z{ln.lineno})")
+                            self.symbols[ln.label] = self.pc
+                        self.pc += p1_size[i]
+                    if ln.label:
+                        rows = sym_line.setdefault(ln.label, [])
+                        if i not in rows: rows.append(i)
+                        if len(rows) > 1:
+                            # zweite Definition (auch hinter der Abbruchstelle) -> wie assemble()
+                            raise ValueError(f"Label doppelt: {ln.label} (Z{max(rows) + 1})")
+                        if self.symbols[ln.label] != old_final.get(ln.label): changed.add(ln.label)
+                        else: changed.discard(ln.label)
+                i += 1
+            if i < n:
+                # unveränderten Rest übernehmen (doppelte Labels trotzdem melden)
+                for name, rows in sym_line.items():
+                    if rows[0] >= i:
+                        if name in self.symbols: raise ValueError(f"Label doppelt: {name} (Z{rows[0] + 1})")
+                        self.symbols[name] = old_final[name]
+            else:
+                p1_pc[n] = self.pc; p1_org[n] = self.org
+            self.pc, self.org = p1_pc[n], p1_org[n]
+            self._final = dict(self.symbols)
+            self.stats = {"relaid": relaid}
+            return changed
+
+        def _generate(self, first: int, region_end: int, changed: set, full: bool, p2_start: int):
+            """Pass 2: nur betroffene Zeilen neu erzeugen, Rest aus dem Cache."""
+            lines = self._lines; p2_pc = self._p2_pc; emit = self._emit; n = len(lines)
+            if full:
+                targets = range(n); self._p2_org = self.pc = self.org; self._reset_segments()
+            else:
+                # neu: geänderte Zeilen, Benutzer geänderter Symbole, .ORG/PC-abhängige Zeilen
+                # Index n (Ende) nur, wenn am Ende Zeilen wegfallen: dann gibt es keine
+                # Folgezeile, an der der alte End-PC bestätigt würde
+                tset = set(range(first, min(region_end + 1, n + 1)))
+                for name in changed:
+                    for ln in self._users.get(name, {}).values(): tset.add(ln.lineno - 1)
+                for ln in self._always.values(): tset.add(ln.lineno - 1)
+                targets = sorted(tset)
+            emitted = shifted = 0; t = 0; nt = len(targets)
+            i = targets[0] if nt else n
+            if not full: self.pc = p2_start if i == first else p2_pc[i]
+            while i < n:
+                is_target = t < nt and targets[t] == i
+                if is_target: t += 1
+                elif self.pc == p2_pc[i]:
+                    # gleiche Adresse, keine geänderte Abhängigkeit: bis zum nächsten Ziel wie gehabt
+                    if t >= nt: break
+                    i = targets[t]; self.pc = p2_start if i == first else p2_pc[i]
                     continue
-                mode, ob = self.detect_mode_and_operand_bytes(mnem, ln.operand, self.pc)
-                opcode = self.spec.get_opcode(mnem, mode)
-                out.append(opcode); out.extend(ob)
-                listing.append(f"{self.pc:04X}: " + " ".join(f"{b:02X}" for b in [opcode]+ob) + f"    {mnem} {ln.operand or ''}")
-                self.rows.append((f"{self.pc:04X}", [opcode]+ob, f"{mnem} {ln.operand or ''}".strip(), ln.lineno))
-                self.pc += 1+len(ob)
+                p2_pc[i] = self.pc
+                ln = lines[i]
+                if ln is not None and ln.mnem and not is_target and ln.mnem not in BRANCHES:
+                    # nur verschoben: Bytes bleiben, Adresse in Zeile/Listing neu
+                    e = emit[i]
+                    if e is not None:
+                        addr = f"{self.pc:04X}"; row = e[0]
+                        emit[i] = ((addr, row[1], row[2], row[3]), addr + e[1][4:], e[2])
+                        self.pc += len(e[2]); shifted += 1
+                elif ln is not None and ln.mnem:
+                    old = self.symbols.get(ln.label) if ln.mnem in (".EQU",".SET") else None
+                    e = self._emit_line(ln)
+                    emit[i] = None if e is None else ((f"{e[0]:04X}", e[1], e[2], i + 1), e[3], bytes(e[1]))
+                    emitted += 1
+                    if old is not None and not full and self.symbols[ln.label] != old:
+                        # .EQU * : Wert aus Pass 2 weicht ab -> Pass 2 komplett
+                        self.symbols = dict(self._final); self.org = self._p1_org[n]
+                        return self._generate(0, n, changed, True, -1)
+                i += 1
+            if i >= n: p2_pc[n] = self.pc
+            else: self.pc = p2_pc[n]
+            self.org = self._p1_org[n]
+            self.rows = [e[0] for e in emit if e is not None]
+            listing = [e[1] for e in emit if e is not None]
+            self.stats["emitted"] = emitted; self.stats["shifted"] = shifted
+            self._result = (b"".join([e[2] for e in emit if e is not None]), self.org, listing)
+            return self._result
+
+    PROV_BASE = 0x1000   # vorläufige Basis relozierbarer Segmente (>= $0100 -> immer absolute Adressierung)
+
+    class ObjectAssembler(MiniAssembler):
+        """
+        Assembliert ein Modul zu einer ObjectFile (asm_linker) statt zu festen Bytes.
+          .SEGMENT name         relozierbares Segment (Adresse vergibt der Linker)
+          .SEGMENT name, $addr  / .ORG $addr   absolutes Segment
+          .EXPORT a, b          Symbole für andere Module
+          .IMPORT a, b          Symbole aus anderen Modulen (immer 16 Bit)
+        Code vor dem ersten .SEGMENT/.ORG liegt im relozierbaren Segment CODE.
+        Ausdrücke mit Labels relozierbarer Segmente bzw. Importen werden als
+        Relocation (Ziel + Addend; Wort, Low- oder High-Byte) abgelegt.
+        """
+        def __init__(self, spec: C6510Spec):
+            super().__init__(spec)
+            self._sym_term: Dict[str, Tuple[int, Tuple[str, str]]] = {}   # Symbol -> (addend, basis)
+            self._seg_base: Dict[str, int] = {}
+            self._reloc: set = set()
+            self._exports: List[Tuple[str, int]] = []
+            self._imports: List[str] = []
+
+        def _reset_segments(self):
+            super()._reset_segments()
+            self._seg_base = {"CODE": PROV_BASE}; self._reloc = {"CODE"}
+
+        def _open_segment(self, name: Optional[str], addr: Optional[int]):
+            if name is not None and addr is None and name not in self._seg_base:
+                addr = PROV_BASE; self._reloc.add(name)
+            elif name is not None and name in self._reloc and addr is not None:
+                raise ValueError(f"Segment {name} ist relozierbar")
+            super()._open_segment(name, addr)
+            self._seg_base.setdefault(self.seg, self.pc)
+
+        # ---------- relozierbare Ausdrücke ----------
+        def _term(self, node) -> Tuple[int, Optional[Tuple[str, str]]]:
+            """Ausdruck -> (wert|addend, basis); basis None = absolut."""
+            if node.__class__ is int: return node, None
+            tag = node[0]
+            if tag == "sym":
+                t = self._sym_term.get(node[1])
+                return t if t is not None else (self.eval_node(node), None)
+            if tag == "pc":
+                if self.seg in self._reloc: return self.pc - PROV_BASE, ("seg", self.seg)
+                return self.pc, None
+            if tag == "bin":
+                op = node[1]; a, ba = self._term(node[2]); b, bb = self._term(node[3])
+                if ba is None and bb is None: return _fold(op, a, b), None
+                if op == "+" and (ba is None or bb is None): return a + b, ba or bb
+                if op == "-" and bb is None: return a - b, ba
+                if op == "-" and ba == bb: return (a - b) & 0xFFFF, None
+                raise ValueError("Ausdruck nicht relozierbar")
+            if self._term(node[1])[1] is not None: raise ValueError("Ausdruck nicht relozierbar")
+            return self.eval_node(node), None
+
+        def _slot(self, node, width: int, offset: int) -> Optional[Relocation]:
+            hl = None
+            if node.__class__ is tuple and node[0] in ("lo", "hi"): hl, node = node[0], node[1]
+            v, base = self._term(node)
+            if base is None: return None
+            if hl and width == 2: raise ValueError("Ausdruck nicht relozierbar")
+            return Relocation(offset, hl or ("w" if width == 2 else "lo"), base, v)
+
+        def _line_relocs(self, ln: AsmLine, nbytes: int) -> List[Relocation]:
+            mnem = ln.mnem; ast = ln.ast; out: List[Optional[Relocation]] = []
+            if mnem in (".BYTE",".TEXT"):
+                off = 0
+                for kind, v in ast:
+                    if kind == "str": off += len(v)
+                    else: out.append(self._slot(v, 1, off)); off += 1
+            elif mnem == ".WORD":
+                out = [self._slot(node, 2, 2*i) for i, node in enumerate(ast)]
+            elif mnem in BRANCHES:
+                _v, base = self._term(ast)
+                here = ("seg", self.seg) if self.seg in self._reloc else None
+                if base != here: raise ValueError("Branch über Segmentgrenze")
+            else:
+                kind, node = ast
+                if kind not in ("imp", "acc"): out.append(self._slot(node, nbytes - 1, 1))
+            return [r for r in out if r is not None]
+
+        def detect_mode_and_operand_bytes(self, mnem: str, operand: Optional[str], pc: int,
+                                          parsed=None, strict: bool = True):
+            mode, ob = super().detect_mode_and_operand_bytes(mnem, operand, pc, parsed, strict)
+            if mode in ("zp", "zpx", "zpy"):
+                # relozierbare Adresse nie als Zeropage annehmen
+                kind, node = parsed if parsed is not None else classify_operand(operand)
+                try: base = self._term(node)[1]
+                except Exception: base = None
+                if base is not None:
+                    v = self.eval_node(node)
+                    mode = {"zp": "abs", "zpx": "absx", "zpy": "absy"}[mode]
+                    ob = [v & 0xFF, (v >> 8) & 0xFF]
+            return mode, ob
+
+        # ---------- Pässe ----------
+        def _layout_line(self, ln: AsmLine):
+            seg = self.seg
+            super()._layout_line(ln)
+            mnem = ln.mnem
+            if mnem == ".IMPORT":
+                for name in ln.ast:
+                    if name in self.symbols: raise ValueError(f"Label doppelt: {name} (Z{ln.lineno})")
+                    self.symbols[name] = PROV_BASE; self._sym_term[name] = (0, ("ext", name))
+                    self._imports.append(name)
+            elif mnem == ".EXPORT":
+                self._exports.extend((name, ln.lineno) for name in ln.ast)
+            if not ln.label: return
+            if mnem in (".EQU",".SET"):
+                _v, base = self._term(ln.ast)
+                if base is not None: self._sym_term[ln.label] = _v, base
+            elif seg in self._reloc:
+                self._sym_term[ln.label] = (self.symbols[ln.label] - PROV_BASE, ("seg", seg))
+
+        def assemble_object(self, text: str) -> ObjectFile:
+            lines = self.parse(text)
+            self.rows.clear(); self._sym_term.clear(); self._exports = []; self._imports = []
 
-            return bytes(out), self.org, listing
+            self.org = self.pc = PROV_BASE; self.symbols.clear(); self._reset_segments()
+            for ln in lines:
+                self._layout_line(ln)
+
+            self.pc = PROV_BASE; self._reset_segments()
+            segs: Dict[str, ObjSegment] = {}
+            for ln in lines:
+                e = self._emit_line(ln)
+                if e is None: continue
+                addr, data = e[0], e[1]
+                self.rows.append((f"{addr:04X}", data, e[2], ln.lineno))
+                seg = segs.get(self.seg)
+                if seg is None:
+                    seg = segs[self.seg] = ObjSegment(self.seg, None if self.seg in self._reloc else self._seg_base[self.seg])
+                off = addr - self._seg_base[self.seg]
+                if off < len(seg.data): raise ValueError(f"Segment {self.seg} überschreibt sich (Z{ln.lineno})")
+                seg.data.extend(bytes(off - len(seg.data)))
+                end_pc = self.pc; self.pc = addr
+                try:
+                    for r in self._line_relocs(ln, len(data)):
+                        r.offset += off; seg.relocs.append(r)
+                except ValueError as ex:
+                    raise ValueError(f"{ex} (Z{ln.lineno})")
+                self.pc = end_pc
+                seg.data.extend(data)
+
+            exports: Dict[str, Tuple[Optional[str], int]] = {}
+            for name, lineno in self._exports:
+                t = self._sym_term.get(name)
+                if t is not None:
+                    if t[1][0] == "ext": raise ValueError(f"Import kann nicht exportiert werden: {name} (Z{lineno})")
+                    exports[name] = (t[1][1], t[0])
+                elif name in self.symbols:
+                    exports[name] = (None, self.symbols[name])
+                else:
+                    raise ValueError(f"Export unbekannt: {name} (Z{lineno})")
+            return ObjectFile(list(segs.values()), exports, list(self._imports))
 
     def build_prg_with_basic_autostart(payload: bytes) -> bytes:
         LOAD_BASIC = 0x0801
@@ -10773,31 +11432,99 @@ try:
         # C64-Pro-Font stellt ASCII dar; wir mappen 32..126 als "druckbar"
         return 32 <= b <= 126
 
-    def format_dual_hex(data: bytes, base_addr: int = 0x0000) -> str:
+    # ---------- Dump-Engine: ganze Blöcke statt Byte-für-Byte ----------
+    #
+    # Hex-Spalte: bytes.hex(" ") formatiert einen ganzen Block in C; Zeile r liegt
+    # danach bei [r*3*w : r*3*w + 3*w-1] (jedes Byte = 3 Zeichen "HH ").
+    # Text-Spalte: Übersetzungstabelle für alle 256 Bytewerte, einmal pro Block
+    # angewandt (bytes.translate, bzw. str.translate bei Unicode-Glyphen).
+    # Zeilen-Template mit den Feldern addr, hex, left, right, text.
+
+    DUMP_PAGE_ROWS = 512   # Zeilen pro formatierter Seite in HexDump
+    DUMP_CACHE_PAGES = 8   # formatierte Seiten im Cache (Speicher bleibt konstant)
+
+    def make_text_table(glyph) -> "bytes | dict":
         """
-        Dual-Hex (8 Bytes/Zeile): 'AAAA: HH HH HH HH HH HH HH HH  ASCII....'
-        Mit Mittenspace zwischen den 4er-Gruppen.
+        Übersetzungstabelle aus einer Funktion Byte -> Zeichen.
+        Nur Latin-1-Einzelzeichen → bytes (für bytes.translate), sonst dict (str.translate).
+        Für HexDump muss jedes Byte genau ein Zeichen ergeben (Spaltenbreite).
         """
-        lines = []
-        for i in range(0, len(data), 8):
-            chunk = data[i:i+8]
-            addr = base_addr + i
+        chars = [glyph(b) for b in range(256)]
+        if all(len(c) == 1 and ord(c) < 256 for c in chars):
+            return bytes(ord(c) for c in chars)
+        return {b: c for b, c in enumerate(chars)}
+
+    ASCII_TABLE = make_text_table(lambda b: chr(b) if _is_printable_ascii(b) else ".")
 
-            left4  = " ".join(f"{b:02X}" for b in chunk[:4])
-            right4 = " ".join(f"{b:02X}" for b in chunk[4:8])
-            if len(chunk) < 4:
-                left4 += " " * (3 * (4 - len(chunk)))  # aufbreiten
-                right4 = ""
-            elif len(chunk) < 8:
-                right_count = len(chunk) - 4
-                right4 += " " * (3 * (4 - max(0, right_count)))
+    def translate_text(data: bytes, table) -> str:
+        if isinstance(table, bytes):
+            return data.translate(table).decode("latin-1")
+        return data.decode("latin-1").translate(table)
 
-            hex_part = f"{left4} {right4}".rstrip()
+    class HexDump:
+        """
+        Hexdump ohne Vorformatierung: Zeilen werden erst bei row()/rows() erzeugt,
+        seitenweise im Block formatiert und in einem kleinen LRU-Cache gehalten.
+        Damit formatiert eine virtuelle Ansicht nur die sichtbaren Zeilen.
+
+        template: Formatstring mit {addr} {hex} {left} {right} {text}
+                  (left/right = erste/zweite Hälfte der Hex-Spalte)
+        """
+        def __init__(self, data: bytes, base_addr: int = 0x0000, width: int = 8,
+                     template: str = "{addr:04X}: {hex:<23}  {text}",
+                     text_table=ASCII_TABLE, upper: bool = True):
+            self.data = bytes(data); self.base_addr = base_addr; self.width = width
+            self.template = template; self.text_table = text_table; self.upper = upper
+            self._pages: "OrderedDict[int, List[str]]" = OrderedDict()
+            # Template auf Positionsfelder umschreiben: map() statt format(**kw) pro Zeile
+            self._split = "{left" in template or "{right" in template
+            names = ("addr", "hex", "left", "right", "text") if self._split else ("addr", "hex", "text")
+            pos = template
+            for k, name in enumerate(names): pos = pos.replace("{" + name, "{" + str(k))
+            self._fmt = pos.format
+
+        def __len__(self) -> int:
+            return (len(self.data) + self.width - 1) // self.width
+
+        row_count = property(__len__)
+
+        def rows(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
+            """Zeilen [start, stop) in einem Durchgang formatieren (ohne Cache)."""
+            n = len(self); stop = n if stop is None else min(stop, n); start = max(0, start)
+            if start >= stop: return []
+            w = self.width; hw = 3 * (w // 2); step = 3 * w
+            chunk = self.data[start * w: stop * w]
+            cells = chunk.hex(" ")
+            if self.upper: cells = cells.upper()
+            text = translate_text(chunk, self.text_table)
+            hexes = [cells[k: k + step - 1] for k in range(0, len(cells), step)]
+            cols = [range(self.base_addr + start * w, self.base_addr + stop * w, w), hexes]
+            if self._split:
+                cols += [[h[:hw - 1] for h in hexes], [h[hw:] for h in hexes]]
+            cols.append([text[k: k + w] for k in range(0, len(text), w)])
+            return list(map(self._fmt, *cols))
+
+        def row(self, i: int) -> str:
+            """Eine Zeile; formatiert bei Bedarf die ganze Seite um i."""
+            page = i // DUMP_PAGE_ROWS
+            rows = self._pages.get(page)
+            if rows is None:
+                rows = self.rows(page * DUMP_PAGE_ROWS, (page + 1) * DUMP_PAGE_ROWS)
+                self._pages[page] = rows
+                if len(self._pages) > DUMP_CACHE_PAGES: self._pages.popitem(last=False)
+            else:
+                self._pages.move_to_end(page)
+            return rows[i - page * DUMP_PAGE_ROWS]
 
-            ascii_part = "".join(chr(b) if _is_printable_ascii(b) else "." for b in chunk)
+        def text(self) -> str:
+            return "\n".join(self.rows())
 
-            lines.append(f"{addr:04X}: {hex_part:<23}  {ascii_part}")
-        return "\n".join(lines)
+    def format_dual_hex(data: bytes, base_addr: int = 0x0000) -> str:
+        """
+        Dual-Hex (8 Bytes/Zeile): 'AAAA: HH HH HH HH HH HH HH HH  ASCII....'
+        Mit Mittenspace zwischen den 4er-Gruppen.
+        """
+        return HexDump(data, base_addr).text()
 
 
     # ---------- Mini-Disassembler (teilweise Abdeckung, erweiterbar) ----------
@@ -10907,7 +11634,7 @@ try:
         Rückgabe: reiner BASIC-Inhalt (ohne PRG-Header-Zweibyte-Ladeadresse).
         """
         # Inhalt: [TOKEN_SYS=0x9E] " " Ziffern ... 0x00 (Zeilenende)
-        text = f" SYS {code_start}"  # führendes Leerzeichen ist ok/üblich
+        text = f" {code_start}"  # führendes Leerzeichen ist ok/üblich (SYS steckt im Token)
         content = bytes([0x9E]) + text.encode("ascii") + b"\x00"
 
         # Link zur nächsten Zeile berechnen: LOAD_ADDR + (Zeilenkopf + Inhalt)
@@ -10932,12 +11659,13 @@ try:
         Achtung: PRG-Header (2 Bytes Ladeadresse) nur EINMAL vorne!
         """
         basic = build_basic_sys_stub(code_start=0)  # Platzhalter; wir berechnen gleich neu
-        # Erstmal nur BASIC bauen, um Länge zu kennen:
-        basic_len = len(basic)
-        code_start = LOAD_ADDR + basic_len  # reale Startadresse des Codes im RAM
-
-        # BASIC erneut, jetzt mit korrekter SYS-Zahl:
-        basic = build_basic_sys_stub(code_start=code_start)
+        # Länge der SYS-Zeile hängt an der Stellenzahl -> bis zum Fixpunkt:
+        code_start = LOAD_ADDR + len(basic)  # reale Startadresse des Codes im RAM
+        while True:
+            basic = build_basic_sys_stub(code_start=code_start)
+            if LOAD_ADDR + len(basic) == code_start:
+                break
+            code_start = LOAD_ADDR + len(basic)
 
         # Endgültig:
         prg = bytearray()
@@ -10946,6 +11674,282 @@ try:
         prg += assembled_code     # Code liegt direkt dahinter
         return bytes(prg), code_start
 
+    import struct
+
+    # ---------- Objektdatei ----------
+    #
+    # Ein Modul besteht aus Segmenten. Absolute Segmente (.ORG / .SEGMENT name,$addr)
+    # haben eine feste Adresse, relozierbare Segmente (.SEGMENT name) bekommen ihre
+    # Adresse erst beim Linken. Relocation = Stelle im Segment, die beim Linken mit
+    #   Ziel + Addend  (Ziel: ("seg", segmentname) | ("ext", importiertes Symbol))
+    # überschrieben wird: "w" = 16 Bit (lo/hi), "lo"/"hi" = ein Byte.
+
+    RELOC_KINDS = ("w", "lo", "hi")
+    OBJ_MAGIC   = b"C6O\x01"
+
+    @dataclass
+    class Relocation:
+        offset: int; kind: str; target: Tuple[str, str]; addend: int = 0
+
+    @dataclass
+    class ObjSegment:
+        name: str
+        org: Optional[int] = None          # None = relozierbar
+        data: bytearray = field(default_factory=bytearray)
+        relocs: List[Relocation] = field(default_factory=list)
+
+        @property
+        def relocatable(self) -> bool:
+            return self.org is None
+
+    @dataclass
+    class ObjectFile:
+        segments: List[ObjSegment] = field(default_factory=list)
+        exports: Dict[str, Tuple[Optional[str], int]] = field(default_factory=dict)  # name -> (segment|None, wert)
+        imports: List[str] = field(default_factory=list)
+        name: str = ""
+
+        def segment(self, name: str) -> ObjSegment:
+            for seg in self.segments:
+                if seg.name == name: return seg
+            raise KeyError(name)
+
+        # --- Binärformat ---
+        # Magic, Stringtabelle, Segmente (Daten + Relocations), Exporte, Importe.
+        # Alle Zahlen little endian; Addend/Exportwert als int32 (Differenzen erlaubt).
+        def to_bytes(self) -> bytes:
+            strings: List[str] = []; index: Dict[str, int] = {}
+            def sid(s: str) -> int:
+                i = index.get(s)
+                if i is None:
+                    i = index[s] = len(strings); strings.append(s)
+                return i
+            body = bytearray()
+            body += struct.pack("<H", len(self.segments))
+            seg_index = {}
+            for n, seg in enumerate(self.segments):
+                seg_index[seg.name] = n
+                body += struct.pack("<HBHH", sid(seg.name), 0 if seg.org is None else 1,
+                                    seg.org or 0, len(seg.data))
+                body += seg.data
+                body += struct.pack("<H", len(seg.relocs))
+                for r in seg.relocs:
+                    kind = RELOC_KINDS.index(r.kind) | (0x10 if r.target[0] == "ext" else 0)
+                    body += struct.pack("<HBHi", r.offset, kind, sid(r.target[1]), r.addend)
+            body += struct.pack("<H", len(self.exports))
+            for name, (seg, value) in self.exports.items():
+                body += struct.pack("<HHi", sid(name), 0xFFFF if seg is None else seg_index[seg], value)
+            body += struct.pack("<H", len(self.imports))
+            for name in self.imports:
+                body += struct.pack("<H", sid(name))
+            head = bytearray(OBJ_MAGIC)
+            head += struct.pack("<H", len(strings))
+            for s in strings:
+                raw = s.encode("utf-8"); head += bytes([len(raw)]) + raw
+            return bytes(head + body)
+
+        @classmethod
+        def from_bytes(cls, blob: bytes, name: str = "") -> "ObjectFile":
+            if blob[:4] != OBJ_MAGIC: raise ValueError("Keine Objektdatei (Magic)")
+            pos = 4
+            def take(fmt: str):
+                nonlocal pos
+                vals = struct.unpack_from(fmt, blob, pos); pos += struct.calcsize(fmt)
+                return vals
+            (nstr,) = take("<H"); strings = []
+            for _ in range(nstr):
+                n = blob[pos]; strings.append(blob[pos+1:pos+1+n].decode("utf-8")); pos += 1 + n
+            obj = cls(name=name)
+            (nseg,) = take("<H")
+            for _ in range(nseg):
+                sname, flags, org, size = take("<HBHH")
+                seg = ObjSegment(strings[sname], org if flags & 1 else None, bytearray(blob[pos:pos+size]))
+                pos += size
+                (nrel,) = take("<H")
+                for _ in range(nrel):
+                    off, kind, target, addend = take("<HBHi")
+                    seg.relocs.append(Relocation(off, RELOC_KINDS[kind & 0x0F],
+                                                 ("ext" if kind & 0x10 else "seg", strings[target]), addend))
+                obj.segments.append(seg)
+            (nexp,) = take("<H")
+            for _ in range(nexp):
+                sname, seg, value = take("<HHi")
+                obj.exports[strings[sname]] = (None if seg == 0xFFFF else obj.segments[seg].name, value)
+            (nimp,) = take("<H")
+            for _ in range(nimp):
+                obj.imports.append(strings[take("<H")[0]])
+            return obj
+
+        def save(self, path: str):
+            with open(path, "wb") as f:
+                f.write(self.to_bytes())
+
+        @classmethod
+        def load(cls, path: str) -> "ObjectFile":
+            with open(path, "rb") as f:
+                return cls.from_bytes(f.read(), name=os.path.basename(path))
+
+    def load_or_assemble(src_path: str, spec, obj_path: Optional[str] = None) -> ObjectFile:
+        """Objektdatei aus dem Cache, neu assembliert nur wenn die Quelle neuer ist."""
+        obj_path = obj_path or os.path.splitext(src_path)[0] + ".o"
+        try:
+            if os.path.getmtime(obj_path) >= os.path.getmtime(src_path):
+                return ObjectFile.load(obj_path)
+        except (OSError, ValueError, struct.error):
+            pass
+        with open(src_path, "r", encoding="utf-8") as f:
+            obj = ObjectAssembler(spec).assemble_object(f.read())
+        obj.name = os.path.basename(src_path)
+        obj.save(obj_path)
+        return obj
+
+    # ---------- Linker ----------
+
+    @dataclass
+    class LinkedImage:
+        chunks: List[Tuple[int, bytes]]          # (adresse, bytes), nach Adresse sortiert
+        symbols: Dict[str, int]
+        entry: Optional[int] = None
+        segments: Dict[str, int] = field(default_factory=dict)   # relozierbares Segment -> Adresse
+
+        @property
+        def start(self) -> int:
+            return self.chunks[0][0] if self.chunks else 0
+
+        @property
+        def end(self) -> int:
+            return max((a + len(d) for a, d in self.chunks), default=0)
+
+        def to_raw(self, fill: int = 0x00) -> bytes:
+            """Speicherabbild von der niedrigsten bis zur höchsten Adresse, Lücken gefüllt."""
+            start = self.start
+            out = bytearray([fill & 0xFF]) * (self.end - start)
+            for addr, data in self.chunks:
+                out[addr - start:addr - start + len(data)] = data
+            return bytes(out)
+
+        def to_prg(self, fill: int = 0x00) -> bytes:
+            return _le16(self.start) + self.to_raw(fill)
+
+    def chunks_from_rows(rows) -> List[Tuple[int, bytes]]:
+        """MiniAssembler.rows -> zusammenhängende Speicherbereiche (adresse, bytes)."""
+        parts: List[Tuple[int, bytearray]] = []
+        ends: Dict[int, int] = {}            # Endadresse -> Index in parts
+        for addr_str, bytes_list, _text, _src in rows:
+            addr = int(addr_str, 16)
+            i = ends.pop(addr, None)
+            if i is None:
+                i = len(parts); parts.append((addr, bytearray()))
+            start, data = parts[i]
+            data.extend(bytes_list)
+            ends[start + len(data)] = i
+        return sorted((a, bytes(d)) for a, d in parts)
+
+    def _merge_adjacent(chunks: List[Tuple[int, bytes]]) -> List[Tuple[int, bytes]]:
+        out: List[Tuple[int, bytes]] = []
+        for addr, data in chunks:
+            if out and out[-1][0] + len(out[-1][1]) == addr:
+                out[-1] = (out[-1][0], out[-1][1] + data)
+            else:
+                out.append((addr, data))
+        return out
+
+    def _check_overlap(chunks: List[Tuple[int, bytes]]):
+        for (a, da), (b, _db) in zip(chunks, chunks[1:]):
+            if a + len(da) > b:
+                raise ValueError(f"Segmente überlappen: ${a:04X}-${a + len(da) - 1:04X} und ${b:04X}")
+
+    def link_chunks(chunks: List[Tuple[int, bytes]]) -> LinkedImage:
+        """Absolute Bereiche (z. B. aus chunks_from_rows) zu einem Abbild."""
+        chunks = sorted(chunks)
+        _check_overlap(chunks)
+        return LinkedImage(_merge_adjacent(chunks), {})
+
+    def link(objects: List[ObjectFile], base: int = 0x1000, layout: Optional[Dict[str, int]] = None,
+             entry: Optional[str] = None) -> LinkedImage:
+        """
+        Legt die Segmente aller Module an und löst Relocations auf.
+          - absolute Segmente bleiben an ihrer Adresse,
+          - gleichnamige relozierbare Segmente werden in Modulreihenfolge
+            aneinandergehängt; layout[name] legt die Startadresse fest, sonst folgt
+            das Segment direkt auf das vorherige (Beginn bei base),
+          - entry: exportiertes Symbol für den Einsprung (sonst Beginn des ersten
+            relozierbaren Segments bzw. niedrigste Adresse).
+        """
+        layout = layout or {}
+        groups: Dict[str, List[Tuple[int, ObjSegment]]] = {}
+        for m, obj in enumerate(objects):
+            for seg in obj.segments:
+                if seg.relocatable: groups.setdefault(seg.name, []).append((m, seg))
+
+        # Adressen: (modul, segment) -> Basis
+        bases: Dict[Tuple[int, str], int] = {}
+        seg_addr: Dict[str, int] = {}
+        cursor = base
+        for name, pieces in groups.items():
+            addr = seg_addr[name] = layout.get(name, cursor)
+            for m, seg in pieces:
+                bases[(m, name)] = addr; addr += len(seg.data)
+            cursor = addr
+        for m, obj in enumerate(objects):
+            for seg in obj.segments:
+                if not seg.relocatable: bases[(m, seg.name)] = seg.org
+
+        # globale Symbole
+        symbols: Dict[str, int] = {}
+        for m, obj in enumerate(objects):
+            for name, (seg, value) in obj.exports.items():
+                if name in symbols:
+                    raise ValueError(f"Symbol doppelt exportiert: {name} ({obj.name or m})")
+                symbols[name] = (value if seg is None else bases[(m, seg)] + value) & 0xFFFF
+
+        # Relocations anwenden
+        chunks: List[Tuple[int, bytes]] = []
+        for m, obj in enumerate(objects):
+            for seg in obj.segments:
+                data = bytearray(seg.data)
+                for r in seg.relocs:
+                    kind, name = r.target
+                    if kind == "seg": target = bases[(m, name)]
+                    else:
+                        target = symbols.get(name)
+                        if target is None:
+                            raise ValueError(f"Unaufgelöstes Symbol: {name} ({obj.name or m})")
+                    v = (target + r.addend) & 0xFFFF
+                    if r.kind == "w": data[r.offset] = v & 0xFF; data[r.offset+1] = v >> 8
+                    elif r.kind == "lo": data[r.offset] = v & 0xFF
+                    else: data[r.offset] = v >> 8
+                if data: chunks.append((bases[(m, seg.name)], bytes(data)))
+        chunks.sort()
+        _check_overlap(chunks)
+        chunks = _merge_adjacent(chunks)
+
+        if entry is not None:
+            if entry not in symbols: raise ValueError(f"Einsprung nicht exportiert: {entry}")
+            start = symbols[entry]
+        elif groups:
+            start = seg_addr[next(iter(groups))]
+        else:
+            start = chunks[0][0] if chunks else None
+        return LinkedImage(chunks, symbols, start, seg_addr)
+
+    def link_prg_with_basic_autostart(objects: List[ObjectFile], layout: Optional[Dict[str, int]] = None,
+                                      entry: Optional[str] = None) -> Tuple[bytes, LinkedImage]:
+        """
+        BASIC-Zeile "10 SYS <einsprung>" ab $0801, relozierbare Segmente direkt dahinter.
+        Die Länge der SYS-Zeile hängt an der Einsprungadresse -> bis zum Fixpunkt linken.
+        """
+        base = LOAD_ADDR + len(build_basic_sys_stub(0))
+        for _ in range(8):
+            image = link(objects, base=base, layout=layout, entry=entry)
+            stub = build_basic_sys_stub(image.entry if image.entry is not None else base)
+            if LOAD_ADDR + len(stub) == base: break
+            base = LOAD_ADDR + len(stub)
+        chunks = sorted(image.chunks + [(LOAD_ADDR, stub)])
+        _check_overlap(chunks)
+        image.chunks = _merge_adjacent(chunks)
+        return image.to_prg(), image
+
     def tokenize(s: str):
         pos=0
         while pos < len(s):
@@ -11965,7 +12969,20 @@ try:
             self.assembler = MiniAssembler(self.spec)
             
             self._last_payload = None
+            self._last_org = None
+            self._hex_text_table = None   # Glyph-Tabelle für die TEXT-Spalte (make_text_table)
             self._last_rows = []
+
+            # Live-Assemble: hält Zeilen/Symbole zwischen den Tastendrücken,
+            # assembliert nach kurzer Pause nur die geänderten Zeilen neu
+            self.live_assemble = True
+            self.live_assembler = IncrementalAssembler(self.spec)
+            self._live_timer = QTimer(self)
+            self._live_timer.setSingleShot(True)
+            self._live_timer.setInterval(150)
+            self._live_timer.timeout.connect(self._live_assemble)
+            for ed in (self.runtime_pre_editor, self.asm_out_editor, self.runtime_post_editor):
+                ed.textChanged.connect(self._schedule_live_assemble)
             
             self._apply_c64_font()
 
@@ -12010,18 +13027,12 @@ try:
             return "\n".join(parts) + "\n"
             
         def _refresh_hex_main(self, base_addr: int, data: bytes):
-            lines = []
-            lines.append("ADDR  00 01 02 03 | 04 05 06 07  TEXT(8)")
-            lines.append("-"*64)
-            for i in range(0, len(data), 8):
-                chunk = data[i:i+8]
-                left  = " ".join(f"{b:02X}" for b in chunk[:4]).ljust(11)
-                right = " ".join(f"{b:02X}" for b in chunk[4:8]).ljust(11)
-                txt_raw = "".join(self._glyph_for_byte(b) for b in chunk)[:8].ljust(8)
-                txt = htmlmod.escape(txt_raw)
-                addr = base_addr + i
-                lines.append(f"{addr:04X}  {left} | {right}  {txt}")
-            self.hex_view.setHtml(self._html_pre("\n".join(lines)))
+            if self._hex_text_table is None:
+                self._hex_text_table = make_text_table(self._glyph_for_byte)
+            dump = HexDump(data, base_addr, template="{addr:04X}  {left:<11} | {right:<11}  {text:<8}",
+                           text_table=self._hex_text_table)
+            lines = ["ADDR  00 01 02 03 | 04 05 06 07  TEXT(8)", "-"*64] + dump.rows()
+            self.hex_view.setHtml(self._html_pre(htmlmod.escape("\n".join(lines))))
 
         def _resolve_operand_numeric(self, operand_str: str) -> str:
             # gleiche Logik wie im Upload, kurzgefasst:
@@ -12371,8 +13382,27 @@ try:
             # self.assembler.ignore_org = True/False
             # self.assembler.org = gewünschter Start (bei „Variante A“ später egal)
             payload, org, listing_lines = self.assembler.assemble(asm_text)
+            self._show_assembly(payload, org, self.assembler.rows)
+
+        def _schedule_live_assemble(self, *_):
+            if self.live_assemble:
+                self._live_timer.start()   # neu starten = entprellen
+
+        def _live_assemble(self):
+            try:
+                payload, org, _listing = self.live_assembler.update(self._compose_final_asm())
+            except Exception as e:
+                # während des Tippens ist die Quelle oft unvollständig -> nur Hinweis am Listing
+                self.listings_view.setToolTip(f"Assemble: {e}")
+                return
+            self.listings_view.setToolTip("")
+            self._show_assembly(payload, org, self.live_assembler.rows)
+
+        def _show_assembly(self, payload: bytes, org: int, rows):
+            hex_changed = payload != self._last_payload or org != self._last_org
             self._last_payload = payload
-            self._last_rows = self.assembler.rows
+            self._last_org = org
+            self._last_rows = rows
             self._last_listing_source = "asm"  # <— wichtig
 
             # Anzeige: Code-Start = BASIC-Stub-Ende (wird beim PRG-Build bestimmt)
@@ -12381,8 +13411,9 @@ try:
             #self._refresh_hex_main(code_start_for_view, payload)
             #self._refresh_hex_instr(self._last_rows)
             
-            # Hex links (wie gehabt)
-            self._refresh_hex_main(org, payload)
+            # Hex links (wie gehabt) - nur neu rendern, wenn sich Bytes/Start geändert haben
+            if hex_changed:
+                self._refresh_hex_main(org, payload)
             # Listing unten: aus rows → Text + Mapping
             lines_with_src = self._rows_to_listing_lines(self._last_rows)
             self._set_listing_text_with_map(lines_with_src)
@@ -14755,15 +15786,14 @@ try:
         
         def set_hex_data(self, data):
             self.hex_data = data.hex()
-            formatted_lines = []
             
-            # 8 Spalten zu je 2 Zeichen mit Trennzeichen nach Spalte 4
-            for i in range(0, len(self.hex_data), 16):  # 8 Spalten * 2 Zeichen = 16
-                line = " ".join(self.hex_data[j:j+2] for j in range(i, i+16, 2))
-                # Füge Trennzeichen nach Spalte 4 ein
-                split_line = line.split(" ")
-                formatted_line = " ".join(split_line[:4]) + " | " + " ".join(split_line[4:])
-                formatted_lines.append(formatted_line)
+            # 8 Spalten zu je 2 Zeichen mit Trennzeichen nach Spalte 4;
+            # volle Zeilen im Block (HexDump), nur die angebrochene Schlusszeile einzeln
+            full = len(data) // 8 * 8
+            formatted_lines = HexDump(data[:full], template="{left} | {right}", upper=False).rows()
+            if full < len(data):
+                split_line = [f"{b:02x}" for b in data[full:]] + [""] * (8 - (len(data) - full))
+                formatted_lines.append(" ".join(split_line[:4]) + " | " + " ".join(split_line[4:]))
             
             self.setPlainText("\n".join(formatted_lines))
         
@@ -14858,26 +15888,52 @@ try:
             
             self.asc_data = ""
         
+        @staticmethod
+        def to_printable(byte):
+            if 0x20 <= byte <= 0x7E:  # Printable ASCII
+                return chr(byte)
+            elif byte == 0x09:  # Tab
+                return "\t"
+            elif byte == 0x0A:  # Line Feed
+                return "\n"
+            elif byte == 0x0D:  # Carriage Return
+                return "\r"
+            else:
+                return f"<{byte:02X}>"
+        
+        # Übersetzungstabelle für alle 256 Bytewerte (einmal je Klasse)
+        text_table = make_text_table(to_printable.__func__)
+        
         def set_asc_data(self, data):
             self.asc_data = data
-            def to_printable(byte):
-                if 0x20 <= byte <= 0x7E:  # Printable ASCII
-                    return chr(byte)
-                elif byte == 0x09:  # Tab
-                    return "\t"
-                elif byte == 0x0A:  # Line Feed
-                    return "\n"
-                elif byte == 0x0D:  # Carriage Return
-                    return "\r"
-                else:
-                    return f"<{byte:02X}>"
             
-            # Konvertiere die Bytes
-            printable_text = "".join(to_printable(b) for b in data)
+            # Konvertiere die Bytes (ein translate-Durchgang statt Byte-für-Byte)
+            printable_text = translate_text(bytes(data), self.text_table)
             
             # Setze den Text in die QPlainTextEdit
             self.setPlainText(printable_text)
 
+    class HexDumpListModel(QAbstractListModel):
+        # ------------------------------------------------------------
+        # Listenmodell über einem HexDump: die View fragt nur sichtbare
+        # Zeilen ab, HexDump formatiert sie seitenweise bei Bedarf.
+        # ------------------------------------------------------------
+        def __init__(self, dump=None, parent=None):
+            super(HexDumpListModel, self).__init__(parent)
+            self._dump = dump if dump is not None else HexDump(b"")
+        
+        def rowCount(self, parent=QModelIndex()):
+            return 0 if parent.isValid() else len(self._dump)
+        
+        def data(self, index, role=Qt.DisplayRole):
+            if role == Qt.DisplayRole and index.isValid():
+                return self._dump.row(index.row())
+        
+        def set_dump(self, dump):
+            self.beginResetModel()
+            self._dump = dump
+            self.endResetModel()
+
     class HexViewer(QWidget):
         def __init__(self, parent=None):
             super(HexViewer, self).__init__(parent)
@@ -14940,7 +15996,17 @@ try:
             splitter.addWidget(self.hex_widget)
             splitter.addWidget(self.asc_edit)
             
+            # Große Dateien: virtuelle Liste (nur sichtbare Zeilen werden formatiert)
+            self.dump_model = HexDumpListModel()
+            self.dump_view  = QListView()
+            self.dump_view.setFont(QFont("Consolas", 10))
+            self.dump_view.setUniformItemSizes(True)
+            self.dump_view.setModel(self.dump_model)
+            self.dump_view.hide()
+            
             layout.addWidget(splitter)
+            layout.addWidget(self.dump_view)
+            self.splitter = splitter
             
             # Initialisierung der Daten
             self.hex_data = ""
@@ -14951,9 +16017,20 @@ try:
             
             self.setLayout(layout)
         
+        # ab dieser Größe (Bytes) statt Text-Editoren die virtuelle Liste
+        VIRTUAL_THRESHOLD = 256 * 1024
+        
         def set_data(self, dat):
-            self.hex_edit.set_hex_data(dat)
-            self.asc_edit.set_asc_data(dat)
+            if len(dat) > self.VIRTUAL_THRESHOLD:
+                self.hex_edit.set_hex_data(b"")
+                self.asc_edit.set_asc_data(b"")
+                self.dump_model.set_dump(HexDump(dat, template="{addr:08X}  {left:<11} | {right:<11}  {text}"))
+                self.splitter.hide(); self.dump_view.show()
+            else:
+                self.dump_model.set_dump(HexDump(b""))
+                self.dump_view.hide(); self.splitter.show()
+                self.hex_edit.set_hex_data(dat)
+                self.asc_edit.set_asc_data(dat)
     
     class DelegateButton(QStyledItemDelegate):
         def paint(self, painter, option, index):
@@ -16154,6 +17231,392 @@ try:
             sys.exit(genv.EXIT_FAILURE)
         return result
 
+    # ---------- Zeichenzellen-Bildschirm für die Konsolenfenster ----------
+    #
+    # Statt HTML pro Zelle: drei flache Puffer (Zeichen, Vordergrund-, Hinter-
+    # grundindex) mit cols*rows Einträgen, Zeile y liegt bei [y*cols : (y+1)*cols].
+    # Farben stehen einmal in der Palette, die Zellen halten nur den Index.
+    # Jede Änderung vergrößert das Dirty-Rechteck; der Zeichner holt es einmal
+    # pro Frame mit take_dirty() ab und malt nur diese Zellen neu.
+
+    class ConsoleScreen:
+        """
+        cols x rows Zeichenzellen mit Farbindex je Zelle und Dirty-Rechteck.
+        palette: Liste der Farbnamen ("#RRGGBB"), color() ergänzt neue Farben.
+        """
+        def __init__(self, cols: int, rows: int, fg: str = "#C0C0C0", bg: str = "#000000"):
+            self.cols = cols; self.rows = rows
+            self.palette: List[str] = []; self._index = {}
+            self.fg = self.color(fg); self.bg = self.color(bg)
+            self.chars: List[str] = []; self.fgs = bytearray(); self.bgs = bytearray()
+            self.dirty: Optional[Tuple[int, int, int, int]] = None
+            self.clear()
+
+        def color(self, name: str) -> int:
+            """Palettenindex für einen Farbnamen (Groß/Klein egal), neu angelegt falls nötig."""
+            key = name.upper(); idx = self._index.get(key)
+            if idx is None:
+                if len(self.palette) >= 256: raise ValueError("Palette voll (max. 256 Farben)")
+                idx = self._index[key] = len(self.palette); self.palette.append(key)
+            return idx
+
+        def set_colors(self, fg: str, bg: str) -> None:
+            self.fg = self.color(fg); self.bg = self.color(bg)
+
+        # ---------- Dirty-Rechteck (Zellen, x1/y1 exklusiv) ----------
+
+        def touch(self, x0: int, y0: int, x1: int, y1: int) -> None:
+            d = self.dirty
+            if d is None: self.dirty = (x0, y0, x1, y1)
+            else: self.dirty = (min(d[0], x0), min(d[1], y0), max(d[2], x1), max(d[3], y1))
+
+        def touch_all(self) -> None:
+            self.dirty = (0, 0, self.cols, self.rows)
+
+        def take_dirty(self) -> Optional[Tuple[int, int, int, int]]:
+            d = self.dirty; self.dirty = None
+            return d
+
+        # ---------- Schreiben ----------
+
+        def clear(self) -> None:
+            n = self.cols * self.rows
+            self.chars = [" "] * n
+            self.fgs = bytearray([self.fg]) * n; self.bgs = bytearray([self.bg]) * n
+            self.touch_all()
+
+        def put_text(self, x: int, y: int, text: str, fg: Optional[int] = None, bg: Optional[int] = None) -> int:
+            """
+            text ab Spalte x in Zeile y schreiben, am Zeilenende abgeschnitten
+            (kein Umbruch). x < 0 zählt als 0, y < 0 schreibt nichts.
+            Rückgabe: Anzahl geschriebener Zellen.
+            """
+            if y < 0: return 0
+            if y >= self.rows: raise IndexError(f"Zeile {y} außerhalb 0..{self.rows - 1}")
+            x = max(x, 0); n = min(len(text), self.cols - x)
+            if n <= 0: return 0
+            fg = self.fg if fg is None else fg; bg = self.bg if bg is None else bg
+            i = y * self.cols + x
+            self.chars[i:i + n] = text[:n]
+            self.fgs[i:i + n] = bytes((fg,)) * n; self.bgs[i:i + n] = bytes((bg,)) * n
+            self.touch(x, y, x + n, y + 1)
+            return n
+
+        def scroll(self, lines: int = 1) -> None:
+            """Inhalt um lines Zeilen nach oben schieben, unten Leerzeilen in den aktuellen Farben."""
+            lines = min(max(lines, 0), self.rows)
+            if not lines: return
+            k = lines * self.cols; n = self.cols * self.rows
+            self.chars[:n - k] = self.chars[k:]; self.chars[n - k:] = [" "] * k
+            self.fgs[:n - k] = self.fgs[k:]; self.fgs[n - k:] = bytes((self.fg,)) * k
+            self.bgs[:n - k] = self.bgs[k:]; self.bgs[n - k:] = bytes((self.bg,)) * k
+            self.touch_all()
+
+        # ---------- Lesen ----------
+
+        def row_text(self, y: int) -> str:
+            return "".join(self.chars[y * self.cols:(y + 1) * self.cols])
+
+        def text(self) -> str:
+            return "\n".join(self.row_text(y).rstrip() for y in range(self.rows))
+
+        def runs(self, y: int, x0: int = 0, x1: Optional[int] = None) -> Iterator[Tuple[int, int, int, int]]:
+            """Zeile y in Läufe gleicher Farbe zerlegen -> (x_start, x_end, fg, bg), x_end exklusiv."""
+            x1 = self.cols if x1 is None else x1
+            base = y * self.cols; fgs = self.fgs; bgs = self.bgs
+            start = x0
+            while start < x1:
+                f = fgs[base + start]; b = bgs[base + start]; end = start + 1
+                while end < x1 and fgs[base + end] == f and bgs[base + end] == b: end += 1
+                yield start, end, f, b
+                start = end
+
+    # ---------- Glyph-Atlas aus dem Zeichensatz-ROM (chargen) ----------
+    #
+    # Beide ROM-Bänke (Groß/Grafik und Klein/Groß) mit je 256 Bildschirmcodes,
+    # 128..255 = Revers-Darstellung, als ein 1-Bit-Bild: 32 Glyphen je Zeile,
+    # 16 Glyphzeilen -> 256 x 128 Pixel. Glyph g = Bank * 256 + Bildschirmcode
+    # liegt bei ((g % 32) * 8, (g // 32) * 8).
+    #
+    # Der Atlas wird einmal gebaut und als PBM (P4, 1 Bit/Pixel, MSB links) unter
+    # __cache__ abgelegt; QImage lädt das Format direkt, ohne PIL und ohne Font.
+    # Neu gebaut wird nur, wenn eine Quelle neuer ist als die Cache-Datei.
+
+    PETSCII_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+    PETSCII_SOURCES = (os.path.join(PETSCII_BASE_DIR, "petscii_upper_normal.json"),
+                       os.path.join(PETSCII_BASE_DIR, "petscii_lower_normal.json"))
+    PETSCII_ATLAS_CACHE = os.path.join(PETSCII_BASE_DIR, "__cache__", "petscii_atlas.pbm")
+
+    ATLAS_COLS = 32                     # Glyphen je Atlaszeile
+    ATLAS_GLYPHS = 512                  # 2 Bänke x 256 Bildschirmcodes
+    ATLAS_WIDTH = ATLAS_COLS * 8
+    ATLAS_HEIGHT = ATLAS_GLYPHS // ATLAS_COLS * 8
+    BANK_UPPER, BANK_LOWER = 0, 1
+
+    # ---------- Quellen: ROM-Abbild oder die vorhandenen JSON-Sätze ----------
+
+    def read_chargen(path: str) -> bytes:
+        """chargen-ROM (4 KB: Bank oben/unten, oder 8 KB: erste 4 KB) -> 4096 Bytes."""
+        with open(path, "rb") as f: data = f.read()
+        if len(data) not in (4096, 8192):
+            raise ValueError(f"Unerwartete ROM-Größe {len(data)} (4096 oder 8192 Bytes)")
+        return data[:4096]
+
+    def chargen_from_json(upper_path: str, lower_path: str) -> bytes:
+        """
+        4 KB chargen aus petscii_upper_normal.json/petscii_lower_normal.json
+        (Bildschirmcode -> 8 Hex-Zeilen). Die JSON-Sätze enthalten nur die Codes
+        0..127 (128..255 = code & 0x7F), die Revers-Hälfte wird invertiert.
+        """
+        out = bytearray()
+        for path in (upper_path, lower_path):
+            with open(path, "r", encoding="utf-8") as f: glyphs = json.load(f)["bytes"]
+            bank = bytearray()
+            for code in range(128):
+                rows = glyphs.get(f"{code:02X}", ["00"] * 8)
+                bank += bytes(int(r, 16) for r in rows[:8]).ljust(8, b"\x00")
+            out += bank + bytes(b ^ 0xFF for b in bank)
+        return bytes(out)
+
+    def load_chargen(source: Optional[str] = None) -> bytes:
+        """source: ROM-Datei; None = JSON-Sätze neben diesem Modul."""
+        return read_chargen(source) if source else chargen_from_json(*PETSCII_SOURCES)
+
+    # ---------- Atlas bauen / cachen ----------
+
+    def build_atlas(chargen: bytes) -> bytes:
+        """4096 Bytes chargen -> Atlas-Bitmap, ATLAS_HEIGHT Zeilen à ATLAS_COLS Bytes."""
+        if len(chargen) != 4096: raise ValueError("chargen muss 4096 Bytes haben")
+        out = bytearray()
+        for first in range(0, ATLAS_GLYPHS, ATLAS_COLS):
+            block = chargen[first * 8:(first + ATLAS_COLS) * 8]
+            for line in range(8): out += block[line::8]
+        return bytes(out)
+
+    def write_pbm(path: str, bits: bytes, width: int = ATLAS_WIDTH, height: int = ATLAS_HEIGHT) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(b"P4\n# petscii atlas\n%d %d\n" % (width, height)); f.write(bits)
+        os.replace(tmp, path)
+
+    def read_pbm(path: str) -> Tuple[int, int, bytes]:
+        with open(path, "rb") as f: data = f.read()
+        fields: List[bytes] = []; pos = 0
+        while len(fields) < 3:
+            while data[pos:pos + 1].isspace(): pos += 1
+            if data[pos:pos + 1] == b"#": pos = data.index(b"\n", pos); continue
+            end = pos
+            while not data[end:end + 1].isspace(): end += 1
+            fields.append(data[pos:end]); pos = end
+        if fields[0] != b"P4": raise ValueError(f"{path}: kein P4-PBM")
+        width, height = int(fields[1]), int(fields[2])
+        bits = data[pos + 1:pos + 1 + (width + 7) // 8 * height]
+        if len(bits) != (width + 7) // 8 * height: raise ValueError(f"{path}: PBM zu kurz")
+        return width, height, bits
+
+    def atlas_path(source: Optional[str] = None, cache: str = PETSCII_ATLAS_CACHE) -> str:
+        """
+        Pfad der Atlas-Datei; baut sie (neu), wenn sie fehlt, ungültig oder älter
+        als die Quelle ist.
+        """
+        sources = (source,) if source else PETSCII_SOURCES
+        try:
+            stamp = os.path.getmtime(cache)
+            if all(os.path.getmtime(s) <= stamp for s in sources):
+                width, height, _bits = read_pbm(cache)
+                if (width, height) == (ATLAS_WIDTH, ATLAS_HEIGHT): return cache
+        except (OSError, ValueError):
+            pass
+        write_pbm(cache, build_atlas(load_chargen(source)))
+        return cache
+
+    # ---------- Zeichen -> Glyph ----------
+    #
+    # Text kommt als Python-str (ASCII aus BASIC-Programmen, Tastatur). Abbildung
+    # auf Bildschirmcodes wie beim C64: '@A-Z[£]↑←' = 0..31, ' '..'?' = 32..63;
+    # im Klein/Groß-Satz a-z = 1..26, A-Z = 65..90.
+
+    def _screen_codes(bank: int) -> Dict[str, int]:
+        table = {chr(0x40 + c): c for c in range(32)}               # @ A..Z [ \ ] ^ _
+        table.update({chr(c): c for c in range(0x20, 0x40)})        # ' '..'?'
+        table.update({"£": 0x1C, "↑": 0x1E, "←": 0x1F, "π": 0x5E})
+        table.update({chr(0x60 + c): c for c in range(1, 27)})      # a..z (Groß/Grafik: als A..Z)
+        if bank == BANK_LOWER:
+            table.update({chr(0x40 + c): 0x40 + c for c in range(1, 27)})  # A..Z
+        return table
+
+    PETSCII_SCREEN_CODES = (_screen_codes(BANK_UPPER), _screen_codes(BANK_LOWER))
+
+    def glyph_index(ch: str, bank: int = BANK_UPPER, reverse: bool = False) -> Optional[int]:
+        """Atlas-Index für ein Zeichen, None wenn es im Zeichensatz nicht vorkommt."""
+        code = PETSCII_SCREEN_CODES[bank].get(ch)
+        if code is None: return None
+        return bank * 256 + (code | 0x80 if reverse else code)
+
+    def glyph_origin(index: int) -> Tuple[int, int]:
+        return (index % ATLAS_COLS) * 8, (index // ATLAS_COLS) * 8
+
+    # ---------------------------------------------------------------------------
+    # \brief glyph cache for the console windows: every (char, color) pair is
+    #        rendered once with the widget font into a pixmap of one cell, after
+    #        that a character is a single drawPixmap() without text layout.
+    #
+    # \param  font        - QFont of the console
+    # \param  cell_width  - width  of one cell in pixel
+    # \param  cell_height - height of one cell in pixel
+    # ---------------------------------------------------------------------------
+    class ConsoleGlyphCache:
+        def __init__(self, font, cell_width, cell_height):
+            self.font        = QFont(font)
+            self.cell_width  = cell_width
+            self.cell_height = cell_height
+            self.ascent      = QFontMetrics(self.font).ascent()
+            self.glyphs      = {}
+        
+        def glyph(self, ch, color):
+            key    = (ch, color.rgba())
+            pixmap = self.glyphs.get(key)
+            if pixmap is None:
+                pixmap = QPixmap(self.cell_width, self.cell_height)
+                pixmap.fill(Qt.transparent)
+                painter = QPainter(pixmap)
+                painter.setFont(self.font)
+                painter.setPen (color)
+                painter.drawText(0, self.ascent, ch)
+                painter.end()
+                self.glyphs[key] = pixmap
+            return pixmap
+        
+        def draw(self, painter, x, y, ch, color):
+            painter.drawPixmap(x, y, self.glyph(ch, color))
+
+    # ---------------------------------------------------------------------------
+    # \brief glyphs from the PETSCII atlas (chargen ROM, see atlas_path()):
+    #        the 1-bit atlas is scaled once to the cell size; per text color
+    #        one pixmap of the whole atlas is made by replacing the two entry
+    #        color table (0 = transparent, 1 = color). a character is then one
+    #        drawPixmap() of a sub-rect - no font, no text layout. characters
+    #        without PETSCII glyph are drawn by the fallback (font) cache.
+    #
+    # \param  bank     - BANK_UPPER (upper/graphics) or BANK_LOWER (lower/upper)
+    # \param  fallback - ConsoleGlyphCache for other characters, or None
+    # ---------------------------------------------------------------------------
+    class PetsciiGlyphAtlas:
+        def __init__(self, cell_width, cell_height, bank=BANK_UPPER, fallback=None, path=None):
+            image = QImage(path or atlas_path())
+            if image.isNull():
+                raise ValueError("PETSCII atlas could not be loaded.")
+            
+            self.cell_width  = cell_width
+            self.cell_height = cell_height
+            self.bank        = bank
+            self.fallback    = fallback
+            self.pixmaps     = {}
+            self.image       = image.convertToFormat(QImage.Format_Mono).scaled(
+                ATLAS_COLS * cell_width,
+                ATLAS_GLYPHS // ATLAS_COLS * cell_height,
+                Qt.IgnoreAspectRatio, Qt.FastTransformation)
+        
+        def pixmap(self, color):
+            key    = color.rgba()
+            pixmap = self.pixmaps.get(key)
+            if pixmap is None:
+                image = QImage(self.image)
+                image.setColorTable([0, key])
+                pixmap = self.pixmaps[key] = QPixmap.fromImage(image)
+            return pixmap
+        
+        def draw(self, painter, x, y, ch, color, reverse=False):
+            index = glyph_index(ch, self.bank, reverse)
+            if index is None:
+                if self.fallback:
+                    self.fallback.draw(painter, x, y, ch, color)
+                return
+            painter.drawPixmap(x, y, self.pixmap(color),
+                (index % ATLAS_COLS)  * self.cell_width,
+                (index // ATLAS_COLS) * self.cell_height,
+                self.cell_width, self.cell_height)
+
+    # ---------------------------------------------------------------------------
+    # \brief paints a ConsoleScreen into the viewport of a console window.
+    #        changes are collected in the dirty rectangle of the screen and
+    #        flushed once per frame (FRAME_MS) as a single update() call, so a
+    #        program printing in a loop does not redraw the window per line.
+    #        paint() draws only the cells inside the exposed rectangle: the
+    #        background as one fillRect() per color run, the characters from
+    #        the glyph cache.
+    #
+    # \param  widget - the console window (QAbstractScrollArea)
+    # \param  screen - ConsoleScreen with the cell buffers
+    # \param  origin - pixel offset of cell (0,0) in the viewport
+    # \param  glyphs - glyph source with draw(); default: font glyph cache
+    # ---------------------------------------------------------------------------
+    class ConsoleRenderer:
+        FRAME_MS = 16
+        
+        def __init__(self, widget, screen, font, cell_width, cell_height, origin=(0, 0), glyphs=None):
+            self.widget      = widget
+            self.screen      = screen
+            self.glyphs      = glyphs or ConsoleGlyphCache(font, cell_width, cell_height)
+            self.cell_width  = cell_width
+            self.cell_height = cell_height
+            self.origin_x, self.origin_y = origin
+            self.colors      = []       # QColor je Palettenindex
+            
+            self.frame_timer = QTimer(widget)
+            self.frame_timer.setSingleShot(True)
+            self.frame_timer.setInterval(self.FRAME_MS)
+            self.frame_timer.timeout.connect(self.flush)
+        
+        # ------------------------------------------------
+        # Zellen geändert: spätestens nach FRAME_MS malen
+        # ------------------------------------------------
+        def changed(self):
+            if not self.frame_timer.isActive():
+                self.frame_timer.start()
+        
+        def flush(self):
+            dirty = self.screen.take_dirty()
+            if dirty:
+                self.widget.viewport().update(self.cell_rect(*dirty))
+        
+        def cell_rect(self, x0, y0, x1, y1):
+            return QRect(
+                self.origin_x + x0 * self.cell_width,
+                self.origin_y + y0 * self.cell_height,
+                (x1 - x0) * self.cell_width,
+                (y1 - y0) * self.cell_height)
+        
+        def qcolor(self, index):
+            colors  = self.colors
+            palette = self.screen.palette
+            while len(colors) < len(palette):
+                colors.append(QColor(palette[len(colors)]))
+            return colors[index]
+        
+        def paint(self, painter, rect):
+            screen = self.screen
+            cw, ch = self.cell_width, self.cell_height
+            ox, oy = self.origin_x, self.origin_y
+            
+            x0 = max((rect.left()   - ox) // cw, 0)
+            y0 = max((rect.top()    - oy) // ch, 0)
+            x1 = min((rect.right()  - ox) // cw + 1, screen.cols)
+            y1 = min((rect.bottom() - oy) // ch + 1, screen.rows)
+            
+            chars = screen.chars
+            for y in range(y0, y1):
+                py   = oy + y * ch
+                base = y * screen.cols
+                for start, end, fg, bg in screen.runs(y, x0, x1):
+                    painter.fillRect(ox + start * cw, py, (end - start) * cw, ch, self.qcolor(bg))
+                    color = self.qcolor(fg)
+                    for x in range(start, end):
+                        c = chars[base + x]
+                        if c != " ":
+                            self.glyphs.draw(painter, ox + x * cw, py, c, color)
+
     # ---------------------------------------------------------------------------
     # \brief A dos-console Qt5 Dialog - used by DOS console Applications.
     # ---------------------------------------------------------------------------
@@ -16185,10 +17648,16 @@ try:
             self.bg_color  = "#000000"
             
             # ------------------------------------------------
-            # initial create/fill the buffer with a empty char
+            # character cells, painted by the renderer. the
+            # document is only drawn until the first
+            # print_line/clear_screen (e.g. append() logs).
             # ------------------------------------------------
-            self.buffer = [['&nbsp;'          for _ in range(self.cols)] for _ in range(self.rows)]
-            self.colors = [['#ff0000:#000000' for _ in range(self.cols)] for _ in range(self.rows)]
+            self.screen = ConsoleScreen(self.cols, self.rows, self.fg_color, self.bg_color)
+            self.screen_active = False
+            
+            margin = int(self.document().documentMargin())
+            self.renderer = ConsoleRenderer(self, self.screen, self.font(),
+                char_width, char_height, (margin, margin))
         
         def get_char_dimensions(self, char):
             font         = self.font()
@@ -16220,11 +17689,9 @@ try:
             return result
         
         def clear_screen(self):
-            self.buffer.clear()
-            self.colors.clear()
-            
-            self.buffer = [['&nbsp;'          for _ in range(self.cols)] for _ in range(self.rows)]
-            self.colors = [['#ff0000:#000000' for _ in range(self.cols)] for _ in range(self.rows)]
+            self.screen_active = True
+            self.screen.clear()
+            self.renderer.changed()
             
             self.gotoxy(1, 1)
         
@@ -16245,51 +17712,28 @@ try:
             if bg_color == None:
                 bg_color = self.bg_color
             try:
-                text_html = ""
-                
                 # ----------------------------
-                # set text cursor ...
+                # write the cells at the text
+                # cursor; painting follows in
+                # the next frame (dirty rect)
                 # ----------------------------
-                x = self.current_x
-                y = self.current_y
-                
-                color = self.fg_color + ':' + self.bg_color
-                i = 0
-                for row in range(self.rows):
-                    if i >= len(text):
-                        break
-                    if row > y:
-                        break
-                    for col in range(self.cols):
-                        if i >= len(text):
-                            break
-                        if (col >= x) and (col <= (x + i)):
-                            if text[i] == ' ':
-                                self.buffer[y][col] = '&nbsp;'
-                                self.colors[y][col] = color
-                            else:
-                                self.buffer[y][col] = text[i]
-                                self.colors[y][col] = color
-                            i += 1
-                
-                for row in range(self.rows):
-                    for col in range(self.cols):
-                        field_value = self.buffer[row][col]
-                        color       = self.colors[row][col].split(':')
-                        
-                        if not field_value == '&nbsp;':
-                            text_html += f'<span style="color:{color[0]};background-color:{color[1]};">'
-                            text_html += field_value
-                            text_html += '</span>'
-                        else:
-                            text_html += f'<span style="color:{color[0]};background-color:{color[1]};">'
-                            text_html += field_value
-                            text_html += '</span>'
-                    text_html += "<br>"
-                self.setHtml(text_html)
+                self.screen_active = True
+                screen = self.screen
+                screen.put_text(self.current_x, self.current_y, text,
+                    screen.color(fg_color),
+                    screen.color(bg_color))
+                self.renderer.changed()
             except Exception as e:
                 DebugPrint(e)
         
+        def paintEvent(self, event):
+            if not self.screen_active:
+                super().paintEvent(event)
+                return
+            painter = QPainter(self.viewport())
+            self.renderer.paint(painter, event.rect())
+            painter.end()
+        
         # ---------------------------------------------------------
         # \brief  This definition try to get the color value by the
         #         given color string.
@@ -16468,10 +17912,24 @@ try:
             self.bg_color  = "#6888FC"
             
             # ------------------------------------------------
-            # initial create/fill the buffer with a empty char
+            # character cells, painted by the renderer
+            # ------------------------------------------------
+            self.screen = ConsoleScreen(self.cols, self.rows, self.fg_color, self.bg_color)
+            
+            # ------------------------------------------------
+            # PETSCII glyphs from the chargen atlas; without
+            # atlas (no sources/cache) the font is used.
             # ------------------------------------------------
-            self.buffer = [['&nbsp;'          for _ in range(self.cols)] for _ in range(self.rows)]
-            self.colors = [['#C0C0C0:#6888FC' for _ in range(self.cols)] for _ in range(self.rows)]
+            fallback = ConsoleGlyphCache(self.font(), char_width, char_height)
+            try:
+                glyphs = PetsciiGlyphAtlas(char_width, char_height, BANK_UPPER, fallback)
+            except (OSError, ValueError) as e:
+                DebugPrint(e)
+                glyphs = fallback
+            
+            margin = int(self.document().documentMargin())
+            self.renderer = ConsoleRenderer(self, self.screen, self.font(),
+                char_width, char_height, (margin, margin), glyphs)
             
             # ------------------------------------------------
             # Timer für das Blinken des Block-Cursors
@@ -16519,11 +17977,8 @@ try:
             return result
         
         def clear_screen(self):
-            self.buffer.clear()
-            self.colors.clear()
-            
-            self.buffer = [['&nbsp;'          for _ in range(self.cols)] for _ in range(self.rows)]
-            self.colors = [['#C0C0C0:#6888FC' for _ in range(self.cols)] for _ in range(self.rows)]
+            self.screen.clear()
+            self.renderer.changed()
             
             self.gotoxy(1, 1)
         
@@ -16544,48 +17999,16 @@ try:
             if bg_color == None:
                 bg_color = self.bg_color
             try:
-                text_html = ""
-                
                 # ----------------------------
-                # set text cursor ...
+                # write the cells at the text
+                # cursor; painting follows in
+                # the next frame (dirty rect)
                 # ----------------------------
-                x = self.current_x
-                y = self.current_y
-                
-                color = self.fg_color + ':' + self.bg_color
-                i = 0
-                for row in range(self.rows):
-                    if i >= len(text):
-                        break
-                    if row > y:
-                        break
-                    for col in range(self.cols):
-                        if i >= len(text):
-                            break
-                        if (col >= x) and (col <= (x + i)):
-                            if text[i] == ' ':
-                                self.buffer[y][col] = '&nbsp;'
-                                self.colors[y][col] = color
-                            else:
-                                self.buffer[y][col] = text[i]
-                                self.colors[y][col] = color
-                            i += 1
-                
-                for row in range(self.rows):
-                    for col in range(self.cols):
-                        field_value = self.buffer[row][col]
-                        color       = self.colors[row][col].split(':')
-                        
-                        if not field_value == '&nbsp;':
-                            text_html += f'<span style="color:{color[0]};background-color:{color[1]};">'
-                            text_html += field_value
-                            text_html += '</span>'
-                        else:
-                            text_html += f'<span style="color:{color[0]};background-color:{color[1]};">'
-                            text_html += field_value
-                            text_html += '</span>'
-                    text_html += "<br>"
-                self.setHtml(text_html)
+                screen = self.screen
+                screen.put_text(self.current_x, self.current_y, text,
+                    screen.color(fg_color),
+                    screen.color(bg_color))
+                self.renderer.changed()
             except Exception as e:
                 self.gotoxy(0,1)
                 #DebugPrint(e)
@@ -16662,7 +18085,7 @@ try:
             # Aktionen aktivieren/deaktivieren basierend auf Zustand
             undo_action.setEnabled(self.document().isUndoAvailable())
             redo_action.setEnabled(self.document().isRedoAvailable())
-            copy_action.setEnabled(self.textCursor().hasSelection())
+            copy_action.setEnabled(True)
 
             # Aktion ausführen
             action = menu.exec_(event.globalPos())
@@ -16671,7 +18094,11 @@ try:
             elif action == redo_action:
                 self.redo()
             elif action == copy_action:
-                self.copy()
+                # ohne Auswahl: Bildschirminhalt als Text
+                if self.textCursor().hasSelection():
+                    self.copy()
+                else:
+                    QApplication.clipboard().setText(self.screen.text())
             elif action == select_all_action:
                 self.selectAll()
         
@@ -16843,6 +18270,7 @@ try:
             # Custom Painting (falls benötigt, z. B. ein Hintergrund zeichnen)
             painter = QPainter(self.viewport())
             painter.fillRect(self.rect(), QColor(64, 64, 248))
+            self.renderer.paint(painter, event.rect())
             painter.end()
 
             # Zeichne den Standardinhalt der QTextEdit
@@ -17501,6 +18929,93 @@ try:
         def readModal(self):
             self.exec_()
 
+    # ---------------------------------------------------------------------------
+    # \brief  compilation cache for the Python code that the script front ends
+    #         (Pascal, C64 BASIC) generate.
+    #         an entry is keyed by sha256 over the Python magic number, the
+    #         compiler name/version and the script source; a hit returns the
+    #         marshalled code object, so parsing and code generation can be
+    #         skipped. entries of an older source/version of the same script
+    #         are removed on store, corrupt entries on load.
+    #
+    # \param  cachedir - directory for the .bin files (default: __cache__)
+    #
+    # \author paule32
+    # \since  1.0.0
+    # ---------------------------------------------------------------------------
+    class CompileCache:
+        MAGIC = b"CCC\x01"
+        
+        def __init__(self, cachedir=None):
+            self.cachedir = cachedir or (genv.v__app__internal__ + "/__cache__")
+        
+        @staticmethod
+        def make_key(source, compiler, version):
+            h = hashlib.sha256(importlib.util.MAGIC_NUMBER)
+            h.update(f"{compiler}\0{version}\0".encode("utf-8"))
+            h.update(source.encode("utf-8", "surrogatepass"))
+            return h.hexdigest()
+        
+        # -----------------------------------------------------------------------
+        # \brief cache name for a script: file stem + hash of the full path, so
+        #        equal file names in different directories don't evict each other.
+        # -----------------------------------------------------------------------
+        @staticmethod
+        def entry_name(script_name):
+            stem = os.path.splitext(os.path.basename(script_name))[0]
+            return stem + "." + hashlib.md5(os.path.abspath(script_name).encode("utf-8")).hexdigest()[:8]
+        
+        def path(self, name, key):
+            return f"{self.cachedir}/{name}-{key[:16]}.bin"
+        
+        def header(self, key):
+            return self.MAGIC + importlib.util.MAGIC_NUMBER + bytes.fromhex(key)
+        
+        def load(self, name, key):
+            path = self.path(name, key)
+            try:
+                with open(path, "rb") as f:
+                    blob = f.read()
+            except OSError:
+                return None
+            head = self.header(key)
+            if blob[:len(head)] == head:
+                try:
+                    code = marshal.loads(blob[len(head):])
+                    if isinstance(code, CodeType):
+                        return code
+                except (EOFError, ValueError, TypeError):
+                    pass
+            self._remove(path)      # korrupt oder andere Python-Version
+            return None
+        
+        def store(self, name, key, code):
+            try:
+                os.makedirs(self.cachedir, exist_ok=True)
+                path = self.path(name, key)
+                with open(path + ".tmp", "wb") as f:
+                    f.write(self.header(key))
+                    marshal.dump(code, f)
+                os.replace(path + ".tmp", path)
+            except OSError:
+                return False        # kein Cache - Ausführung geht trotzdem weiter
+            for old in glob.glob(f"{glob.escape(self.cachedir)}/{glob.escape(name)}-*.bin"):
+                if os.path.normpath(old) != os.path.normpath(path):
+                    self._remove(old)
+            return True
+        
+        def compile(self, name, key, text, filename):
+            code = compile(text, filename, "exec")
+            self.store(name, key, code)
+            return code
+        
+        @staticmethod
+        def _remove(path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
     # ---------------------------------------------------------------------------
     # \brief  class for interpreting dBase related stuff ...
     #         the constructor need a string based script name that shall be read
@@ -20397,9 +21912,15 @@ try:
                 showError(e)
     
     class interpreter_Pascal(interpreter_base):
+        # bei Änderungen am Codegenerator erhöhen (CompileCache-Schlüssel)
+        COMPILER_VERSION = "1"
+        
         def __init__(self, file_name):
             super(interpreter_Pascal, self).__init__(file_name)
             self.script_name   = file_name
+            self.cache         = CompileCache()
+            self.cache_name    = CompileCache.entry_name(file_name)
+            self.cache_key     = CompileCache.make_key(self.source, "pascal", self.COMPILER_VERSION)
             self.pascal_keywords = [
                 "program", "begin", "end",
                 "for", "while", "repeat",
@@ -20418,7 +21939,23 @@ try:
                     dest[k] = v
             return dest
     
+        # -------------------------------------------------------------------
+        # Cache-Treffer: gespeicherten Code ausführen, ohne zu parsen.
+        # -------------------------------------------------------------------
+        def run_cached(self):
+            bytecode = self.cache.load(self.cache_name, self.cache_key)
+            if bytecode is None:
+                return False
+            try:
+                exec(bytecode, globals())
+            except Exception as e:
+                showException(traceback.format_exc())
+            return True
+        
         def parse(self):
+            if self.run_cached():
+                return
+            
             genv.line_col = 1
             genv.line_row = 1
             #
@@ -20520,37 +22057,15 @@ try:
             showInfo(genv.text_code)
             try:
                 # ---------------------
-                # prepare output file:
+                # compile text code and
+                # save it in the cache:
                 # ---------------------
-                cachedir = genv.v__app__internal__ + "/__cache__"
-                if not os.path.exists(cachedir):
-                    os.makedirs(cachedir)
-                
-                fname = os.path.basename(self.script_name)
-                fname = os.path.splitext(fname)[0]
-                fname = cachedir+"/"+fname+".bin"
+                bytecode = self.cache.compile(self.cache_name, self.cache_key, genv.text_code, "<string>")
                 
                 # ---------------------
-                # compile text code ...
-                # ---------------------
-                bytecode = compile(genv.text_code, "<string>", "exec")
-                
-                # ---------------------
-                # save binary code ...
+                # execute binary code:
                 # ---------------------
-                with open(fname,"wb") as bytefile:
-                    marshal.dump(bytecode , bytefile)
-                    bytefile.close()
-                
-                bytecode = ""
-                with open(fname,"rb") as bytefile:
-                    bytecode = marshal.load(bytefile)
-                    bytefile.close()
-                
-                    # ---------------------
-                    # execute binary code:
-                    # ---------------------
-                    exec(bytecode, globals())
+                exec(bytecode, globals())
                 
                 # ---------------------
                 # reset old code ...
@@ -21497,6 +23012,140 @@ try:
             self.thread.stop()
             showInfo("ddddd")
 
+    # ---------- Tokentabelle CBM BASIC V2 ----------
+    #
+    # Schlüsselwort -> Token-Byte, wie sie im C64-ROM stehen. Einmal gebaut und
+    # von allen Parsern geteilt (MappingProxyType: nur lesend).
+
+    C64_BASIC_TOKENS = MappingProxyType({
+        "END": 0x80, "FOR": 0x81, "NEXT": 0x82, "DATA": 0x83, "INPUT#": 0x84, "INPUT": 0x85,
+        "DIM": 0x86, "READ": 0x87, "LET": 0x88, "GOTO": 0x89, "RUN": 0x8A, "IF": 0x8B,
+        "RESTORE": 0x8C, "GOSUB": 0x8D, "RETURN": 0x8E, "REM": 0x8F, "STOP": 0x90, "ON": 0x91,
+        "WAIT": 0x92, "LOAD": 0x93, "SAVE": 0x94, "VERIFY": 0x95, "DEF": 0x96, "POKE": 0x97,
+        "PRINT#": 0x98, "PRINT": 0x99, "CONT": 0x9A, "LIST": 0x9B, "CLR": 0x9C, "CMD": 0x9D,
+        "SYS": 0x9E, "OPEN": 0x9F, "CLOSE": 0xA0, "GET": 0xA1, "NEW": 0xA2, "TAB(": 0xA3,
+        "TO": 0xA4, "FN": 0xA5, "SPC(": 0xA6, "THEN": 0xA7, "NOT": 0xA8, "STEP": 0xA9,
+        "+": 0xAA, "-": 0xAB, "*": 0xAC, "/": 0xAD, "^": 0xAE, "AND": 0xAF, "OR": 0xB0,
+        ">": 0xB1, "=": 0xB2, "<": 0xB3, "SGN": 0xB4, "INT": 0xB5, "ABS": 0xB6, "USR": 0xB7,
+        "FRE": 0xB8, "POS": 0xB9, "SQR": 0xBA, "RND": 0xBB, "LOG": 0xBC, "EXP": 0xBD,
+        "COS": 0xBE, "SIN": 0xBF, "TAN": 0xC0, "ATN": 0xC1, "PEEK": 0xC2, "LEN": 0xC3,
+        "STR$": 0xC4, "VAL": 0xC5, "ASC": 0xC6, "CHR$": 0xC7, "LEFT$": 0xC8, "RIGHT$": 0xC9,
+        "MID$": 0xCA, "GO": 0xCB,
+        "?": 0x99,                                  # Abkürzung für PRINT
+    })
+    BASIC_TOKEN_REM, BASIC_TOKEN_DATA = 0x8F, 0x83
+
+    # Trie über die Schlüsselwörter: Zeichen -> Knoten, "" -> (Länge, Token)
+    def _build_basic_trie(tokens) -> Dict[str, dict]:
+        root: Dict[str, dict] = {}
+        for word, tok in tokens.items():
+            node = root
+            for ch in word: node = node.setdefault(ch, {})
+            node[""] = (len(word), tok)
+        return root
+
+    BASIC_KEYWORD_TRIE = _build_basic_trie(C64_BASIC_TOKENS)
+
+    def match_basic_keyword(text: str, pos: int) -> Optional[Tuple[int, int]]:
+        """Längstes Schlüsselwort ab pos (text in Großbuchstaben) -> (Länge, Token) oder None."""
+        node = BASIC_KEYWORD_TRIE; hit = None; n = len(text)
+        while pos < n:
+            node = node.get(text[pos])
+            if node is None: break
+            hit = node.get("", hit); pos += 1
+        return hit
+
+    # ---------- Tokenizer für C64BasicParser ----------
+    #
+    # Eine Master-Regex mit benannten Gruppen; die Reihenfolge der Alternativen ist
+    # die Priorität (wie vorher: erstes passendes Muster gewinnt). Jede Zeile wird
+    # einmal von links nach rechts gelesen, ohne den Rest neu zu schneiden.
+
+    BASIC_TOKEN_PATTERNS = MappingProxyType({
+        "NUMBER":       r"\d+",
+        "COMMAND":      r"[a-zA-Z]+",
+        "STRING":       r'\"[^"]*\"',
+        "VARIABLE":     r"[a-zA-Z][0-9a-zA-Z]*",
+        "SYMBOL":       r"[=,+\-*/()]",
+    })
+    BASIC_TOKEN_REGEX = re.compile(r"\s*(?:" + "|".join(f"(?P<{name}>{pat})" for name, pat in BASIC_TOKEN_PATTERNS.items()) + ")")
+    BASIC_LINE_NUMBER_REGEX = re.compile(r"\d+")
+
+    def basic_tokenize(code: str) -> List[Tuple[str, str]]:
+        """Eine Zeile (ohne Zeilennummer) -> [(Art, Text), ...]."""
+        tokens = []; pos = 0; match = BASIC_TOKEN_REGEX.match
+        while True:
+            m = match(code, pos)
+            if m is None:
+                rest = code[pos:].lstrip()
+                if rest: raise SyntaxError(f"Unbekanntes Token: {rest}")
+                return tokens
+            kind = m.lastgroup
+            tokens.append((kind, m.group(kind))); pos = m.end()
+
+    def basic_tokenize_program(code: str) -> List[dict]:
+        """
+        Ganzes Programm -> [{"line_number", "tokens", "text"}, ...]
+        text = Zeile ohne Zeilennummer (für basic_crunch()).
+        """
+        program = []
+        for line in code.splitlines():
+            line = line.strip()
+            if not line: continue
+            m = BASIC_LINE_NUMBER_REGEX.match(line)
+            if not m: raise SyntaxError(f"Fehlende Zeilennummer: {line}")
+            rest = line[m.end():].strip()
+            program.append({"line_number": int(m.group(0)), "tokens": basic_tokenize(rest), "text": rest})
+        return program
+
+    # ---------- Crunch: Zeilentext -> Token-Bytes (wie CRUNCH im C64-ROM) ----------
+
+    _BASIC_UPPER = {c: c - 32 for c in range(ord("a"), ord("z") + 1)}
+
+    def basic_crunch(text: str) -> bytearray:
+        """
+        Schlüsselwörter außerhalb von Strings durch Token-Bytes ersetzen; nach DATA
+        bis ':' und nach REM bis Zeilenende bleibt der Text unverändert.
+        Kleinbuchstaben werden wie in ascii_to_petscii zu Großbuchstaben.
+        """
+        up = text.translate(_BASIC_UPPER); out = bytearray(); i = 0; n = len(up)
+        quote = data = rem = False
+        while i < n:
+            c = up[i]
+            if not (quote or data or rem):
+                hit = match_basic_keyword(up, i)
+                if hit:
+                    size, tok = hit; out.append(tok); i += size
+                    if tok == BASIC_TOKEN_REM: rem = True
+                    elif tok == BASIC_TOKEN_DATA: data = True
+                    continue
+            code = ord(c)
+            if not 0x20 <= code <= 0x5F:
+                raise ValueError(f"Zeichen '{text[i]}' kann nicht in PETSCII konvertiert werden.")
+            if c == '"': quote = not quote
+            elif c == ":" and data and not quote: data = False
+            out.append(code); i += 1
+        return out
+
+    def basic_crunch_program(program: List[dict], load_addr: int = 0x0801) -> bytes:
+        """
+        Tokenisiertes Programm im C64-Speicherformat (ohne Ladeadresse):
+        je Zeile Link auf die nächste Zeile, Zeilennummer, Token-Bytes, $00; Ende $00 $00.
+        """
+        output = bytearray()
+        for line in program:
+            text = line.get("text")
+            if text is None: text = " ".join(tok for _kind, tok in line["tokens"])
+            body = basic_crunch(text)
+            link = load_addr + len(output) + 4 + len(body) + 1
+            if not 0 <= line["line_number"] <= 63999:
+                raise ValueError(f"Zeilennummer außerhalb 0..63999: {line['line_number']}")
+            if link > 0xFFFF: raise ValueError("Programm zu groß für den C64-Speicher")
+            output += link.to_bytes(2, "little") + line["line_number"].to_bytes(2, "little") + body
+            output.append(0x00)
+        output += b"\x00\x00"
+        return bytes(output)
+
     class C64BasicWorkerThread(QThread):
         progress = pyqtSignal(int)
         def run(self):
@@ -21516,6 +23165,56 @@ try:
             
             def get(self, key, default=None):
                 return super().get(key.lower(), default)
+            
+            def __init__(self, items=()):
+                super().__init__((key.lower(), value) for key, value in dict(items).items())
+        
+        # ----------------------------------------
+        # Liste der BASIC-Schlüsselwörter mit ent-
+        # sprechenden Opcodes (einmal je Klasse,
+        # von allen Instanzen geteilt)
+        # ----------------------------------------
+        commands = CaseInsensitiveDict({
+            "NEW":      0x9E00,
+
+            "RUN":      0xA000,
+            "INPUT":    0xA500,
+            "PRINT":    0xA600,
+            "IF":       0xA800,
+            "GOTO":     0xA900,
+            "GOSUB":    0xAA00,
+            "RETURN":   0xAB00,
+            "POKE":     0xAC00,
+            "PEEK":     0xAD00,
+            "FOR":      0xAE00,
+            "NEXT":     0xAF00,
+
+            "END":      0xB000,
+            "STOP":     0xB100,
+            "DIM":      0xB300,
+            "READ":     0xB400,
+            "DATA":     0xB500,
+            "RESTORE":  0xB600,
+            "ON":       0xB700,
+            "SYS":      0xB900,
+            "OPEN":     0xBA00,
+            "CLOSE":    0xBB00,
+            "VERIFY":   0xBC00,
+
+            "CLR":      0xC000,
+
+            "RIGHT":    0xD100,
+            "LEFT":     0xD200
+        })
+        
+        # ----------------------------------------
+        # Reguläre Ausdrücke für BASIC-Elemente
+        # (Master-Regex: BASIC_TOKEN_REGEX)
+        # ----------------------------------------
+        token_patterns = BASIC_TOKEN_PATTERNS
+        
+        # bei Änderungen an convert_to_python erhöhen (CompileCache-Schlüssel)
+        COMPILER_VERSION = "1"
         
         def __init__(self, script_name):
             self.script_name = script_name
@@ -21542,72 +23241,13 @@ try:
                 self.code = file.read()
                 file.close()
             
-            # ----------------------------------------
-            # Liste der BASIC-Schlüsselwörter mit ent-
-            # sprechenden Opcodes
-            # ----------------------------------------
-            self.commands = self.CaseInsensitiveDict({
-                "NEW":      0x9E00,
-                
-                "RUN":      0xA000,
-                "INPUT":    0xA500,
-                "PRINT":    0xA600,
-                "IF":       0xA800,
-                "GOTO":     0xA900,
-                "GOSUB":    0xAA00,
-                "RETURN":   0xAB00,
-                "POKE":     0xAC00,
-                "PEEK":     0xAD00,
-                "FOR":      0xAE00,
-                "NEXT":     0xAF00,
-                
-                "END":      0xB000,
-                "STOP":     0xB100,
-                "DIM":      0xB300,
-                "READ":     0xB400,
-                "DATA":     0xB500,
-                "RESTORE":  0xB600,
-                "ON":       0xB700,
-                "SYS":      0xB900,
-                "OPEN":     0xBA00,
-                "CLOSE":    0xBB00,
-                "VERIFY":   0xBC00,
-                
-                "CLR":      0xC000,
-                
-                "RIGHT":    0xD100,
-                "LEFT":     0xD200
-            })
-            
-            # ----------------------------------------
-            # Reguläre Ausdrücke für BASIC-Elemente
-            # ----------------------------------------
-            self.token_patterns = {
-                "NUMBER":       r"^\d+",
-                "COMMAND":      r"^[a-zA-Z]+",
-                "STRING":       r'^\"[^"]*\"',
-                "VARIABLE":     r"^[a-zA-Z][0-9a-zA-Z]*",
-                "SYMBOL":       r"^[=,+\-*/()]",
-            }
-        
         # ----------------------------------------
         # Zerlegt den BASIC-Code in Tokens.
+        #   (eine Master-Regex, Zeile wird einmal
+        #   gelesen - siehe basic_tokenize)
         # ----------------------------------------
         def tokenize(self, code):
-            tokens = []
-            while code:
-                code = code.lstrip()  # Leerzeichen entfernen
-                matched = False
-                for token_type, pattern in self.token_patterns.items():
-                    match = re.match(pattern, code, re.IGNORECASE)
-                    if match:
-                        tokens.append((token_type, match.group(0)))
-                        code = code[len(match.group(0)):]
-                        matched = True
-                        break
-                if not matched:
-                    raise SyntaxError(f"Unbekanntes Token: {code}")
-            return tokens
+            return basic_tokenize(code)
         
         # -------------------------------------
         # Parst einen BASIC-Code in eine Liste
@@ -21625,7 +23265,7 @@ try:
                 # ----------------------------------
                 # Extrahiere die Zeilennummer
                 # ----------------------------------
-                match = re.match(self.token_patterns["NUMBER"], line)
+                match = BASIC_LINE_NUMBER_REGEX.match(line)
                 if not match:
                     raise SyntaxError(f"Fehlende Zeilennummer: {line}")
 
@@ -21643,13 +23283,13 @@ try:
                 # ----------------------------------
                 #showInfo(f"info:\n{tokens[0][0]}\n1: {tokens[0][1]}")
                 if tokens[0][0] == "COMMAND":
-                    if not (tokens[0][1].upper() in (key.upper() for key in self.commands)):
+                    if tokens[0][1] not in self.commands:
                         raise SyntaxError(f"Unbekannter Befehl '{tokens[0][1]}' in Zeile {line_number}")
                 
                 # ----------------------------------
                 # Übersetze die Tokens
                 # ----------------------------------
-                parsed_line = {"line_number": line_number, "tokens": tokens}
+                parsed_line = {"line_number": line_number, "tokens": tokens, "text": rest_of_line}
                 parsed_program.append(parsed_line)
 
             return parsed_program
@@ -22021,77 +23661,17 @@ try:
         # \return: Bytes im C64 BASIC Dateiformat
         # -----------------------------------------------------------------------
         def convert_to_binbas(self, parsed_program):
-            memory_address = 0x0801  # Standardadresse für BASIC-Programme im C64
-            output = bytearray()
-
-            for line in parsed_program:
-                line_number = line["line_number"]
-                tokens = line["tokens"]
-                
-                # ----------------------------------
-                # Zeilenadresse (2 Bytes)
-                # ----------------------------------
-                line_address = memory_address + len(output) + 2  # +2 für Zeilenadresse selbst
-                output.extend(line_address.to_bytes(2, "little"))
-                
-                # ----------------------------------
-                # Zeilennummer (2 Bytes)
-                # ----------------------------------
-                output.extend(line_number.to_bytes(2, "little"))
-                
-                # ----------------------------------
-                # Tokenisierte Zeile
-                # ----------------------------------
-                for token in tokens:
-                    if token[0] == "COMMAND" and token[1] in C64BasicParser(self.script_name).commands:
-                        # ----------------------------------
-                        # BASIC-Schlüsselwort in Tokenform
-                        # ----------------------------------
-                        token_value = C64BasicParser(self.script_name).commands[token[1]] & 0xFF
-                        output.append(token_value)
-                        
-                    elif token[0] == "STRING":
-                        # ----------------------------------
-                        # String in Anführungszeichen
-                        # ----------------------------------
-                        # Entferne Anführungszeichen
-                        # ----------------------------------
-                        petscii_string = self.ascii_to_petscii(token[1][1:-1])
-                        output.extend(petscii_string)
-                        
-                    elif token[0] == "NUMBER":
-                        # ----------------------------------
-                        # Zahl als ASCII
-                        # ----------------------------------
-                        output.extend(self.ascii_to_petscii(token[1]))
-                        
-                    elif token[0] == "SYMBOL":
-                        # ----------------------------------
-                        # Symbole direkt hinzufügen
-                        # ----------------------------------
-                        output.extend(self.ascii_to_petscii(token[1]))
-                        
-                    elif token[0] == "VARIABLE":
-                        # ----------------------------------
-                        # Variable direkt hinzufügen
-                        # ----------------------------------
-                        output.extend(self.ascii_to_petscii(token[1]))
-                
-                # ----------------------------------
-                # End-of-line Marker
-                # ----------------------------------
-                output.append(0x00)
-            
-            # ----------------------------------
-            # End-of-file Marker
-            # ----------------------------------
-            output.extend(b"\x00\x00")
-            return bytes(output)
+            # Schlüsselwörter über den geteilten Trie (C64_BASIC_TOKENS),
+            # Link-Adresse zeigt auf die nächste Zeile
+            return basic_crunch_program(parsed_program, 0x0801)
         
         def run_bytecode(self, bytecode_file):
             with open(bytecode_file, "rb") as f:
                 loaded_code = marshal.load(f)
-            exec(loaded_code, globals())
+            self.run_code(loaded_code)
+        
+        def run_code(self, code):
+            exec(code, globals())
             
             #"""Führt den Bytecode in einem separaten Thread aus."""
             #def run():
@@ -26357,8 +27937,22 @@ try:
         
         def parse_source(self, edit_type, script_name):
             try:
+                cache_entry = None
                 if edit_type == genv.SIDE_BUTTON_C64:
                     parser = C64BasicParser(script_name)
+                    
+                    # ------------------------------------------
+                    # unveränderte Quelle: Bytecode aus dem
+                    # Cache, ohne Parsen und Codeerzeugung
+                    # ------------------------------------------
+                    cache = CompileCache()
+                    cache_entry = (CompileCache.entry_name(script_name),
+                        CompileCache.make_key(parser.code, "c64basic", C64BasicParser.COMPILER_VERSION))
+                    compiled_code = cache.load(*cache_entry)
+                    if compiled_code is not None:
+                        parser.run_code(compiled_code)
+                        return
+                    
                     parsed = parser.parse()
                     
                 elif edit_type == genv.SIDE_BUTTON_DBASE:
@@ -26420,20 +28014,30 @@ try:
                 # und speichere ihn ...
                 # ------------------------------------------
                 compiled_code = compile(python_code, python_file, "exec")
-                try:
-                    with open(bytecode_file, "wb") as f:
-                        marshal.dump(compiled_code, f)
-                except PermissionError as e:
-                    showError(_str("no permissions to write byte code file."))
-                    return
-                except Exception as e:
-                    showError(_str(f"unexpected error occured:\n{e}"))
-                    return
+                if cache_entry:
+                    cache.store(*cache_entry, compiled_code)
+                else:
+                    try:
+                        with open(bytecode_file, "wb") as f:
+                            marshal.dump(compiled_code, f)
+                    except PermissionError as e:
+                        showError(_str("no permissions to write byte code file."))
+                        return
+                    except Exception as e:
+                        showError(_str(f"unexpected error occured:\n{e}"))
+                        return
                 
                 print("Python Code:")
                 print(python_code)
                 
-                parser.run_bytecode(bytecode_file)
+                # ------------------------------------------
+                # Code-Objekt direkt ausführen (kein
+                # Umweg über Datei schreiben + lesen)
+                # ------------------------------------------
+                if cache_entry:
+                    parser.run_code(compiled_code)
+                else:
+                    parser.run_bytecode(bytecode_file)
                 
             except Exception as e:
                 self.showExceptionHandler(e)
@@ -35988,30 +37592,145 @@ try:
                 return [(m.group(0), m.start()) for m in re.finditer(r"[A-Za-zÄÖÜäöüß\-]+", text)]
             
             def levenshtein(a: str, b: str, max_dist: int = 2) -> int:
+                """Distanz a/b, max_dist + 1 für alles darüber. Gemeinsamer Anfang/Ende zählt nicht, gerechnet wird im Band |i-j| <= max_dist."""
                 if a == b:
                     return 0
                 la, lb = len(a), len(b)
                 if abs(la - lb) > max_dist:
                     return max_dist + 1
-                if la > lb:
-                    a, b = b, a
-                    la, lb = lb, la
-                prev = list(range(lb + 1))
-                for i in range(1, la + 1):
-                    cur = [i] + [0]*lb
+                n = min(la, lb); i = 0
+                while i < n and a[i] == b[i]:
+                    i += 1
+                j = 0
+                while j < n - i and a[la-1-j] == b[lb-1-j]:
+                    j += 1
+                a = a[i:la-j]; b = b[i:lb-j]
+                if not a or not b:
+                    return min(max(len(a), len(b)), max_dist + 1)
+                big = max_dist + 1
+                prev = [j if j <= max_dist else big for j in range(len(b) + 1)]
+                for i in range(1, len(a) + 1):
+                    cur = [big] * (len(b) + 1)
+                    if i <= max_dist:
+                        cur[0] = i
                     ai = a[i-1]
                     row_min = cur[0]
-                    for j in range(1, lb + 1):
-                        cost = 0 if ai == b[j-1] else 1
-                        cur[j] = min(prev[j] + 1, cur[j-1] + 1, prev[j-1] + cost)
-                        if cur[j] < row_min:
-                            row_min = cur[j]
+                    for j in range(max(1, i - max_dist), min(len(b), i + max_dist) + 1):
+                        d = prev[j-1] + (ai != b[j-1])
+                        if prev[j] < d: d = prev[j] + 1
+                        if cur[j-1] < d: d = cur[j-1] + 1
+                        cur[j] = d
+                        if d < row_min:
+                            row_min = d
                     if row_min > max_dist:
                         return max_dist + 1
                     prev = cur
-                return prev[-1]
+                return min(prev[-1], max_dist + 1)
+            
+            # ---------- Vorschlagsindex für candidates() ----------
+            #
+            # Jedes Wort der Länge l wird in max_dist+1 Stücke zerlegt und unter (erster
+            # Buchstabe, l, Stücknummer, Stück) abgelegt. Bei höchstens max_dist Änderungen
+            # bleibt ein Stück unverändert und liegt im Suchwort nur wenig verschoben
+            # (Schubfachprinzip): gerechnet wird levenshtein() nur noch für die Wörter
+            # unter diesen Schlüsseln statt für das ganze Wörterbuch.
+            # Gebaut einmal je Wörterbuch, abgelegt als <csv ohne Endung>.suggest daneben.
+            class SuggestIndex:
+                VERSION = 1
+            
+                def __init__(self, words, max_dist: int = 2):
+                    self.max_dist = max_dist
+                    self.words: List[str] = sorted(set(words))
+                    buckets: Dict[str, List[int]] = {}
+                    for n, w in enumerate(self.words):
+                        if len(w) <= max_dist:                      # zu kurz für Stücke: Schlüssel = Anfangsbuchstabe
+                            buckets.setdefault(w[:1], []).append(n)
+                            continue
+                        for i, (start, size) in enumerate(self.segments(len(w))):
+                            buckets.setdefault(self.key(w[:1], len(w), i, w[start:start + size]), []).append(n)
+                    # flach ablegen: Schlüssel -> Nr., Wort-Ids der Nr. b = ids[offsets[b]:offsets[b+1]]
+                    self.buckets: Dict[str, int] = {}
+                    self.ids = array("I"); self.offsets = array("I", [0])
+                    for b, (key, ids) in enumerate(buckets.items()):
+                        self.buckets[key] = b; self.ids.extend(ids); self.offsets.append(len(self.ids))
+            
+                def segments(self, length: int) -> List[Tuple[int, int]]:
+                    """(Start, Länge) der max_dist+1 Stücke eines Worts dieser Länge."""
+                    parts = self.max_dist + 1
+                    base, extra = divmod(length, parts)
+                    out = []; start = 0
+                    for i in range(parts):
+                        size = base + (i >= parts - extra)
+                        out.append((start, size)); start += size
+                    return out
+            
+                @staticmethod
+                def key(first: str, length: int, part: int, piece: str) -> str:
+                    return f"{first}{length}:{part}:{piece}"
+            
+                def bucket(self, key: str):
+                    b = self.buckets.get(key)
+                    return () if b is None else self.ids[self.offsets[b]:self.offsets[b + 1]]
+            
+                def suggest(self, word: str, limit: int = 5) -> List[str]:
+                    """Wie candidates(): gleicher Anfangsbuchstabe, Distanz <= max_dist, sortiert nach (Distanz, Wort)."""
+                    w = word.casefold(); L = len(w); k = self.max_dist; first = w[:1]
+                    found = set()
+                    for key in ([first] if w else [key for key in self.buckets if len(key) <= 1]):
+                        found.update(n for n in self.bucket(key) if len(self.words[n]) <= L + k)
+                    for length in range(max(L - k, k + 1), L + k + 1):
+                        delta = L - length
+                        for i, (start, size) in enumerate(self.segments(length)):
+                            # Stück i ist höchstens i Stellen verschoben (Änderungen davor) und
+                            # höchstens k-i Stellen gegen die Längendifferenz (Änderungen danach)
+                            lo = max(0, start - i, start + delta - (k - i))
+                            hi = min(L - size, start + i, start + delta + (k - i))
+                            for pos in range(lo, hi + 1):
+                                found.update(self.bucket(self.key(first, length, i, w[pos:pos + size])))
+                    scored = []
+                    for n in found:
+                        d = levenshtein(w, self.words[n], max_dist=k)
+                        if d <= k:
+                            scored.append((d, self.words[n]))
+                    scored.sort()
+                    return [v for d, v in scored[:limit]]
+            
+                @staticmethod
+                def cache_path(csv_path: str) -> str:
+                    return os.path.splitext(csv_path)[0] + ".suggest"
             
-            def build_vocab(df: pd.DataFrame):
+                @classmethod
+                def load_or_build(cls, words, csv_path: str, max_dist: int = 2) -> "SuggestIndex":
+                    """
+                    Index neben csv_path (Datei, aus der words stammen) laden; fehlt er oder
+                    ist die CSV seitdem geändert (mtime/Größe): bauen und ablegen.
+                    """
+                    path = cls.cache_path(csv_path)
+                    st = os.stat(csv_path)
+                    key = f"v{cls.VERSION}:{max_dist}:{st.st_mtime_ns}:{st.st_size}"
+                    try:
+                        with open(path, "rb") as f:
+                            stored_key, data = marshal.loads(f.read())     # loads(): marshal.load(f) liest stückweise, ~4x langsamer
+                        if stored_key == key:
+                            index = cls.__new__(cls)
+                            index.max_dist, index.words, index.buckets, ids, offsets = data
+                            index.ids = array("I"); index.ids.frombytes(ids)
+                            index.offsets = array("I"); index.offsets.frombytes(offsets)
+                            return index
+                    except (OSError, ValueError, EOFError, TypeError):
+                        pass
+                    index = cls(words, max_dist)
+                    try:
+                        tmp = path + ".tmp"
+                        with open(tmp, "wb") as f:
+                            marshal.dump((key, (index.max_dist, index.words, index.buckets,
+                                                index.ids.tobytes(), index.offsets.tobytes())), f)
+                        os.replace(tmp, path)
+                    except OSError as e:
+                        print(f"Vorschlagsindex nicht gespeichert: {e}", file=sys.stderr)
+                    return index
+            
+            def build_vocab(df: pd.DataFrame, csv_path: str = None):
                 vocab_all = set(w.casefold() for w in df["wort"].astype(str).tolist())
                 nouns = set(w.casefold() for w in df[df["kategorie"]=="Substantiv"]["wort"].astype(str).tolist())
                 male_names = set(w.casefold() for w in df[df["kategorie"]=="Männername"]["wort"].astype(str).tolist())
@@ -36021,9 +37740,14 @@ try:
                 verbs = set(w.casefold() for w in df[df["kategorie"]=="Verb"]["wort"].astype(str).tolist())
                 adjs = set(w.casefold() for w in df[df["kategorie"]=="Adjektiv"]["wort"].astype(str).tolist())
                 colors = set(w.casefold() for w in df[df["kategorie"]=="Farbe"]["wort"].astype(str).tolist())
-                return {"all": vocab_all,"nouns": nouns,"names": names,"cities": cities,"verbs": verbs,"adjs": adjs,"colors": colors}
+                vocab = {"all": vocab_all,"nouns": nouns,"names": names,"cities": cities,"verbs": verbs,"adjs": adjs,"colors": colors}
+                if csv_path:
+                    vocab["suggest"] = SuggestIndex.load_or_build(vocab_all, csv_path)
+                return vocab
             
             def candidates(word: str, vocab_list):
+                if isinstance(vocab_list, SuggestIndex):
+                    return vocab_list.suggest(word)
                 w = word.casefold()
                 L = len(w)
                 pool = [v for v in vocab_list if abs(len(v) - L) <= 2 and (not w or v[:1] == w[:1])]
@@ -36046,12 +37770,13 @@ try:
                           "notes": ["Rechtschreibprüfung gegen Wörterbuch (case-insensitive).","Nomen-Heuristik für Groß-/Klein (außer am Satzanfang)."]}
                 vocab_all = vocab["all"]; nouns = vocab["nouns"]; names = vocab["names"]; cities = vocab["cities"]
                 non_noun_categories = vocab["verbs"] | vocab["adjs"] | vocab["colors"]
+                suggest = vocab.get("suggest", vocab_all)   # Index aus build_vocab(df, csv_path), sonst Scan ohne Kopie
                 for idx, (tok, pos) in enumerate(toks):
                     t_cf = tok.casefold()
                     known = t_cf in vocab_all
                     if not known:
                         report["unknown"].append(tok)
-                        cands = candidates(tok, list(vocab_all))
+                        cands = candidates(tok, suggest)
                         if cands:
                             report["suggestions"][tok] = cands
                     if tok[:1].islower() and t_cf in nouns and idx != 0:
@@ -36233,7 +37958,7 @@ try:
                     sys.exit(0)
                 sentence = sys.argv[1]
                 df = pd.read_csv(DICT_PATH)
-                vocab = build_vocab(df)
+                vocab = build_vocab(df, DICT_PATH)
                 out = {
                     "step1": analyze_sentence_step1(sentence, vocab),
                     "step2": analyze_sentence_step2(sentence),
@@ -36518,7 +38243,7 @@ try:
                     if self.csv_path:
                         try:
                             df = pd.read_csv(self.csv_path)
-                            self.vocab = build_vocab(df)
+                            self.vocab = build_vocab(df, self.csv_path)
                         except Exception as e:
                             QMessageBox.warning(self, "Warnung", f"Konnte CSV nicht laden:\n{e}")
                     self.last_ranges = []
@@ -36550,7 +38275,7 @@ try:
                     if path:
                         try:
                             df = pd.read_csv(path)
-                            self.vocab = build_vocab(df)
+                            self.vocab = build_vocab(df, path)
                             self.csv_path = path
                             self.lblCSV.setText(f"Wörterbuch: {path}")
                         except Exception as e:
@@ -43918,6 +45643,90 @@ try:
     def to_hex64DB(x: int) -> str:
         return f"{(x & ((1 << 64) - 1)):016x}"
     
+    def edit_distance_within(a: str, b: str, max_dist: int) -> Optional[int]:
+        """
+        Levenshtein-Distanz a/b, None wenn sie größer als max_dist ist. Gemeinsamer
+        Anfang/Ende wird abgeschnitten, gerechnet wird nur im Band |i-j| <= max_dist
+        mit Abbruch, sobald eine Zeile komplett über max_dist liegt.
+        """
+        if abs(len(a) - len(b)) > max_dist: return None
+        n = min(len(a), len(b)); i = 0
+        while i < n and a[i] == b[i]: i += 1
+        a = a[i:]; b = b[i:]; n -= i; i = 0
+        while i < n and a[-1 - i] == b[-1 - i]: i += 1
+        if i: a = a[:-i]; b = b[:-i]
+        if not a or not b: return max(len(a), len(b))
+        big = max_dist + 1
+        prev = [j if j <= max_dist else big for j in range(len(b) + 1)]
+        for i, ca in enumerate(a, 1):
+            cur = [big] * (len(b) + 1)
+            if i <= max_dist: cur[0] = i
+            best = cur[0]
+            for j in range(max(1, i - max_dist), min(len(b), i + max_dist) + 1):
+                v = prev[j - 1] + (ca != b[j - 1])
+                if prev[j] < v: v = prev[j] + 1
+                if cur[j - 1] < v: v = cur[j - 1] + 1
+                cur[j] = v
+                if v < best: best = v
+            if best > max_dist: return None
+            prev = cur
+        return prev[-1] if prev[-1] <= max_dist else None
+    
+    def fuzzy_pieces(norm: str, max_dist: int) -> List[str]:
+        """
+        norm in k+1 lückenlose Stücke (k <= max_dist): bei höchstens k Änderungen
+        bleibt mindestens ein Stück unverändert (Schubfachprinzip). Das erste
+        Stück wird über den Präfix gesucht und bleibt kurz, die übrigen werden so
+        lang wie möglich (seltener im Trigramm-Index), mindestens 3 Zeichen -
+        kurze Wörter bekommen daher ein kleineres k (Rest: ShortTermIndex).
+        """
+        k = max(0, min(max_dist, (len(norm) - 1) // 3))
+        size = (len(norm) - 1) // k if k else 0
+        first = len(norm) - size * k
+        return [norm[:first]] + [norm[first + i * size:first + (i + 1) * size] for i in range(k)]
+    
+    class ShortTermIndex:
+        """
+        Segment-Index der kurzen Terme (bis 4 * max_dist Zeichen) einer Sprache
+        für fuzzy_terms(), wo fuzzy_pieces() zu kurze Stücke für Trigramme liefert:
+        jeder Term steht unter seinen max_dist+2 Segmenten; ein Term mit Distanz
+        e <= max_dist zur Anfrage enthält mindestens max_dist+2-e davon
+        unverändert, um höchstens max_dist Zeichen verschoben. Nur im Speicher.
+        """
+        def __init__(self, max_dist: int):
+            self.max_dist = max_dist
+            self.max_len  = 4 * max_dist
+            self.ids: set = set()
+            self.buckets: Dict[Tuple[int, int, str], List[int]] = {}
+        
+        def segments(self, length: int) -> List[Tuple[int, int]]:
+            parts = self.max_dist + 2
+            return [(length * i // parts, length * (i + 1) // parts - length * i // parts) for i in range(parts)]
+        
+        def add(self, rows):
+            """rows: (term_id, norm_text); längere und schon bekannte Terme werden übergangen."""
+            buckets = self.buckets; ids = self.ids
+            for term_id, norm in rows:
+                if len(norm) > self.max_len or term_id in ids: continue
+                ids.add(term_id)
+                for i, (start, size) in enumerate(self.segments(len(norm))):
+                    buckets.setdefault((len(norm), i, norm[start:start + size]), []).append(term_id)
+        
+        def candidates(self, norm: str, limit: int) -> List[int]:
+            """term_ids mit mindestens zwei Segmenten an passender Stelle; die mit den meisten, dann die kürzesten zuerst."""
+            d = self.max_dist; n = len(norm); found = []
+            for length in range(max(0, n - d), min(n + d, self.max_len) + 1):
+                delta = n - length; hits: Dict[int, int] = {}
+                for i, (start, size) in enumerate(self.segments(length)):
+                    lo = max(0, start - d, start + delta - d); hi = min(n - size, start + d, start + delta + d)
+                    ids = set()
+                    for seg in {norm[p:p + size] for p in range(lo, hi + 1)}:
+                        ids.update(self.buckets.get((length, i, seg), ()))
+                    for term_id in ids: hits[term_id] = hits.get(term_id, 0) + 1
+                found += [(-count, length, term_id) for term_id, count in hits.items() if count >= 2]
+            found.sort()
+            return [term_id for *_key, term_id in found[:limit]]
+    
     @dataclass
     class TermDB:
         term_id: int
@@ -43925,6 +45734,72 @@ try:
         text: str
         norm_text: str
 
+    # ---------------------------------------------------------------------------
+    # \brief table model for the translator pair table: rows are paged from the
+    #        database (TranslatorDB.page_pairs, keyset pagination) when the view
+    #        scrolls near the end (canFetchMore/fetchMore), so opening a large
+    #        glossary only reads the first page. set_query() switches language
+    #        direction or filter and starts again with one page.
+    # ---------------------------------------------------------------------------
+    class TranslationPairModel(QAbstractTableModel):
+        HEADERS = ("Hash", "Source", "Target")
+        
+        def __init__(self, parent=None):
+            super(TranslationPairModel, self).__init__(parent)
+            self.db       = None
+            self.src_lang = ""
+            self.dst_lang = ""
+            self.match    = ""
+            self.rows     = []      # (term_id, src_text, dst_text, key)
+            self.at_end   = True
+        
+        def set_query(self, db, src_lang: str, dst_lang: str, match: str = ""):
+            self.beginResetModel()
+            self.db, self.src_lang, self.dst_lang, self.match = db, src_lang, dst_lang, match
+            self.rows   = []
+            self.at_end = db is None or db.conn is None
+            self.endResetModel()
+            if not self.at_end:
+                self.fetchMore()
+        
+        def clear(self):
+            self.set_query(None, "", "")
+        
+        def rowCount(self, parent=QModelIndex()):
+            return 0 if parent.isValid() else len(self.rows)
+        
+        def columnCount(self, parent=QModelIndex()):
+            return 0 if parent.isValid() else len(self.HEADERS)
+        
+        def headerData(self, section, orientation, role=Qt.DisplayRole):
+            if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+                return self.HEADERS[section]
+            return super().headerData(section, orientation, role)
+        
+        def data(self, index, role=Qt.DisplayRole):
+            if role == Qt.DisplayRole and index.isValid():
+                hid, src, dst, _key = self.rows[index.row()]
+                return (to_hex64DB(hid), src, dst)[index.column()]
+        
+        def canFetchMore(self, parent=QModelIndex()):
+            return not parent.isValid() and not self.at_end
+        
+        def fetchMore(self, parent=QModelIndex()):
+            if parent.isValid() or self.at_end:
+                return
+            after = self.rows[-1][3] if self.rows else None
+            page  = self.db.page_pairs(self.src_lang, self.dst_lang, after, self.db.PAGE_SIZE, self.match)
+            self.at_end = len(page) < self.db.PAGE_SIZE
+            if page:
+                first = len(self.rows)
+                self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+                self.rows.extend(page)
+                self.endInsertRows()
+        
+        def pair(self, row: int) -> Tuple[str, str]:
+            _hid, src, dst, _key = self.rows[row]
+            return src, dst
+    
     class TransLatorMainWindow(QWidget):
         def _update_quick_placeholder(self):
             lang = self.src_combo.currentText()
@@ -43985,11 +45860,25 @@ try:
             
             # Linke Tabelle
             left_layout = QVBoxLayout(left)
-            self.table = QTableWidget(0, 3, left)
-            self.table.setHorizontalHeaderLabels(["Hash", "Source", "Target"])
+            self.filter_edit = QLineEdit(left)
+            self.filter_edit.setPlaceholderText("Filter (Quelltext) …")
+            self.filter_edit.setClearButtonEnabled(True)
+            left_layout.addWidget(self.filter_edit)
+            
+            # Filter erst nach einer kurzen Tipp-Pause anwenden
+            self.filter_timer = QTimer(self)
+            self.filter_timer.setSingleShot(True)
+            self.filter_timer.setInterval(200)
+            self.filter_timer.timeout.connect(self.refresh_table)
+            self.filter_edit.textChanged.connect(self.filter_timer.start)
+            
+            self.pair_model = TranslationPairModel(self)
+            self.table = QTableView(left)
+            self.table.setModel(self.pair_model)
             self.table.horizontalHeader().setStretchLastSection(True)
-            self.table.setSelectionBehavior(QTableWidget.SelectRows)
-            self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+            self.table.verticalHeader().setDefaultSectionSize(self.table.fontMetrics().height() + 6)
+            self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+            self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
             left_layout.addWidget(self.table)
             
             self.del_btn = QPushButton("Löschen")
@@ -44017,6 +45906,16 @@ try:
             path_row.addWidget(load_btn)
             path_row.addWidget(new_btn)
             form.addRow(QLabel("Wörterbuch:"), path_row)
+            
+            bulk_row = QHBoxLayout()
+            self.import_btn = QPushButton("Import (CSV/TMX/PO) …")
+            self.export_btn = QPushButton("Export (CSV/TMX/PO) …")
+            self.import_btn.clicked.connect(self.on_bulk_import)
+            self.export_btn.clicked.connect(self.on_bulk_export)
+            bulk_row.addWidget(self.import_btn)
+            bulk_row.addWidget(self.export_btn)
+            bulk_row.addStretch()
+            form.addRow(QLabel("Glossar:"), bulk_row)
             right_layout.addLayout(form)
             
             # Quell- und Zieltext
@@ -44130,7 +46029,7 @@ try:
             self.undo_btn.clicked.connect(self.on_undo)
             self.redo_btn.clicked.connect(self.on_redo)
             self.quick_btn.clicked.connect(self.on_quick_translate)
-            self.table.itemSelectionChanged.connect(self.on_table_select)
+            self.table.selectionModel().selectionChanged.connect(self.on_table_select)
             self.src_combo.currentIndexChanged.connect(self.refresh_table)
             self.dst_combo.currentIndexChanged.connect(self.refresh_table)
             self.src_edit.textChanged.connect(self.on_source_changed)
@@ -44190,9 +46089,7 @@ try:
             count = 0
             
             for idx in rows:
-                r = idx.row()
-                src_text = self.table.item(r, 1).text()
-                dst_text = self.table.item(r, 2).text()
+                src_text, dst_text = self.pair_model.pair(idx.row())
                 try:
                     self.db.delete_translation(src_lang, src_text, dst_lang, dst_text)
                     count += 1
@@ -44219,12 +46116,16 @@ try:
             if src_lang == dst_lang:
                 self.sugg_table.setRowCount(0); return
             
-            rows = self.db.candidates(src_lang, src_word, dst_lang, limit=100)
+            # exakte Treffer zuerst, dann Präfix/Tippfehler/Teilstring (fuzzy_terms)
+            rows = self.db.fuzzy_candidates(src_lang, src_word, dst_lang, limit=100)
             
             # Tabelle füllen
             self.sugg_table.setRowCount(len(rows))
-            for r, (tgt_text, conf, source) in enumerate(rows):
-                self.sugg_table.setItem(r, 0, QTableWidgetItem(src_word))
+            for r, (src_text, tgt_text, conf, source, kind) in enumerate(rows):
+                item = QTableWidgetItem(src_text)
+                if kind != "exact":
+                    item.setToolTip(kind)
+                self.sugg_table.setItem(r, 0, item)
                 self.sugg_table.setItem(r, 1, QTableWidgetItem(tgt_text))
                 self.sugg_table.setItem(r, 2, QTableWidgetItem(f"{conf:.2f}"))
         
@@ -44260,6 +46161,64 @@ try:
             self.undo_btn.setEnabled(has_db)
             self.redo_btn.setEnabled(has_db)
             self.quick_btn.setEnabled(has_db)
+            self.import_btn.setEnabled(has_db)
+            self.export_btn.setEnabled(has_db)
+        
+        # ------------------------------------------------
+        # Fortschritt für bulk_import/bulk_export: Zeilen
+        # und Zeilen/s, Abbrechen beendet den Import.
+        # ------------------------------------------------
+        def _bulk_progress(self, title: str):
+            dlg = QProgressDialog(title, "Abbrechen", 0, 0, self)
+            dlg.setWindowModality(Qt.WindowModal)
+            dlg.setMinimumDuration(0)
+            def progress(rows: int, rate: float):
+                dlg.setLabelText(f"{title}\n{rows:,} Zeilen, {rate:,.0f} Zeilen/s")
+                QApplication.processEvents()
+                return not dlg.wasCanceled()
+            return dlg, progress
+        
+        def on_bulk_import(self):
+            if not self.db.conn:
+                return
+            start_dir = os.path.dirname(self.db.path) if getattr(self.db, "path", None) else ""
+            path, _ = QFileDialog.getOpenFileName(self, "Glossar importieren", start_dir,
+                "Glossar (*.csv *.tmx *.po);;Alle Dateien (*)")
+            if not path:
+                return
+            src_lang = self.src_combo.currentText()
+            dst_lang = self.dst_combo.currentText()
+            dlg, progress = self._bulk_progress(f"Import {os.path.basename(path)}")
+            try:
+                rows, secs = self.db.bulk_import(path, src_lang, dst_lang, progress=progress)
+            except Exception as e:
+                QMessageBox.critical(self, "Import fehlgeschlagen", str(e))
+                return
+            finally:
+                dlg.close()
+            self.refresh_table()
+            QMessageBox.information(self, "Import",
+                f"{rows:,} Einträge in {secs:.1f} s ({rows / max(secs, 1e-9):,.0f} Zeilen/s).")
+        
+        def on_bulk_export(self):
+            if not self.db.conn:
+                return
+            start_dir = os.path.dirname(self.db.path) if getattr(self.db, "path", None) else ""
+            path, _ = QFileDialog.getSaveFileName(self, "Glossar exportieren", start_dir,
+                "CSV (*.csv);;TMX (*.tmx);;PO (*.po)")
+            if not path:
+                return
+            src_lang = self.src_combo.currentText()
+            dst_lang = self.dst_combo.currentText()
+            dlg, progress = self._bulk_progress(f"Export {os.path.basename(path)}")
+            try:
+                rows, secs = self.db.bulk_export(path, src_lang, dst_lang, progress=progress)
+            except Exception as e:
+                QMessageBox.critical(self, "Export fehlgeschlagen", str(e))
+                return
+            finally:
+                dlg.close()
+            QMessageBox.information(self, "Export", f"{rows:,} Einträge in {secs:.1f} s exportiert.")
         
         def on_browse(self):
             path, _ = QFileDialog.getSaveFileName(self,
@@ -44408,9 +46367,7 @@ try:
         def on_table_select(self):
             rows = self.table.selectionModel().selectedRows()
             if not rows: return
-            r = rows[0].row()
-            src_text = self.table.item(r, 1).text()
-            dst_text = self.table.item(r, 2).text()
+            src_text, dst_text = self.pair_model.pair(rows[0].row())
             self.set_source_text(src_text)
             self._baseline_target = dst_text
             self.set_target_text(dst_text)
@@ -44496,29 +46453,71 @@ try:
         
         def refresh_table(self):
             if not self.db.conn:
-                self.table.setRowCount(0)
+                self.pair_model.clear()
                 return
             src_lang = self.src_combo.currentText()
             dst_lang = self.dst_combo.currentText()
             try:
-                rows = self.db.fetch_pairs(src_lang, dst_lang)
+                # nur die erste Seite; weitere lädt die View beim Scrollen
+                self.pair_model.set_query(self.db, src_lang, dst_lang, self.filter_edit.text())
             except Exception as e:
                 QMessageBox.critical(self, "DB-Fehler", str(e))
                 return
-            self.table.setRowCount(len(rows))
-            for r, (hid, s, t) in enumerate(rows):
-                self.table.setItem(r, 0, QTableWidgetItem(to_hex64DB(hid)))
-                self.table.setItem(r, 1, QTableWidgetItem(s))
-                self.table.setItem(r, 2, QTableWidgetItem(t))
-            if rows:
+            if self.pair_model.rowCount():
                 self.table.selectRow(0)
             else:
                 self.table.clearSelection()
                 
+    # ---------------------------------------------------------------------------
+    # \brief SQLite translation dictionary (terms + translations).
+    #        term ids are term_hash64DB(lang, text) - they are computed in Python,
+    #        so lookups never insert: best_translation(), lookup_many(),
+    #        candidates(), fuzzy_terms() and get_translation_meta() are read-only.
+    #        results of lookups are kept in a LRU cache (LOOKUP_CACHE_SIZE
+    #        entries), which is cleared by every write. writes go through add_translations(), one
+    #        executemany() transaction per batch, which also adds new terms to
+    #        the ShortTermIndex of fuzzy_terms().
+    # ---------------------------------------------------------------------------
     class TranslatorDB:
+        LOOKUP_CACHE_SIZE = 8192
+        LOOKUP_CHUNK      = 500     # Anzahl ? je IN (...)-Abfrage
+        BULK_CHUNK        = 50000   # Zeilen je Transaktion beim Import
+        PAGE_SIZE         = 500     # Zeilen je Seite (page_pairs / Tabellenmodell)
+        
+        FUZZY_POOL        = 400     # Kandidaten je Index-Abfrage für fuzzy_terms()
+
+        # ------------------------------------------------
+        # Volltextindex über terms.norm_text (external
+        # content), per Trigger synchron gehalten.
+        # trigram: Teilstring-Suche und Kandidaten für
+        # fuzzy_terms(); ältere sqlite ohne trigram
+        # (< 3.34) bekommen unicode61 (nur Wortpräfix).
+        # ------------------------------------------------
+        FTS_TOKENIZERS = ("trigram", "unicode61 remove_diacritics 0")
+        FTS_TABLE    = """CREATE VIRTUAL TABLE terms_fts USING fts5(
+            norm_text, content='terms', content_rowid='term_id', tokenize='{tokenize}')"""
+        FTS_TRIGGERS = """
+        CREATE TRIGGER IF NOT EXISTS terms_fts_ai AFTER INSERT ON terms BEGIN
+            INSERT INTO terms_fts(rowid, norm_text) VALUES (new.term_id, new.norm_text);
+        END;
+        CREATE TRIGGER IF NOT EXISTS terms_fts_ad AFTER DELETE ON terms BEGIN
+            INSERT INTO terms_fts(terms_fts, rowid, norm_text) VALUES ('delete', old.term_id, old.norm_text);
+        END;
+        CREATE TRIGGER IF NOT EXISTS terms_fts_au AFTER UPDATE ON terms BEGIN
+            INSERT INTO terms_fts(terms_fts, rowid, norm_text) VALUES ('delete', old.term_id, old.norm_text);
+            INSERT INTO terms_fts(rowid, norm_text) VALUES (new.term_id, new.norm_text);
+        END;
+        """
+        
         def __init__(self, parent: QWidget = None):
             self.conn: Optional[sqlite3.Connection] = None
             self.path: Optional[str] = None
+            self.has_fts = False
+            self.fts_tokenize: Optional[str] = None
+            # (src_lang, norm_text, dst_lang) -> bester Zieltext oder None
+            self.lookup_cache: "OrderedDict[Tuple[str, str, str], Optional[str]]" = OrderedDict()
+            # (lang, max_dist) -> ShortTermIndex, bei Bedarf gebaut
+            self.short_terms: Dict[Tuple[str, int], ShortTermIndex] = {}
         
         def connect(self, path: str, create_if_missing: bool = True):
             # wenn laden ohne Erstellen, Datei muss existieren
@@ -44545,13 +46544,68 @@ try:
                 self.conn.execute(sql)
             
             self.conn.commit()
+            self.ensure_fts()
             self.path = path
+            self.lookup_cache.clear()
+            self.short_terms.clear()
+        
+        # -----------------------------------------------------------------------
+        # \brief create terms_fts + triggers if missing (or built with another
+        #        tokenizer) and fill it from terms. the first tokenizer of
+        #        FTS_TOKENIZERS this sqlite build knows is used (fts_tokenize);
+        #        without FTS5 has_fts stays False and filters fall back to LIKE.
+        # -----------------------------------------------------------------------
+        def ensure_fts(self, rebuild: bool = False):
+            self.ensure()
+            row = self.conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type='table' AND name='terms_fts'").fetchone()
+            for tokenize in self.FTS_TOKENIZERS:
+                sql = self.FTS_TABLE.format(tokenize=tokenize)
+                try:
+                    if row is None or row[0] != sql:
+                        with self.conn:
+                            self.conn.execute("DROP TABLE IF EXISTS terms_fts")
+                            self.conn.execute(sql)
+                        rebuild = True
+                    self.conn.executescript(self.FTS_TRIGGERS)
+                    if rebuild:
+                        with self.conn:
+                            self.conn.execute("INSERT INTO terms_fts(terms_fts) VALUES ('rebuild')")
+                    self.has_fts = True
+                    self.fts_tokenize = tokenize
+                    return
+                except sqlite3.OperationalError as e:
+                    DebugPrint(f"FTS5 ({tokenize}) nicht verfügbar: {e}")
+                    row = None
+            self.has_fts = False
+            self.fts_tokenize = None
+        
+        def drop_fts_triggers(self):
+            for name in ("terms_fts_ai", "terms_fts_ad", "terms_fts_au"):
+                self.conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+        
+        def fts_query(self, text: str) -> str:
+            """
+            Filtertext -> FTS5-Ausdruck, UND-verknüpft: trigram - jedes Wort als
+            Teilstring, unicode61 - jedes Wort als Präfix. "" = nicht über den
+            Index suchbar (kein FTS oder ein Wort < 3 Zeichen bei trigram).
+            """
+            words = re.findall(r"\w+", normDB(text), re.UNICODE)
+            if not self.has_fts or not words:
+                return ""
+            if self.fts_tokenize == "trigram":
+                if min(len(w) for w in words) < 3:
+                    return ""
+                return " ".join('"' + w + '"' for w in words)
+            return " ".join('"' + w.replace('"', '""') + '"*' for w in words)
         
         def close(self):
             if self.conn:
                 self.conn.close()
                 self.conn = None
                 self.path = None
+            self.lookup_cache.clear()
+            self.short_terms.clear()
             
         def ensure(self):
             if self.conn is None:
@@ -44560,14 +46614,13 @@ try:
         def upsert_term(self, lang: str, text: str) -> int:
             self.ensure()
             nid = term_hash64DB(lang, text)
-            try:
+            with self.conn:
                 self.conn.execute(
-                    "INSERT INTO terms(term_id, lang, text, norm_text) VALUES (?, ?, ?, ?)",
-                    (nid, lang, text, norm(text)),
+                    "INSERT OR IGNORE INTO terms(term_id, lang, text, norm_text) VALUES (?, ?, ?, ?)",
+                    (nid, lang, text, normDB(text)),
                 )
-                self.conn.commit()
-            except sqlite3.IntegrityError:
-                pass  # existiert bereits
+            for (index_lang, _max_dist), index in self.short_terms.items():
+                if index_lang == lang: index.add([(nid, normDB(text))])
             return nid
         
         def get_term_text(self, term_id: int) -> Optional[Term]:
@@ -44588,24 +46641,53 @@ try:
             number: Optional[str] = None,
             is_noun: int = 0, is_adj: int = 0, is_verb: int = 0,
             is_fem: int = 0, is_mask: int = 0):
+            self.add_translations([(src_lang, src_text, dst_lang, dst_text,
+                confidence, source, number,
+                is_noun, is_adj, is_verb, is_fem, is_mask)])
+            return term_hash64DB(src_lang, src_text), term_hash64DB(dst_lang, dst_text)
+        
+        # -----------------------------------------------------------------------
+        # \brief write a batch of translations in one transaction: terms with
+        #        INSERT OR IGNORE, pairs with INSERT OR REPLACE, each as a single
+        #        executemany(). rows as for add_translation(); trailing fields
+        #        (confidence ... is_mask) may be omitted.
+        # \return number of rows
+        # -----------------------------------------------------------------------
+        def add_translations(self, rows) -> int:
             self.ensure()
-            s_id = self.upsert_term(src_lang, src_text)
-            t_id = self.upsert_term(dst_lang, dst_text)
-            self.conn.execute(
-                """INSERT OR REPLACE INTO translations
-                   (src_term_id, tgt_term_id, confidence, source, number,
-                    is_noun, is_adj, is_verb, is_fem, is_mask)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (s_id, t_id, confidence, source, number,
-                 int(is_noun), int(is_adj), int(is_verb), int(is_fem), int(is_mask))
-            )
-            self.conn.commit()
-            return s_id, t_id
+            defaults = (1.0, None, None, 0, 0, 0, 0, 0)
+            terms = {}
+            pairs = []
+            for row in rows:
+                src_lang, src_text, dst_lang, dst_text = row[:4]
+                confidence, source, number, is_noun, is_adj, is_verb, is_fem, is_mask = \
+                    tuple(row[4:]) + defaults[len(row) - 4:]
+                s_id = term_hash64DB(src_lang, src_text)
+                t_id = term_hash64DB(dst_lang, dst_text)
+                terms.setdefault(s_id, (s_id, src_lang, src_text, normDB(src_text)))
+                terms.setdefault(t_id, (t_id, dst_lang, dst_text, normDB(dst_text)))
+                pairs.append((s_id, t_id, confidence, source, number,
+                    int(is_noun), int(is_adj), int(is_verb), int(is_fem), int(is_mask)))
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO terms(term_id, lang, text, norm_text) VALUES (?, ?, ?, ?)",
+                    terms.values())
+                self.conn.executemany(
+                    """INSERT OR REPLACE INTO translations
+                       (src_term_id, tgt_term_id, confidence, source, number,
+                        is_noun, is_adj, is_verb, is_fem, is_mask)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    pairs)
+            self.lookup_cache.clear()
+            for (lang, _max_dist), index in self.short_terms.items():
+                index.add((term_id, norm) for term_id, term_lang, _text, norm in terms.values()
+                          if term_lang == lang)
+            return len(pairs)
         
         def get_translation_meta(self, src_lang: str, src_text: str, dst_lang: str, dst_text: str):
             self.ensure()
-            s_id = self.upsert_term(src_lang, src_text)
-            t_id = self.upsert_term(dst_lang, dst_text)
+            s_id = term_hash64DB(src_lang, src_text)
+            t_id = term_hash64DB(dst_lang, dst_text)
             cur = self.conn.execute(
                 """SELECT number, is_noun, is_adj, is_verb, is_fem, is_mask
                    FROM translations WHERE src_term_id=? AND tgt_term_id=?""",
@@ -44615,18 +46697,51 @@ try:
         
         def best_translation(self, src_lang: str, src_text: str, dst_lang: str) -> Optional[str]:
             """Gibt die beste Zieltext-Variante zurück (oder None)."""
+            return self.lookup_many(src_lang, (src_text,), dst_lang).get(normDB(src_text))
+        
+        def lookup_many(self, src_lang: str, texts, dst_lang: str) -> Dict[str, Optional[str]]:
+            """
+            Beste Übersetzung für viele Texte auf einmal, nur lesend.
+            Rückgabe: norm_text -> Zieltext oder None. Was nicht im LRU-Cache
+            steht, wird mit einer IN (...)-Abfrage je LOOKUP_CHUNK Terme geholt.
+            """
             self.ensure()
-            s_id = self.upsert_term(src_lang, src_text)  # sorgt für konsistente ID
-            cur = self.conn.execute("""
-                SELECT t.text, tr.confidence
-                FROM translations tr
-                JOIN terms t ON t.term_id = tr.tgt_term_id
-                WHERE tr.src_term_id=? AND t.lang=?
-                ORDER BY tr.confidence DESC
-                LIMIT 1
-            """, (s_id, dst_lang))
-            row = cur.fetchone()
-            return row[0] if row else None
+            cache  = self.lookup_cache
+            result = {}
+            ids    = {}
+            seen   = set()
+            for text in texts:
+                n = normDB(text)
+                if n in seen:
+                    continue
+                seen.add(n)
+                key = (src_lang, n, dst_lang)
+                if key in cache:
+                    cache.move_to_end(key)
+                    result[n] = cache[key]
+                else:
+                    ids[term_hash64DB(src_lang, n)] = n
+            
+            found = {}
+            pending = list(ids)
+            for i in range(0, len(pending), self.LOOKUP_CHUNK):
+                chunk = pending[i:i + self.LOOKUP_CHUNK]
+                cur = self.conn.execute(f"""
+                    SELECT tr.src_term_id, t.text
+                    FROM translations tr
+                    JOIN terms t ON t.term_id = tr.tgt_term_id
+                    WHERE tr.src_term_id IN ({",".join("?" * len(chunk))}) AND t.lang=?
+                    ORDER BY tr.src_term_id, tr.confidence DESC
+                """, (*chunk, dst_lang))
+                for s_id, text in cur:
+                    found.setdefault(s_id, text)
+            
+            for s_id, n in ids.items():
+                text = result[n] = found.get(s_id)
+                cache[(src_lang, n, dst_lang)] = text
+            while len(cache) > self.LOOKUP_CACHE_SIZE:
+                cache.popitem(last=False)
+            return result
         
         def fetch_pairs(self, src_lang: str, dst_lang: str) -> List[Tuple[int, str, str]]:
             """Liste aller (hash, src, dst) für die aktuelle Sprachrichtung."""
@@ -44641,10 +46756,241 @@ try:
             """, (src_lang, dst_lang))
             return [(row[0], row[1], row[2]) for row in cur.fetchall()]
         
-        def candidates(self, src_lang: str, src_text: str, dst_lang: str, limit: int = 100):
-            """Alle Ziel-Kandidaten für ein Quell-Wort/-Phrase, absteigend nach confidence."""
+        # -----------------------------------------------------------------------
+        # \brief one page of pairs in fetch_pairs() order, keyset pagination:
+        #        after = key of the last row of the previous page. the key is
+        #        (norm_text, src term_id, tgt term_id) - a source term can have
+        #        several targets. match filters the source terms by terms_fts.
+        # \return [(term_id, src_text, dst_text, key), ...]
+        # -----------------------------------------------------------------------
+        def page_pairs(self, src_lang: str, dst_lang: str, after: Optional[tuple] = None,
+            limit: int = PAGE_SIZE, match: str = ""):
+            self.ensure()
+            where  = ["s.lang=?", "t.lang=?"]
+            params = [src_lang, dst_lang]
+            if after is not None:
+                where.append("(s.norm_text, s.term_id, t.term_id) > (?, ?, ?)")
+                params += after
+            if match.strip():
+                query = self.fts_query(match)
+                if query:
+                    where.append("s.term_id IN (SELECT rowid FROM terms_fts WHERE terms_fts MATCH ?)")
+                    params.append(query)
+                else:
+                    where.append("s.norm_text LIKE ? ESCAPE '\\'")
+                    params.append("%" + re.sub(r"([%_\\])", r"\\\1", normDB(match)) + "%")
+            cur = self.conn.execute(f"""
+                SELECT s.term_id, s.text, t.text, s.norm_text, t.term_id
+                FROM terms s
+                JOIN translations tr ON tr.src_term_id = s.term_id
+                JOIN terms t ON t.term_id = tr.tgt_term_id
+                WHERE {" AND ".join(where)}
+                ORDER BY s.norm_text, s.term_id, t.term_id
+                LIMIT ?
+            """, (*params, limit))
+            return [(hid, src, dst, (norm, hid, tid)) for hid, src, dst, norm, tid in cur]
+        
+        def iter_pairs(self, src_lang: str, dst_lang: str, batch: int = 1000):
+            """Wie fetch_pairs(), aber als Generator (fetchmany) - ohne alles im Speicher."""
             self.ensure()
-            s_id = self.upsert_term(src_lang, src_text)
+            cur = self.conn.execute("""
+                SELECT s.term_id, s.text AS src_text, t.text AS dst_text,
+                       tr.confidence, IFNULL(tr.source, '')
+                FROM translations tr
+                JOIN terms s ON s.term_id = tr.src_term_id
+                JOIN terms t ON t.term_id = tr.tgt_term_id
+                WHERE s.lang=? AND t.lang=?
+                ORDER BY s.norm_text ASC
+            """, (src_lang, dst_lang))
+            while True:
+                rows = cur.fetchmany(batch)
+                if not rows:
+                    return
+                yield from rows
+        
+        # -----------------------------------------------------------------------
+        # \brief bulk import of a glossary (CSV, TMX or PO; by file extension if
+        #        fmt is None). the file is read by a generator and written with
+        #        add_translations() in transactions of BULK_CHUNK rows; during the
+        #        load synchronous=OFF and the secondary indexes idx_terms_lang_norm
+        #        and idx_terms_lang_len are dropped and built once at the end.
+        #
+        # \param  progress - callback(rows, rows_per_sec); returning False stops
+        # \return (rows, seconds)
+        # -----------------------------------------------------------------------
+        def bulk_import(self, path: str, src_lang: str, dst_lang: str, fmt: Optional[str] = None,
+            source: Optional[str] = None, progress=None) -> Tuple[int, float]:
+            self.ensure()
+            rows  = translation_reader(path, src_lang, dst_lang, fmt, source)
+            total = 0
+            start = time.perf_counter()
+            synchronous = self.conn.execute("PRAGMA synchronous").fetchone()[0]
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=OFF")
+            try:
+                with self.conn:
+                    self.conn.execute("DROP INDEX IF EXISTS idx_terms_lang_norm")
+                    self.conn.execute("DROP INDEX IF EXISTS idx_terms_lang_len")
+                    if self.has_fts:
+                        self.drop_fts_triggers()
+                for chunk in iter(lambda: list(itertools.islice(rows, self.BULK_CHUNK)), []):
+                    total += self.add_translations(chunk)
+                    if progress and progress(total, total / max(time.perf_counter() - start, 1e-9)) is False:
+                        break
+            finally:
+                with self.conn:
+                    self.conn.execute("CREATE INDEX IF NOT EXISTS idx_terms_lang_norm ON terms(lang, norm_text)")
+                    self.conn.execute("CREATE INDEX IF NOT EXISTS idx_terms_lang_len ON terms(lang, length(norm_text), norm_text)")
+                if self.has_fts:
+                    self.ensure_fts(rebuild=True)
+                self.conn.execute(f"PRAGMA synchronous={int(synchronous)}")
+            return total, time.perf_counter() - start
+        
+        # -----------------------------------------------------------------------
+        # \brief streaming export of one language direction (CSV, TMX or PO);
+        #        rows come from iter_pairs(), nothing is materialized.
+        # \return (rows, seconds)
+        # -----------------------------------------------------------------------
+        def bulk_export(self, path: str, src_lang: str, dst_lang: str, fmt: Optional[str] = None,
+            progress=None) -> Tuple[int, float]:
+            self.ensure()
+            start = time.perf_counter()
+            total = translation_writer(path, src_lang, dst_lang,
+                ((src, dst, conf, source) for _hid, src, dst, conf, source in self.iter_pairs(src_lang, dst_lang)),
+                fmt, progress)
+            return total, time.perf_counter() - start
+        
+        # -----------------------------------------------------------------------
+        # \brief ShortTermIndex over the terms of lang up to 4 * max_dist
+        #        characters (the longest possible hit of a word fuzzy_pieces()
+        #        cannot cover), read once over idx_terms_lang_len; writes add new
+        #        terms to it, deleting terms drops it.
+        # -----------------------------------------------------------------------
+        def short_term_index(self, lang: str, max_dist: int) -> ShortTermIndex:
+            index = self.short_terms.get((lang, max_dist))
+            if index is None:
+                index = self.short_terms[(lang, max_dist)] = ShortTermIndex(max_dist)
+                index.add(self.conn.execute(
+                    "SELECT term_id, norm_text FROM terms WHERE lang=? AND length(norm_text) <= ?",
+                    (lang, index.max_len)))
+            return index
+        
+        # -----------------------------------------------------------------------
+        # \brief ranked fuzzy lookup of terms of one language: exact, prefix,
+        #        substring and edit distance <= max_dist, all through indexes -
+        #        exact and prefix over idx_terms_lang_norm (range scan), substring
+        #        over the trigram index terms_fts. typo candidates come from
+        #        fuzzy_pieces(): with <= k edits one piece is unchanged, so the
+        #        terms with the first piece as prefix (nearest to the word in
+        #        sort order) and the terms containing one of the other pieces
+        #        hold every hit; edit_distance_within() checks at most FUZZY_POOL
+        #        candidates per piece. short words (fewer than max_dist+1 pieces of
+        #        >= 3 characters) additionally take the FUZZY_POOL candidates of
+        #        short_term_index() sharing the most segments.
+        #
+        #        order: exact, prefix, distance 1, substring, distance 2; then
+        #        distance, length, text.
+        # \return [(term_id, text, norm_text, kind, distance), ...]
+        #         kind "exact" | "prefix" | "fuzzy" | "substring", distance None
+        #         if > max_dist
+        # -----------------------------------------------------------------------
+        def fuzzy_terms(self, lang: str, text: str, limit: int = 10, max_dist: int = 2):
+            self.ensure()
+            norm = normDB(text)
+            if not norm:
+                return []
+            pool = self.FUZZY_POOL
+            size = (len(norm) - max_dist, len(norm) + max_dist)
+            trigram = self.has_fts and self.fts_tokenize == "trigram"
+            def scan(where, params, order="norm_text", limit=pool):
+                return self.conn.execute(f"""
+                    SELECT term_id, text, norm_text FROM terms
+                    WHERE lang=? AND {where} ORDER BY {order} LIMIT ?
+                """, (lang, *params, limit)).fetchall()
+            def substring(piece, where="", params=()):
+                return self.conn.execute(f"""
+                    SELECT t.term_id, t.text, t.norm_text
+                    FROM terms_fts CROSS JOIN terms t ON t.term_id = terms_fts.rowid
+                    WHERE terms_fts MATCH ? AND t.lang=? {where}
+                    LIMIT ?
+                """, ('"' + piece.replace('"', '""') + '"', lang, *params, pool)).fetchall()
+            
+            # exakt + Präfix
+            rows = scan("norm_text >= ? AND norm_text < ?", (norm, norm + "\U0010ffff"))
+            if trigram and len(norm) >= 3:
+                rows += substring(norm)
+            if max_dist > 0:
+                pieces = fuzzy_pieces(norm, max_dist)
+                near = "length(norm_text) BETWEEN ? AND ? AND norm_text >= ? AND norm_text < ?"
+                # Terme mit dem ersten Stück als Präfix, von norm aus in beide Richtungen
+                rows += scan(near + " AND norm_text >= ?", (*size, pieces[0], pieces[0] + "\U0010ffff", norm),
+                             limit=pool // 2)
+                rows += scan(near + " AND norm_text < ?", (*size, pieces[0], pieces[0] + "\U0010ffff", norm),
+                             order="norm_text DESC", limit=pool // 2)
+                if trigram:
+                    for piece in pieces[1:]:
+                        rows += substring(piece, "AND length(t.norm_text) BETWEEN ? AND ?", size)
+                if len(pieces) <= max_dist:
+                    # kurzes Wort: Stücke zu kurz für Trigramme -> Segment-Index der kurzen Terme
+                    ids = self.short_term_index(lang, max_dist).candidates(norm, pool)
+                    for i in range(0, len(ids), self.LOOKUP_CHUNK):
+                        chunk = ids[i:i + self.LOOKUP_CHUNK]
+                        rows += self.conn.execute(f"""
+                            SELECT term_id, text, norm_text FROM terms WHERE term_id IN ({",".join("?" * len(chunk))})
+                        """, chunk).fetchall()
+            
+            found = {}
+            for term_id, term_text, term_norm in rows:
+                if term_id in found:
+                    continue
+                dist = edit_distance_within(norm, term_norm, max_dist)
+                if dist == 0:
+                    rank, kind = 0, "exact"
+                elif term_norm.startswith(norm):
+                    rank, kind = 1, "prefix"
+                elif dist == 1:
+                    rank, kind = 2, "fuzzy"
+                elif len(norm) >= 3 and norm in term_norm:    # Teilstring wird nur über Trigramme gesucht
+                    rank, kind = 3, "substring"
+                elif dist is not None:
+                    rank, kind = 4, "fuzzy"
+                else:
+                    continue
+                found[term_id] = ((rank, max_dist + 1 if dist is None else dist, len(term_norm), term_norm),
+                                  (term_id, term_text, term_norm, kind, dist))
+            return [row for _key, row in sorted(found.values())[:limit]]
+        
+        # -----------------------------------------------------------------------
+        # \brief translations of the fuzzy_terms() hits of src_text, in their
+        #        rank order, per term by confidence.
+        # \return [(src_text, tgt_text, confidence, source, kind), ...]
+        # -----------------------------------------------------------------------
+        def fuzzy_candidates(self, src_lang: str, src_text: str, dst_lang: str,
+            limit: int = 100, terms: int = 10, max_dist: int = 2):
+            self.ensure()
+            hits = self.fuzzy_terms(src_lang, src_text, terms, max_dist)
+            if not hits:
+                return []
+            order = {hit[0]: i for i, hit in enumerate(hits)}
+            cur = self.conn.execute(f"""
+                SELECT tr.src_term_id, t.text, tr.confidence, IFNULL(tr.source, '')
+                FROM translations tr
+                JOIN terms t ON t.term_id = tr.tgt_term_id
+                WHERE tr.src_term_id IN ({",".join("?" * len(hits))}) AND t.lang=?
+            """, (*order, dst_lang))
+            rows = sorted(cur.fetchall(), key=lambda r: (order[r[0]], -r[2]))
+            return [(hits[order[s_id]][1], tgt, conf, source, hits[order[s_id]][3])
+                    for s_id, tgt, conf, source in rows[:limit]]
+        
+        def candidates(self, src_lang: str, src_text: str, dst_lang: str, limit: int = 100,
+            fuzzy: bool = False):
+            """
+            Alle Ziel-Kandidaten für ein Quell-Wort/-Phrase, absteigend nach confidence.
+            fuzzy: ohne exakten Treffer die Übersetzungen ähnlicher Quell-Terme
+            (fuzzy_candidates()) liefern.
+            """
+            self.ensure()
+            s_id = term_hash64DB(src_lang, src_text)
             cur = self.conn.execute("""
                 SELECT t.text, tr.confidence, IFNULL(tr.source, '')
                 FROM translations tr
@@ -44653,17 +46999,22 @@ try:
                 ORDER BY tr.confidence DESC
                 LIMIT ?
             """, (s_id, dst_lang, limit))
-            return cur.fetchall()  # List[Tuple[str,float,str]]
+            rows = cur.fetchall()  # List[Tuple[str,float,str]]
+            if fuzzy and not rows:
+                rows = [(tgt, conf, source) for _src, tgt, conf, source, _kind
+                        in self.fuzzy_candidates(src_lang, src_text, dst_lang, limit)]
+            return rows
             
         def delete_translation(self, src_lang: str, src_text: str, dst_lang: str, dst_text: str):
             self.ensure()
-            s_id = self.upsert_term(src_lang, src_text)
-            t_id = self.upsert_term(dst_lang, dst_text)
+            s_id = term_hash64DB(src_lang, src_text)
+            t_id = term_hash64DB(dst_lang, dst_text)
             self.conn.execute(
                 "DELETE FROM translations WHERE src_term_id=? AND tgt_term_id=?",
                 (s_id, t_id)
             )
             self.conn.commit()
+            self.lookup_cache.clear()
         
         def cleanup_orphan_terms(self):
             self.ensure()
@@ -44672,34 +47023,178 @@ try:
                 WHERE term_id NOT IN (SELECT src_term_id FROM translations)
                   AND term_id NOT IN (SELECT tgt_term_id FROM translations)
             """)
-            self.conn.commit()            
-                
-        # ---------- Hilfsfunktionen Übersetzung (einfaches Token-Mapping) ----------
-        TOKEN_RE = re.compile(r"\s+|[\w'-]+|[^\w\s]", re.UNICODE)
-        # ---------------------------------------------------------------------------
-        # Sehr einfache tokenbasierte Übersetzung:
-        # - Splittet in Wörter, Whitespaces und Satzzeichen
-        # - Für jedes *Wort*-Token DB-Lookup; fällt nichts an -> Original behalten
-        # - Groß-/Kleinschreibung des Quellworts wird auf das Ziel gemappt
-        # - Whitespace & Satzzeichen werden 1:1 übernommen (Spaces bleiben erhalten)
-        # ---------------------------------------------------------------------------
-        def translate_string_simple(db: TranslatorDB, src_lang: str, dst_lang: str, text: str) -> str:
-            def preserve_case(src_word: str, dst_word: str) -> str:
-                if not dst_word: return dst_word
-                if src_word.istitle(): return dst_word[:1].upper() + dst_word[1:]
-                if src_word.isupper(): return dst_word.upper()
-                return dst_word
-            
-            tokens = TOKEN_RE.findall(text)
-            out = []
-            for tok in tokens:
-                if tok.isspace():
-                    out.append(tok); continue
-                if not tok[0].isalnum():
-                    out.append(tok); continue
-                best = db.best_translation(src_lang, tok, dst_lang)
-                out.append(preserve_case(tok, best if best else tok))
-            return "".join(out)
+            self.conn.commit()
+            self.lookup_cache.clear()
+            self.short_terms.clear()
+                
+    # ---------- Hilfsfunktionen Übersetzung (einfaches Token-Mapping) ----------
+    TOKEN_RE = re.compile(r"\s+|[\w'-]+|[^\w\s]", re.UNICODE)
+    # ---------------------------------------------------------------------------
+    # Sehr einfache tokenbasierte Übersetzung:
+    # - Splittet in Wörter, Whitespaces und Satzzeichen
+    # - alle *Wort*-Token mit einem lookup_many() (nur lesend, ein Query je
+    #   Block statt einem INSERT+commit je Wort); fällt nichts an -> Original
+    # - Groß-/Kleinschreibung des Quellworts wird auf das Ziel gemappt
+    # - Whitespace & Satzzeichen werden 1:1 übernommen (Spaces bleiben erhalten)
+    # ---------------------------------------------------------------------------
+    def translate_string_simple(db: TranslatorDB, src_lang: str, dst_lang: str, text: str) -> str:
+        def preserve_case(src_word: str, dst_word: str) -> str:
+            if not dst_word: return dst_word
+            if src_word.istitle(): return dst_word[:1].upper() + dst_word[1:]
+            if src_word.isupper(): return dst_word.upper()
+            return dst_word
+        
+        tokens = TOKEN_RE.findall(text)
+        words  = [tok for tok in tokens if not tok.isspace() and tok[0].isalnum()]
+        best   = db.lookup_many(src_lang, words, dst_lang)
+        out = []
+        for tok in tokens:
+            if tok.isspace():
+                out.append(tok); continue
+            if not tok[0].isalnum():
+                out.append(tok); continue
+            hit = best.get(normDB(tok))
+            out.append(preserve_case(tok, hit if hit else tok))
+        return "".join(out)
+    
+    # ---------- Import/Export: CSV, TMX, PO (Generatoren, zeilenweise) ----------
+    #
+    # Leser liefern Zeilen für TranslatorDB.add_translations():
+    #   (src_lang, src_text, dst_lang, dst_text, confidence, source)
+    # Schreiber bekommen (src_text, dst_text, confidence, source).
+    
+    TMX_LANG = {"DEU": "de", "ENU": "en", "FRE": "fr"}
+    CSV_HEADER = {"src", "dst", "confidence", "source"}     # Spaltennamen der Kopfzeile
+    
+    def translation_format(path: str, fmt: Optional[str] = None) -> str:
+        fmt = (fmt or os.path.splitext(path)[1].lstrip(".")).lower()
+        if fmt not in ("csv", "tmx", "po"):
+            raise ValueError(f"Unbekanntes Format: {fmt or path} (csv, tmx, po)")
+        return fmt
+    
+    def iter_csv_translations(path: str, src_lang: str, dst_lang: str, source: Optional[str] = None):
+        """
+        CSV: src;dst[;confidence[;source]] - Trennzeichen per Sniffer. Kopfzeile:
+        Sniffer oder bekannte Spaltennamen (CSV_HEADER) in der ersten Zeile.
+        Leere oder nicht lesbare confidence -> 1.0 (kein Abbruch des Imports).
+        """
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            head = f.read(8192); f.seek(0)
+            try:
+                dialect = csv.Sniffer().sniff(head, delimiters=",;\t")
+                header  = csv.Sniffer().has_header(head)
+            except csv.Error:
+                dialect, header = csv.excel, False
+            reader = csv.reader(f, dialect)
+            if header:
+                next(reader, None)
+            for n, row in enumerate(reader):
+                if n == 0 and not header and row[:2] and all(c.strip().lower() in CSV_HEADER for c in row[:2]):
+                    continue
+                if len(row) < 2 or not row[0].strip() or not row[1].strip():
+                    continue
+                try:
+                    conf = float(row[2]) if len(row) > 2 and row[2].strip() else 1.0
+                except ValueError:
+                    conf = 1.0
+                yield (src_lang, row[0], dst_lang, row[1], conf, row[3] if len(row) > 3 and row[3] else source)
+    
+    def iter_tmx_translations(path: str, src_lang: str, dst_lang: str, source: Optional[str] = None):
+        """TMX: je <tu> das <seg> der Quell- und Zielsprache (xml:lang, Präfix de/en/fr)."""
+        from xml.etree.ElementTree import iterparse
+        xml_lang = "{http://www.w3.org/XML/1998/namespace}lang"
+        want = (TMX_LANG.get(src_lang, src_lang).lower(), TMX_LANG.get(dst_lang, dst_lang).lower())
+        for _event, elem in iterparse(path, events=("end",)):
+            if elem.tag != "tu":
+                continue
+            segs = {}
+            for tuv in elem.iter("tuv"):
+                lang = (tuv.get(xml_lang) or tuv.get("lang") or "").lower().split("-")[0]
+                seg  = tuv.find("seg")
+                if seg is not None:
+                    segs[lang] = "".join(seg.itertext())
+            elem.clear()
+            src, dst = segs.get(want[0], "").strip(), segs.get(want[1], "").strip()
+            if src and dst:
+                yield (src_lang, src, dst_lang, dst, 1.0, source)
+    
+    def _po_unquote(text: str) -> str:
+        text = text.strip()[1:-1]
+        return re.sub(r'\\(.)', lambda m: {"n": "\n", "t": "\t"}.get(m.group(1), m.group(1)), text)
+    
+    def iter_po_translations(path: str, src_lang: str, dst_lang: str, source: Optional[str] = None):
+        """PO: msgid -> msgstr (mehrzeilige Strings, Header und leere/fuzzy Einträge übersprungen)."""
+        msg, key, flags, fuzzy = {}, None, "", False
+        with open(path, "r", encoding="utf-8") as f:
+            for line in itertools.chain(f, ("msgid \"\"",)):     # Sentinel: letzter Eintrag
+                line = line.strip()
+                if not line:
+                    continue
+                if line.startswith("#"):
+                    if line.startswith("#,"):
+                        flags += line       # gehört zum nächsten Eintrag
+                    continue
+                if line.startswith('"') and key:
+                    msg[key] += _po_unquote(line)
+                    continue
+                word, _, rest = line.partition(" ")
+                if word in ("msgid", "msgctxt") and "msgstr" in msg:
+                    if msg.get("msgid") and msg["msgstr"] and not fuzzy:
+                        yield (src_lang, msg["msgid"], dst_lang, msg["msgstr"], 1.0, source)
+                    msg = {}
+                if not msg:
+                    fuzzy, flags = "fuzzy" in flags, ""
+                if word in ("msgid", "msgstr", "msgctxt"):
+                    key = word
+                    msg[key] = _po_unquote(rest)
+                else:
+                    key = None      # msgid_plural / msgstr[n]: nicht unterstützt
+    
+    def translation_reader(path: str, src_lang: str, dst_lang: str, fmt: Optional[str] = None,
+        source: Optional[str] = None):
+        reader = {"csv": iter_csv_translations, "tmx": iter_tmx_translations,
+                  "po": iter_po_translations}[translation_format(path, fmt)]
+        return reader(path, src_lang, dst_lang, source or os.path.basename(path))
+    
+    def _po_quote(text: str) -> str:
+        return '"' + text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n").replace("\t", "\\t") + '"'
+    
+    def translation_writer(path: str, src_lang: str, dst_lang: str, rows, fmt: Optional[str] = None,
+        progress=None, progress_every: int = 10000) -> int:
+        """rows: (src_text, dst_text, confidence, source) - wird zeilenweise geschrieben."""
+        fmt = translation_format(path, fmt)
+        from xml.sax.saxutils import escape, quoteattr
+        count = 0
+        start = time.perf_counter()
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            if fmt == "csv":
+                out = csv.writer(f, delimiter=";")
+                out.writerow(("src", "dst", "confidence", "source"))
+            elif fmt == "tmx":
+                f.write('<?xml version="1.0" encoding="UTF-8"?>\n<tmx version="1.4">\n'
+                    f'<header srclang={quoteattr(TMX_LANG.get(src_lang, src_lang))} datatype="plaintext" '
+                    'segtype="phrase" adminlang="en" creationtool="TranslatorDB" creationtoolversion="1" o-tmf="sqlite"/>\n<body>\n')
+            else:
+                f.write(f'msgid ""\nmsgstr ""\n"Content-Type: text/plain; charset=UTF-8\\n"\n'
+                    f'"Language: {TMX_LANG.get(dst_lang, dst_lang)}\\n"\n\n')
+            s_lang = quoteattr(TMX_LANG.get(src_lang, src_lang))
+            d_lang = quoteattr(TMX_LANG.get(dst_lang, dst_lang))
+            for src, dst, conf, source in rows:
+                if fmt == "csv":
+                    out.writerow((src, dst, conf, source))
+                elif fmt == "tmx":
+                    f.write(f'<tu><tuv xml:lang={s_lang}><seg>{escape(src)}</seg></tuv>'
+                            f'<tuv xml:lang={d_lang}><seg>{escape(dst)}</seg></tuv></tu>\n')
+                else:
+                    f.write(f"msgid {_po_quote(src)}\nmsgstr {_po_quote(dst)}\n\n")
+                count += 1
+                if progress and count % progress_every == 0:
+                    progress(count, count / max(time.perf_counter() - start, 1e-9))
+            if fmt == "tmx":
+                f.write("</body>\n</tmx>\n")
+        if progress:
+            progress(count, count / max(time.perf_counter() - start, 1e-9))
+        return count
             
     def analyze_pe(file_path):
         try:
@@ -0,0 +1,103 @@
+# console_screen.py
+from __future__ import annotations
+from typing import Iterator, List, Optional, Tuple
+
+# ---------- Zeichenzellen-Bildschirm für die Konsolenfenster ----------
+#
+# Statt HTML pro Zelle: drei flache Puffer (Zeichen, Vordergrund-, Hinter-
+# grundindex) mit cols*rows Einträgen, Zeile y liegt bei [y*cols : (y+1)*cols].
+# Farben stehen einmal in der Palette, die Zellen halten nur den Index.
+# Jede Änderung vergrößert das Dirty-Rechteck; der Zeichner holt es einmal
+# pro Frame mit take_dirty() ab und malt nur diese Zellen neu.
+
+class ConsoleScreen:
+    """
+    cols x rows Zeichenzellen mit Farbindex je Zelle und Dirty-Rechteck.
+    palette: Liste der Farbnamen ("#RRGGBB"), color() ergänzt neue Farben.
+    """
+    def __init__(self, cols: int, rows: int, fg: str = "#C0C0C0", bg: str = "#000000"):
+        self.cols = cols; self.rows = rows
+        self.palette: List[str] = []; self._index = {}
+        self.fg = self.color(fg); self.bg = self.color(bg)
+        self.chars: List[str] = []; self.fgs = bytearray(); self.bgs = bytearray()
+        self.dirty: Optional[Tuple[int, int, int, int]] = None
+        self.clear()
+
+    def color(self, name: str) -> int:
+        """Palettenindex für einen Farbnamen (Groß/Klein egal), neu angelegt falls nötig."""
+        key = name.upper(); idx = self._index.get(key)
+        if idx is None:
+            if len(self.palette) >= 256: raise ValueError("Palette voll (max. 256 Farben)")
+            idx = self._index[key] = len(self.palette); self.palette.append(key)
+        return idx
+
+    def set_colors(self, fg: str, bg: str) -> None:
+        self.fg = self.color(fg); self.bg = self.color(bg)
+
+    # ---------- Dirty-Rechteck (Zellen, x1/y1 exklusiv) ----------
+
+    def touch(self, x0: int, y0: int, x1: int, y1: int) -> None:
+        d = self.dirty
+        if d is None: self.dirty = (x0, y0, x1, y1)
+        else: self.dirty = (min(d[0], x0), min(d[1], y0), max(d[2], x1), max(d[3], y1))
+
+    def touch_all(self) -> None:
+        self.dirty = (0, 0, self.cols, self.rows)
+
+    def take_dirty(self) -> Optional[Tuple[int, int, int, int]]:
+        d = self.dirty; self.dirty = None
+        return d
+
+    # ---------- Schreiben ----------
+
+    def clear(self) -> None:
+        n = self.cols * self.rows
+        self.chars = [" "] * n
+        self.fgs = bytearray([self.fg]) * n; self.bgs = bytearray([self.bg]) * n
+        self.touch_all()
+
+    def put_text(self, x: int, y: int, text: str, fg: Optional[int] = None, bg: Optional[int] = None) -> int:
+        """
+        text ab Spalte x in Zeile y schreiben, am Zeilenende abgeschnitten
+        (kein Umbruch). x < 0 zählt als 0, y < 0 schreibt nichts.
+        Rückgabe: Anzahl geschriebener Zellen.
+        """
+        if y < 0: return 0
+        if y >= self.rows: raise IndexError(f"Zeile {y} außerhalb 0..{self.rows - 1}")
+        x = max(x, 0); n = min(len(text), self.cols - x)
+        if n <= 0: return 0
+        fg = self.fg if fg is None else fg; bg = self.bg if bg is None else bg
+        i = y * self.cols + x
+        self.chars[i:i + n] = text[:n]
+        self.fgs[i:i + n] = bytes((fg,)) * n; self.bgs[i:i + n] = bytes((bg,)) * n
+        self.touch(x, y, x + n, y + 1)
+        return n
+
+    def scroll(self, lines: int = 1) -> None:
+        """Inhalt um lines Zeilen nach oben schieben, unten Leerzeilen in den aktuellen Farben."""
+        lines = min(max(lines, 0), self.rows)
+        if not lines: return
+        k = lines * self.cols; n = self.cols * self.rows
+        self.chars[:n - k] = self.chars[k:]; self.chars[n - k:] = [" "] * k
+        self.fgs[:n - k] = self.fgs[k:]; self.fgs[n - k:] = bytes((self.fg,)) * k
+        self.bgs[:n - k] = self.bgs[k:]; self.bgs[n - k:] = bytes((self.bg,)) * k
+        self.touch_all()
+
+    # ---------- Lesen ----------
+
+    def row_text(self, y: int) -> str:
+        return "".join(self.chars[y * self.cols:(y + 1) * self.cols])
+
+    def text(self) -> str:
+        return "\n".join(self.row_text(y).rstrip() for y in range(self.rows))
+
+    def runs(self, y: int, x0: int = 0, x1: Optional[int] = None) -> Iterator[Tuple[int, int, int, int]]:
+        """Zeile y in Läufe gleicher Farbe zerlegen -> (x_start, x_end, fg, bg), x_end exklusiv."""
+        x1 = self.cols if x1 is None else x1
+        base = y * self.cols; fgs = self.fgs; bgs = self.bgs
+        start = x0
+        while start < x1:
+            f = fgs[base + start]; b = bgs[base + start]; end = start + 1
+            while end < x1 and fgs[base + end] == f and bgs[base + end] == b: end += 1
+            yield start, end, f, b
+            start = end
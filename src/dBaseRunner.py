@@ -8,6 +8,11 @@ from __future__  import annotations
 from antlr4      import (
      InputStream, FileStream, CommonTokenStream, Token,
      ParserRuleContext)
+from antlr4.Token     import CommonToken
+from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
+from antlr4.error.Errors        import ParseCancellationException
+from antlr4.atn.PredictionMode  import PredictionMode
+from antlr4.tree.Tree import TerminalNode, TerminalNodeImpl
 
 from dataclasses import dataclass, field
 from typing      import Dict, List, Optional, Union, Any
@@ -18,7 +23,17 @@ from gen.dBaseLexer         import dBaseLexer
 from gen.dBaseParser        import dBaseParser
 from gen.dBaseParserVisitor import dBaseParserVisitor
 
+from dBaseRuntime import (
+    OutputSink, StreamSink, FileSink, get_output_sink, set_output_sink
+)
+
 import traceback
+import argparse
+import concurrent.futures
+import multiprocessing
+import hashlib
+import pickle
+import time
 import sys
 import os
 import re
@@ -30,7 +45,7 @@ import pprint
 from PyQt5.QtCore    import (
     QObject, Qt, QSocketNotifier, pyqtSignal, QEvent, QRect, QSize, QRegExp,
     QFileInfo, QPoint, QAbstractProxyModel, QModelIndex, QRegularExpression,
-    QRectF, QPointF
+    QRectF, QPointF, QThread
 )
 from PyQt5.QtGui     import (
     QFont, QPainter, QFontMetrics, QSyntaxHighlighter, QTextCharFormat,
@@ -288,7 +303,16 @@ class ClassDef:
     methods: dict[str, object] = field(default_factory = dict)        # methodname -> MethodDeclContext
     default_props: dict[str, object] = field(default_factory = dict)  # defaults
     inits: list[object] = field(default_factory = list)
-    
+
+# Aufgelöste Klassenhierarchie (gecacht pro Klasse, verworfen bei Neudefinition)
+@dataclass
+class ClassInfo:
+    lineage: tuple[str, ...]                  # Klasse, Parent, ... (evtl. undefinierte Basis am Ende)
+    chain: tuple[str, ...]                    # definierte Klassen, Basis zuerst
+    methods: dict[str, tuple[str, object]]    # METHOD -> (owner, MethodDeclContext)
+    methods_silent: dict[str, object]         # nur "echte" Einträge (wie resolve_method_silent)
+    defaults: dict[str, object] | None = None # gemergte Default-Props (lazy)
+
 @dataclass
 class BoundMethod:
     target: "Instance"
@@ -315,6 +339,17 @@ class UnterminatedBlockCommentError(Exception):
         self.column  = column
         self.message = message
 
+# Token-Stream, der beim Holen des EOF-Tokens die Kommentar-Tiefe des Lexers
+# prüft. Damit wird der Quelltext genau einmal tokenisiert (fill() bzw. der
+# Parser selbst), ein zweiter nextToken()-Durchlauf entfällt.
+class CommentCheckingTokenStream(CommonTokenStream):
+    def fetch(self, n: int):
+        got = super().fetch(n)
+        if self.fetchedEOF and getattr(self.tokenSource, "_cmtDepth", 0) > 0:
+            lexer = self.tokenSource
+            raise UnterminatedBlockCommentError(lexer.line, lexer.column)
+        return got
+
 class KeyError(Exception):
     def __init__(self, name, message="Zuordnungs-Fehler"):
         super().__init__(self, name)
@@ -457,6 +492,9 @@ class Preprocessor:
         self.macros: dict[str, Macro] = {}
         self.defined: set[str] = set()
         self._include_stack: list[Path] = []
+        self.included: list[Path] = []      # alle gelesenen Dateien (Parse-Cache-Key)
+        self._scanner   = None                # kombinierter Makro-Scanner (lazy)
+        self._signature = None                # Hash des Makro-Zustands (Include-Cache)
 
     def _split_args(self, s: str) -> list[str]:
         # s ist Inhalt zwischen den äußeren (...) eines Calls
@@ -488,7 +526,9 @@ class Preprocessor:
         norm = norm.replace("\\", "\\\\").replace('"', '\\"')
         return f"\"{norm}\""
 
-    def _expand_function_macro(self, macro: Macro, call_args: list[str]) -> str:
+    def _expand_function_macro(self, macro: Macro, call_args: list[str],
+                               raw_args: list[str] | None = None) -> str:
+        # call_args: (vor-)expandierte Argumente, raw_args: Rohtext für # und ##
         if macro.params is None:
             raise PreprocessorError("internal: not a function macro")
 
@@ -498,6 +538,7 @@ class Preprocessor:
             )
 
         argmap = dict(zip(macro.params, call_args))
+        rawmap = dict(zip(macro.params, raw_args)) if raw_args is not None else argmap
 
         # body als Arbeitsstring
         body = macro.body
@@ -505,8 +546,8 @@ class Preprocessor:
         # 1) stringize: #param  (nur wenn param direkt folgt)
         #    Beispiel: #x
         for p in macro.params:
-            body = re.sub(rf'#\s*{re.escape(p)}\b',
-                          lambda m, p=p: self._stringize(argmap[p]),
+            body = re.sub(rf'(?<!#)#(?!#)\s*{re.escape(p)}\b',
+                          lambda m, p=p: self._stringize(rawmap[p]),
                           body)
 
         # 2) token paste: a ## b  (pragmatisch: Strings zusammenkleben)
@@ -520,8 +561,8 @@ class Preprocessor:
             right = m.group(2)
 
             # param ersetzen, falls es param ist
-            left_val = argmap.get(left, left)
-            right_val = argmap.get(right, right)
+            left_val = rawmap.get(left, left)
+            right_val = rawmap.get(right, right)
 
             # Wenn left_val ein Stringliteral ist ("..."), quotes entfernen und concat
             if left_val.startswith('"') and left_val.endswith('"'):
@@ -539,62 +580,150 @@ class Preprocessor:
 
         # 3) normale param substitution (für verbleibende params im body)
         for p in macro.params:
-            body = re.sub(rf'\b{re.escape(p)}\b', argmap[p], body)
+            body = re.sub(rf'\b{re.escape(p)}\b', lambda m, p=p: argmap[p], body)
 
         return body
 
-    def _expand_macros_in_line(self, line: str) -> str:
-        # Sehr einfache, iterative Expansion (mit Limit gegen Endlosschleifen)
-        out = line
-        for _ in range(50):
-            changed = False
-
-            # 1) function-like macros: NAME(...)
-            #    Suche NAME( ... ) und expandiere
-            for name, macro in list(self.macros.items()):
-                if macro.params is None:
-                    continue
+    # -----------------------------------------------------------------------
+    # Makro-Engine: ein kombinierter Scanner über alle Makronamen (neu gebaut
+    # nach #define), Expansion in einem Durchlauf mit Hide-Set gegen Rekursion.
+    # Stringliterale werden übersprungen (wie in C) - so bleibt auch das
+    # Ergebnis von #param beim erneuten Scannen unverändert.
+    # -----------------------------------------------------------------------
+    def _define(self, macro: Macro) -> None:
+        self.macros[macro.name] = macro
+        self.defined.add(macro.name)
+        self._scanner   = None
+        self._signature = None
+
+    def _get_scanner(self):
+        if self._scanner is None and self.macros:
+            names = sorted(self.macros, key=len, reverse=True)
+            self._scanner = re.compile(
+                r"""("(?:[^"\\\n]|\\.)*"|'[^'\n]*')|\b(?:"""
+                + "|".join(re.escape(n) for n in names) + r")\b")
+        return self._scanner
+
+    def _find_call_end(self, text: str, open_pos: int) -> int:
+        # open_pos zeigt auf '(' -> Index hinter der passenden ')' oder -1
+        depth = 0
+        for j in range(open_pos, len(text)):
+            ch = text[j]
+            if ch == "(":
+                depth += 1
+            elif ch == ")":
+                depth -= 1
+                if depth == 0:
+                    return j + 1
+        return -1
 
-                # finde "name(" in der Zeile
-                idx = out.find(name + "(")
-                while idx != -1:
-                    # parse bis passendes ')'
-                    j = idx + len(name) + 1
-                    depth = 1
-                    while j < len(out) and depth > 0:
-                        if out[j] == "(":
-                            depth += 1
-                        elif out[j] == ")":
-                            depth -= 1
-                        j += 1
-                    if depth != 0:
-                        # unbalanciert -> abbrechen
-                        break
+    def _expand(self, text: str, hide: frozenset) -> str:
+        scanner = self._get_scanner()
+        if scanner is None:
+            return text
 
-                    inside = out[idx + len(name) + 1 : j - 1]
-                    args = self._split_args(inside)
-                    repl = self._expand_function_macro(macro, args)
+        out: list[str] = []
+        pos = 0
+        while True:
+            m = scanner.search(text, pos)
+            if m is None:
+                break
+            name = m.group(0)
+            if m.group(1) is not None or name in hide:     # Stringliteral / verdeckt
+                out.append(text[pos:m.end()])
+                pos = m.end()
+                continue
 
-                    out = out[:idx] + repl + out[j:]
-                    changed = True
+            macro = self.macros[name]
+            if macro.params is None:
+                out.append(text[pos:m.start()])
+                out.append(self._expand(macro.body, hide | {name}))
+                pos = m.end()
+                continue
 
-                    idx = out.find(name + "(", idx + len(repl))
-                # next macro
+            # function-like: nur direkt gefolgt von "(" ein Aufruf
+            end = -1
+            if m.end() < len(text) and text[m.end()] == "(":
+                end = self._find_call_end(text, m.end())
+            if end == -1:
+                out.append(text[pos:m.end()])
+                pos = m.end()
+                continue
 
-            # 2) object-like macros: \bNAME\b
-            for name, macro in list(self.macros.items()):
-                if macro.params is not None:
-                    continue
-                # ganzes Wort ersetzen
-                new_out = re.sub(rf'\b{re.escape(name)}\b', macro.body, out)
-                if new_out != out:
-                    out = new_out
-                    changed = True
+            inside = text[m.end() + 1 : end - 1]
+            raw_args = self._split_args(inside)
+            if len(raw_args) != len(macro.params):
+                raise PreprocessorError(
+                    f"macro {macro.name} expects {len(macro.params)} args, got {len(raw_args)}"
+                )
+            # Argumente vorab expandieren (außer für #param, das nimmt den Rohtext)
+            args = [self._expand(a, hide) for a in raw_args]
+            repl = self._expand_function_macro(macro, args, raw_args)
 
-            if not changed:
-                break
+            out.append(text[pos:m.start()])
+            out.append(self._expand(repl, hide | {name}))
+            pos = end
 
-        return out
+        if not out:
+            return text
+        out.append(text[pos:])
+        return "".join(out)
+
+    def _expand_macros_in_line(self, line: str) -> str:
+        return self._expand(line, frozenset())
+
+    # -----------------------------------------------------------------------
+    # Include-Cache (prozessweit): verarbeitete Include-Dateien nach Pfad,
+    # mtime/Größe und Makro-Zustand beim Einbinden. Gespeichert werden Text,
+    # die dabei definierten Makros und die gelesenen Unter-Includes.
+    # -----------------------------------------------------------------------
+    _include_cache: dict[tuple, tuple] = {}
+    INCLUDE_CACHE_MAX = 256
+
+    @staticmethod
+    def _file_stamp(path: Path) -> tuple:
+        st = path.stat()
+        return (path, st.st_mtime_ns, st.st_size)
+
+    def _macro_signature(self) -> str:
+        if self._signature is None:
+            h = hashlib.sha1()
+            for name in sorted(self.macros):
+                mac = self.macros[name]
+                params = "" if mac.params is None else ",".join(mac.params)
+                h.update(f"{name}({params})={mac.body}\0".encode("utf-8"))
+            self._signature = h.hexdigest()
+        return self._signature
+
+    def _process_include(self, path: Path) -> str:
+        key = (self._file_stamp(path), self._macro_signature())
+        hit = self._include_cache.get(key)
+        if hit is not None:
+            text, defs, stamps = hit
+            try:
+                valid = all(self._file_stamp(st[0]) == st for st in stamps)
+            except OSError:
+                valid = False
+            if valid and not any(st[0] in self._include_stack for st in stamps):
+                for mac in defs:
+                    self._define(mac)
+                self.included.extend(st[0] for st in stamps)
+                return text
+
+        before = dict(self.macros)
+        first  = len(self.included)
+        text   = self._process_file(path)
+        defs   = [m for n, m in self.macros.items() if before.get(n) is not m]
+        try:
+            stamps = [self._file_stamp(p) for p in self.included[first:]]
+        except OSError:
+            return text
+
+        cache = self._include_cache
+        if len(cache) >= self.INCLUDE_CACHE_MAX:
+            del cache[next(iter(cache))]
+        cache[key] = (text, defs, stamps)
+        return text
 
     def process(self, filename: str | Path) -> str:
         #data = Path(filename).read_text(encoding="utf-8")
@@ -639,6 +768,7 @@ class Preprocessor:
             raise PreprocessorError(f"circular include detected: {chain}")
 
         self._include_stack.append(path)
+        self.included.append(path)
         try:
             text = path.read_text(encoding="utf-8", errors="replace")
             out_lines: list[str] = []
@@ -658,7 +788,7 @@ class Preprocessor:
                         inc_name = m.group(1)
                         inc_path = self._resolve_include(path, inc_name)
                         out_lines.append(f'**line 1 "{inc_path}"*/\n')
-                        out_lines.append(self._process_file(inc_path))
+                        out_lines.append(self._process_include(inc_path))
                         out_lines.append(f'**line {i+1} "{path}"*/\n')
                     continue
                     
@@ -666,10 +796,12 @@ class Preprocessor:
                 if m:
                     if active():
                         name = m.group(1)
-                        tail = (m.group(2) or "").strip()
+                        rest = m.group(2) or ""
+                        tail = rest.strip()
 
-                        # function-like: direkt nach Name "("
-                        if tail.startswith("("):
+                        # function-like: direkt nach Name "(" (ohne Leerzeichen,
+                        # sonst ist "(...)" der Body eines object-like Makros)
+                        if rest.startswith("("):
                             close = tail.find(")")
                             if close == -1:
                                 raise PreprocessorError(f"{path}:{i}: malformed function-like #define")
@@ -677,11 +809,9 @@ class Preprocessor:
                             body = tail[close+1:].lstrip()
 
                             params = [p.strip() for p in params_part.split(",")] if params_part else []
-                            self.macros[name] = Macro(name=name, params=params, body=body)
+                            self._define(Macro(name=name, params=params, body=body))
                         else:
-                            self.macros[name] = Macro(name=name, params=None, body=tail)
-
-                        self.defined.add(name)
+                            self._define(Macro(name=name, params=None, body=tail))
                     continue
                 
                 m = self.ifdef_re.match(line)
@@ -5343,6 +5473,553 @@ class FileEditorWindow(QDialog):
     def help_about(self):
         QMessageBox.information(self, "Über", "Einfacher QPlainTextEdit-Editor mit Zeilennummern.\n(Generiert im dBaseRunner)")
         
+# ---------------------------------------------------------------------------
+# IRCompiler - übersetzt ANTLR-Kontexte einmalig in Python-Closures ...
+# ---------------------------------------------------------------------------
+IMMUTABLE_PROP_TYPES = (type(None), bool, int, float, str, bytes, tuple)
+
+SIMPLE_REFERENCE_RE = re.compile(r'(this|[A-Za-z_]\w*)(\.[A-Za-z_]\w*)*', re.IGNORECASE)
+
+class IRCompiler:
+    """
+    Übersetzt den Parse-Baum (nach parse()) einmalig in einen Baum aus
+    vorab aufgelösten Closures. Beim Ausführen werden dann keine ANTLR-
+    Zugriffe (getText(), getChild(), multiplicativeExpr(i), ...) mehr
+    gemacht - wichtig für enge FOR/DO WHILE Schleifen.
+
+    Alles, was (noch) nicht übersetzt wird, fällt auf den ExecVisitor
+    zurück (vm.visit(ctx)), die Semantik bleibt also identisch.
+    """
+    def __init__(self, vm: "ExecVisitor"):
+        self.vm     = vm
+        self._cache : dict[object, Any] = {}   # ctx -> Closure
+
+        P = dBaseParser
+        self._stmt_table = {
+            P.StatementContext        : self._c_statement,
+            P.BlockContext            : self.compile_block,
+            P.IfStmtContext           : self._c_if,
+            P.ForStmtContext          : self._c_for,
+            P.DoWhileStatementContext : self._c_do_while,
+            P.WriteStmtContext        : self._c_write,
+            P.AssignStmtContext       : self._c_assign,
+            P.LocalDeclStmtContext    : self._c_local_decl,
+            P.LocalAssignStmtContext  : self._c_local_assign,
+            P.BreakStmtContext        : self._c_break,
+            P.ReturnStmtContext       : self._c_return,
+            P.ExprStmtContext         : self._c_expr_stmt,
+        }
+        self._expr_table = {
+            P.ExprContext               : lambda c: self.compile_expr(c.logicalOr()),
+            P.ConditionContext          : lambda c: self.compile_expr(c.logicalOr()),
+            P.LogicalOrContext          : self._c_logical_or,
+            P.LogicalAndContext         : self._c_logical_and,
+            P.LogicalNotContext         : self._c_logical_not,
+            P.ComparisonContext         : self._c_comparison,
+            P.AdditiveExprContext       : self._c_additive,
+            P.MultiplicativeExprContext : self._c_multiplicative,
+            P.PostfixExprContext        : self._c_postfix,
+            P.PrimaryContext            : self._c_primary,
+            P.LiteralContext            : self._c_literal,
+            P.MemberExprContext         : self._c_member,
+        }
+
+    # ---------- Einstieg ----------
+    def compile_input(self, ctx):
+        # entspricht ExecVisitor.visitInput im "exec"-Modus
+        body = tuple(self.compile_stmt(it.statement()) for it in ctx.item() if it.statement())
+
+        def run():
+            for st in body:
+                st()
+        return run
+
+    def compile_block(self, ctx):
+        code = self._cache.get(ctx)
+        if code is not None:
+            return code
+
+        body = tuple(self.compile_stmt(st) for st in ctx.statement())
+        if len(body) == 1:
+            code = body[0]
+        else:
+            def code():
+                for st in body:
+                    st()
+        self._cache[ctx] = code
+        return code
+
+    def compile_stmt(self, ctx):
+        fn = self._stmt_table.get(type(ctx))
+        if fn is None:
+            return self._fallback(ctx)
+        try:
+            return fn(ctx)
+        except Exception as err:
+            # Fehler beim Übersetzen (STEP 0, unvollständige Bäume nach der
+            # ANTLR-Fehlerbehandlung, ...) erst beim Ausführen melden - wie
+            # beim Visitor laufen alle Anweisungen davor noch
+            return self._deferred_error(err)
+
+    def compile_expr(self, ctx):
+        fn = self._expr_table.get(type(ctx))
+        if fn is None:
+            return self._fallback(ctx)
+        return fn(ctx)
+
+    def _fallback(self, ctx):
+        visit = self.vm.visit
+        return lambda: visit(ctx)
+
+    @staticmethod
+    def _deferred_error(err):
+        tb = err.__traceback__
+        def run():
+            raise err.with_traceback(tb)
+        return run
+
+    def _need(self, fn, ctx, what):
+        where = f"{ctx.start.line}:{ctx.start.column}"
+        def run():
+            v = fn()
+            if v is None:
+                raise Exception(f"{where}: {what} ist None")
+            return v
+        return run
+
+    # ---------- Statements ----------
+    def _c_statement(self, ctx):
+        # statement : ifStmt | doStmt | ... (genau ein Kind)
+        return self.compile_stmt(ctx.getChild(0))
+
+    def _c_if(self, ctx):
+        cond   = self.compile_expr(ctx.expr())
+        blocks = ctx.block()
+        then_b = self.compile_block(blocks[0])
+        else_b = self.compile_block(blocks[1]) if len(blocks) > 1 else None
+
+        if else_b is None:
+            def run():
+                if cond() != 0:
+                    then_b()
+        else:
+            def run():
+                if cond() != 0:
+                    then_b()
+                else:
+                    else_b()
+        return run
+
+    def _c_for(self, ctx):
+        vm     = self.vm
+        plan   = vm.for_loop_plan(ctx)
+        key    = plan[0]
+        body   = self.compile_block(ctx.block())
+
+        def run():
+            slot = vm.var_slot(key)           # Schleifenvariable einmal auflösen
+            try:
+                for v in vm.for_loop_values(plan):
+                    slot[key] = v
+                    body()
+            except BreakSignal:
+                pass
+            return None
+        return run
+
+    def _c_do_while(self, ctx):
+        cond  = self.compile_expr(ctx.condition())
+        block = self.compile_block(ctx.block())
+
+        def run():
+            guard = 0
+            while cond():
+                try:
+                    block()
+                except BreakSignal:
+                    break
+                guard += 1
+                if guard > 1_000_000:
+                    raise RuntimeError("DO WHILE: Endlosschleife?")
+        return run
+
+    def _c_write(self, ctx):
+        parts = []
+        for a in ctx.writeArg():
+            if a.STRING():
+                s = a.STRING().getText()[1:-1]
+                parts.append(lambda s=s: s)
+                continue
+            fn = self._c_dotted_ref(a.dottedRef()) if a.dottedRef() else self.compile_expr(a.expr())
+            def part(fn=fn):
+                val = fn()
+                return "" if val is None else str(val)
+            parts.append(part)
+        parts = tuple(parts)
+
+        def run():
+            get_output_sink().write_line("".join([p() for p in parts]))
+        return run
+
+    def _c_assign(self, ctx):
+        lv = ctx.lvalue()
+        pe = lv.postfixExpr()
+        if pe is None or pe.getChildCount() != 1:
+            # Calls/Suffixe im Ziel: Fehlerbehandlung bleibt beim Visitor
+            return self._fallback(ctx)
+
+        vm      = self.vm
+        value   = self.compile_expr(ctx.expr())
+        chain_u = [pe.primary().getText().upper()]
+        parts   = lv.getText().split(".")
+
+        if len(parts) == 1:
+            # einfacher Name: Key vorab, vorhandene Variable direkt im Scope setzen
+            name = parts[0]
+            key  = vm._vkey(name)
+
+            def run_name():
+                v = value()
+                if vm.with_stack and chain_u[0] != "THIS":
+                    return vm.set_chain_on_object(vm.with_stack[-1], chain_u, v, ctx)
+                for scope in reversed(vm._scopes):
+                    if key in scope:
+                        scope[key] = v
+                        return None
+                vm._set_name(name, v, ctx)
+                return None
+            return run_name
+
+        def run():
+            v = value()
+            base = vm.with_stack[-1] if vm.with_stack else None
+            if base is not None and chain_u[0] != "THIS":
+                return vm.set_chain_on_object(base, chain_u, v, ctx)
+            vm._set_chain_parts(parts, v, ctx)
+            return None
+        return run
+
+    def _c_local_decl(self, ctx):
+        vm   = self.vm
+        name = ctx.name.text
+        return lambda: vm.set_var(name, None)
+
+    def _c_local_assign(self, ctx):
+        vm    = self.vm
+        name  = ctx.name.text
+        value = self.compile_expr(ctx.expr())
+        def run():
+            v = value()
+            vm.set_var(name, v)
+            return v
+        return run
+
+    def _c_break(self, ctx):
+        def run():
+            raise BreakSignal()
+        return run
+
+    def _c_return(self, ctx):
+        value = self.compile_expr(ctx.expr()) if ctx.expr() else (lambda: None)
+        def run():
+            raise ReturnSignal(value())
+        return run
+
+    def _c_expr_stmt(self, ctx):
+        fn = self.compile_expr(ctx.postfixExpr())
+        def run():
+            fn()
+            return None
+        return run
+
+    # ---------- Expressions ----------
+    def _c_logical_or(self, ctx):
+        items = tuple(self.compile_expr(c) for c in ctx.logicalAnd())
+        if len(items) == 1:
+            return items[0]
+        def run():
+            result = None
+            for fn in items:
+                result = fn()
+                if bool(result):     # short-circuit
+                    return result
+            return result
+        return run
+
+    def _c_logical_and(self, ctx):
+        items = tuple(self.compile_expr(c) for c in ctx.logicalNot())
+        if len(items) == 1:
+            return items[0]
+        def run():
+            result = None
+            for fn in items:
+                result = fn()
+                if not bool(result): # short-circuit
+                    return result
+            return result
+        return run
+
+    def _c_logical_not(self, ctx):
+        if not ctx.NOT():
+            return self.compile_expr(ctx.comparison())
+        inner = self._need(self.compile_expr(ctx.logicalNot()), ctx, "logicalNot")
+        return lambda: not bool(inner())
+
+    _COMPARE_OPS = {
+        "<" : lambda a, b: a <  b,
+        "<=": lambda a, b: a <= b,
+        ">" : lambda a, b: a >  b,
+        ">=": lambda a, b: a >= b,
+        "==": lambda a, b: a == b,
+        "!=": lambda a, b: a != b,
+    }
+
+    def _c_comparison(self, ctx):
+        left = self.compile_expr(ctx.additiveExpr(0))
+        if ctx.additiveExpr(1) is None:
+            # additiveExpr prüft schon selbst auf None
+            return left
+
+        left  = self._need(left, ctx, "comparison left")
+        right = self._need(self.compile_expr(ctx.additiveExpr(1)), ctx, "comparison right")
+        op    = ctx.compareOp().getText()
+        fn    = self._COMPARE_OPS.get(op)
+        if fn is None:
+            raise Exception(f"{ctx.start.line}:{ctx.start.column}: unbekannter Vergleichs-Operator {op}")
+        return lambda: fn(left(), right())
+
+    def _c_binary_chain(self, ctx, operands, what, plus_op):
+        # operand ( op operand )*  -> links-assoziativ, Operatoren vorab aufgelöst
+        first = self._need(self.compile_expr(operands[0]), ctx, what)
+        rest  = []
+        for i in range(1, len(operands)):
+            is_first_op = ctx.getChild(2*i - 1).getText() == plus_op
+            rest.append((is_first_op, self._need(self.compile_expr(operands[i]), ctx, what + " rhs")))
+        return first, tuple(rest)
+
+    def _c_additive(self, ctx):
+        first, rest = self._c_binary_chain(ctx, ctx.multiplicativeExpr(), "additiveExpr", "+")
+        if not rest:
+            return first
+        if len(rest) == 1:
+            is_add, rhs = rest[0]
+            if is_add:
+                return lambda: first() + rhs()
+            return lambda: first() - rhs()
+
+        def run():
+            v = first()
+            for is_add, rhs in rest:
+                v = v + rhs() if is_add else v - rhs()
+            return v
+        return run
+
+    def _c_multiplicative(self, ctx):
+        first, rest = self._c_binary_chain(ctx, ctx.postfixExpr(), "multiplicativeExpr", "*")
+        if not rest:
+            return first
+        if len(rest) == 1:
+            is_mul, rhs = rest[0]
+            if is_mul:
+                return lambda: first() * rhs()
+            return lambda: first() / rhs()
+
+        def run():
+            v = first()
+            for is_mul, rhs in rest:
+                v = v * rhs() if is_mul else v / rhs()
+            return v
+        return run
+
+    def _c_postfix(self, ctx):
+        n = ctx.getChildCount()
+        if n == 1:
+            return self.compile_expr(ctx.primary())
+        # genau ein Call direkt hinter dem primary: obj.Method(...) / Foo(...)
+        if n in (3, 4) and ctx.getChild(1).getText() == "(" and ctx.getChild(n - 1).getText() == ")":
+            al = ctx.argList(0)        # None bei obj.Method() (argList() liefert dann [])
+            if n == 3 or al is not None:
+                return self.compile_call(ctx.primary(), al.expr() if al is not None else [], ctx)
+        # sonstige Member-/Call-Ketten: (noch) über den Visitor
+        return self._fallback(ctx)
+
+    def compile_call(self, callee_ctx, arg_ctxs, ctx):
+        # Call-Site mit Inline-Cache: (Klasse, Methode, Epoche) -> MethodDeclContext,
+        # ein wiederholtes obj.Method(...) spart sich die Hierarchiesuche.
+        vm     = self.vm
+        callee = self.compile_expr(callee_ctx)
+        args   = tuple(self.compile_expr(e) for e in arg_ctxs)
+        where  = f"{ctx.start.line}:{ctx.start.column}"
+        site   = [None, None, -1, None]        # class_name, method, epoch, mctx
+
+        def call_method(target, mname, argv):
+            if (site[0] != target.class_name or site[1] != mname
+                    or site[2] != vm.class_epoch):
+                if mname.upper() == "OPEN":
+                    # natives OPEN (FORM) nicht cachen
+                    return vm.invoke_method(target, mname, argv, ctx)
+                _, mctx = vm.resolve_method(target.class_name, mname, ctx)
+                site[0], site[1], site[2], site[3] = target.class_name, mname, vm.class_epoch, mctx
+            return vm.invoke_resolved(target, site[3], argv)
+
+        def run():
+            cur  = callee()
+            argv = [a() for a in args]
+            if isinstance(cur, Delegate):
+                return call_method(cur.target, cur.method_name, argv)
+            if isinstance(cur, BoundMethod):
+                return call_method(cur.target, cur.name, argv)
+            if callable(cur):
+                return cur(*argv)
+            raise Exception(f"{where}: Ausdruck ist nicht aufrufbar: {ctx.getText()}")
+        return run
+
+    def _c_primary(self, ctx):
+        vm = self.vm
+        if ctx.handlerList():
+            return self._fallback(ctx)
+        if ctx.literal():
+            return self._c_literal(ctx.literal())
+        if ctx.newExpr():
+            return self._fallback(ctx)
+        if ctx.memberExpr():
+            return self._c_member(ctx.memberExpr())
+        if ctx.THIS():
+            return lambda: vm.get_var("THIS", ctx)
+        if ctx.SUPER():
+            return lambda: "SUPER"
+        if ctx.FLOAT():
+            v = float(ctx.FLOAT().getText())
+            return lambda: v
+        if ctx.NUMBER():
+            v = float(ctx.NUMBER().getText())
+            return lambda: v
+        if ctx.STRING():
+            s = ctx.STRING().getText()
+            s = s[1:-1] if len(s) >= 2 and s[0] == s[-1] and s[0] in ('"', "'") else s
+            return lambda: s
+        if ctx.IDENT():
+            return self._name_reader(ctx.IDENT().getSymbol().text)
+        if ctx.BRACKET_STRING():
+            s = vm._unescape_bracket_string(ctx.BRACKET_STRING().getText())
+            return lambda: s
+        if ctx.expr():
+            return self.compile_expr(ctx.expr())
+        return self._fallback(ctx)
+
+    def _name_reader(self, name: str):
+        # wie ExecVisitor._get_name, Scopes aber ohne upper()/try pro Zugriff;
+        # nur wenn die Variable fehlt, läuft der volle Pfad (WITH, Fehler)
+        vm  = self.vm
+        key = vm._vkey(name)
+
+        def run():
+            for scope in reversed(vm._scopes):
+                if key in scope:
+                    return scope[key]
+            return vm._get_name(name)
+        return run
+
+    def _c_literal(self, ctx):
+        if ctx.TRUE():
+            return lambda: True
+        if ctx.FALSE():
+            return lambda: False
+        if ctx.NUMBER():
+            v = float(ctx.NUMBER().getText())
+            return lambda: v
+        if ctx.STRING():
+            s = ctx.STRING().getText()
+            s = s[1:-1] if len(s) >= 2 and s[0] == s[-1] and s[0] in ('"', "'") else s
+            return lambda: s
+        return self._fallback(ctx)
+
+    def _c_member(self, ctx):
+        vm     = self.vm
+        idents = [t.getText() for t in ctx.IDENT()]
+        if ctx.THIS() is None and len(idents) == 1:
+            # einzelner Name -> _get_name (WITH-Context/Props)
+            return self._name_reader(idents[0])
+        if ctx.THIS() is not None and idents:
+            # THIS.a.b: bei genau einem Member zuerst Methode (-> Delegate)
+            return self.compile_chain("THIS", idents, ctx, method_first=len(idents) == 1)
+        if len(idents) > 1 and idents[0].upper() != "SUPER":
+            return self.compile_chain(idents[0], idents[1:], ctx)
+        return self._fallback(ctx)
+
+    def _c_dotted_ref(self, ctx):
+        # wie ExecVisitor.visitDottedRef: Kopf THIS/_get_name, Rest get_member
+        vm     = self.vm
+        idents = [t.getText() for t in ctx.IDENT()]
+        if ctx.THIS() is not None:
+            head = lambda: vm.get_var("THIS", ctx)
+            tail = idents
+        else:
+            name = idents[0]
+            head = lambda: vm._get_name(name)
+            tail = idents[1:]
+        steps = tuple((n.upper(), n) for n in tail)
+
+        def run():
+            cur = head()
+            for key, name in steps:
+                if isinstance(cur, Instance) and key in cur.props:
+                    cur = cur.props[key]
+                else:
+                    cur = vm.get_member(cur, name, ctx)
+            return cur
+        return run
+
+    # ---------- Member-Ketten ----------
+    def compile_chain(self, head: str, names: list[str], ctx, *, method_first: bool = False):
+        # Vorab aufgelöste Zugriffskette a.b.c (Semantik wie ExecVisitor.get_chain).
+        # Pro Glied ein Inline-Cache [Klasse, Epoche, ist_Methode], damit
+        # resolve_method_silent nur beim Klassenwechsel/Neudefinition läuft.
+        vm    = self.vm
+        hkey  = vm._vkey(head)
+        where = f"{ctx.start.line}:{ctx.start.column}"
+        steps = tuple((n.upper(), [None, -1, False]) for n in names)
+
+        def is_method(inst, key, ic):
+            cls = inst.class_name
+            if ic[0] != cls or ic[1] != vm.class_epoch:
+                ic[0] = cls
+                ic[1] = vm.class_epoch
+                ic[2] = vm.resolve_method_silent(cls.upper(), key) is not None
+            return ic[2]
+
+        def run():
+            for scope in reversed(vm._scopes):
+                if hkey in scope:
+                    cur = scope[hkey]
+                    break
+            else:
+                cur = vm.get_var(hkey, ctx)     # wirft "nicht definiert"
+
+            if method_first and isinstance(cur, Instance):
+                key, ic = steps[0]
+                if is_method(cur, key, ic):
+                    return Delegate(target=cur, method_name=key, runner=vm)
+
+            if cur is None:
+                raise RuntimeError(f"{where}: '{hkey}' ist None")
+
+            for key, ic in steps:
+                if not isinstance(cur, Instance):
+                    raise RuntimeError(f"{where}: '{hkey}' ist kein Objekt (ist {type(cur).__name__})")
+                props = cur.props
+                if key in props:
+                    cur = props[key]
+                elif is_method(cur, key, ic):
+                    cur = Delegate(target=cur, method_name=key, runner=vm)
+                else:
+                    try:
+                        cur = vm.get_member(cur, key, ctx)
+                    except RuntimeError:
+                        raise RuntimeError(f"{where}: Member '{key}' nicht gefunden")
+            return cur
+        return run
+
 # ---------------------------------------------------------------------------
 # ExecVisitor - Interpreter for dBase DSL ...
 # ---------------------------------------------------------------------------
@@ -5387,6 +6064,13 @@ class ExecVisitor(dBaseParserVisitor):
         self.this_stack = []
         self.with_stack      : list[object] = []
         self.with_stack_owner: list[object] = []
+        
+        # Closure-IR statt erneutem Tree-Walk (use_ir=False: Referenz-/Debug-Modus)
+        self.use_ir = True
+        self.ir     = IRCompiler(self)
+        self._eval_cache: dict[object, Any] = {}   # ctx -> Closure (eval_expr)
+        self.class_epoch = 0                       # +1 bei jeder Klassen(neu)definition
+        self._class_info: dict[str, ClassInfo] = {}
 
     @property
     def current_frame(self) -> Frame:
@@ -5404,6 +6088,13 @@ class ExecVisitor(dBaseParserVisitor):
             raise RuntimeError("Cannot pop global frame")
         return self.frames.pop()
     
+    def run_block(self, block_ctx):
+        # Methoden-/Schleifenrumpf ausführen: übersetzt (gecacht) oder per Visitor
+        if not self.use_ir:
+            return self.visit(block_ctx)
+        self.ir.compile_block(block_ctx)()
+        return None
+    
     def push_this(self, inst: Instance):
         self.this_stack.append(inst)
 
@@ -5634,37 +6325,51 @@ class ExecVisitor(dBaseParserVisitor):
         return None
         
     def eval_expr(self, ctx):
-        text = ctx.getText()
-        
+        # Ausdrucksknoten werden einmal klassifiziert, danach nur noch die
+        # gecachte Closure ausgeführt (kein getText()/Regex pro Auswertung).
+        fn = self._eval_cache.get(ctx)
+        if fn is None:
+            fn = self._eval_cache[ctx] = self._classify_expr(ctx)
+        return fn()
+
+    def _classify_expr(self, ctx):
         if getattr(ctx, "BRACKET_STRING", None) and ctx.BRACKET_STRING():
             tok = ctx.BRACKET_STRING().getSymbol()
-            return self._unescape_bracket_string(tok.text)
-            
+            s = self._unescape_bracket_string(tok.text)
+            return lambda: s
+
+        text = ctx.getText()
         if self.is_simple_reference(text):
-            return self.eval_reference_text(text)
-        # Fallback: normale Expr-Auswertung über Visitor
-        return self.visit(ctx)
-    
+            return self.compile_reference_text(text)
+        # Fallback: normale Expr-Auswertung (IR bzw. Visitor)
+        if self.use_ir:
+            return self.ir.compile_expr(ctx)
+        return lambda: self.visit(ctx)
+
     def is_simple_reference(self, s: str) -> bool:
         # erlaubt: X, this.width, a.b.c
         # (ohne Klammern/Operatoren)
-        import re
-        return re.fullmatch(r'(this|[A-Za-z_]\w*)(\.[A-Za-z_]\w*)*', s, re.IGNORECASE) is not None
+        return SIMPLE_REFERENCE_RE.fullmatch(s) is not None
 
-    def eval_reference_text(self, s: str):
+    def compile_reference_text(self, s: str):
+        # Kopf über _get_name (WITH + Variablen), Rest über get_member;
+        # Properties direkt aus dem props-Dict
         parts = s.split('.')
-        head = parts[0].upper()
-
-        if head == "this":
-            obj = self.this_object
-            idx = 1
-        else:
-            obj = self._get_name(parts[0])
-            idx = 1
+        head  = parts[0]
+        tail  = tuple((name.upper(), name) for name in parts[1:])
+
+        def run():
+            obj = self._get_name(head)
+            for key, name in tail:
+                if isinstance(obj, Instance) and key in obj.props:
+                    obj = obj.props[key]
+                else:
+                    obj = self.get_member(obj, name)
+            return obj
+        return run
 
-        for name in parts[idx:]:
-            obj = self.get_member(obj, name)
-        return obj
+    def eval_reference_text(self, s: str):
+        return self.compile_reference_text(s)()
         
     def visitBooleanLiteral(self, ctx):
         if ctx.TRUE():
@@ -5697,40 +6402,73 @@ class ExecVisitor(dBaseParserVisitor):
         except Exception:
             return False
 
+    # ---------- Klassen-Cache: MRO, flache Methodentabellen, Default-Props ----------
+    def define_class(self, class_name: str, cdef) -> None:
+        self.classes[class_name] = cdef
+        self.invalidate_class_cache()
+
+    def invalidate_class_cache(self) -> None:
+        self.class_epoch += 1
+        self._class_info.clear()
+
+    def class_info(self, class_name: str) -> ClassInfo:
+        info = self._class_info.get(class_name)
+        if info is not None:
+            return info
+
+        lineage = []
+        c = class_name
+        while c and c not in lineage:
+            lineage.append(c)
+            cdef = self.classes.get(c)
+            if cdef is None:
+                break
+            parent = cdef.get("parent") if isinstance(cdef, dict) else cdef.parent
+            c = parent.upper() if parent else None
+
+        chain = [c for c in lineage if c in self.classes]
+        methods: dict[str, tuple[str, object]] = {}
+        silent:  dict[str, object] = {}
+        for c in chain:                          # abgeleitet -> Basis, erster Treffer gewinnt
+            cdef = self.classes[c]
+            table = cdef.get("methods", {}) if isinstance(cdef, dict) else cdef.methods
+            for m, mctx in table.items():
+                methods.setdefault(m, (c, mctx))
+                if mctx and m not in silent:
+                    silent[m] = mctx
+
+        info = ClassInfo(
+            lineage        = tuple(lineage),
+            chain          = tuple(reversed(chain)),
+            methods        = methods,
+            methods_silent = silent,
+        )
+        self._class_info[class_name] = info
+        return info
+
     def resolve_method(self, start_class: str, method_name: str, ctx):
         c = start_class.upper()
         m = method_name.upper()
 
+        hit = self.class_info(c).methods.get(m)
+        if hit is not None:
+            return hit
+
+        # kein Treffer: Kette erneut laufen, um die passende Fehlermeldung zu liefern
         while c is not None:
             cdef = self.classes.get(c)
             if cdef is None:
                 raise Exception(f"{ctx.start.line}:{ctx.start.column}: Klasse '{c}' ist nicht definiert")
 
-            # ClassDef statt dict
-            if m in cdef.methods:
-                return c, cdef.methods[m]
-
             c = cdef.parent.upper() if cdef.parent else None
 
         raise Exception(f"{ctx.start.line}:{ctx.start.column}: Methode '{m}' nicht gefunden (ab '{start_class}')")
 
 
     def resolve_method_silent(self, class_name: str, method_name: str):
-        c = class_name
-        m = method_name.upper()
-
-        while c:
-            cdef = self.classes.get(c)
-            if not cdef:
-                return None
-
-            hit = cdef.methods.get(m)
-            if hit:
-                return hit
-
-            c = cdef.parent.upper() if cdef.parent else None
-
-        return None
+        if not class_name:
+            return None
+        return self.class_info(class_name).methods_silent.get(method_name.upper())
 
     def in_local_scope(self) -> bool:
         return bool(self._scopes)
@@ -5939,15 +6677,7 @@ class ExecVisitor(dBaseParserVisitor):
         return value
 
     def class_chain_base_to_derived(self, class_name: str) -> list[str]:
-        chain = []
-        c = class_name.upper()
-        while c:
-            if c not in self.classes:
-                break
-            chain.append(c)
-            parent = self.classes[c].parent
-            c = parent.upper() if parent else None
-        return list(reversed(chain))  # base zuerst
+        return list(self.class_info(class_name.upper()).chain)  # base zuerst
         
     def eval_member(self, obj, name: str, ctx):
         key = name.upper()
@@ -6462,24 +7192,18 @@ class ExecVisitor(dBaseParserVisitor):
                 self.visit(st)
             
     def collect_default_props(self, class_name: str) -> dict:
-        cname = class_name.upper()
+        info = self.class_info(class_name.upper())
 
-        # Klassenkette sammeln: derived -> base
-        chain = []
-        c = cname
-        while c:
-            cdef = self.classes.get(c)
-            if not cdef:
-                break
-            chain.append(cdef)
-            c = cdef.parent.upper() if cdef.parent else None
+        # base -> derived mergen (Kind überschreibt), einmal pro Klasse
+        if info.defaults is None:
+            out = {}
+            for c in info.chain:
+                for k, v in (self.classes[c].default_props or {}).items():
+                    out[k.upper()] = v
+            info.defaults = out
 
-        # base -> derived mergen (Kind überschreibt)
-        out = {}
-        for cdef in reversed(chain):
-            for k, v in (cdef.default_props or {}).items():
-                out[k.upper()] = deepcopy(v)
-        return out
+        return {k: v if isinstance(v, IMMUTABLE_PROP_TYPES) else deepcopy(v)
+                for k, v in info.defaults.items()}
         
     # Wert für PROPERTY ... = <expr> auswerten.
     # Läuft in einem frischen Scope und setzt THIS/SELF auf die neue Instanz.
@@ -6497,6 +7221,7 @@ class ExecVisitor(dBaseParserVisitor):
     def _ensure_classdef(self, class_name: str) -> dict:
         k = self._norm(class_name.upper())
         if k not in self.classes:
+            self.invalidate_class_cache()
             self.classes[k] = {
                 "props": set(),
                 "methods": {},
@@ -6642,7 +7367,7 @@ class ExecVisitor(dBaseParserVisitor):
             params = self._get_method_params(method_ctx)
             for i, pname in enumerate(params):
                 self.set_var(pname.upper(), arg_values[i] if i < len(arg_values) else None)
-            return self.visit(method_ctx.block())
+            return self.run_block(method_ctx.block())
         finally:
             self.pop_scope()
             self.this_obj = prev_this
@@ -6721,7 +7446,7 @@ class ExecVisitor(dBaseParserVisitor):
             elif tname.endswith("StatementContext"):
                 cdef.inits.append(ch)
 
-        self.classes[class_name] = cdef
+        self.define_class(class_name, cdef)
         return None
 
     # Basisklasse -> Kind-Reihenfolge, damit Kind überschreiben könnte (später).
@@ -7073,38 +7798,67 @@ class ExecVisitor(dBaseParserVisitor):
             self.assign_lvalue(ctx.lvalue(), value, ctx)
             return None
     
-    def visitForStmt(self, ctx):
-        var_name = ctx.IDENT().getText()
+    def for_loop_plan(self, ctx) -> tuple:
+        # (Variablen-Key, start, end, step, ganzzahlig?) - Grenzen sind NUMBER-Literale
+        key   = self._vkey(ctx.IDENT().getText())
         start = float(ctx.numberExpr(0).getText())
-        end = float(ctx.numberExpr(1).getText())
+        end   = float(ctx.numberExpr(1).getText())
 
-        # klassisch inklusiv (wie in vielen Basics/xBase)
-        step = 1.0
-        i = start
-        
         # STEP optional
         if ctx.STEP() is not None:
-            step = float(self.visit(ctx.numberExpr(2)))
+            step = float(ctx.numberExpr(2).getText())
             if step == 0:
                 raise RuntimeError(f"{self.loc(ctx)}: STEP darf nicht 0 sein")
         else:
             # sinnvoller Default: Richtung automatisch
             step = 1.0 if end >= start else -1.0
 
-        def cond(x):
-            return x <= end if step > 0 else x >= end
+        integral = start.is_integer() and end.is_integer() and step.is_integer()
+        return key, start, end, step, integral
+
+    @staticmethod
+    def for_loop_values(plan):
+        # klassisch inklusiv (wie in vielen Basics/xBase); Werte bleiben float
+        _, start, end, step, integral = plan
+        if integral:
+            # Integer-Zähler (range in C), kein Aufsummieren von Floats
+            stop = int(end) + (1 if step > 0 else -1)
+            return map(float, range(int(start), stop, int(step)))
+
+        def values():
+            i = start
+            if step > 0:
+                while i <= end:
+                    yield i
+                    i += step
+            else:
+                while i >= end:
+                    yield i
+                    i += step
+        return values()
 
-        while cond(i):
-            self.set_var(var_name.upper(), i)
+    def var_slot(self, name: str) -> dict:
+        # Scope-Dict, in dem set_var(name, ...) schreiben würde
+        key = self._vkey(name)
+        for s in reversed(self._scopes):
+            if key in s:
+                return s
+        return self._scopes[-1]
 
-            try:
+    def visitForStmt(self, ctx):
+        plan  = self.for_loop_plan(ctx)
+        key   = plan[0]
+        stmts = ctx.block().statement()     # einmal holen, nicht pro Durchlauf
+        slot  = self.var_slot(key)
+
+        try:
+            for v in self.for_loop_values(plan):
+                slot[key] = v
                 # block ausführen: statement*
-                for st in ctx.block().statement():
+                for st in stmts:
                     self.visit(st)
-            except BreakSignal:
-                break
-
-            i += step
+        except BreakSignal:
+            pass
 
         return None
         
@@ -7118,7 +7872,7 @@ class ExecVisitor(dBaseParserVisitor):
             #      "expr?", a.expr() is not None)
 
         parts = [self.eval_writeArg(a) for a in ctx.writeArg()]
-        print("".join(parts))
+        get_output_sink().write_line("".join(parts))
         return None
     
     def eval_writeArg(self, arg_ctx):
@@ -7505,7 +8259,10 @@ class ExecVisitor(dBaseParserVisitor):
 
         # resolve_method liefert (owner_class, method_ctx)
         owner_class, mctx = self.resolve_method(target.class_name, mname, ctx)
+        return self.invoke_resolved(target, mctx, args)
 
+    def invoke_resolved(self, target, mctx, args: list):
+        # Methodenrumpf mit THIS = target ausführen (Methode bereits aufgelöst)
         self.push_this(target)
         self.push_scope()
         try:
@@ -7518,7 +8275,7 @@ class ExecVisitor(dBaseParserVisitor):
                 self.set_var(pname, args[i] if i < len(args) else None)
 
             try:
-                self.visit(mctx.block())
+                self.run_block(mctx.block())
                 return None
             except ReturnSignal as rs:
                 return rs.value
@@ -7568,15 +8325,7 @@ class ExecVisitor(dBaseParserVisitor):
         return items
         
     def is_descendant_of(self, class_name: str, base_name: str) -> bool:
-        cn = class_name.upper()
-        base = base_name.upper()
-        while True:
-            if cn == base:
-                return True
-            cdef = self.classes.get(cn)
-            if not cdef or not cdef.parent:
-                return False
-            cn = cdef.parent.upper()
+        return base_name.upper() in self.class_info(class_name.upper()).lineage
 
     def _bool_arg(self, args, idx, default=False):
         if idx >= len(args):
@@ -7656,7 +8405,7 @@ class ExecVisitor(dBaseParserVisitor):
             for i, pname in enumerate(params):
                 self.set_var(pname, args[i] if i < len(args) else None)
 
-            self.visit(mctx.block())
+            self.run_block(mctx.block())
         finally:
             self.pop_scope()
             self.pop_this()
@@ -7708,45 +8457,277 @@ class ExecVisitor(dBaseParserVisitor):
 # ---------------------------------------------------------------------------
 # parser stuff ...
 # ---------------------------------------------------------------------------        
-def parse(filename: str):
-    # 0 pre-procession
-    pp = Preprocessor(include_paths=[Path("includes")])
-    pre = pp.process(filename)
-    
-    #source = FileStream(filename, encoding="utf-8")
+# ---------------------------------------------------------------------------
+# Parse-Cache: serialisierte Parse-Bäume auf der Platte
+# ---------------------------------------------------------------------------
+# Der Key ist ein SHA-256 über den präprozessierten Quelltext, alle gelesenen
+# (Include-)Dateien samt mtime/Größe und die Grammatik (serialisiertes ATN).
+# Gespeichert werden nur fehlerfreie Bäume, d.h. bei einem Treffer entfallen
+# Lexer, Parser und der Kommentar-Check komplett.
+# ---------------------------------------------------------------------------
+PARSE_CACHE_VERSION = 1
+
+def _grammar_fingerprint() -> str:
+    mod = sys.modules[dBaseParser.__module__]
+    return hashlib.sha256(repr(mod.serializedATN()).encode("utf-8")).hexdigest()
+
+def tree_to_data(tree) -> tuple:
+    # Token-Tabelle + verschachtelte Tupel (Klasse, start, stop, Labels, Kinder).
+    # Kinder sind entweder int (Index in die Token-Tabelle) oder Tupel.
+    tokens: list[tuple] = []
+    index:  dict[int, int] = {}
+
+    def tok(t) -> int:
+        if t is None:
+            return -1
+        k = index.get(id(t))
+        if k is None:
+            k = index[id(t)] = len(tokens)
+            tokens.append((t.type, t.text, t.line, t.column, t.channel,
+                           t.start, t.stop, t.tokenIndex))
+        return k
+
+    def node(ctx) -> tuple:
+        labels = tuple(
+            (attr, tok(v)) for attr, v in
+            ((a, getattr(ctx, a, None)) for a in ("name", "parent"))
+            if isinstance(v, Token)
+        )
+        kids = tuple(
+            tok(c.symbol) if isinstance(c, TerminalNode) else node(c)
+            for c in (ctx.children or ())
+        )
+        return (type(ctx).__name__, tok(ctx.start), tok(ctx.stop), labels, kids)
+
+    root = node(tree)
+    return (tuple(tokens), root)
+
+def tree_from_data(data: tuple):
+    token_rows, root = data
+    tokens = []
+    for (ttype, text, line, column, channel, start, stop, tidx) in token_rows:
+        t = CommonToken(type=ttype, channel=channel, start=start, stop=stop)
+        t.text       = text
+        t.line       = line
+        t.column     = column
+        t.tokenIndex = tidx
+        tokens.append(t)
+
+    def tok(k):
+        return None if k < 0 else tokens[k]
+
+    def node(row, parent):
+        cls_name, start, stop, labels, kids = row
+        ctx = getattr(dBaseParser, cls_name)(None, parent)
+        ctx.start = tok(start)
+        ctx.stop  = tok(stop)
+        for attr, k in labels:
+            setattr(ctx, attr, tok(k))
+        if kids:
+            children = []
+            for k in kids:
+                if isinstance(k, int):
+                    leaf = TerminalNodeImpl(tokens[k])
+                    leaf.parentCtx = ctx
+                    children.append(leaf)
+                else:
+                    children.append(node(k, ctx))
+            ctx.children = children
+        return ctx
+
+    return node(root, None)
+
+@dataclass
+class ParseCacheStats:
+    hits:      int   = 0
+    misses:    int   = 0
+    stores:    int   = 0
+    evictions: int   = 0
+    load_ms:   float = 0.0
+    parse_ms:  float = 0.0
+
+class ParseCache:
+    def __init__(self, directory: Path | None = None, *, enabled: bool = True):
+        self.directory = directory or (Path(__file__).resolve().parent / "__cache__" / "dbase")
+        self.enabled   = enabled
+        self.stats     = ParseCacheStats()
+        self._grammar: str | None = None
+
+    def key(self, pre: str, files: list[Path]) -> str:
+        if self._grammar is None:
+            self._grammar = _grammar_fingerprint()
+        h = hashlib.sha256()
+        h.update(f"v{PARSE_CACHE_VERSION}:{self._grammar}\n".encode("utf-8"))
+        for f in sorted(set(files)):
+            try:
+                st = f.stat()
+                h.update(f"{f}:{st.st_mtime_ns}:{st.st_size}\n".encode("utf-8"))
+            except OSError:
+                h.update(f"{f}:-\n".encode("utf-8"))
+        h.update(pre.encode("utf-8"))
+        return h.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.tree"
+
+    def load(self, key: str):
+        path = self._path(key)
+        if not path.exists():
+            self.stats.misses += 1
+            return None
+        t0 = time.perf_counter()
+        try:
+            with path.open("rb") as f:
+                version, data = pickle.load(f)
+            if version != PARSE_CACHE_VERSION:
+                raise ValueError("stale parse cache entry")
+            tree = tree_from_data(data)
+        except Exception:
+            # kaputt oder veraltet -> wegwerfen, normal parsen
+            self.evict(key)
+            self.stats.misses += 1
+            return None
+        self.stats.hits    += 1
+        self.stats.load_ms += (time.perf_counter() - t0) * 1000.0
+        return tree
+
+    def store(self, key: str, tree) -> None:
+        path = self._path(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            with tmp.open("wb") as f:
+                pickle.dump((PARSE_CACHE_VERSION, tree_to_data(tree)), f,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+            self.stats.stores += 1
+        except (OSError, RecursionError, pickle.PicklingError) as e:
+            print(f"parse cache: store failed: {e}", file=sys.stderr)
+
+    def evict(self, key: str) -> None:
+        try:
+            self._path(key).unlink()
+            self.stats.evictions += 1
+        except OSError:
+            pass
+
+    def clear(self) -> int:
+        n = 0
+        if self.directory.is_dir():
+            for f in self.directory.glob("*.tree"):
+                try:
+                    f.unlink()
+                    n += 1
+                except OSError:
+                    pass
+        return n
+
+    def disk_usage(self) -> tuple[int, int]:
+        if not self.directory.is_dir():
+            return 0, 0
+        files = list(self.directory.glob("*.tree"))
+        return len(files), sum(f.stat().st_size for f in files)
+
+    def report(self) -> str:
+        s = self.stats
+        entries, size = self.disk_usage()
+        total = s.hits + s.misses
+        rate  = (100.0 * s.hits / total) if total else 0.0
+        return (
+            f"parse cache: {'on' if self.enabled else 'off'}, "
+            f"hits={s.hits} misses={s.misses} ({rate:.1f}% hit), "
+            f"stores={s.stores} evictions={s.evictions}, "
+            f"load={s.load_ms:.1f} ms parse={s.parse_ms:.1f} ms, "
+            f"{entries} entries / {size / 1024:.1f} KiB in {self.directory}"
+        )
+
+PARSE_CACHE = ParseCache()
+PARSE_CACHE_STATS = False       # --cache-stats: Statistik nach jedem Lauf ausgeben
+
+def parse_two_stage(parser):
+    # Stufe 1: SLL-Vorhersage ohne Fehlerbehandlung (schnell, reicht fast immer).
+    # Stufe 2: nur bei Abbruch volles LL mit normaler Fehlermeldung.
+    # Die Tokens bleiben im Stream, es wird nicht neu gelext.
+    parser._interp.predictionMode = PredictionMode.SLL
+    parser._errHandler = BailErrorStrategy()
+    try:
+        return parser.input_()
+    except ParseCancellationException:
+        parser.reset()      # seek(0) auf dem Token-Stream
+        parser._interp.predictionMode = PredictionMode.LL
+        parser._errHandler = DefaultErrorStrategy()
+        return parser.input_()
+
+def parse_tree(pre: str):
+    # Lexer + Parser in einem Durchlauf; ein offener Blockkommentar wird beim
+    # EOF im Token-Stream erkannt. Liefert (tree, fehlerfrei?)
     source = InputStream(pre)
     lexer  = dBaseLexer(source)
-    tokens = CommonTokenStream(lexer)
+    tokens = CommentCheckingTokenStream(lexer)
     tokens.fill();
     parser = dBaseParser(tokens)
 
-    tree   = parser.input_()
-    sema   = analyze(tree, parser)
-    
-    # 1. lexer check
-    while True:
-        tok = lexer.nextToken()   # HIER wird dein Override aufgerufen
-        if tok.type == Token.EOF:
-            depth = getattr(lexer, "_cmtDepth", 0)
-            if depth > 0:
-                line = lexer.line
-                col  = lexer.column
-                raise UnterminatedBlockCommentError(line, col)
-            break
-    
-    global VISITOR
-    VISITOR = ExecVisitor()
-    
-    # PASS 1: Klassen sammeln
-    VISITOR._mode = "collect"
-    VISITOR.visit(tree)
+    tree   = parse_two_stage(parser)
+    return tree, parser.getNumberOfSyntaxErrors() == 0
+
+def load_tree(filename: str, *, use_cache: bool | None = None):
+    # Präprozessor + (Parse-Cache oder Lexer/Parser); liefert (tree, fehlerfrei?)
+    # 0 pre-procession
+    pp = Preprocessor(include_paths=[Path("includes")])
+    pre = pp.process(filename)
 
-    # PASS 2: Statements ausführen
-    VISITOR._mode = "exec"
-    VISITOR.visit(tree)
+    cache = PARSE_CACHE
+    if use_cache is None:
+        use_cache = cache.enabled
+
+    if use_cache:
+        key  = cache.key(pre, pp.included)
+        tree = cache.load(key)
+        if tree is not None:
+            return tree, True
+
+    t0 = time.perf_counter()
+    tree, clean = parse_tree(pre)
+    cache.stats.parse_ms += (time.perf_counter() - t0) * 1000.0
+    if use_cache and clean:
+        cache.store(key, tree)
+    return tree, clean
+
+def parse(filename: str, *, use_ir: bool = True, use_cache: bool | None = None,
+          output: OutputSink | None = None):
+    tree, _ = load_tree(filename, use_cache=use_cache)
+    sema    = analyze(tree, None)
+
+    if PARSE_CACHE_STATS:
+        print(PARSE_CACHE.report(), file=sys.stderr)
     
-    for line in VISITOR.output:
-        print(line)
+    # WRITE geht gepuffert an den Sink (Standard: stdout), optional
+    # für diesen Lauf an einen anderen (Datei/Pipe, Terminal, ...)
+    previous = set_output_sink(output) if output is not None else None
+    sink     = get_output_sink()
+    try:
+        global VISITOR
+        VISITOR = ExecVisitor()
+        
+        # PASS 1: Klassen sammeln
+        VISITOR._mode = "collect"
+        VISITOR.visit(tree)
+
+        # PASS 2: Statements ausführen
+        VISITOR._mode  = "exec"
+        VISITOR.use_ir = use_ir
+        if use_ir:
+            program = VISITOR.ir.compile_input(tree)   # einmalig übersetzen
+            program()
+        else:
+            VISITOR.visit(tree)                        # Referenz-/Debug-Modus
+        
+        for line in VISITOR.output:
+            sink.write_line(str(line))
+    finally:
+        sink.flush()
+        if previous is not None:
+            set_output_sink(previous)
     
     #print("Tree  :", tree.toStringTree(recog=parser))
     return tree
@@ -8189,8 +9170,119 @@ class DBaseParser:
         self.tokens  = CommonTokenStream (self.lexer)
         self.tokens.fill();
         self.parser  = dBaseParser       (self.tokens)
-        self.tree    = self.parser.input_()
+        self.tree    = parse_two_stage   (self.parser)
         
+# ---------------------------------------------------------------------------
+# Code-Generierung für alle Zielsprachen: einmal parsen, Emitter parallel
+# ---------------------------------------------------------------------------
+# Der Baum wird einmal erzeugt (bzw. aus dem Parse-Cache geladen), mit
+# tree_to_data() serialisiert und an einen Prozess-Pool verteilt; jeder
+# Worker baut den Baum neu auf und lässt genau einen Emitter laufen.
+# Die Generatoren benutzen den Parser nicht, sie bekommen None.
+# ---------------------------------------------------------------------------
+CODEGEN_TARGETS = {
+    "python": ("dbase.py",   lambda: DBaseToPython    (None)),
+    "pascal": ("dbase.pas",  lambda: DBaseToPascal    (None, unit_name="GenProg")),
+    "java":   ("dbase.java", lambda: DBaseToJava      (None, class_name="GenProg", package=None)),
+    "cpp":    ("dbase.cc",   lambda: DBaseToCpp       (None, prog_name="genprog")),
+    "csharp": ("dbase.cs",   lambda: DBaseToCSharp    (None, class_name="GenProg", namespace=None)),
+    "vba":    ("dbase.cls",  lambda: DBaseToVBAAccess (None, class_name="GenProg", module_name="GenProg")),
+    "js":     ("dbase.js",   lambda: DBaseToJavaScript(None, class_name="GenProg", module_name=None)),
+}
+
+@dataclass
+class CodegenResult:
+    target:  str
+    path:    str
+    seconds: float = 0.0
+    size:    int   = 0
+    error:   str | None = None
+
+_CODEGEN_TREE = None     # im Worker-Prozess einmal aus tree_data aufgebaut
+
+def _codegen_init(tree_data: tuple) -> None:
+    global _CODEGEN_TREE
+    _CODEGEN_TREE = tree_from_data(tree_data)
+
+def _codegen_run(target: str, out_path: str, tree=None) -> CodegenResult:
+    # läuft im Worker-Prozess (oder sequentiell im Hauptprozess mit tree)
+    t0 = time.perf_counter()
+    try:
+        CODEGEN_TARGETS[target][1]().generate(tree if tree is not None else _CODEGEN_TREE, out_path)
+        size = os.path.getsize(out_path) if os.path.exists(out_path) else 0
+        return CodegenResult(target, out_path, time.perf_counter() - t0, size)
+    except Exception as e:
+        return CodegenResult(target, out_path, time.perf_counter() - t0,
+            error=f"{type(e).__name__}: {e}")
+
+def generate_all(filename: str, targets: list[str] | None = None, out_dir: str | Path | None = None,
+                 *, workers: int | None = None, progress=None) -> list[CodegenResult]:
+    targets = list(targets or CODEGEN_TARGETS)
+    unknown = [t for t in targets if t not in CODEGEN_TARGETS]
+    if unknown:
+        raise ValueError(f"unbekannte Zielsprache(n): {', '.join(unknown)}")
+
+    out_dir = Path(out_dir) if out_dir else Path(".")
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    tree, clean = load_tree(filename)
+    jobs        = [(t, str(out_dir / CODEGEN_TARGETS[t][0])) for t in targets]
+
+    # Syntaxfehler: nichts aus dem von der Fehlerbehandlung reparierten Baum
+    # erzeugen, jedes Ziel bekommt den Parse-Fehler
+    if not clean:
+        results = [CodegenResult(t, path, error=f"SyntaxError: {filename}: Syntaxfehler beim Parsen")
+                   for t, path in jobs]
+        if progress:
+            for r in results:
+                progress(r)
+        return results
+
+    # ein Kern/ein Ziel: Pool + Baum-Transfer lohnen nicht, direkt im Prozess
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+
+    results: list[CodegenResult] = []
+    if workers <= 1:
+        for t, path in jobs:
+            results.append(_codegen_run(t, path, tree))
+            if progress:
+                progress(results[-1])
+        return results
+
+    # spawn statt fork: generate_all() läuft auch aus einem QThread im
+    # GUI-Prozess, ein fork() würde Qt-/Thread-Zustand mitkopieren
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_codegen_init, initargs=(tree_to_data(tree),)) as pool:
+        futures = [pool.submit(_codegen_run, t, path) for t, path in jobs]
+        for fut in concurrent.futures.as_completed(futures):
+            results.append(fut.result())
+            if progress:
+                progress(results[-1])
+
+    order = {t: i for i, t in enumerate(targets)}
+    results.sort(key=lambda r: order[r.target])
+    return results
+
+class CodegenAllThread(QThread):
+    # generate_all() im Hintergrund, damit die GUI bedienbar bleibt
+    target_done = pyqtSignal(object)     # CodegenResult
+    all_done    = pyqtSignal(object)     # list[CodegenResult] oder Exception
+
+    def __init__(self, filename: str, targets=None, out_dir=None, parent=None):
+        super().__init__(parent)
+        self.filename = filename
+        self.targets  = targets
+        self.out_dir  = out_dir
+
+    def run(self):
+        try:
+            res = generate_all(self.filename, self.targets, self.out_dir,
+                progress=self.target_done.emit)
+        except Exception as e:
+            res = e
+        self.all_done.emit(res)
+
 class EditorWidget(QDialog):
     def __init__(self, text="abcdef"):
         super().__init__()
@@ -8328,9 +9420,14 @@ QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
         self.btn_gen_vbaout.clicked.connect(self.on_button_gen_vbaout_clicked)
         self.btn_gen_javscr.clicked.connect(self.on_button_gen_javscr_clicked)
         
+        self.btn_gen_all = GlossyPillButtonGold("Gen. alle Sprachen", self)
+        self.btn_gen_all.clicked.connect(self.on_button_gen_all_clicked)
+        self._gen_thread = None
+        
         h2layout = QHBoxLayout()
         h2layout.addWidget(self.btn_gen_vbaout)
         h2layout.addWidget(self.btn_gen_javscr)
+        h2layout.addWidget(self.btn_gen_all)
         
         vlayout.addLayout(h1layout)
         vlayout.addLayout(h2layout)
@@ -8353,6 +9450,34 @@ QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
     def closeEvent(self, event):
         self.close_tracked_windows()
 
+    def on_button_gen_all_clicked(self):
+        # alle Emitter aus einem Parse, parallel im Hintergrund
+        if self._gen_thread is not None and self._gen_thread.isRunning():
+            return
+        self.btn_gen_all.setEnabled(False)
+        self._gen_thread = CodegenAllThread(self.filename, parent=self)
+        self._gen_thread.target_done.connect(self.on_gen_target_done)
+        self._gen_thread.all_done.connect(self.on_gen_all_done)
+        self._gen_thread.start()
+
+    def on_gen_target_done(self, r):
+        if r.error:
+            print(f"gen {r.target} failed: {r.error}")
+        else:
+            print(f"gen {r.target} ok. ({r.path}, {r.size} bytes, {r.seconds:.2f} s)")
+
+    def on_gen_all_done(self, res):
+        self.btn_gen_all.setEnabled(True)
+        if isinstance(res, Exception):
+            tb_str = "".join(traceback.TracebackException.from_exception(res).format())
+            dlg = showException(self, "Generator-Fehler: " + type(res).__name__, tb_str)
+            dlg.exec_()
+            return
+        failed = [r for r in res if r.error]
+        if failed:
+            QMessageBox.warning(self, "Code-Generierung",
+                "\n".join(f"{r.target}: {r.error}" for r in failed))
+
     def on_button_gen_vbaout_clicked(self):
         parser  = DBaseParser(self.filename)
         codegen = DBaseToVBAAccess(parser, class_name="GenProg", module_name="GenProg")
@@ -10189,6 +11314,58 @@ class MainWindow(QMainWindow):
         self._dlg_workplace.activateWindow()
         
 def main():
+    global PARSE_CACHE_STATS
+    ap = argparse.ArgumentParser(description="dBase Runner")
+    ap.add_argument("--no-cache", action="store_true",
+        help="Parse-Cache nicht verwenden (immer ANTLR-Lauf)")
+    ap.add_argument("--cache-stats", action="store_true",
+        help="Parse-Cache-Statistik nach jedem Lauf ausgeben")
+    ap.add_argument("--clear-cache", action="store_true",
+        help="Parse-Cache leeren")
+    ap.add_argument("--gen-all", metavar="FILE",
+        help="headless: Code für alle (bzw. --targets) Zielsprachen erzeugen und beenden")
+    ap.add_argument("--targets", default=",".join(CODEGEN_TARGETS),
+        help="Komma-Liste der Zielsprachen (" + ", ".join(CODEGEN_TARGETS) + ")")
+    ap.add_argument("--out-dir", default=".",
+        help="Ausgabeverzeichnis für --gen-all")
+    ap.add_argument("-j", "--jobs", type=int, default=None,
+        help="Anzahl Worker-Prozesse für --gen-all (1 = sequentiell)")
+    ap.add_argument("--run", metavar="FILE",
+        help="headless: dBase-Programm ausführen und beenden")
+    ap.add_argument("--output", metavar="PATH", default="-",
+        help="Ziel für WRITE bei --run: Datei oder Pipe (Standard '-' = stdout)")
+    ap.add_argument("--output-stats", action="store_true",
+        help="Zeilen/Bytes/Durchsatz der WRITE-Ausgabe nach dem Lauf ausgeben")
+    args, rest = ap.parse_known_args()
+    sys.argv[1:] = rest     # Rest bleibt für Qt
+
+    PARSE_CACHE.enabled = not args.no_cache
+    PARSE_CACHE_STATS   = args.cache_stats
+    if args.clear_cache:
+        print(f"parse cache: {PARSE_CACHE.clear()} entries removed")
+
+    if args.gen_all:
+        targets = [t.strip() for t in args.targets.split(",") if t.strip()]
+        t0 = time.perf_counter()
+        results = generate_all(args.gen_all, targets, args.out_dir, workers=args.jobs)
+        for r in results:
+            state = f"error: {r.error}" if r.error else f"{r.size} bytes"
+            print(f"{r.target:<7} {r.path:<30} {r.seconds:6.2f} s  {state}")
+        print(f"total {time.perf_counter() - t0:.2f} s")
+        if PARSE_CACHE_STATS:
+            print(PARSE_CACHE.report(), file=sys.stderr)
+        sys.exit(1 if any(r.error for r in results) else 0)
+
+    if args.run:
+        sink = StreamSink() if args.output == "-" else FileSink(args.output)
+        try:
+            parse(args.run, output=sink)
+        finally:
+            sink.close()
+            if args.output_stats:
+                print(sink.report(), file=sys.stderr)
+        sys.exit(0)
+
     app = ensure_qt_app()
     if app is not None:
         global MAINAPP
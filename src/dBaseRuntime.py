@@ -6,12 +6,15 @@
 import os       ##! Python operating system module
 import re       ##! Python regular expression module
 import sys      ##! Python system module
+import time     ##! Python time module
 
+import atexit
 import inspect
+import threading
 
 from typing          import Callable, Optional, Any
 
-from PyQt5.QtCore    import Qt, QSocketNotifier, QThread, pyqtSignal, QObject
+from PyQt5.QtCore    import Qt, QSocketNotifier, QThread, QTimer, pyqtSignal, QObject
 from PyQt5.QtGui     import QFont, QTextCursor, QTextCharFormat, QColor
 from PyQt5.QtWidgets import QApplication, QMainWindow, QTextEdit
 
@@ -99,6 +102,183 @@ def iter_ansi_chunks(text: str, state: AnsiState):
     if pos < len(text):
         yield text[pos:], state.to_format()
 
+# ----------------------------------------------------------------------------
+# \brief  base class of all output sinks for WRITE. Lines are collected in a
+#         list and written in one block once "limit" characters are pending
+#         (or on flush()/close()), instead of one console write per line.
+#         The counters allow to measure the output throughput.
+# \since  version 0.0.1
+# \author paule32
+# ----------------------------------------------------------------------------
+class OutputSink:
+    DEFAULT_LIMIT = 1 << 18         # 256 KiB Zeichen puffern
+
+    def __init__(self, limit: int = DEFAULT_LIMIT, encoding: str = "utf-8"):
+        self.limit    = max(0, int(limit))
+        self.encoding = encoding
+        self._buf     = []
+        self._pending = 0
+        self._lock    = threading.Lock()
+
+        self.bytes_written = 0      # tatsächlich ausgegebene Bytes
+        self.lines_written = 0      # Zeilen (WRITE-Aufrufe)
+        self.flushes       = 0      # Anzahl Block-Schreibvorgänge
+        self._t0           = time.perf_counter()
+
+    def write_line(self, text: str) -> None:
+        self.write(text + "\n", lines=1)
+
+    def write(self, text: str, lines: int = 0) -> None:
+        with self._lock:
+            self._buf.append(text)
+            self._pending += len(text)
+            self.lines_written += lines
+            full = self._pending >= self.limit
+        if full:
+            self.flush()
+        else:
+            self._schedule()
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._buf:
+                return
+            data = "".join(self._buf)
+            self._buf.clear()
+            self._pending = 0
+            self.bytes_written += self._emit(data)
+            self.flushes += 1
+
+    def close(self) -> None:
+        self.flush()
+
+    # -----------------------------------------------------------------------
+    # \brief  write one block to the target.
+    # \return number of bytes written
+    # -----------------------------------------------------------------------
+    def _emit(self, data: str) -> int:
+        raise NotImplementedError
+
+    # Hook für zeitgesteuerte Sinks (Terminal)
+    def _schedule(self) -> None:
+        pass
+
+    def report(self) -> str:
+        dt = max(time.perf_counter() - self._t0, 1e-9)
+        return (f"output: {self.lines_written} lines, {self.bytes_written} bytes, "
+                f"{self.flushes} flushes, {self.lines_written / dt:.0f} lines/s, "
+                f"{self.bytes_written / dt / 1024:.0f} KiB/s")
+
+# ----------------------------------------------------------------------------
+# \brief  sink for a text stream. Without explicit stream the current
+#         sys.stdout is used at flush time, so redirect_stdout() still works.
+#         In interactive runs (QApplication exists) pending lines are also
+#         flushed by a timer, so WRITE output from event handlers - after
+#         parse() has returned - shows up without waiting for "limit" or exit.
+# \since  version 0.0.1
+# \author paule32
+# ----------------------------------------------------------------------------
+class StreamSink(OutputSink):
+    def __init__(self, stream=None, limit: int = OutputSink.DEFAULT_LIMIT,
+                 interval_ms: int = 40):
+        super().__init__(limit, getattr(stream, "encoding", None) or "utf-8")
+        self.stream      = stream
+        self.interval_ms = interval_ms
+        self._timer      = None     # erst anlegen, wenn eine Qt-App läuft
+
+    def _schedule(self) -> None:
+        app = QApplication.instance()
+        if app is None or QThread.currentThread() is not app.thread():
+            return                  # ohne Event-Loop: flush() durch parse()/atexit
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.setInterval(self.interval_ms)
+            self._timer.timeout.connect(self.flush)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _emit(self, data: str) -> int:
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write(data)
+        stream.flush()
+        return len(data.encode(getattr(stream, "encoding", None) or self.encoding, "replace"))
+
+# ----------------------------------------------------------------------------
+# \brief  sink for headless runs: writes into a file, a named pipe or an
+#         already opened file descriptor (binary, unbuffered by Python -
+#         the sink itself is the buffer).
+# \since  version 0.0.1
+# \author paule32
+# ----------------------------------------------------------------------------
+class FileSink(OutputSink):
+    def __init__(self, target, limit: int = OutputSink.DEFAULT_LIMIT,
+                 encoding: str = "utf-8", append: bool = False):
+        super().__init__(limit, encoding)
+        if isinstance(target, int):
+            self._fh = os.fdopen(target, "wb", buffering=0, closefd=False)
+        else:
+            self._fh = open(target, "ab" if append else "wb", buffering=0)
+        self.target = target
+
+    def _emit(self, data: str) -> int:
+        raw = data.encode(self.encoding, "replace")
+        self._fh.write(raw)
+        return len(raw)
+
+    def close(self) -> None:
+        super().close()
+        if not self._fh.closed:
+            self._fh.close()
+
+# ----------------------------------------------------------------------------
+# \brief  sink for the TerminalWidget. Lines are collected and handed over in
+#         batches to append_ansi() by a timer, so the QTextEdit gets one
+#         insert per interval instead of one per line. Must be used from the
+#         GUI thread (the timer lives there).
+# \since  version 0.0.1
+# \author paule32
+# ----------------------------------------------------------------------------
+class TerminalSink(OutputSink):
+    def __init__(self, term, interval_ms: int = 40,
+                 limit: int = OutputSink.DEFAULT_LIMIT):
+        super().__init__(limit)
+        self.term   = term
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+
+    def _schedule(self) -> None:
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _emit(self, data: str) -> int:
+        self._timer.stop()
+        self.term.append_ansi(data)
+        self.term.prompt()
+        return len(data.encode(self.encoding, "replace"))
+
+# ----------------------------------------------------------------------------
+# \brief  the current WRITE sink (shared by RT.WRITE and the dBase runner).
+# \since  version 0.0.1
+# \author paule32
+# ----------------------------------------------------------------------------
+_output_sink: OutputSink = StreamSink()
+
+def get_output_sink() -> OutputSink:
+    return _output_sink
+
+def set_output_sink(sink: OutputSink) -> OutputSink:
+    global _output_sink
+    old = _output_sink
+    old.flush()
+    _output_sink = sink
+    return old
+
+# Rest im Puffer beim Programmende nicht verlieren
+atexit.register(lambda: _output_sink.close())
+
 # ----------------------------------------------------------------------------
 # \brief  this is the command router class. The class itself will be used for
 #         interpreting the commands that are typed into the Terminal Window.
@@ -238,7 +418,12 @@ class TerminalWidget(QTextEdit):
         if "\x1b[2J" in text and "\x1b[H" in text:
             self.clear()
             self.ansi_state.reset()
-            return
+            # gebündelte Ausgabe (TerminalSink): Text nach dem letzten
+            # Clear-Screen trotzdem ausgeben
+            home = text.find("\x1b[H", text.rfind("\x1b[2J"))
+            text = text[home + 3:] if home >= 0 else ""
+            if not text:
+                return
 
         cursor = self.textCursor()
         cursor.movePosition(QTextCursor.End)
@@ -415,10 +600,102 @@ def EntryPoint(callback: Optional[Callable[[], Any]] = None) -> int:
     app = QApplication(sys.argv)
     w = MainWindow()
     w.show()
+    # WRITE-Ausgaben ab jetzt gebündelt ins Terminal-Fenster
+    set_output_sink(TerminalSink(w.term))
+    app.aboutToQuit.connect(lambda: get_output_sink().close())
     if callable(callback):
         callback()
     sys.exit(app.exec_())
     
+# ----------------------------------------------------------------------------
+# \brief  symbol table for the run time variables. Names are normalized once
+#         (max. 32 chars, stripped, upper case) and stored in a dict per scope
+#         frame, so get/set is O(1) instead of a linear scan over all rows.
+#         Each new variable gets a slot number; the code generator can bind a
+#         slot at compile time and use GET_SLOT/SET_SLOT as fast path.
+#         Locals get the slots above the frame base; pop_frame() releases
+#         them, so the slot numbers are reused by the next frame.
+# \since  version 0.0.1
+# \author paule32
+# ----------------------------------------------------------------------------
+class SymbolTable():
+    MAX_NAME = 32   # identifiers only 32 in size length
+    
+    def __init__(self):
+        self.frames = [{}]      # scope frames: [0] = global
+        self.slots  = []        # slot -> entry
+        self.bases  = []        # erster Slot je lokalem Frame
+    
+    @staticmethod
+    def norm(name) -> str:
+        return str(name)[:SymbolTable.MAX_NAME].strip().upper()
+    
+    def push_frame(self):
+        self.frames.append({})
+        self.bases.append(len(self.slots))
+    
+    # -----------------------------------------------------------------------
+    # \brief  close the innermost frame and release its slots.
+    # \return number of released entries
+    # -----------------------------------------------------------------------
+    def pop_frame(self) -> int:
+        if len(self.frames) <= 1:
+            raise Exception("SymbolTable: cannot pop global frame.")
+        self.frames.pop()
+        base  = self.bases.pop()
+        count = len(self.slots) - base
+        for entry in self.slots[base:]:
+            entry["slot"] = None    # alte Slot-Nummer nicht mehr gültig
+        del self.slots[base:]
+        return count
+    
+    # -----------------------------------------------------------------------
+    # \brief  find the entry of a normalized "key", innermost frame first.
+    # \return entry dict, or None if not registered.
+    # -----------------------------------------------------------------------
+    def lookup(self, key: str):
+        frames = self.frames
+        if len(frames) == 1:
+            return frames[0].get(key)
+        for frame in reversed(frames):
+            entry = frame.get(key)
+            if entry is not None:
+                return entry
+        return None
+    
+    # -----------------------------------------------------------------------
+    # \brief  create a new entry in the current frame.
+    # \return entry dict
+    # -----------------------------------------------------------------------
+    def define(self, key: str, value=None):
+        entry = {
+            "type"  : type(value),
+            "parent": None,
+            "name"  : key,
+            "value" : value,
+            "slot"  : len(self.slots),
+        }
+        self.frames[-1][key] = entry
+        self.slots.append(entry)
+        return entry
+    
+    def slot(self, name) -> int:
+        key   = self.norm(name)
+        entry = self.lookup(key)
+        if entry is None:
+            entry = self.define(key)
+        return entry["slot"]
+    
+    def entries(self):
+        for frame in self.frames:
+            yield from frame.values()
+    
+    def __len__(self):
+        return len(self.slots)
+    
+    def __contains__(self, name):
+        return self.lookup(self.norm(name)) is not None
+
 # ----------------------------------------------------------------------------
 # \brief  run time library house keeper dictionaey list ...
 # \since  version 0.0.1
@@ -430,14 +707,7 @@ var_registry = {
         "class" : 0,    # count class's
         "method": 0,    # count method's
     },
-    "var": [            # table dictionary for variables
-        [{
-            "name"  : "_app",   # dbase default application variable
-            "type"  : None,
-            "parent": None,
-            "value" : None,
-        }]
-    ],
+    "var": SymbolTable(),   # table dictionary for variables
     "class": [          # table dictionary for classes
         {
             # base class informations
@@ -473,6 +743,9 @@ var_registry = {
         },
     ],
 }
+# dbase default application variable
+var_registry["var"].define("_APP")
+
 # ----------------------------------------------------------------------------
 # \brief  class for run time library functionality ...
 # \since  version 0.0.1
@@ -500,24 +773,23 @@ class RT():
     # \author paule32
     # -----------------------------------------------------------------------
     def WRITE(self, *args):
+        sink = get_output_sink()
         if len(args) <= 0:
-            print("no arguments")
+            sink.write_line("no arguments")
             return
-        sz = f""
+        parts = []
         found = False
         for v in args:
-            if   isinstance(v,   str): sz += f"{str(v)}"; found = True; continue
-            elif isinstance(v,   int): sz += f"{str(v)}"; found = True; continue
-            elif isinstance(v, float): sz += f"{str(v)}"; found = True; continue
-            elif isinstance(v,  list):
+            if isinstance(v, (str, int, float)):
+                parts.append(str(v))
+                found = True
+            elif isinstance(v, list):
                 found = False
                 for l in v:
                     self.WRITE(l)
-                    continue
-            else:
-                if not found:
-                    sz += "Other: " + str(type(v)) + " " + str(v)
-        print(sz)
+            elif not found:
+                parts.append("Other: " + str(type(v)) + " " + str(v))
+        sink.write_line("".join(parts))
     
     # -----------------------------------------------------------------------
     # \brief  create a new class object given by a "class_name" string and
@@ -572,11 +844,10 @@ class RT():
     # \author paule32
     # -----------------------------------------------------------------------
     def GET(self, base, path):
-        base = base.upper()
-        for row in var_registry["var"]:
-            for entry in row:
-                if entry["name"] == base:
-                    return entry["value"]
+        base  = SymbolTable.norm(base)
+        entry = var_registry["var"].lookup(base)
+        if entry is not None:
+            return entry["value"]
         # todo: class
         raise Exception(f"variable: '{base}' is undefined.")
 
@@ -593,14 +864,12 @@ class RT():
     # -----------------------------------------------------------------------
     def PRIMARY(self, name):
         # identifiers only 32 in size length
-        name = name[:32].strip().upper()
-        for row in var_registry["var"]:
-            for entry in row:
-                if entry["name"] == name:
-                    self.last_cmd   = "primary"
-                    self.last_entry = entry
-                    return entry["value"]
-        return None
+        entry = var_registry["var"].lookup(SymbolTable.norm(name))
+        if entry is None:
+            return None
+        self.last_cmd   = "primary"
+        self.last_entry = entry
+        return entry["value"]
     
     # -----------------------------------------------------------------------
     # \brief  add a parameter to the parameter list. parameter can occur over
@@ -725,27 +994,53 @@ class RT():
     def SET_NAME(self, name, value):
         try:
             # identifiers only 32 in size length
-            name = name[:32].strip().upper()
+            name  = SymbolTable.norm(name)
+            table = var_registry["var"]
             # ---------------------------------------
             # set the properties of an dict. item ...
             # ---------------------------------------
-            for row in var_registry["var"]:
-                for entry in row:
-                    if entry["name"] == name:
-                        entry["value"] = value
-                        return True
+            entry = table.lookup(name)
+            if entry is not None:
+                entry["value"] = value
+                return True
             var_registry["info"]["var"] += 1
-            prop = {
-                "type"  : type(value),
-                "parent": None,
-                "name"  : name,
-                "value" : value,
-            }
-            var_registry["var"].append([prop])
+            table.define(name, value)
         except:
             raise Exception("SET_NAME: ", name)
         return True
     
+    # -----------------------------------------------------------------------
+    # \brief  slot-indexed fast path: the code generator binds a variable to
+    #         its slot once (SLOT), and then reads/writes without any name
+    #         normalization or dict lookup.
+    # \see    SymbolTable.slot
+    # \since  version 0.0.1
+    # -----------------------------------------------------------------------
+    def SLOT(self, name) -> int:
+        table = var_registry["var"]
+        count = len(table)
+        slot  = table.slot(name)
+        if len(table) > count:
+            var_registry["info"]["var"] += 1
+        return slot
+    
+    def GET_SLOT(self, slot):
+        return var_registry["var"].slots[slot]["value"]
+    
+    def SET_SLOT(self, slot, value):
+        var_registry["var"].slots[slot]["value"] = value
+        return True
+    
+    # -----------------------------------------------------------------------
+    # \brief  open/close a local scope frame (method or procedure call).
+    # \since  version 0.0.1
+    # -----------------------------------------------------------------------
+    def PUSH_FRAME(self):
+        var_registry["var"].push_frame()
+    
+    def POP_FRAME(self):
+        var_registry["info"]["var"] -= var_registry["var"].pop_frame()
+    
     # -----------------------------------------------------------------------
     # \brief  get the "value" of a variable "name"
     # \param  name - str
@@ -1,35 +1,105 @@
 # hex_listing.py
 from __future__ import annotations
+from collections import OrderedDict
+from typing import List, Optional
 
 def _is_printable_ascii(b: int) -> bool:
     # C64-Pro-Font stellt ASCII dar; wir mappen 32..126 als "druckbar"
     return 32 <= b <= 126
 
+# ---------- Dump-Engine: ganze Blöcke statt Byte-für-Byte ----------
+#
+# Hex-Spalte: bytes.hex(" ") formatiert einen ganzen Block in C; Zeile r liegt
+# danach bei [r*3*w : r*3*w + 3*w-1] (jedes Byte = 3 Zeichen "HH ").
+# Text-Spalte: Übersetzungstabelle für alle 256 Bytewerte, einmal pro Block
+# angewandt (bytes.translate, bzw. str.translate bei Unicode-Glyphen).
+# Zeilen-Template mit den Feldern addr, hex, left, right, text.
+
+DUMP_PAGE_ROWS = 512   # Zeilen pro formatierter Seite in HexDump
+DUMP_CACHE_PAGES = 8   # formatierte Seiten im Cache (Speicher bleibt konstant)
+
+def make_text_table(glyph) -> "bytes | dict":
+    """
+    Übersetzungstabelle aus einer Funktion Byte -> Zeichen.
+    Nur Latin-1-Einzelzeichen → bytes (für bytes.translate), sonst dict (str.translate).
+    Für HexDump muss jedes Byte genau ein Zeichen ergeben (Spaltenbreite).
+    """
+    chars = [glyph(b) for b in range(256)]
+    if all(len(c) == 1 and ord(c) < 256 for c in chars):
+        return bytes(ord(c) for c in chars)
+    return {b: c for b, c in enumerate(chars)}
+
+ASCII_TABLE = make_text_table(lambda b: chr(b) if _is_printable_ascii(b) else ".")
+
+def translate_text(data: bytes, table) -> str:
+    if isinstance(table, bytes):
+        return data.translate(table).decode("latin-1")
+    return data.decode("latin-1").translate(table)
+
+class HexDump:
+    """
+    Hexdump ohne Vorformatierung: Zeilen werden erst bei row()/rows() erzeugt,
+    seitenweise im Block formatiert und in einem kleinen LRU-Cache gehalten.
+    Damit formatiert eine virtuelle Ansicht nur die sichtbaren Zeilen.
+
+    template: Formatstring mit {addr} {hex} {left} {right} {text}
+              (left/right = erste/zweite Hälfte der Hex-Spalte)
+    """
+    def __init__(self, data: bytes, base_addr: int = 0x0000, width: int = 8,
+                 template: str = "{addr:04X}: {hex:<23}  {text}",
+                 text_table=ASCII_TABLE, upper: bool = True):
+        self.data = bytes(data); self.base_addr = base_addr; self.width = width
+        self.template = template; self.text_table = text_table; self.upper = upper
+        self._pages: "OrderedDict[int, List[str]]" = OrderedDict()
+        # Template auf Positionsfelder umschreiben: map() statt format(**kw) pro Zeile
+        self._split = "{left" in template or "{right" in template
+        names = ("addr", "hex", "left", "right", "text") if self._split else ("addr", "hex", "text")
+        pos = template
+        for k, name in enumerate(names): pos = pos.replace("{" + name, "{" + str(k))
+        self._fmt = pos.format
+
+    def __len__(self) -> int:
+        return (len(self.data) + self.width - 1) // self.width
+
+    row_count = property(__len__)
+
+    def rows(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        """Zeilen [start, stop) in einem Durchgang formatieren (ohne Cache)."""
+        n = len(self); stop = n if stop is None else min(stop, n); start = max(0, start)
+        if start >= stop: return []
+        w = self.width; hw = 3 * (w // 2); step = 3 * w
+        chunk = self.data[start * w: stop * w]
+        cells = chunk.hex(" ")
+        if self.upper: cells = cells.upper()
+        text = translate_text(chunk, self.text_table)
+        hexes = [cells[k: k + step - 1] for k in range(0, len(cells), step)]
+        cols = [range(self.base_addr + start * w, self.base_addr + stop * w, w), hexes]
+        if self._split:
+            cols += [[h[:hw - 1] for h in hexes], [h[hw:] for h in hexes]]
+        cols.append([text[k: k + w] for k in range(0, len(text), w)])
+        return list(map(self._fmt, *cols))
+
+    def row(self, i: int) -> str:
+        """Eine Zeile; formatiert bei Bedarf die ganze Seite um i."""
+        page = i // DUMP_PAGE_ROWS
+        rows = self._pages.get(page)
+        if rows is None:
+            rows = self.rows(page * DUMP_PAGE_ROWS, (page + 1) * DUMP_PAGE_ROWS)
+            self._pages[page] = rows
+            if len(self._pages) > DUMP_CACHE_PAGES: self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(page)
+        return rows[i - page * DUMP_PAGE_ROWS]
+
+    def text(self) -> str:
+        return "\n".join(self.rows())
+
 def format_dual_hex(data: bytes, base_addr: int = 0x0000) -> str:
     """
     Dual-Hex (8 Bytes/Zeile): 'AAAA: HH HH HH HH HH HH HH HH  ASCII....'
     Mit Mittenspace zwischen den 4er-Gruppen.
     """
-    lines = []
-    for i in range(0, len(data), 8):
-        chunk = data[i:i+8]
-        addr = base_addr + i
-
-        left4  = " ".join(f"{b:02X}" for b in chunk[:4])
-        right4 = " ".join(f"{b:02X}" for b in chunk[4:8])
-        if len(chunk) < 4:
-            left4 += " " * (3 * (4 - len(chunk)))  # aufbreiten
-            right4 = ""
-        elif len(chunk) < 8:
-            right_count = len(chunk) - 4
-            right4 += " " * (3 * (4 - max(0, right_count)))
-
-        hex_part = f"{left4} {right4}".rstrip()
-
-        ascii_part = "".join(chr(b) if _is_printable_ascii(b) else "." for b in chunk)
-
-        lines.append(f"{addr:04X}: {hex_part:<23}  {ascii_part}")
-    return "\n".join(lines)
+    return HexDump(data, base_addr).text()
 
 
 # ---------- Mini-Disassembler (teilweise Abdeckung, erweiterbar) ----------
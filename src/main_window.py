@@ -7,8 +7,8 @@ from c6510_spec import C6510Spec
 from code_editor import CodeEditor
 from settings import Settings
 from settings_dialog import SettingsDialog
-from mini_assembler import MiniAssembler, build_prg_with_basic_autostart
-from hex_listing import format_dual_hex, disassemble_listing
+from mini_assembler import MiniAssembler, IncrementalAssembler, build_prg_with_basic_autostart
+from hex_listing import format_dual_hex, disassemble_listing, HexDump, make_text_table
 from prg_builder import build_single_segment_prg
 from runner import ensure_build_dir, write_prg_file, make_d64_and_run
 
@@ -43,7 +43,19 @@ class MainWindow(QtWidgets.QMainWindow):
         self.assembler = MiniAssembler(self.spec)
         
         self._last_payload = None
+        self._last_org = None
         self._last_rows = []
+        self._hex_text_table = None   # Glyph-Tabelle für die TEXT-Spalte (make_text_table)
+
+        # Live-Assemble: hält Zeilen/Symbole zwischen den Tastendrücken,
+        # assembliert nach kurzer Pause nur die geänderten Zeilen neu
+        self.live_assembler = IncrementalAssembler(self.spec)
+        self._live_timer = QtCore.QTimer(self)
+        self._live_timer.setSingleShot(True)
+        self._live_timer.setInterval(150)
+        self._live_timer.timeout.connect(self._live_assemble)
+        for ed in (self.runtime_pre_editor, self.asm_out_editor, self.runtime_post_editor):
+            ed.textChanged.connect(self._schedule_live_assemble)
         
         self._apply_c64_font()
 
@@ -88,18 +100,12 @@ class MainWindow(QtWidgets.QMainWindow):
         return "\n".join(parts) + "\n"
         
     def _refresh_hex_main(self, base_addr: int, data: bytes):
-        lines = []
-        lines.append("ADDR  00 01 02 03 | 04 05 06 07  TEXT(8)")
-        lines.append("-"*64)
-        for i in range(0, len(data), 8):
-            chunk = data[i:i+8]
-            left  = " ".join(f"{b:02X}" for b in chunk[:4]).ljust(11)
-            right = " ".join(f"{b:02X}" for b in chunk[4:8]).ljust(11)
-            txt_raw = "".join(self._glyph_for_byte(b) for b in chunk)[:8].ljust(8)
-            txt = htmlmod.escape(txt_raw)
-            addr = base_addr + i
-            lines.append(f"{addr:04X}  {left} | {right}  {txt}")
-        self.hex_view.setHtml(self._html_pre("\n".join(lines)))
+        if self._hex_text_table is None:
+            self._hex_text_table = make_text_table(self._glyph_for_byte)
+        dump = HexDump(data, base_addr, template="{addr:04X}  {left:<11} | {right:<11}  {text:<8}",
+                       text_table=self._hex_text_table)
+        lines = ["ADDR  00 01 02 03 | 04 05 06 07  TEXT(8)", "-"*64] + dump.rows()
+        self.hex_view.setHtml(self._html_pre(htmlmod.escape("\n".join(lines))))
 
     def _resolve_operand_numeric(self, operand_str: str) -> str:
         # gleiche Logik wie im Upload, kurzgefasst:
@@ -304,6 +310,9 @@ class MainWindow(QtWidgets.QMainWindow):
         tb.addSeparator()
         self.actCompileBasic = tb.addAction("Compile BASIC→ASM")
         self.actAssemble     = tb.addAction("Assemble")
+        self.actLiveAssemble = tb.addAction("Live")
+        self.actLiveAssemble.setCheckable(True)
+        self.actLiveAssemble.setChecked(True)
         tb.addSeparator()
         self.actExportD64    = tb.addAction("Export D64")
         self.actRunVice      = tb.addAction("Run in VICE")
@@ -316,6 +325,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.actSave.triggered.connect(self.save_cb)
         self.actCompileBasic.triggered.connect(self.compile_basic_cb)
         self.actAssemble.triggered.connect(self.assemble_cb)
+        self.actLiveAssemble.toggled.connect(self._schedule_live_assemble)
         self.actExportD64.triggered.connect(self.export_d64_cb)
         self.actRunVice.triggered.connect(self.run_vice_cb)
 
@@ -439,8 +449,27 @@ class MainWindow(QtWidgets.QMainWindow):
         # self.assembler.ignore_org = True/False
         # self.assembler.org = gewünschter Start (bei „Variante A“ später egal)
         payload, org, listing_lines = self.assembler.assemble(asm_text)
+        self._show_assembly(payload, org, self.assembler.rows)
+
+    def _schedule_live_assemble(self, *_):
+        if self.actLiveAssemble.isChecked():
+            self._live_timer.start()   # neu starten = entprellen
+
+    def _live_assemble(self):
+        try:
+            payload, org, _listing = self.live_assembler.update(self._compose_final_asm())
+        except Exception as e:
+            # während des Tippens ist die Quelle oft unvollständig -> nur Statuszeile
+            self.statusBar().showMessage(f"Assemble: {e}", 3000)
+            return
+        self.statusBar().clearMessage()
+        self._show_assembly(payload, org, self.live_assembler.rows)
+
+    def _show_assembly(self, payload: bytes, org: int, rows):
+        hex_changed = payload != self._last_payload or org != self._last_org
         self._last_payload = payload
-        self._last_rows = self.assembler.rows
+        self._last_org = org
+        self._last_rows = rows
         self._last_listing_source = "asm"  # <— wichtig
 
         # Anzeige: Code-Start = BASIC-Stub-Ende (wird beim PRG-Build bestimmt)
@@ -449,8 +478,9 @@ class MainWindow(QtWidgets.QMainWindow):
         #self._refresh_hex_main(code_start_for_view, payload)
         #self._refresh_hex_instr(self._last_rows)
         
-        # Hex links (wie gehabt)
-        self._refresh_hex_main(org, payload)
+        # Hex links (wie gehabt) - nur neu rendern, wenn sich Bytes/Start geändert haben
+        if hex_changed:
+            self._refresh_hex_main(org, payload)
         # Listing unten: aus rows → Text + Mapping
         lines_with_src = self._rows_to_listing_lines(self._last_rows)
         self._set_listing_text_with_map(lines_with_src)
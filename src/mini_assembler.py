@@ -1,21 +1,201 @@
 # mini_assembler.py
 from dataclasses import dataclass
-from typing import Optional, List, Tuple, Dict
-import re
+from typing import Optional, List, Tuple, Dict, Any
 
 from c6510_spec import C6510Spec
+from asm_linker import ObjSegment, ObjectFile, Relocation, chunks_from_rows
 
 ALIASES = {
     "BNZ":"BNE","BZ":"BEQ",".BYT":".BYTE",".ASC":".TEXT","DB":".BYTE","DW":".WORD",
     "*":".ORG","ORG":".ORG",
-    "EQU":".EQU","SET":".SET"
+    "EQU":".EQU","SET":".SET",
+    "SEGMENT":".SEGMENT",".SECTION":".SEGMENT",".GLOBAL":".EXPORT",".EXTERN":".IMPORT"
 }
 
 BRANCHES = {"BPL","BMI","BVC","BVS","BCC","BCS","BNE","BEQ"}
+_SEGMENT_DIRECTIVES = {".ORG",".SEGMENT",".EXPORT",".IMPORT"}
 
 @dataclass
 class AsmLine:
     label: Optional[str]; mnemonic: Optional[str]; operand: Optional[str]; raw: str; lineno: int
+    mnem: Optional[str] = None   # Mnemonic nach ALIASES
+    ast: Any = None              # Operand einmalig geparst (siehe MiniAssembler._line_ast)
+
+# ---------- Ausdrücke: Tokenizer + Pratt-Parser ----------
+#
+# AST-Knoten: int (Konstante, bereits gefaltet) oder Tupel
+#   ("sym", name) | ("pc",) | ("neg", x) | ("lo", x) | ("hi", x) | ("bin", op, a, b)
+# Binäre Operatoren (Bindungsstärke): | < ^ < & < + - < * /
+# Unär: - (Vorzeichen), < (Low-Byte), > (High-Byte) - < und > gelten für den
+# gesamten folgenden Ausdruck (#<TABELLE+1 = Low-Byte von TABELLE+1).
+# '*' an Operandenstelle ist der aktuelle PC.
+
+BINARY_OPS = {"|": 1, "^": 2, "&": 3, "+": 4, "-": 4, "*": 5, "/": 5}
+UNARY_BP   = 6
+
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+_SYM_CHARS  = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_.@")
+_OP_CHARS   = frozenset("+-*/&|^<>()")
+
+def tokenize_asm_expr(text: str) -> List[Tuple[str, Any]]:
+    toks: List[Tuple[str, Any]] = []
+    i = 0; n = len(text)
+    while i < n:
+        c = text[i]
+        if c == " " or c == "\t":
+            i += 1; continue
+        if c == "$" or c == "%":
+            j = i + 1
+            digits = _HEX_DIGITS if c == "$" else "01"
+            while j < n and text[j] in digits: j += 1
+            if j == i + 1: raise ValueError(f"Zahl erwartet: {text}")
+            toks.append(("num", int(text[i+1:j], 16 if c == "$" else 2))); i = j; continue
+        if c.isdigit():
+            j = i + 1
+            while j < n and text[j].isdigit(): j += 1
+            toks.append(("num", int(text[i:j]))); i = j; continue
+        if c == "'" and i + 2 < n and text[i+2] == "'":
+            toks.append(("num", ord(text[i+1]))); i += 3; continue
+        if c in _SYM_CHARS:
+            j = i + 1
+            while j < n and text[j] in _SYM_CHARS: j += 1
+            toks.append(("sym", text[i:j])); i = j; continue
+        if c in _OP_CHARS:
+            toks.append(("op", c)); i += 1; continue
+        raise ValueError(f"Unerwartetes Zeichen '{c}' in: {text}")
+    toks.append(("end", None))
+    return toks
+
+def _fold(op: str, a: int, b: int) -> int:
+    if op == "+": return (a + b) & 0xFFFF
+    if op == "-": return (a - b) & 0xFFFF
+    if op == "*": return (a * b) & 0xFFFF
+    if op == "/":
+        if b == 0: raise ValueError("Division durch 0")
+        return (a // b) & 0xFFFF
+    if op == "&": return a & b
+    if op == "|": return a | b
+    return a ^ b
+
+class AsmExprParser:
+    """Pratt-Parser über tokenize_asm_expr(); Konstanten werden sofort gefaltet."""
+    def __init__(self, text: str):
+        self.text = text
+        self.toks = tokenize_asm_expr(text)
+        self.i = 0
+
+    def parse(self):
+        node = self.expr(0)
+        if self.toks[self.i][0] != "end":
+            raise ValueError(f"Unerwartetes Ende im Ausdruck: {self.text}")
+        return node
+
+    def expr(self, rbp: int):
+        kind, val = self.toks[self.i]; self.i += 1
+        left = self.nud(kind, val)
+        while True:
+            kind, op = self.toks[self.i]
+            bp = BINARY_OPS.get(op, 0) if kind == "op" else 0
+            if bp <= rbp: return left
+            self.i += 1
+            right = self.expr(bp)
+            if left.__class__ is int and right.__class__ is int:
+                left = _fold(op, left, right)
+            else:
+                left = ("bin", op, left, right)
+
+    def nud(self, kind: str, val):
+        if kind == "num": return val
+        if kind == "sym": return ("sym", val)
+        if kind == "op":
+            if val == "(":
+                node = self.expr(0)
+                if self.toks[self.i] != ("op", ")"):
+                    raise ValueError(f"')' fehlt: {self.text}")
+                self.i += 1
+                return node
+            if val == "*": return ("pc",)
+            if val == "+": return self.expr(UNARY_BP)
+            if val == "-":
+                x = self.expr(UNARY_BP)
+                return (-x) & 0xFFFF if x.__class__ is int else ("neg", x)
+            if val == "<" or val == ">":
+                x = self.expr(0)
+                if x.__class__ is int:
+                    return x & 0xFF if val == "<" else (x >> 8) & 0xFF
+                return ("lo" if val == "<" else "hi", x)
+        raise ValueError(f"Ausdruck unvollständig: {self.text}")
+
+def parse_asm_expr(text: str):
+    """
+    Ausdruck -> AST. Nicht parsebarer Text wird als Symbolname behandelt
+    (Labels mit Sonderzeichen bleiben so nutzbar, sonst Fehler beim Auswerten).
+    """
+    text = text.strip()
+    try:
+        return AsmExprParser(text).parse()
+    except (ValueError, IndexError):
+        return ("sym", text)
+
+def _top_level_comma(s: str) -> int:
+    """Position des letzten Kommas außerhalb von Klammern/Zeichenliteralen, sonst -1."""
+    depth = 0; pos = -1; i = 0; n = len(s)
+    while i < n:
+        c = s[i]
+        if c == "'" and i + 2 < n and s[i+2] == "'":
+            i += 3; continue
+        if c == "(": depth += 1
+        elif c == ")": depth -= 1
+        elif c == "," and depth == 0: pos = i
+        i += 1
+    return pos
+
+def _split_index(s: str) -> Tuple[str, Optional[str]]:
+    """'expr,X' -> ('expr', 'X'); ohne Index-Register -> (s, None)."""
+    k = _top_level_comma(s)
+    if k >= 0:
+        reg = s[k+1:].strip().upper()
+        if reg == "X" or reg == "Y":
+            return s[:k].strip(), reg
+    return s, None
+
+def _matching_paren(s: str, start: int) -> int:
+    depth = 0
+    for i in range(start, len(s)):
+        c = s[i]
+        if c == "(": depth += 1
+        elif c == ")":
+            depth -= 1
+            if depth == 0: return i
+    return -1
+
+def classify_operand(operand: Optional[str]) -> Tuple[str, Any]:
+    """
+    Operand -> (Art, AST), ohne reguläre Ausdrücke. Art ist eine von
+    imp, acc, imm, indx, indy, ind, x, y, expr.
+    """
+    if operand is None: return "imp", None
+    op = operand.strip()
+    if not op: return "imp", None
+    if op.upper() == "A": return "acc", None
+    if op[0] == "#": return "imm", parse_asm_expr(op[1:])
+    if op[0] == "(":
+        close = _matching_paren(op, 0)
+        if close == len(op) - 1:
+            inner, reg = _split_index(op[1:-1])
+            if reg == "X": return "indx", parse_asm_expr(inner)
+            return "ind", parse_asm_expr(op[1:-1])
+        if close > 0:
+            rest = op[close+1:].strip()
+            if rest[:1] == "," and rest[1:].strip().upper() == "Y":
+                return "indy", parse_asm_expr(op[1:close])
+    base, reg = _split_index(op)
+    if reg == "X": return "x", parse_asm_expr(base)
+    if reg == "Y": return "y", parse_asm_expr(base)
+    return "expr", parse_asm_expr(op)
+
+def _is_name(s: str) -> bool:
+    return bool(s) and (s[0].isalpha() or s[0] == "_") and all(c.isalnum() or c == "_" for c in s)
 
 class MiniAssembler:
     def __init__(self, spec: C6510Spec):
@@ -25,22 +205,37 @@ class MiniAssembler:
         self.symbols: Dict[str,int] = {}
         self.rows: List[Tuple[str, List[int], str, int]] = []  # (addr, bytes, text, srcline)
         self.ignore_org: bool = False
+        self.seg = "CODE"                        # aktuelles Segment
+        self._seg_pc: Dict[str,int] = {}         # Segment -> PC beim Verlassen
+        self._expr_cache: Dict[str, Any] = {}
+        self._operand_cache: Dict[Optional[str], Tuple[str, Any]] = {}
+
+    def parse_line(self, rawline: str, lineno: int) -> Optional[AsmLine]:
+        line = rawline.split(";",1)[0].rstrip()
+        if not line.strip(): return None
+        label=None; mnemonic=None; operand=None
+        if ":" in line:
+            before, after = line.split(":",1)
+            if before.strip(): label = before.strip()
+            line = after.strip()
+        if line:
+            parts = line.split(None,1)
+            mnemonic = parts[0].upper()
+            operand = parts[1].strip() if len(parts)>1 else None
+        ln = AsmLine(label,mnemonic,operand,rawline,lineno)
+        if mnemonic:
+            ln.mnem = ALIASES.get(mnemonic, mnemonic)
+            # "NAME = expr" als .EQU (Name in Originalschreibweise)
+            if (not label and operand and operand.startswith("=")
+                    and ln.mnem != ".ORG" and _is_name(parts[0])):
+                ln.label = parts[0]; ln.mnem = ".EQU"; ln.operand = operand[1:].strip()
+        return ln
 
     def parse(self, text: str) -> List[AsmLine]:
         lines: List[AsmLine] = []
         for lineno, rawline in enumerate(text.splitlines(), start=1):
-            line = rawline.split(";",1)[0].rstrip()
-            if not line.strip(): continue
-            label=None; mnemonic=None; operand=None
-            if ":" in line:
-                before, after = line.split(":",1)
-                if before.strip(): label = before.strip()
-                line = after.strip()
-            if line:
-                parts = line.split(None,1)
-                mnemonic = parts[0].upper()
-                operand = parts[1].strip() if len(parts)>1 else None
-            lines.append(AsmLine(label,mnemonic,operand,rawline,lineno))
+            ln = self.parse_line(rawline, lineno)
+            if ln is not None: lines.append(ln)
         return lines
 
     def _split_args(self, operand: Optional[str]) -> List[str]:
@@ -59,46 +254,88 @@ class MiniAssembler:
         if part: out.append(part)
         return out
 
+    # ---------- Ausdrücke ----------
+    def eval_node(self, node) -> int:
+        if node.__class__ is int: return node
+        tag = node[0]
+        if tag == "sym":
+            v = self.symbols.get(node[1])
+            if v is None: raise ValueError(f"Unbekannter Ausdruck/Label: {node[1]}")
+            return v
+        if tag == "bin": return _fold(node[1], self.eval_node(node[2]), self.eval_node(node[3]))
+        if tag == "lo":  return self.eval_node(node[1]) & 0xFF
+        if tag == "hi":  return (self.eval_node(node[1]) >> 8) & 0xFF
+        if tag == "neg": return (-self.eval_node(node[1])) & 0xFFFF
+        return self.pc   # ("pc",)
+
+    def _try_node(self, node):
+        try: return self.eval_node(node)
+        except Exception: return None
+
     def eval_expr(self, expr: str) -> int:
-        expr=expr.strip()
-        m=re.fullmatch(r"'(.)'",expr)
-        if m: return ord(m.group(1))
-        if expr.startswith("$"): return int(expr[1:],16)
-        if expr.startswith("%"): return int(expr[1:],2)
-        if expr.isdigit(): return int(expr,10)
-        if expr in self.symbols: return self.symbols[expr]
-        m=re.fullmatch(r"(.+)\s*([+-])\s*(.+)",expr)
-        if m:
-            a=self.eval_expr(m.group(1)); b=self.eval_expr(m.group(3))
-            return (a+b)&0xFFFF if m.group(2)== '+' else (a-b)&0xFFFF
-        raise ValueError(f"Unbekannter Ausdruck/Label: {expr}")
+        node = self._expr_cache.get(expr)
+        if node is None:
+            if len(self._expr_cache) > 4096: self._expr_cache.clear()
+            node = self._expr_cache[expr] = parse_asm_expr(expr)
+        return self.eval_node(node)
 
     def _try_eval(self, expr: str):
         try: return self.eval_expr(expr)
         except Exception: return None
 
-    def detect_mode_and_operand_bytes(self, mnem: str, operand: Optional[str], pc: int):
-        if operand is None or operand.strip()=="": return "imp", []
-        op = operand.strip()
-        if op.upper() == "A": return "acc", []
-        if op.startswith("#"): v=self.eval_expr(op[1:])&0xFF; return "imm",[v]
-        if re.fullmatch(r"\(\s*[^)]+\s*,\s*X\s*\)", op, flags=re.IGNORECASE):
-            inner=op[1:-1]; lhs=inner.split(",")[0]; v=self._try_eval(lhs); return "indx", [0xFF & (v or 0)]
-        if re.fullmatch(r"\(\s*[^)]+\s*\)\s*,\s*Y", op, flags=re.IGNORECASE):
-            inner=op.split(")")[0][1:]; v=self._try_eval(inner); return "indy", [0xFF & (v or 0)]
-        if re.fullmatch(r"\(\s*[^)]+\s*\)", op):
-            v=self._try_eval(op[1:-1]); vv = v or 0; return "ind", [vv&0xFF,(vv>>8)&0xFF]
-        m = re.fullmatch(r"(.+)\s*,\s*([XY])", op, re.IGNORECASE)
-        if m:
-            val=self._try_eval(m.group(1)); idx=m.group(2).upper()
-            if val is not None and val<=0xFF:
-                return ("zpx",[val&0xFF]) if idx=="X" else ("zpy",[val&0xFF])
-            vv=val or 0
-            return ("absx",[vv&0xFF,(vv>>8)&0xFF]) if idx=="X" else ("absy",[vv&0xFF,(vv>>8)&0xFF])
-        val=self._try_eval(op)
-        if val is not None and val<=0xFF: return "zp",[val&0xFF]
-        vv=val or 0
-        return "abs",[vv&0xFF,(vv>>8)&0xFF]
+    def detect_mode_and_operand_bytes(self, mnem: str, operand: Optional[str], pc: int,
+                                      parsed=None, strict: bool = True):
+        kind, node = parsed if parsed is not None else classify_operand(operand)
+        if kind == "imp": return "imp", []
+        if kind == "acc": return "acc", []
+        if kind == "imm":
+            # Pass 1 (strict=False): Vorwärtsreferenz (#<label) ändert die Größe nicht
+            v = self.eval_node(node) if strict else (self._try_node(node) or 0)
+            return "imm", [v & 0xFF]
+        v = self._try_node(node)
+        if kind == "indx": return "indx", [0xFF & (v or 0)]
+        if kind == "indy": return "indy", [0xFF & (v or 0)]
+        if kind == "ind":
+            vv = v or 0; return "ind", [vv&0xFF,(vv>>8)&0xFF]
+        if v is not None and v<=0xFF:
+            if kind == "x": return "zpx",[v&0xFF]
+            if kind == "y": return "zpy",[v&0xFF]
+            return "zp",[v&0xFF]
+        vv = v or 0
+        mode = "absx" if kind == "x" else "absy" if kind == "y" else "abs"
+        return mode,[vv&0xFF,(vv>>8)&0xFF]
+
+    def _line_ast(self, ln: AsmLine):
+        """Operand einer Zeile einmalig parsen und an der AsmLine cachen."""
+        if ln.ast is not None: return ln.ast
+        mnem = ln.mnem
+        if mnem in (".BYTE",".TEXT"):
+            ast = []
+            for p in self._split_args(ln.operand):
+                if p.startswith('"') and p.endswith('"'): ast.append(("str", bytes(p[1:-1],"latin1","replace")))
+                else: ast.append(("val", parse_asm_expr(p)))
+        elif mnem == ".WORD":
+            ast = [parse_asm_expr(p) for p in self._split_args(ln.operand)]
+        elif mnem == ".SEGMENT":
+            # .SEGMENT name [, adresse]
+            parts = self._split_args(ln.operand)
+            if not parts: raise ValueError(f".SEGMENT ohne Namen (Z{ln.lineno})")
+            ast = (parts[0].strip('"'), parse_asm_expr(parts[1]) if len(parts) > 1 else None)
+        elif mnem in (".EXPORT",".IMPORT"):
+            ast = [p.strip() for p in self._split_args(ln.operand)]
+        elif mnem in (".ORG",".EQU",".SET") or mnem in BRANCHES:
+            op = (ln.operand or "").strip()
+            if mnem == ".ORG" and op.startswith("="):      # * = $1000 / .org = $1000
+                op = op[1:].strip()
+            ast = parse_asm_expr(op) if op else None
+        else:
+            # gleiche Operanden-Texte ($FB, ($FB),Y, ...) nur einmal klassifizieren
+            ast = self._operand_cache.get(ln.operand)
+            if ast is None:
+                if len(self._operand_cache) > 4096: self._operand_cache.clear()
+                ast = self._operand_cache[ln.operand] = classify_operand(ln.operand)
+        ln.ast = ast
+        return ast
 
     @staticmethod
     def rel_branch_offset(pc: int, target: int) -> int:
@@ -107,105 +344,524 @@ class MiniAssembler:
         if diff < -128 or diff > 127: raise ValueError("Branch außerhalb Reichweite")
         return diff & 0xFF
 
+    # ---------- Segmente ----------
+    def _reset_segments(self):
+        self.seg = "CODE"; self._seg_pc = {}
+
+    def _open_segment(self, name: Optional[str], addr: Optional[int]):
+        """.ORG (name=None) öffnet ein neues Segment, .SEGMENT name setzt ein
+        vorhandenes fort bzw. beginnt es am aktuellen PC."""
+        self._seg_pc[self.seg] = self.pc
+        if name is None:
+            name = base = f"ORG_{addr:04X}"; k = 1
+            while name in self._seg_pc:
+                k += 1; name = f"{base}_{k}"
+        elif addr is None:
+            addr = self._seg_pc.get(name, self.pc)
+        self.seg = name; self.pc = addr
+
+    def _segment_line(self, ln: AsmLine, ast) -> bool:
+        """Segment-Direktiven (beide Pässe); True wenn die Zeile damit erledigt ist."""
+        mnem = ln.mnem
+        if mnem == ".ORG":
+            if not self.ignore_org:
+                if ast is None:
+                    raise ValueError(".org ohne Adresse (Z{})".format(ln.lineno))
+                self.org = self.eval_node(ast)
+                self._open_segment(None, self.org)
+            return True
+        if mnem == ".SEGMENT":
+            name, node = ast
+            self._open_segment(name, None if node is None else self.eval_node(node))
+            return True
+        return mnem in (".EXPORT",".IMPORT")   # nur für Objektdateien (ObjectAssembler)
+
+    def segments(self) -> List[Tuple[int, bytes]]:
+        """Zusammenhängende Speicherbereiche (adresse, bytes) der letzten Assemblierung."""
+        return chunks_from_rows(self.rows)
+
+    def _layout_line(self, ln: AsmLine):
+        """Pass 1 für eine Zeile: Label setzen, PC um die Größe weiterzählen."""
+        if ln.label:
+            if ln.label in self.symbols: raise ValueError(f"Label doppelt: {ln.label} (Z{ln.lineno})")
+            self.symbols[ln.label]=self.pc
+        mnem = ln.mnem
+        if not mnem: return
+        ast = self._line_ast(ln)
+        if mnem in _SEGMENT_DIRECTIVES:
+            self._segment_line(ln, ast); return
+        if mnem in (".EQU",".SET"):
+            if not ln.label or ast is None: raise ValueError(f"{mnem} braucht Label+Wert (Z{ln.lineno})")
+            self.symbols[ln.label] = self.eval_node(ast)&0xFFFF; return
+        if mnem in (".BYTE",".TEXT"):
+            for kind, v in ast:
+                self.pc += len(v) if kind == "str" else 1
+            return
+        if mnem == ".WORD":
+            self.pc += 2*len(ast); return
+        if mnem in BRANCHES:
+            self.pc += 2; return
+        try:
+            mode, ob = self.detect_mode_and_operand_bytes(mnem, ln.operand, self.pc, ast, strict=False)
+            _ = self.spec.get_opcode(mnem, mode)
+            self.pc += 1+len(ob)
+        except Exception:
+            self.pc += 3   # worst case
+
+    def _emit_line(self, ln: AsmLine):
+        """Pass 2 für eine Zeile -> (adresse, bytes, text, listingzeile) oder None."""
+        mnem = ln.mnem
+        if not mnem: return None
+        ast = ln.ast
+        if mnem in _SEGMENT_DIRECTIVES:
+            self._segment_line(ln, ast); return None
+        if mnem in (".EQU",".SET"):
+            self.symbols[ln.label] = self.eval_node(ast) & 0xFFFF
+            return None
+        start_pc = self.pc
+        if mnem in (".BYTE",".TEXT"):
+            bytes_here=[]
+            for kind, v in ast:
+                if kind == "str": bytes_here.extend(v)
+                else: bytes_here.append(self.eval_node(v)&0xFF)
+            text = f"{mnem} {ln.operand or ''}"
+        elif mnem == ".WORD":
+            bytes_here=[]
+            for node in ast:
+                v=self.eval_node(node)&0xFFFF; bytes_here.extend([v & 0xFF,(v>>8)&0xFF])
+            text = f"{mnem} {ln.operand or ''}"
+        elif mnem in BRANCHES:
+            opcode = self.spec.get_opcode(mnem,"rel")
+            if ast is None: raise ValueError(f"{mnem} ohne Sprungziel (Z{ln.lineno})")
+            target = self.eval_node(ast)
+            bytes_here = [opcode, MiniAssembler.rel_branch_offset(start_pc, target)]
+            text = f"{mnem} ${target:04X}"
+        else:
+            mode, ob = self.detect_mode_and_operand_bytes(mnem, ln.operand, start_pc, ast)
+            bytes_here = [self.spec.get_opcode(mnem, mode)]+ob
+            text = f"{mnem} {ln.operand or ''}"
+        self.pc += len(bytes_here)
+        return (start_pc, bytes_here, text.strip(),
+                f"{start_pc:04X}: " + " ".join(f"{b:02X}" for b in bytes_here) + f"    {text}")
+
     def assemble(self, text: str):
-        listing: List[str] = []
         lines = self.parse(text)
         self.rows.clear()
 
         # Pass 1: Adressen/Größen
-        self.pc = self.org; self.symbols.clear()
+        self.pc = self.org; self.symbols.clear(); self._reset_segments()
         for ln in lines:
-            if ln.label:
-                if ln.label in self.symbols: raise ValueError(f"Label doppelt: {ln.label} (Z{ln.lineno})")
-                self.symbols[ln.label]=self.pc
-            if not ln.mnemonic: continue
-            mnem = ALIASES.get(ln.mnemonic.upper(), ln.mnemonic.upper())
-            # Pass 1 (in assemble, wo mnem == ".ORG"):
-            if mnem == ".ORG":
-                if not self.ignore_org:
-                    if not ln.operand:
-                        raise ValueError(".org ohne Adresse (Z{})".format(ln.lineno))
-                    op = ln.operand.strip()
-                    if op.startswith("="):      # <— NEU: * = $1000 / .org = $1000
-                        op = op[1:].strip()
-                    self.org = self.eval_expr(op)
-                    self.pc = self.org
-                continue
-            if mnem in (".EQU",".SET"):
-                if not ln.label or not ln.operand: raise ValueError(f"{mnem} braucht Label+Wert (Z{ln.lineno})")
-                self.symbols[ln.label] = self.eval_expr(ln.operand)&0xFFFF; continue
-            if mnem in (".BYTE",".BYT",".TEXT",".ASC"):
-                for p in self._split_args(ln.operand):
-                    if p.startswith('"') and p.endswith('"'): self.pc += len(p[1:-1])
-                    else: self.pc += 1
-                continue
-            if mnem == ".WORD":
-                self.pc += 2*len(self._split_args(ln.operand)); continue
-            if mnem in {"BPL","BMI","BVC","BVS","BCC","BCS","BNE","BEQ"}:
-                self.pc += 2; continue
-            try:
-                mode, ob = self.detect_mode_and_operand_bytes(mnem, ln.operand, self.pc)
-                _ = self.spec.get_opcode(mnem, mode)
-                self.pc += 1+len(ob)
-            except Exception:
-                self.pc += 3   # worst case
-
-        # Pass 2: Bytes erzeugen
-        self.pc = self.org; out = bytearray()
+            self._layout_line(ln)
+
+        # Pass 2: Bytes erzeugen (Operanden sind geparst, nur Symbole neu auswerten)
+        self.pc = self.org; self._reset_segments(); out = bytearray(); listing: List[str] = []
         for ln in lines:
-            if not ln.mnemonic: continue
-            mnem = ALIASES.get(ln.mnemonic.upper(), ln.mnemonic.upper())
-            # Guard: "NAME = expr" als .EQU behandeln
-            if (ln.operand and ln.operand.lstrip().startswith("=")
-                and re.fullmatch(r"[A-Za-z_]\w*", mnem)):
-                mnem = ".EQU"
-                op_equ = ln.operand.lstrip()[1:].strip()
+            e = self._emit_line(ln)
+            if e is None: continue
+            out.extend(e[1]); listing.append(e[3])
+            self.rows.append((f"{e[0]:04X}", e[1], e[2], ln.lineno))
+
+        return bytes(out), self.org, listing
+
+def _ast_symbols(node, acc: set):
+    """Alle Symbolnamen eines (Zeilen-)AST sammeln."""
+    if isinstance(node, tuple):
+        if node and node[0] == "sym": acc.add(node[1]); return
+        for x in node[1:]: _ast_symbols(x, acc)
+    elif isinstance(node, list):
+        for x in node: _ast_symbols(x, acc)
+
+def _ast_uses_pc(node) -> bool:
+    if isinstance(node, tuple):
+        if node and node[0] == "pc": return True
+        return any(_ast_uses_pc(x) for x in node[1:])
+    if isinstance(node, list):
+        return any(_ast_uses_pc(x) for x in node)
+    return False
+
+_NO_DEPS: frozenset = frozenset()
+
+class IncrementalAssembler(MiniAssembler):
+    """
+    MiniAssembler für den Editor: hält geparste Zeilen, Adressen, Symbole und
+    erzeugte Bytes zwischen zwei Aufrufen.
+
+    update(text) / replace_lines(start, count, new_lines)
+      - parst nur geänderte Zeilen neu,
+      - Pass 1 ab der ersten geänderten Zeile; bricht ab, sobald PC/ORG wieder
+        mit dem alten Stand übereinstimmen und kein Symbol einen neuen Wert hat,
+      - Pass 2 erzeugt nur Zeilen neu, die neu geparst wurden oder deren Operand
+        ein geändertes Symbol benutzt; verschobene Zeilen bekommen nur die neue
+        Adresse (Branches werden neu berechnet).
+    Ergebnis wie assemble(): (bytes, org, listing); rows wird neu aufgebaut.
+    """
+    def __init__(self, spec: C6510Spec):
+        super().__init__(spec)
+        self.base_org = self.org
+        self.stats: Dict[str, int] = {}
+        self._raw: List[str] = []
+        self._lines: List[Optional[AsmLine]] = []
+        self._deps: List[Optional[frozenset]] = []   # None = immer neu (PC/.ORG/Fehler)
+        self._p1_pc:  List[int] = [self.base_org]    # Zustand *vor* Zeile i, Index n = Ende
+        self._p1_org: List[int] = [self.base_org]
+        self._p1_size: List[int] = []
+        self._p2_pc:  List[int] = [-1]
+        self._emit: List[Any] = []                   # (row, listingzeile, bytes) | None
+        self._sym_line: Dict[str, List[int]] = {}    # Symbol -> definierende Zeilen (>1 = doppelt)
+        self._users: Dict[str, Dict[int, AsmLine]] = {}  # Symbol -> Zeilen, die es benutzen
+        self._always: Dict[int, AsmLine] = {}        # Zeilen ohne feste Abhängigkeiten
+        self._p2_org = self.base_org                 # Start-PC von Pass 2
+        self._n_segment_lines = 0                    # .SEGMENT -> immer komplett (PC je Segment)
+        self._final: Dict[str, int] = {}             # Symboltabelle nach Pass 1
+        self._result: Any = None
+        self._full = True
+        self._layout_key = None
+
+    def reset(self):
+        self.__init__(self.spec)
+
+    def update(self, text: str):
+        new = text.splitlines()
+        old = self._raw
+        if new == old and not self._full and self._result is not None:
+            self.stats = {"parsed": 0, "relaid": 0, "emitted": 0, "shifted": 0}
+            return self._result
+        n = min(len(old), len(new)); p = 0
+        while p < n and old[p] == new[p]: p += 1
+        s = 0
+        while s < n - p and old[-1-s] == new[-1-s]: s += 1
+        return self.replace_lines(p, len(old) - s - p, new[p:len(new) - s])
+
+    def replace_lines(self, start: int, count: int, new_lines: List[str]):
+        end = start + count; k = len(new_lines); delta = k - count
+        removed = set()
+        for ln, d in zip(self._lines[start:end], self._deps[start:end]):
+            if ln is None: continue
+            if ln.label: removed.add(ln.label)
+            self._index(ln, d, add=False)
+
+        # --- neu parsen (nur die geänderten Zeilen) ---
+        parsed: List[Optional[AsmLine]] = []; deps: List[Optional[frozenset]] = []
+        for j, raw in enumerate(new_lines):
+            ln = self.parse_line(raw, start + j + 1)
+            d = self._line_deps(ln)
+            parsed.append(ln); deps.append(d); self._index(ln, d)
+        p1_start = (self._p1_pc[start], self._p1_org[start])
+        p2_start = self._p2_pc[start]
+        self._raw[start:end] = new_lines
+        self._lines[start:end] = parsed
+        self._deps[start:end] = deps
+        self._p1_pc[start:end] = [0] * k
+        self._p1_org[start:end] = [0] * k
+        self._p1_size[start:end] = [0] * k
+        self._p2_pc[start:end] = [-1] * k
+        self._emit[start:end] = [None] * k
+        if delta:
+            for i in range(start + k, len(self._lines)):
+                ln = self._lines[i]
+                if ln is not None: ln.lineno = i + 1
+                e = self._emit[i]
+                if e is not None: self._emit[i] = (e[0][:3] + (i + 1,),) + e[1:]
+        for name in (list(self._sym_line) if delta else removed):
+            rows = self._sym_line.get(name)
+            if rows is None: continue
+            rows = [i + delta if i >= end else i for i in rows if not start <= i < end]
+            if rows: self._sym_line[name] = rows
+            else: del self._sym_line[name]
+
+        key = (self.base_org, self.ignore_org)
+        if key != self._layout_key:
+            self._full = True; self._layout_key = key
+        full = self._full or self._n_segment_lines > 0
+        self._full = True                             # erst nach Erfolg zurücksetzen
+        if full:
+            self._reset_segments()
+            start = 0; k = len(self._lines); p1_start = (self.base_org, self.base_org)
+            removed = set(self._final); self._sym_line.clear()
+        changed = self._layout(start, start + k, p1_start, removed, full)
+        if self.org != self._p2_org: full = True       # Pass 2 beginnt beim letzten .ORG
+        result = self._generate(start, start + k, changed, full, p2_start)
+        self._full = False
+        self.stats["parsed"] = len(new_lines)
+        return result
+
+    def _index(self, ln: Optional[AsmLine], d: Optional[frozenset], add: bool = True):
+        if ln is None: return
+        key = id(ln)
+        if ln.mnem == ".SEGMENT": self._n_segment_lines += 1 if add else -1
+        if d is None:
+            if add: self._always[key] = ln
+            else: self._always.pop(key, None)
+            return
+        for name in d:
+            if add: self._users.setdefault(name, {})[key] = ln
             else:
-                op_equ = ln.operand
-            # Pass 2 (in assemble, wo mnem == ".ORG"):
-            if mnem == ".ORG":
-                if not self.ignore_org:
-                    if not op_equ: raise ValueError(".org ohne Adresse (Z{})".format(ln.lineno))
-                    self.org = self.eval_expr(op_equ); self.pc = self.org
-                continue
-            if mnem in (".EQU",".SET"):
-                if not ln.label or not op_equ: raise ValueError(f"{mnem} braucht Label+Wert (Z{ln.lineno})")
-                self.symbols[ln.label] = self.eval_expr(op_equ) & 0xFFFF
-                continue
-            if mnem in (".BYTE",".BYT",".TEXT",".ASC"):
-                start_pc = self.pc; bytes_here=[]
-                for p in self._split_args(ln.operand):
-                    if p.startswith('"') and p.endswith('"'):
-                        s=bytes(p[1:-1],"latin1","replace"); out.extend(s); bytes_here.extend(list(s)); self.pc += len(s)
-                    else:
-                        v=self.eval_expr(p)&0xFF; out.append(v); bytes_here.append(v); self.pc += 1
-                listing.append(f"{start_pc:04X}: " + " ".join(f"{b:02X}" for b in bytes_here) + f"    {mnem} {ln.operand or ''}")
-                self.rows.append((f"{start_pc:04X}", bytes_here, f"{mnem} {ln.operand or ''}".strip(), ln.lineno))
-                continue
-            if mnem == ".WORD":
-                start_pc = self.pc; bytes_here=[]
-                for p in self._split_args(ln.operand):
-                    v=self.eval_expr(p)&0xFFFF; out.extend([v & 0xFF,(v>>8)&0xFF]); bytes_here.extend([v & 0xFF,(v>>8)&0xFF]); self.pc += 2
-                listing.append(f"{start_pc:04X}: " + " ".join(f"{b:02X}" for b in bytes_here) + f"    {mnem} {ln.operand or ''}")
-                self.rows.append((f"{start_pc:04X}", bytes_here, f"{mnem} {ln.operand or ''}".strip(), ln.lineno))
-                continue
-            if mnem in BRANCHES:
-                opcode = self.spec.get_opcode(mnem,"rel")
-                target = self.eval_expr(ln.operand)
-                off = MiniAssembler.rel_branch_offset(self.pc, target)
-                out.extend([opcode, off])
-                listing.append(f"{self.pc:04X}: {opcode:02X} {off:02X}    {mnem} ${target:04X}")
-                self.rows.append((f"{self.pc:04X}", [opcode, off], f"{mnem} ${target:04X}", ln.lineno))
-                self.pc += 2
+                users = self._users.get(name)
+                if users is not None: users.pop(key, None)
+
+    def _line_deps(self, ln: Optional[AsmLine]) -> Optional[frozenset]:
+        if ln is None or not ln.mnem: return _NO_DEPS
+        if ln.mnem in (".ORG",".SEGMENT"): return None
+        try: ast = self._line_ast(ln)
+        except Exception: return None
+        if _ast_uses_pc(ast): return None
+        acc: set = set(); _ast_symbols(ast, acc)
+        return frozenset(acc) if acc else _NO_DEPS
+
+    def _layout(self, first: int, region_end: int, p1_start, removed: set, full: bool) -> set:
+        """Pass 1 ab Zeile first; liefert die Symbole, deren Wert sich geändert hat."""
+        old_final = self._final; sym_line = self._sym_line
+        lines = self._lines; deps = self._deps; n = len(lines)
+        p1_pc = self._p1_pc; p1_org = self._p1_org; p1_size = self._p1_size
+        self.symbols = {name: old_final[name] for name, rows in sym_line.items() if rows[0] < first}
+        self.pc, self.org = p1_start
+        changed = set(removed); relaid = 0; i = first
+        while i < n:
+            if i >= region_end and not changed and not full \
+                    and self.pc == p1_pc[i] and self.org == p1_org[i]:
+                break   # ab hier ist alles wie vorher
+            p1_pc[i] = self.pc; p1_org[i] = self.org
+            ln = lines[i]; d = deps[i]
+            if ln is not None:
+                if i < region_end or full or d is None or ln.mnem in (".EQU",".SET") \
+                        or not d.isdisjoint(changed):
+                    self._layout_line(ln); relaid += 1
+                    p1_size[i] = self.pc - p1_pc[i]
+                else:
+                    # Größe hängt an keinem geänderten Symbol -> alte Größe
+                    if ln.label:
+                        if ln.label in self.symbols: raise ValueError(f"Label doppelt: {ln.label} (Z{ln.lineno})")
+                        self.symbols[ln.label] = self.pc
+                    self.pc += p1_size[i]
+                if ln.label:
+                    rows = sym_line.setdefault(ln.label, [])
+                    if i not in rows: rows.append(i)
+                    if len(rows) > 1:
+                        # zweite Definition (auch hinter der Abbruchstelle) -> wie assemble()
+                        raise ValueError(f"Label doppelt: {ln.label} (Z{max(rows) + 1})")
+                    if self.symbols[ln.label] != old_final.get(ln.label): changed.add(ln.label)
+                    else: changed.discard(ln.label)
+            i += 1
+        if i < n:
+            # unveränderten Rest übernehmen (doppelte Labels trotzdem melden)
+            for name, rows in sym_line.items():
+                if rows[0] >= i:
+                    if name in self.symbols: raise ValueError(f"Label doppelt: {name} (Z{rows[0] + 1})")
+                    self.symbols[name] = old_final[name]
+        else:
+            p1_pc[n] = self.pc; p1_org[n] = self.org
+        self.pc, self.org = p1_pc[n], p1_org[n]
+        self._final = dict(self.symbols)
+        self.stats = {"relaid": relaid}
+        return changed
+
+    def _generate(self, first: int, region_end: int, changed: set, full: bool, p2_start: int):
+        """Pass 2: nur betroffene Zeilen neu erzeugen, Rest aus dem Cache."""
+        lines = self._lines; p2_pc = self._p2_pc; emit = self._emit; n = len(lines)
+        if full:
+            targets = range(n); self._p2_org = self.pc = self.org; self._reset_segments()
+        else:
+            # neu: geänderte Zeilen, Benutzer geänderter Symbole, .ORG/PC-abhängige Zeilen
+            # Index n (Ende) nur, wenn am Ende Zeilen wegfallen: dann gibt es keine
+            # Folgezeile, an der der alte End-PC bestätigt würde
+            tset = set(range(first, min(region_end + 1, n + 1)))
+            for name in changed:
+                for ln in self._users.get(name, {}).values(): tset.add(ln.lineno - 1)
+            for ln in self._always.values(): tset.add(ln.lineno - 1)
+            targets = sorted(tset)
+        emitted = shifted = 0; t = 0; nt = len(targets)
+        i = targets[0] if nt else n
+        if not full: self.pc = p2_start if i == first else p2_pc[i]
+        while i < n:
+            is_target = t < nt and targets[t] == i
+            if is_target: t += 1
+            elif self.pc == p2_pc[i]:
+                # gleiche Adresse, keine geänderte Abhängigkeit: bis zum nächsten Ziel wie gehabt
+                if t >= nt: break
+                i = targets[t]; self.pc = p2_start if i == first else p2_pc[i]
                 continue
-            mode, ob = self.detect_mode_and_operand_bytes(mnem, ln.operand, self.pc)
-            opcode = self.spec.get_opcode(mnem, mode)
-            out.append(opcode); out.extend(ob)
-            listing.append(f"{self.pc:04X}: " + " ".join(f"{b:02X}" for b in [opcode]+ob) + f"    {mnem} {ln.operand or ''}")
-            self.rows.append((f"{self.pc:04X}", [opcode]+ob, f"{mnem} {ln.operand or ''}".strip(), ln.lineno))
-            self.pc += 1+len(ob)
+            p2_pc[i] = self.pc
+            ln = lines[i]
+            if ln is not None and ln.mnem and not is_target and ln.mnem not in BRANCHES:
+                # nur verschoben: Bytes bleiben, Adresse in Zeile/Listing neu
+                e = emit[i]
+                if e is not None:
+                    addr = f"{self.pc:04X}"; row = e[0]
+                    emit[i] = ((addr, row[1], row[2], row[3]), addr + e[1][4:], e[2])
+                    self.pc += len(e[2]); shifted += 1
+            elif ln is not None and ln.mnem:
+                old = self.symbols.get(ln.label) if ln.mnem in (".EQU",".SET") else None
+                e = self._emit_line(ln)
+                emit[i] = None if e is None else ((f"{e[0]:04X}", e[1], e[2], i + 1), e[3], bytes(e[1]))
+                emitted += 1
+                if old is not None and not full and self.symbols[ln.label] != old:
+                    # .EQU * : Wert aus Pass 2 weicht ab -> Pass 2 komplett
+                    self.symbols = dict(self._final); self.org = self._p1_org[n]
+                    return self._generate(0, n, changed, True, -1)
+            i += 1
+        if i >= n: p2_pc[n] = self.pc
+        else: self.pc = p2_pc[n]
+        self.org = self._p1_org[n]
+        self.rows = [e[0] for e in emit if e is not None]
+        listing = [e[1] for e in emit if e is not None]
+        self.stats["emitted"] = emitted; self.stats["shifted"] = shifted
+        self._result = (b"".join([e[2] for e in emit if e is not None]), self.org, listing)
+        return self._result
 
-        return bytes(out), self.org, listing
+PROV_BASE = 0x1000   # vorläufige Basis relozierbarer Segmente (>= $0100 -> immer absolute Adressierung)
+
+class ObjectAssembler(MiniAssembler):
+    """
+    Assembliert ein Modul zu einer ObjectFile (asm_linker) statt zu festen Bytes.
+      .SEGMENT name         relozierbares Segment (Adresse vergibt der Linker)
+      .SEGMENT name, $addr  / .ORG $addr   absolutes Segment
+      .EXPORT a, b          Symbole für andere Module
+      .IMPORT a, b          Symbole aus anderen Modulen (immer 16 Bit)
+    Code vor dem ersten .SEGMENT/.ORG liegt im relozierbaren Segment CODE.
+    Ausdrücke mit Labels relozierbarer Segmente bzw. Importen werden als
+    Relocation (Ziel + Addend; Wort, Low- oder High-Byte) abgelegt.
+    """
+    def __init__(self, spec: C6510Spec):
+        super().__init__(spec)
+        self._sym_term: Dict[str, Tuple[int, Tuple[str, str]]] = {}   # Symbol -> (addend, basis)
+        self._seg_base: Dict[str, int] = {}
+        self._reloc: set = set()
+        self._exports: List[Tuple[str, int]] = []
+        self._imports: List[str] = []
+
+    def _reset_segments(self):
+        super()._reset_segments()
+        self._seg_base = {"CODE": PROV_BASE}; self._reloc = {"CODE"}
+
+    def _open_segment(self, name: Optional[str], addr: Optional[int]):
+        if name is not None and addr is None and name not in self._seg_base:
+            addr = PROV_BASE; self._reloc.add(name)
+        elif name is not None and name in self._reloc and addr is not None:
+            raise ValueError(f"Segment {name} ist relozierbar")
+        super()._open_segment(name, addr)
+        self._seg_base.setdefault(self.seg, self.pc)
+
+    # ---------- relozierbare Ausdrücke ----------
+    def _term(self, node) -> Tuple[int, Optional[Tuple[str, str]]]:
+        """Ausdruck -> (wert|addend, basis); basis None = absolut."""
+        if node.__class__ is int: return node, None
+        tag = node[0]
+        if tag == "sym":
+            t = self._sym_term.get(node[1])
+            return t if t is not None else (self.eval_node(node), None)
+        if tag == "pc":
+            if self.seg in self._reloc: return self.pc - PROV_BASE, ("seg", self.seg)
+            return self.pc, None
+        if tag == "bin":
+            op = node[1]; a, ba = self._term(node[2]); b, bb = self._term(node[3])
+            if ba is None and bb is None: return _fold(op, a, b), None
+            if op == "+" and (ba is None or bb is None): return a + b, ba or bb
+            if op == "-" and bb is None: return a - b, ba
+            if op == "-" and ba == bb: return (a - b) & 0xFFFF, None
+            raise ValueError("Ausdruck nicht relozierbar")
+        if self._term(node[1])[1] is not None: raise ValueError("Ausdruck nicht relozierbar")
+        return self.eval_node(node), None
+
+    def _slot(self, node, width: int, offset: int) -> Optional[Relocation]:
+        hl = None
+        if node.__class__ is tuple and node[0] in ("lo", "hi"): hl, node = node[0], node[1]
+        v, base = self._term(node)
+        if base is None: return None
+        if hl and width == 2: raise ValueError("Ausdruck nicht relozierbar")
+        return Relocation(offset, hl or ("w" if width == 2 else "lo"), base, v)
+
+    def _line_relocs(self, ln: AsmLine, nbytes: int) -> List[Relocation]:
+        mnem = ln.mnem; ast = ln.ast; out: List[Optional[Relocation]] = []
+        if mnem in (".BYTE",".TEXT"):
+            off = 0
+            for kind, v in ast:
+                if kind == "str": off += len(v)
+                else: out.append(self._slot(v, 1, off)); off += 1
+        elif mnem == ".WORD":
+            out = [self._slot(node, 2, 2*i) for i, node in enumerate(ast)]
+        elif mnem in BRANCHES:
+            _v, base = self._term(ast)
+            here = ("seg", self.seg) if self.seg in self._reloc else None
+            if base != here: raise ValueError("Branch über Segmentgrenze")
+        else:
+            kind, node = ast
+            if kind not in ("imp", "acc"): out.append(self._slot(node, nbytes - 1, 1))
+        return [r for r in out if r is not None]
+
+    def detect_mode_and_operand_bytes(self, mnem: str, operand: Optional[str], pc: int,
+                                      parsed=None, strict: bool = True):
+        mode, ob = super().detect_mode_and_operand_bytes(mnem, operand, pc, parsed, strict)
+        if mode in ("zp", "zpx", "zpy"):
+            # relozierbare Adresse nie als Zeropage annehmen
+            kind, node = parsed if parsed is not None else classify_operand(operand)
+            try: base = self._term(node)[1]
+            except Exception: base = None
+            if base is not None:
+                v = self.eval_node(node)
+                mode = {"zp": "abs", "zpx": "absx", "zpy": "absy"}[mode]
+                ob = [v & 0xFF, (v >> 8) & 0xFF]
+        return mode, ob
+
+    # ---------- Pässe ----------
+    def _layout_line(self, ln: AsmLine):
+        seg = self.seg
+        super()._layout_line(ln)
+        mnem = ln.mnem
+        if mnem == ".IMPORT":
+            for name in ln.ast:
+                if name in self.symbols: raise ValueError(f"Label doppelt: {name} (Z{ln.lineno})")
+                self.symbols[name] = PROV_BASE; self._sym_term[name] = (0, ("ext", name))
+                self._imports.append(name)
+        elif mnem == ".EXPORT":
+            self._exports.extend((name, ln.lineno) for name in ln.ast)
+        if not ln.label: return
+        if mnem in (".EQU",".SET"):
+            _v, base = self._term(ln.ast)
+            if base is not None: self._sym_term[ln.label] = _v, base
+        elif seg in self._reloc:
+            self._sym_term[ln.label] = (self.symbols[ln.label] - PROV_BASE, ("seg", seg))
+
+    def assemble_object(self, text: str) -> ObjectFile:
+        lines = self.parse(text)
+        self.rows.clear(); self._sym_term.clear(); self._exports = []; self._imports = []
+
+        self.org = self.pc = PROV_BASE; self.symbols.clear(); self._reset_segments()
+        for ln in lines:
+            self._layout_line(ln)
+
+        self.pc = PROV_BASE; self._reset_segments()
+        segs: Dict[str, ObjSegment] = {}
+        for ln in lines:
+            e = self._emit_line(ln)
+            if e is None: continue
+            addr, data = e[0], e[1]
+            self.rows.append((f"{addr:04X}", data, e[2], ln.lineno))
+            seg = segs.get(self.seg)
+            if seg is None:
+                seg = segs[self.seg] = ObjSegment(self.seg, None if self.seg in self._reloc else self._seg_base[self.seg])
+            off = addr - self._seg_base[self.seg]
+            if off < len(seg.data): raise ValueError(f"Segment {self.seg} überschreibt sich (Z{ln.lineno})")
+            seg.data.extend(bytes(off - len(seg.data)))
+            end_pc = self.pc; self.pc = addr
+            try:
+                for r in self._line_relocs(ln, len(data)):
+                    r.offset += off; seg.relocs.append(r)
+            except ValueError as ex:
+                raise ValueError(f"{ex} (Z{ln.lineno})")
+            self.pc = end_pc
+            seg.data.extend(data)
+
+        exports: Dict[str, Tuple[Optional[str], int]] = {}
+        for name, lineno in self._exports:
+            t = self._sym_term.get(name)
+            if t is not None:
+                if t[1][0] == "ext": raise ValueError(f"Import kann nicht exportiert werden: {name} (Z{lineno})")
+                exports[name] = (t[1][1], t[0])
+            elif name in self.symbols:
+                exports[name] = (None, self.symbols[name])
+            else:
+                raise ValueError(f"Export unbekannt: {name} (Z{lineno})")
+        return ObjectFile(list(segs.values()), exports, list(self._imports))
 
 def build_prg_with_basic_autostart(payload: bytes) -> bytes:
     LOAD_BASIC = 0x0801
@@ -0,0 +1,144 @@
+# petscii_atlas.py
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+# ---------- Glyph-Atlas aus dem Zeichensatz-ROM (chargen) ----------
+#
+# Beide ROM-Bänke (Groß/Grafik und Klein/Groß) mit je 256 Bildschirmcodes,
+# 128..255 = Revers-Darstellung, als ein 1-Bit-Bild: 32 Glyphen je Zeile,
+# 16 Glyphzeilen -> 256 x 128 Pixel. Glyph g = Bank * 256 + Bildschirmcode
+# liegt bei ((g % 32) * 8, (g // 32) * 8).
+#
+# Der Atlas wird einmal gebaut und als PBM (P4, 1 Bit/Pixel, MSB links) unter
+# __cache__ abgelegt; QImage lädt das Format direkt, ohne PIL und ohne Font.
+# Neu gebaut wird nur, wenn eine Quelle neuer ist als die Cache-Datei.
+
+PETSCII_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PETSCII_SOURCES = (os.path.join(PETSCII_BASE_DIR, "petscii_upper_normal.json"),
+                   os.path.join(PETSCII_BASE_DIR, "petscii_lower_normal.json"))
+PETSCII_ATLAS_CACHE = os.path.join(PETSCII_BASE_DIR, "__cache__", "petscii_atlas.pbm")
+
+ATLAS_COLS = 32                     # Glyphen je Atlaszeile
+ATLAS_GLYPHS = 512                  # 2 Bänke x 256 Bildschirmcodes
+ATLAS_WIDTH = ATLAS_COLS * 8
+ATLAS_HEIGHT = ATLAS_GLYPHS // ATLAS_COLS * 8
+BANK_UPPER, BANK_LOWER = 0, 1
+
+# ---------- Quellen: ROM-Abbild oder die vorhandenen JSON-Sätze ----------
+
+def read_chargen(path: str) -> bytes:
+    """chargen-ROM (4 KB: Bank oben/unten, oder 8 KB: erste 4 KB) -> 4096 Bytes."""
+    with open(path, "rb") as f: data = f.read()
+    if len(data) not in (4096, 8192):
+        raise ValueError(f"Unerwartete ROM-Größe {len(data)} (4096 oder 8192 Bytes)")
+    return data[:4096]
+
+def chargen_from_json(upper_path: str, lower_path: str) -> bytes:
+    """
+    4 KB chargen aus petscii_upper_normal.json/petscii_lower_normal.json
+    (Bildschirmcode -> 8 Hex-Zeilen). Die JSON-Sätze enthalten nur die Codes
+    0..127 (128..255 = code & 0x7F), die Revers-Hälfte wird invertiert.
+    """
+    out = bytearray()
+    for path in (upper_path, lower_path):
+        with open(path, "r", encoding="utf-8") as f: glyphs = json.load(f)["bytes"]
+        bank = bytearray()
+        for code in range(128):
+            rows = glyphs.get(f"{code:02X}", ["00"] * 8)
+            bank += bytes(int(r, 16) for r in rows[:8]).ljust(8, b"\x00")
+        out += bank + bytes(b ^ 0xFF for b in bank)
+    return bytes(out)
+
+def load_chargen(source: Optional[str] = None) -> bytes:
+    """source: ROM-Datei; None = JSON-Sätze neben diesem Modul."""
+    return read_chargen(source) if source else chargen_from_json(*PETSCII_SOURCES)
+
+# ---------- Atlas bauen / cachen ----------
+
+def build_atlas(chargen: bytes) -> bytes:
+    """4096 Bytes chargen -> Atlas-Bitmap, ATLAS_HEIGHT Zeilen à ATLAS_COLS Bytes."""
+    if len(chargen) != 4096: raise ValueError("chargen muss 4096 Bytes haben")
+    out = bytearray()
+    for first in range(0, ATLAS_GLYPHS, ATLAS_COLS):
+        block = chargen[first * 8:(first + ATLAS_COLS) * 8]
+        for line in range(8): out += block[line::8]
+    return bytes(out)
+
+def write_pbm(path: str, bits: bytes, width: int = ATLAS_WIDTH, height: int = ATLAS_HEIGHT) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(b"P4\n# petscii atlas\n%d %d\n" % (width, height)); f.write(bits)
+    os.replace(tmp, path)
+
+def read_pbm(path: str) -> Tuple[int, int, bytes]:
+    with open(path, "rb") as f: data = f.read()
+    fields: List[bytes] = []; pos = 0
+    while len(fields) < 3:
+        while data[pos:pos + 1].isspace(): pos += 1
+        if data[pos:pos + 1] == b"#": pos = data.index(b"\n", pos); continue
+        end = pos
+        while not data[end:end + 1].isspace(): end += 1
+        fields.append(data[pos:end]); pos = end
+    if fields[0] != b"P4": raise ValueError(f"{path}: kein P4-PBM")
+    width, height = int(fields[1]), int(fields[2])
+    bits = data[pos + 1:pos + 1 + (width + 7) // 8 * height]
+    if len(bits) != (width + 7) // 8 * height: raise ValueError(f"{path}: PBM zu kurz")
+    return width, height, bits
+
+def atlas_path(source: Optional[str] = None, cache: str = PETSCII_ATLAS_CACHE) -> str:
+    """
+    Pfad der Atlas-Datei; baut sie (neu), wenn sie fehlt, ungültig oder älter
+    als die Quelle ist.
+    """
+    sources = (source,) if source else PETSCII_SOURCES
+    try:
+        stamp = os.path.getmtime(cache)
+        if all(os.path.getmtime(s) <= stamp for s in sources):
+            width, height, _bits = read_pbm(cache)
+            if (width, height) == (ATLAS_WIDTH, ATLAS_HEIGHT): return cache
+    except (OSError, ValueError):
+        pass
+    write_pbm(cache, build_atlas(load_chargen(source)))
+    return cache
+
+# ---------- Zeichen -> Glyph ----------
+#
+# Text kommt als Python-str (ASCII aus BASIC-Programmen, Tastatur). Abbildung
+# auf Bildschirmcodes wie beim C64: '@A-Z[£]↑←' = 0..31, ' '..'?' = 32..63;
+# im Klein/Groß-Satz a-z = 1..26, A-Z = 65..90.
+
+def _screen_codes(bank: int) -> Dict[str, int]:
+    table = {chr(0x40 + c): c for c in range(32)}               # @ A..Z [ \ ] ^ _
+    table.update({chr(c): c for c in range(0x20, 0x40)})        # ' '..'?'
+    table.update({"£": 0x1C, "↑": 0x1E, "←": 0x1F, "π": 0x5E})
+    table.update({chr(0x60 + c): c for c in range(1, 27)})      # a..z (Groß/Grafik: als A..Z)
+    if bank == BANK_LOWER:
+        table.update({chr(0x40 + c): 0x40 + c for c in range(1, 27)})  # A..Z
+    return table
+
+PETSCII_SCREEN_CODES = (_screen_codes(BANK_UPPER), _screen_codes(BANK_LOWER))
+
+def glyph_index(ch: str, bank: int = BANK_UPPER, reverse: bool = False) -> Optional[int]:
+    """Atlas-Index für ein Zeichen, None wenn es im Zeichensatz nicht vorkommt."""
+    code = PETSCII_SCREEN_CODES[bank].get(ch)
+    if code is None: return None
+    return bank * 256 + (code | 0x80 if reverse else code)
+
+def glyph_origin(index: int) -> Tuple[int, int]:
+    return (index % ATLAS_COLS) * 8, (index // ATLAS_COLS) * 8
+
+def main():
+    ap = argparse.ArgumentParser(description="PETSCII-Glyph-Atlas (PBM) aus chargen-ROM oder JSON-Sätzen bauen.")
+    ap.add_argument("rom", nargs="?", help="chargen ROM (4 oder 8 KB); ohne: petscii_*_normal.json")
+    ap.add_argument("-o", "--out", default=PETSCII_ATLAS_CACHE, help="Ausgabe (PBM)")
+    args = ap.parse_args()
+    write_pbm(args.out, build_atlas(load_chargen(args.rom)))
+    print(f"{args.out}: {ATLAS_WIDTH}x{ATLAS_HEIGHT}, {ATLAS_GLYPHS} Glyphen")
+
+if __name__ == "__main__":
+    main()
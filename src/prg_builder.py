@@ -13,7 +13,7 @@ def build_basic_sys_stub(code_start: int, line_number: int = 10) -> bytes:
     Rückgabe: reiner BASIC-Inhalt (ohne PRG-Header-Zweibyte-Ladeadresse).
     """
     # Inhalt: [TOKEN_SYS=0x9E] " " Ziffern ... 0x00 (Zeilenende)
-    text = f" SYS {code_start}"  # führendes Leerzeichen ist ok/üblich
+    text = f" {code_start}"  # führendes Leerzeichen ist ok/üblich (SYS steckt im Token)
     content = bytes([0x9E]) + text.encode("ascii") + b"\x00"
 
     # Link zur nächsten Zeile berechnen: LOAD_ADDR + (Zeilenkopf + Inhalt)
@@ -38,12 +38,13 @@ def build_single_segment_prg(assembled_code: bytes) -> bytes:
     Achtung: PRG-Header (2 Bytes Ladeadresse) nur EINMAL vorne!
     """
     basic = build_basic_sys_stub(code_start=0)  # Platzhalter; wir berechnen gleich neu
-    # Erstmal nur BASIC bauen, um Länge zu kennen:
-    basic_len = len(basic)
-    code_start = LOAD_ADDR + basic_len  # reale Startadresse des Codes im RAM
-
-    # BASIC erneut, jetzt mit korrekter SYS-Zahl:
-    basic = build_basic_sys_stub(code_start=code_start)
+    # Länge der SYS-Zeile hängt an der Stellenzahl -> bis zum Fixpunkt:
+    code_start = LOAD_ADDR + len(basic)  # reale Startadresse des Codes im RAM
+    while True:
+        basic = build_basic_sys_stub(code_start=code_start)
+        if LOAD_ADDR + len(basic) == code_start:
+            break
+        code_start = LOAD_ADDR + len(basic)
 
     # Endgültig:
     prg = bytearray()
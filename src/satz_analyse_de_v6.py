@@ -7,7 +7,8 @@ Satzanalyse DE (v5) – erweiterte Morphologie
 - Schritt 5: Flexions-Erkennung (Verbformen inkl. Partizip II & trennbare Verben; Nomen-Plurale inkl. Umlaut-Heuristik & Sonderfälle)
 Optional: JSON-Konfigurationsdatei "satz_analyse_config.json" im selben Ordner.
 """
-import sys, re, json, os
+import sys, re, json, os, marshal
+from array import array
 from typing import List, Tuple, Union, Dict
 import pandas as pd
 
@@ -51,30 +52,172 @@ def tokenize(text: str) -> List[Tuple[str,int]]:
     return [(m.group(0), m.start()) for m in re.finditer(r"[A-Za-zÄÖÜäöüß\-]+", text)]
 
 def levenshtein(a: str, b: str, max_dist: int = 2) -> int:
+    """Distanz a/b, max_dist + 1 für alles darüber. Gemeinsamer Anfang/Ende zählt nicht, gerechnet wird im Band |i-j| <= max_dist."""
     if a == b:
         return 0
     la, lb = len(a), len(b)
     if abs(la - lb) > max_dist:
         return max_dist + 1
-    if la > lb:
-        a, b = b, a
-        la, lb = lb, la
-    prev = list(range(lb + 1))
-    for i in range(1, la + 1):
-        cur = [i] + [0]*lb
+    n = min(la, lb); i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    j = 0
+    while j < n - i and a[la-1-j] == b[lb-1-j]:
+        j += 1
+    a = a[i:la-j]; b = b[i:lb-j]
+    if not a or not b:
+        return min(max(len(a), len(b)), max_dist + 1)
+    big = max_dist + 1
+    prev = [j if j <= max_dist else big for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        cur = [big] * (len(b) + 1)
+        if i <= max_dist:
+            cur[0] = i
         ai = a[i-1]
         row_min = cur[0]
-        for j in range(1, lb + 1):
-            cost = 0 if ai == b[j-1] else 1
-            cur[j] = min(prev[j] + 1, cur[j-1] + 1, prev[j-1] + cost)
-            if cur[j] < row_min:
-                row_min = cur[j]
+        for j in range(max(1, i - max_dist), min(len(b), i + max_dist) + 1):
+            d = prev[j-1] + (ai != b[j-1])
+            if prev[j] < d: d = prev[j] + 1
+            if cur[j-1] < d: d = cur[j-1] + 1
+            cur[j] = d
+            if d < row_min:
+                row_min = d
         if row_min > max_dist:
             return max_dist + 1
         prev = cur
-    return prev[-1]
+    return min(prev[-1], max_dist + 1)
 
-def build_vocab(df: pd.DataFrame):
+# ---------- Vorschlagsindex für candidates() ----------
+#
+# Jedes Wort der Länge l wird in max_dist+1 Stücke zerlegt und unter (erster
+# Buchstabe, l, Stücknummer, Stück) abgelegt. Bei höchstens max_dist Änderungen
+# bleibt ein Stück unverändert und liegt im Suchwort nur wenig verschoben
+# (Schubfachprinzip): gerechnet wird levenshtein() nur noch für die Wörter
+# unter diesen Schlüsseln statt für das ganze Wörterbuch - und nur, wenn die
+# Buchstabenmengen (Bitmaske je Wort) sich um höchstens max_dist Buchstaben und
+# die Buchstabenpaare um höchstens 2*max_dist Paare je Seite unterscheiden
+# (eine Änderung bringt höchstens einen neuen Buchstaben bzw. zwei neue Paare).
+# Gebaut einmal je Wörterbuch, abgelegt als <csv ohne Endung>.suggest daneben.
+class SuggestIndex:
+    VERSION = 2
+
+    def __init__(self, words, max_dist: int = 2):
+        self.max_dist = max_dist
+        self.words: List[str] = sorted(set(words))
+        buckets: Dict[str, List[int]] = {}
+        for n, w in enumerate(self.words):
+            if len(w) <= max_dist:                      # zu kurz für Stücke: Schlüssel = Anfangsbuchstabe
+                buckets.setdefault(w[:1], []).append(n)
+                continue
+            for i, (start, size) in enumerate(self.segments(len(w))):
+                buckets.setdefault(self.key(w[:1], len(w), i, w[start:start + size]), []).append(n)
+        # flach ablegen: Schlüssel -> Nr., Wort-Ids der Nr. b = ids[offsets[b]:offsets[b+1]]
+        self.buckets: Dict[str, int] = {}
+        self.ids = array("I"); self.offsets = array("I", [0])
+        for b, (key, ids) in enumerate(buckets.items()):
+            self.buckets[key] = b; self.ids.extend(ids); self.offsets.append(len(self.ids))
+        self.masks   = array("Q", map(self.mask, self.words))
+        self.bigrams = array("Q", map(self.bigram_mask, self.words))
+
+    @staticmethod
+    def mask(word: str) -> int:
+        """Buchstabenmenge als Bitmaske (64 Bit, Zeichencode mod 64)."""
+        m = 0
+        for c in set(word):
+            m |= 1 << (ord(c) & 63)
+        return m
+
+    @staticmethod
+    def bigram_mask(word: str) -> int:
+        """Menge der Buchstabenpaare als Bitmaske (64 Bit, gestreut)."""
+        m = 0
+        for a, b in zip(word, word[1:]):
+            m |= 1 << ((ord(a) * 31 + ord(b)) & 63)
+        return m
+
+    def segments(self, length: int) -> List[Tuple[int, int]]:
+        """(Start, Länge) der max_dist+1 Stücke eines Worts dieser Länge."""
+        parts = self.max_dist + 1
+        base, extra = divmod(length, parts)
+        out = []; start = 0
+        for i in range(parts):
+            size = base + (i >= parts - extra)
+            out.append((start, size)); start += size
+        return out
+
+    @staticmethod
+    def key(first: str, length: int, part: int, piece: str) -> str:
+        return f"{first}{length}:{part}:{piece}"
+
+    def bucket(self, key: str):
+        b = self.buckets.get(key)
+        return () if b is None else self.ids[self.offsets[b]:self.offsets[b + 1]]
+
+    def suggest(self, word: str, limit: int = 5) -> List[str]:
+        """Wie candidates(): gleicher Anfangsbuchstabe, Distanz <= max_dist, sortiert nach (Distanz, Wort)."""
+        w = word.casefold(); L = len(w); k = self.max_dist; first = w[:1]
+        found = set()
+        for key in ([first] if w else [key for key in self.buckets if len(key) <= 1]):
+            found.update(n for n in self.bucket(key) if len(self.words[n]) <= L + k)
+        for length in range(max(L - k, k + 1), L + k + 1):
+            delta = L - length
+            for i, (start, size) in enumerate(self.segments(length)):
+                # Stück i ist höchstens i Stellen verschoben (Änderungen davor) und
+                # höchstens k-i Stellen gegen die Längendifferenz (Änderungen danach)
+                lo = max(0, start - i, start + delta - (k - i))
+                hi = min(L - size, start + i, start + delta + (k - i))
+                for pos in range(lo, hi + 1):
+                    found.update(self.bucket(self.key(first, length, i, w[pos:pos + size])))
+        scored = []; mw = self.mask(w); bw = self.bigram_mask(w); masks = self.masks; bigrams = self.bigrams
+        for n in found:
+            mv = masks[n]; bv = bigrams[n]
+            if (mw & ~mv).bit_count() > k or (mv & ~mw).bit_count() > k \
+               or (bw & ~bv).bit_count() > 2 * k or (bv & ~bw).bit_count() > 2 * k:
+                continue                                # zu viele verschiedene Buchstaben/Paare
+            d = levenshtein(w, self.words[n], max_dist=k)
+            if d <= k:
+                scored.append((d, self.words[n]))
+        scored.sort()
+        return [v for d, v in scored[:limit]]
+
+    @staticmethod
+    def cache_path(csv_path: str) -> str:
+        return os.path.splitext(csv_path)[0] + ".suggest"
+
+    @classmethod
+    def load_or_build(cls, words, csv_path: str, max_dist: int = 2) -> "SuggestIndex":
+        """
+        Index neben csv_path (Datei, aus der words stammen) laden; fehlt er oder
+        ist die CSV seitdem geändert (mtime/Größe): bauen und ablegen.
+        """
+        path = cls.cache_path(csv_path)
+        st = os.stat(csv_path)
+        key = f"v{cls.VERSION}:{max_dist}:{st.st_mtime_ns}:{st.st_size}"
+        try:
+            with open(path, "rb") as f:
+                stored_key, data = marshal.loads(f.read())     # loads(): marshal.load(f) liest stückweise, ~4x langsamer
+            if stored_key == key:
+                index = cls.__new__(cls)
+                index.max_dist, index.words, index.buckets, ids, offsets, masks, bigrams = data
+                index.ids = array("I"); index.ids.frombytes(ids)
+                index.offsets = array("I"); index.offsets.frombytes(offsets)
+                index.masks = array("Q"); index.masks.frombytes(masks)
+                index.bigrams = array("Q"); index.bigrams.frombytes(bigrams)
+                return index
+        except (OSError, ValueError, EOFError, TypeError):
+            pass
+        index = cls(words, max_dist)
+        try:
+            tmp = path + ".tmp"
+            with open(tmp, "wb") as f:
+                marshal.dump((key, (index.max_dist, index.words, index.buckets, index.ids.tobytes(),
+                                    index.offsets.tobytes(), index.masks.tobytes(), index.bigrams.tobytes())), f)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"Vorschlagsindex nicht gespeichert: {e}", file=sys.stderr)
+        return index
+
+def build_vocab(df: pd.DataFrame, csv_path: str = None):
     vocab_all = set(w.casefold() for w in df["wort"].astype(str).tolist())
     nouns = set(w.casefold() for w in df[df["kategorie"]=="Substantiv"]["wort"].astype(str).tolist())
     male_names = set(w.casefold() for w in df[df["kategorie"]=="Männername"]["wort"].astype(str).tolist())
@@ -84,9 +227,14 @@ def build_vocab(df: pd.DataFrame):
     verbs = set(w.casefold() for w in df[df["kategorie"]=="Verb"]["wort"].astype(str).tolist())
     adjs = set(w.casefold() for w in df[df["kategorie"]=="Adjektiv"]["wort"].astype(str).tolist())
     colors = set(w.casefold() for w in df[df["kategorie"]=="Farbe"]["wort"].astype(str).tolist())
-    return {"all": vocab_all,"nouns": nouns,"names": names,"cities": cities,"verbs": verbs,"adjs": adjs,"colors": colors}
+    vocab = {"all": vocab_all,"nouns": nouns,"names": names,"cities": cities,"verbs": verbs,"adjs": adjs,"colors": colors}
+    if csv_path:
+        vocab["suggest"] = SuggestIndex.load_or_build(vocab_all, csv_path)
+    return vocab
 
 def candidates(word: str, vocab_list):
+    if isinstance(vocab_list, SuggestIndex):
+        return vocab_list.suggest(word)
     w = word.casefold()
     L = len(w)
     pool = [v for v in vocab_list if abs(len(v) - L) <= 2 and (not w or v[:1] == w[:1])]
@@ -109,12 +257,13 @@ def analyze_sentence_step1(sentence: str, vocab_or_df: Union[dict, pd.DataFrame]
               "notes": ["Rechtschreibprüfung gegen Wörterbuch (case-insensitive).","Nomen-Heuristik für Groß-/Klein (außer am Satzanfang)."]}
     vocab_all = vocab["all"]; nouns = vocab["nouns"]; names = vocab["names"]; cities = vocab["cities"]
     non_noun_categories = vocab["verbs"] | vocab["adjs"] | vocab["colors"]
+    suggest = vocab.get("suggest", vocab_all)   # Index aus build_vocab(df, csv_path), sonst Scan ohne Kopie
     for idx, (tok, pos) in enumerate(toks):
         t_cf = tok.casefold()
         known = t_cf in vocab_all
         if not known:
             report["unknown"].append(tok)
-            cands = candidates(tok, list(vocab_all))
+            cands = candidates(tok, suggest)
             if cands:
                 report["suggestions"][tok] = cands
         if tok[:1].islower() and t_cf in nouns and idx != 0:
@@ -296,7 +445,7 @@ def main():
         sys.exit(0)
     sentence = sys.argv[1]
     df = pd.read_csv(DICT_PATH)
-    vocab = build_vocab(df)
+    vocab = build_vocab(df, DICT_PATH)
     out = {
         "step1": analyze_sentence_step1(sentence, vocab),
         "step2": analyze_sentence_step2(sentence),
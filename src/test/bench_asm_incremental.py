@@ -0,0 +1,98 @@
+# ---------------------------------------------------------------------------
+# Benchmark: IncrementalAssembler.update() gegen assemble() pro "Tastendruck"
+#
+# Quelle wie bench_mini_assembler.py (Standard 20k Zeilen). Simuliert werden
+#   operand : Operand in der Mitte ändern (Größe gleich)
+#   insert  : NOP in der Mitte einfügen (alle folgenden Adressen verschieben sich)
+#   append  : Zeile am Ende anhängen
+# Jedes Ergebnis wird mit einem vollen assemble() verglichen.
+#
+# Danach --fuzz zufällige Bearbeitungen (Zeilen löschen - auch am Ende -,
+# einfügen, ersetzen; Labels, doppelte Labels, Branches, JMP *, .ORG) auf
+# einem kleinen Quelltext; Ergebnis bzw. Fehler muss assemble() entsprechen.
+#
+# Aufruf (aus src/):
+#     python test/bench_asm_incremental.py [zeilen] [--edits 50] [--fuzz 3000]
+# ---------------------------------------------------------------------------
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from c6510_spec     import C6510Spec
+from c6510_cpu      import SPEC_JSON
+from mini_assembler import MiniAssembler, IncrementalAssembler
+
+from bench_mini_assembler import generate_source
+
+def edit(lines, case: str, k: int, mid: int):
+    if case == "operand":
+        lines[mid] = f"        STA ${0xFB + k % 2:02X}"
+    elif case == "insert":
+        lines.insert(mid, "        NOP")
+    else:
+        lines.append(f"        LDA #{k & 0xFF}")
+
+FUZZ_LINES = [
+    "        LDA #1", "        STA $D020", "        NOP", "        JMP *", "        .byte 1,2,3",
+    "        .word a, b", "        LDX a+1", "        LDA b,Y", "        JSR c", "        BNE a",
+    "        BEQ b", "a:      INY", "b:      DEX", "c:      RTS", "d = *", "e = $10",
+    "        LDA e", "        LDA d", "        .org $C100", "",
+]
+
+def fuzz(spec, rounds: int, seed: int = 1):
+    """Zufällige Bearbeitungen: IncrementalAssembler gegen assemble()."""
+    rnd = random.Random(seed)
+    lines = ["        .org $C000", "        LDA #1", "        STA $D020"]
+    inc = IncrementalAssembler(spec)
+    for r in range(rounds):
+        pos = rnd.randint(0, len(lines)); op = rnd.randrange(4)
+        if op == 0 and lines: del lines[min(pos, len(lines) - 1):min(pos, len(lines) - 1) + rnd.randint(1, 3)]
+        elif op == 1 and lines: del lines[-rnd.randint(1, min(3, len(lines))):]
+        elif op == 2 and pos < len(lines): lines[pos] = rnd.choice(FUZZ_LINES)
+        else: lines[pos:pos] = [rnd.choice(FUZZ_LINES) for _ in range(rnd.randint(1, 2))]
+        if len(lines) > 40: del lines[rnd.randrange(len(lines))]
+        text = "\n".join(lines)
+        full = MiniAssembler(spec)
+        try: want = full.assemble(text)
+        except Exception as e: want = type(e)
+        try: got = inc.update(text)
+        except Exception as e: got = type(e)
+        assert got == want and (isinstance(want, type) or inc.rows == full.rows), \
+            f"Runde {r}: Ergebnis weicht ab\n{text}\n{got}\n{want}"
+    print(f"fuzz     {rounds} zufällige Änderungen wie assemble()")
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("lines", type=int, nargs="?", default=20_000)
+    ap.add_argument("--edits", type=int, default=50)
+    ap.add_argument("--fuzz", type=int, default=3000)
+    args = ap.parse_args()
+
+    spec = C6510Spec.from_json(SPEC_JSON)
+    base = generate_source(args.lines).splitlines()
+    mid  = base.index("        STA $FB", len(base) // 2)
+    print(f"{args.lines} Zeilen, {args.edits} Änderungen je Fall")
+    for case in ("operand", "insert", "append"):
+        lines = list(base)
+        inc = IncrementalAssembler(spec)
+        inc.update("\n".join(lines))
+        t_inc = t_full = 0.0; emitted = 0
+        for k in range(args.edits):
+            edit(lines, case, k, mid)
+            text = "\n".join(lines)
+            t0 = time.perf_counter(); got = inc.update(text); t_inc += time.perf_counter() - t0
+            emitted += inc.stats["emitted"]
+            full = MiniAssembler(spec)
+            t0 = time.perf_counter(); want = full.assemble(text); t_full += time.perf_counter() - t0
+            assert got == want and inc.rows == full.rows, f"{case}: Ergebnis weicht ab"
+        n = args.edits
+        print(f"{case:<8} full {t_full / n * 1000:8.2f} ms  incremental {t_inc / n * 1000:8.2f} ms  "
+              f"speedup {t_full / t_inc:6.1f}x   ({emitted / n:.0f} Zeilen neu erzeugt)")
+    fuzz(spec, args.fuzz)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# ---------------------------------------------------------------------------
+# Benchmark: Bibliotheksmodule einmal zu Objektdateien assemblieren, danach
+# nur noch linken - gegen "alles neu assemblieren" (eine große Quelle).
+#
+# Erzeugt --modules Module à --lines Zeilen (relozierbare Segmente CODE/DATA,
+# Exporte/Importe zwischen den Modulen), prüft, dass das gelinkte Abbild dem
+# absolut assemblierten entspricht, und misst:
+#   assemble : alle Module als eine Quelle mit MiniAssembler.assemble()
+#   objects  : ObjectAssembler.assemble_object() je Modul + to_bytes()
+#   relink   : ObjectFile.from_bytes() + link() (Objekte aus dem Cache)
+#
+# Aufruf (aus src/):
+#     python test/bench_asm_link.py [--modules 20] [--lines 1000]
+# ---------------------------------------------------------------------------
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from c6510_spec     import C6510Spec
+from c6510_cpu      import SPEC_JSON
+from mini_assembler import MiniAssembler, ObjectAssembler
+from asm_linker     import ObjectFile, link
+
+def module_parts(m: int, modules: int, lines: int):
+    # Code- und Datenteil eines Moduls; ruft die Routine des nächsten Moduls
+    nxt = (m + 1) % modules
+    code = [f"m{m}_entry: LDX #0"]
+    data = [f"m{m}_tab:"]
+    for n in range(lines // 10):
+        code += [
+            f"m{m}_l{n}: LDA m{m}_tab+{n % 8},X",
+            f"        STA $0400+{n % 200}",
+            f"        LDA #<m{m}_tab",
+            f"        LDY #>m{m}_tab",
+            f"        INX",
+            f"        CPX #{n % 100 + 1}",
+            f"        BNE m{m}_l{n}",
+            f"        JSR m{nxt}_entry",
+        ]
+        data += [f"        .BYTE {n & 0xFF}, {(n * 7) & 0xFF}"]
+    code += ["        RTS"]
+    data += [f"        .WORD m{m}_entry, m{m}_tab"]
+    return code, data, nxt
+
+def object_source(m: int, modules: int, lines: int) -> str:
+    code, data, nxt = module_parts(m, modules, lines)
+    head = [f"        .EXPORT m{m}_entry, m{m}_tab"]
+    if nxt != m: head += [f"        .IMPORT m{nxt}_entry"]
+    return "\n".join(head + ["        .SEGMENT CODE"] + code + ["        .SEGMENT DATA"] + data) + "\n"
+
+def absolute_source(modules: int, lines: int, base: int) -> str:
+    # gleiche Reihenfolge wie der Linker: erst alle CODE-Teile, dann alle DATA-Teile
+    parts = [module_parts(m, modules, lines) for m in range(modules)]
+    out = [f"        .ORG ${base:04X}"]
+    for code, _data, _nxt in parts: out += code
+    for _code, data, _nxt in parts: out += data
+    return "\n".join(out) + "\n"
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--modules", type=int, default=20)
+    ap.add_argument("--lines", type=int, default=1000)
+    args = ap.parse_args()
+
+    spec = C6510Spec.from_json(SPEC_JSON)
+    srcs = [object_source(m, args.modules, args.lines) for m in range(args.modules)]
+    full = absolute_source(args.modules, args.lines, 0x1000)
+
+    t0 = time.perf_counter()
+    asm = MiniAssembler(spec); asm.assemble(full)
+    t_asm = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    blobs = [ObjectAssembler(spec).assemble_object(src).to_bytes() for src in srcs]
+    t_obj = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    image = link([ObjectFile.from_bytes(b) for b in blobs], base=0x1000)
+    t_link = time.perf_counter() - t0
+
+    assert image.chunks == asm.segments(), "gelinktes Abbild weicht ab"
+    size = sum(len(d) for _a, d in image.chunks)
+    print(f"{args.modules} Module x {args.lines} Zeilen, {size} Bytes, "
+          f"{sum(len(b) for b in blobs)} Bytes Objektdateien")
+    print(f"assemble {t_asm * 1000:9.1f} ms")
+    print(f"objects  {t_obj * 1000:9.1f} ms")
+    print(f"relink   {t_link * 1000:9.1f} ms   ({t_asm / t_link:.0f}x schneller als neu assemblieren)")
+
+if __name__ == "__main__":
+    main()
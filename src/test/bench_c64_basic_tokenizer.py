@@ -0,0 +1,91 @@
+# ---------------------------------------------------------------------------
+# Benchmark: C64-BASIC-Tokenizer - bisherige Schleife (re.match je Muster auf
+# dem schrumpfenden Zeilenrest) gegen die Master-Regex (basic_tokenize) und
+# das Crunchen über den Schlüsselwort-Trie (basic_crunch_program).
+#
+# Programm: --lines Zeilen (Standard 10k) mit PRINT/GOTO/FOR/IF/DATA/REM,
+# Strings und Ausdrücken. Die Token-Listen müssen identisch sein.
+#
+# Aufruf (aus src/):
+#     python test/bench_c64_basic_tokenizer.py [--lines 10000]
+# ---------------------------------------------------------------------------
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from c64_basic_tokenizer import basic_tokenize_program, basic_crunch
+
+OLD_PATTERNS = {
+    "NUMBER":       r"^\d+",
+    "COMMAND":      r"^[a-zA-Z]+",
+    "STRING":       r'^\"[^"]*\"',
+    "VARIABLE":     r"^[a-zA-Z][0-9a-zA-Z]*",
+    "SYMBOL":       r"^[=,+\-*/()]",
+}
+
+def old_tokenize(code):
+    # bisherige C64BasicParser.tokenize (Referenz)
+    tokens = []
+    while code:
+        code = code.lstrip()
+        matched = False
+        for token_type, pattern in OLD_PATTERNS.items():
+            match = re.match(pattern, code, re.IGNORECASE)
+            if match:
+                tokens.append((token_type, match.group(0)))
+                code = code[len(match.group(0)):]
+                matched = True
+                break
+        if not matched:
+            raise SyntaxError(f"Unbekanntes Token: {code}")
+    return tokens
+
+def old_parse(code):
+    out = []
+    for line in code.splitlines():
+        line = line.strip()
+        if not line: continue
+        m = re.match(OLD_PATTERNS["NUMBER"], line)
+        rest = line[len(m.group(0)):].strip()
+        out.append({"line_number": int(m.group(0)), "tokens": old_tokenize(rest)})
+    return out
+
+def generate_program(lines: int) -> str:
+    body = [
+        'PRINT "HELLO WORLD" , A1 , B2 + 3 * ( C - 4 )',
+        "FOR I = 1 TO 100 STEP 2",
+        "X = X + I * 2 - ( Y / 3 )",
+        "IF X = 10 THEN 100",
+        "GOSUB 9000",
+        'PRINT LEFT ( "ABCDEFGHIJ" , 3 ) , RIGHT ( "XYZ" , 1 )',
+        "NEXT I",
+        "DATA 1 , 2 , 3 , 4 , 5 , 6 , 7 , 8",
+        "POKE 53280 , 0",
+        "GOTO 10",
+    ]
+    return "\n".join(f"{n + 1} {body[n % len(body)]}" for n in range(lines)) + "\n"
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--lines", type=int, default=10_000)
+    args = ap.parse_args()
+    src = generate_program(args.lines)
+
+    t0 = time.perf_counter(); old = old_parse(src); t_old = time.perf_counter() - t0
+    t0 = time.perf_counter(); new = basic_tokenize_program(src); t_new = time.perf_counter() - t0
+    t0 = time.perf_counter(); size = sum(len(basic_crunch(l["text"])) for l in new); t_crunch = time.perf_counter() - t0
+
+    assert [(l["line_number"], l["tokens"]) for l in new] == [(l["line_number"], l["tokens"]) for l in old], \
+        "Token-Listen weichen ab"
+    n = sum(len(l["tokens"]) for l in new)
+    print(f"{args.lines} Zeilen, {n} Tokens, {size} Bytes tokenisiert")
+    print(f"tokenize alt {t_old * 1000:8.1f} ms")
+    print(f"tokenize neu {t_new * 1000:8.1f} ms   ({t_old / t_new:.1f}x)")
+    print(f"crunch       {t_crunch * 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# ---------------------------------------------------------------------------
+# Benchmark: 6510-Emulator (c6510_cpu.CPU6510) mit MiniAssembler-Code
+#
+# Ein Programm mit typischem Befehlsmix (Speicher kopieren über (zp),Y,
+# 16-Bit-Zähler, Verzweigungen, JSR/RTS) läuft per run(cycles) im Block.
+# Ausgabe: Zyklen/s als MHz-Äquivalent (echter C64: ~0.985 MHz PAL).
+#
+# Aufruf (aus src/):
+#     python test/bench_c6510_cpu.py [--cycles 20000000]
+# ---------------------------------------------------------------------------
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from c6510_spec     import C6510Spec
+from c6510_cpu      import CPU6510, SPEC_JSON
+from mini_assembler import MiniAssembler
+
+SOURCE = """
+        .org $1000
+start:  LDA #$00
+        STA $FB
+        LDA #$20
+        STA $FC
+        LDA #$00
+        STA $FD
+        LDA #$40
+        STA $FE
+outer:  LDY #$00
+copy:   LDA ($FB),Y
+        EOR #$5A
+        STA ($FD),Y
+        INY
+        BNE copy
+        JSR count
+        INC $FC
+        INC $FE
+        LDA $FE
+        CMP #$60
+        BNE outer
+        JMP start
+count:  CLC
+        LDA $02
+        ADC #$01
+        STA $02
+        LDA $03
+        ADC #$00
+        STA $03
+        RTS
+"""
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--cycles", type=int, default=20_000_000)
+    args = ap.parse_args()
+
+    spec = C6510Spec.from_json(SPEC_JSON)
+    code, org, _ = MiniAssembler(spec).assemble(SOURCE)
+
+    t0 = time.perf_counter()
+    cpu = CPU6510(spec)
+    t_build = time.perf_counter() - t0
+
+    cpu.load(org, code)
+    cpu.pc = org
+    t0 = time.perf_counter()
+    done = cpu.run(args.cycles)
+    dt = time.perf_counter() - t0
+
+    print(f"dispatch table built in {t_build * 1000:.1f} ms")
+    print(f"{done} cycles, {cpu.instructions} instructions in {dt:.2f} s")
+    print(f"{done / dt / 1e6:.2f} MHz-Äquivalent, {cpu.instructions / dt / 1e6:.2f} M instr/s")
+
+if __name__ == "__main__":
+    main()
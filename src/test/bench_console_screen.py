@@ -0,0 +1,79 @@
+# ---------------------------------------------------------------------------
+# Benchmark: print_line der Konsolenfenster - altes Verfahren (ganzes 40x25-
+# bzw. 80x25-Raster pro Zeile als HTML mit einem <span> je Zelle aufbauen,
+# "fg:bg" je Zelle splitten) gegen ConsoleScreen (Zellen schreiben, Dirty-
+# Rechteck; gemalt wird einmal pro Frame nur das geänderte Rechteck).
+#
+# Gemessen wird nur der Python-Anteil ohne setHtml()/Qt-Layout; der alte Weg
+# ist real also noch deutlich teurer.
+#
+# Aufruf (aus src/):
+#     python test/bench_console_screen.py [--lines 2000] [--cols 80]
+# ---------------------------------------------------------------------------
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from console_screen import ConsoleScreen
+
+def old_print_line(buffer, colors, cols, rows, x, y, text, color):
+    # Kopie der bisherigen Schleifen aus DOSConsoleWindow.print_line (ohne setHtml)
+    text_html = ""; i = 0
+    for row in range(rows):
+        if i >= len(text): break
+        if row > y: break
+        for col in range(cols):
+            if i >= len(text): break
+            if (col >= x) and (col <= (x + i)):
+                buffer[y][col] = '&nbsp;' if text[i] == ' ' else text[i]
+                colors[y][col] = color
+                i += 1
+    for row in range(rows):
+        for col in range(cols):
+            field_value = buffer[row][col]
+            c = colors[row][col].split(':')
+            text_html += f'<span style="color:{c[0]};background-color:{c[1]};">'
+            text_html += field_value
+            text_html += '</span>'
+        text_html += "<br>"
+    return text_html
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--lines", type=int, default=2000)
+    ap.add_argument("--cols", type=int, default=80)
+    args = ap.parse_args()
+    cols, rows = args.cols, 25
+    # Text passt in eine Zeile: beim Überlauf schrieb der alte Code den Rest
+    # noch einmal an den Anfang derselben Zeile, ConsoleScreen schneidet ab
+    lines = [(i % rows, f"Zeile {i:5d}: PRINT-Schleife mit etwas Text"[:cols]) for i in range(args.lines)]
+
+    buffer = [['&nbsp;' for _ in range(cols)] for _ in range(rows)]
+    colors = [['#ff0000:#000000' for _ in range(cols)] for _ in range(rows)]
+    t0 = time.perf_counter()
+    for y, text in lines: old_print_line(buffer, colors, cols, rows, 0, y, text, '#ff0000:#000000')
+    t_old = time.perf_counter() - t0
+
+    screen = ConsoleScreen(cols, rows, "#ff0000", "#000000")
+    fg, bg = screen.color("#ff0000"), screen.color("#000000")
+    t0 = time.perf_counter(); frames = 0
+    for n, (y, text) in enumerate(lines):
+        screen.put_text(0, y, text, fg, bg)
+        if n % 100 == 99:       # ~ ein Frame je 100 Zeilen (Programm druckt in einer Schleife)
+            screen.take_dirty(); frames += 1
+    if screen.take_dirty(): frames += 1
+    t_new = time.perf_counter() - t0
+
+    for y in range(rows):
+        old = "".join(" " if c == '&nbsp;' else c for c in buffer[y])
+        assert old == screen.row_text(y), f"Zeile {y} weicht ab:\n{old!r}\n{screen.row_text(y)!r}"
+
+    print(f"{args.lines} Zeilen, {cols}x{rows} Zellen")
+    print(f"html     {t_old * 1000:9.1f} ms")
+    print(f"screen   {t_new * 1000:9.1f} ms   ({frames} Frames, {t_old / t_new:.0f}x schneller)")
+
+if __name__ == "__main__":
+    main()
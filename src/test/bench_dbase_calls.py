@@ -0,0 +1,74 @@
+# ---------------------------------------------------------------------------
+# Micro-Benchmark: Methodenaufrufe obj.Method(...) im dBase-Interpreter
+#
+# Schleife mit Aufrufen ohne Argumente (C.Inc(), C.Get()) und mit Argument
+# (C.Add(k)); jede Call-Site nutzt den Inline-Cache. IR und Visitor müssen
+# dieselbe Ausgabe liefern.
+#
+# Aufruf (aus src/):
+#     python test/bench_dbase_calls.py [--n 20000]
+# ---------------------------------------------------------------------------
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+from contextlib import redirect_stdout
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import dBaseRunner
+
+SOURCE = (
+    "LOCAL C\n"
+    "C = NEW Counter()\n"
+    "FOR I = 1 TO {n}\n"
+    "    C.Inc()\n"
+    "    C.Add(2)\n"
+    "ENDFOR\n"
+    "WRITE C.Get()\n"
+    "\n"
+    "CLASS Counter\n"
+    "    PROPERTY n = 0\n"
+    "    METHOD Inc()\n"
+    "        THIS.n = THIS.n + 1\n"
+    "    ENDMETHOD\n"
+    "    METHOD Add(k)\n"
+    "        THIS.n = THIS.n + k\n"
+    "    ENDMETHOD\n"
+    "    METHOD Get()\n"
+    "        RETURN THIS.n\n"
+    "    ENDMETHOD\n"
+    "ENDCLASS\n"
+)
+
+def run(src: str, use_ir: bool):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.prg")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(src)
+
+        out = io.StringIO()
+        t0 = time.perf_counter()
+        with redirect_stdout(out):
+            dBaseRunner.parse(path, use_ir=use_ir, use_cache=False)
+        return time.perf_counter() - t0, out.getvalue().strip().splitlines()
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=20_000)
+    args = ap.parse_args()
+
+    src = SOURCE.format(n=args.n)
+    t_ir, out_ir = run(src, True)
+    t_vis, out_vis = run(src, False)
+    assert out_ir == out_vis, f"IR {out_ir[-1:]} != Visitor {out_vis[-1:]}"
+    print(f"{args.n} Durchläufe, 2 Aufrufe je Durchlauf   (WRITE -> {out_ir[-1]})")
+    print(f"ir       {t_ir:8.3f} s")
+    print(f"visitor  {t_vis:8.3f} s   ({t_vis / t_ir:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# ---------------------------------------------------------------------------
+# Micro-Benchmark: FOR-Schleifen mit 1e6 Durchläufen im dBase-Interpreter
+#
+# Misst leere Schleife, Schleife mit Arithmetik und Schleife mit STEP/BREAK.
+# Standard ist der IR-Pfad; --visitor misst den Tree-Walk (mit --n kleiner
+# wählen, der Visitor ist um Größenordnungen langsamer).
+#
+# Vorab: fehlerhafte Programme (STEP 0, FOR ohne Grenze) - IR und Visitor
+# müssen die Anweisungen vor dem Fehler ausführen und denselben Fehler melden.
+#
+# Aufruf (aus src/):
+#     python test/bench_dbase_for.py [--n 1000000] [--visitor]
+# ---------------------------------------------------------------------------
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+from contextlib import redirect_stdout
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import dBaseRunner
+
+CASES = {
+    "empty": (
+        "FOR I = 1 TO {n}\n"
+        "ENDFOR\n"
+        "WRITE I\n"
+    ),
+    "sum": (
+        "X = 0\n"
+        "FOR I = 1 TO {n}\n"
+        "    X = X + I\n"
+        "ENDFOR\n"
+        "WRITE X\n"
+    ),
+    "step+break": (
+        "X = 0\n"
+        "FOR I = 1 TO {n2} STEP 2\n"
+        "    X = X + 1\n"
+        "    IF I >= {last}\n"
+        "        BREAK\n"
+        "    ENDIF\n"
+        "ENDFOR\n"
+        "WRITE X\n"
+    ),
+}
+
+ERROR_CASES = (
+    "WRITE 1\nFOR I = 1 TO 3 STEP 0\n    WRITE I\nENDFOR\n",
+    "WRITE 1\nIF 1 = 1\n    WRITE 2\n    FOR I = 1 TO 2 STEP 0\n    ENDFOR\nENDIF\n",
+    "WRITE 1\nFOR I = 1 TO\n    WRITE I\nENDFOR\n",
+)
+
+def run_case(src: str, use_ir: bool):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.prg")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(src)
+
+        out = io.StringIO()
+        t0 = time.perf_counter()
+        with redirect_stdout(out):
+            dBaseRunner.parse(path, use_ir=use_ir, use_cache=False)
+        return time.perf_counter() - t0, out.getvalue().strip().splitlines()[-1]
+
+def check_errors():
+    for src in ERROR_CASES:
+        got = []
+        for use_ir in (True, False):
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "error.prg")
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(src)
+                out, err = io.StringIO(), None
+                try:
+                    with redirect_stdout(out):
+                        dBaseRunner.parse(path, use_ir=use_ir, use_cache=False)
+                except Exception as e:
+                    err = f"{type(e).__name__}: {e}"
+            got.append((out.getvalue().split(), err))
+        assert got[0] == got[1] and got[0][0], f"IR {got[0]} != Visitor {got[1]}"
+    print(f"Fehlerfälle {len(ERROR_CASES)} ok (IR == Visitor)")
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=1_000_000)
+    ap.add_argument("--visitor", action="store_true")
+    args = ap.parse_args()
+
+    check_errors()
+    mode = "visitor" if args.visitor else "ir"
+    print(f"{args.n} Durchläufe, Modus: {mode}")
+    for name, tmpl in CASES.items():
+        src = tmpl.format(n=args.n, n2=args.n * 4, last=args.n * 2 - 1)
+        dt, last = run_case(src, use_ir=not args.visitor)
+        print(f"{name:<11} {dt:8.3f} s  {args.n / dt:>12.0f} it/s   (WRITE -> {last})")
+
+if __name__ == "__main__":
+    main()
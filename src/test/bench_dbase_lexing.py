@@ -0,0 +1,93 @@
+# ---------------------------------------------------------------------------
+# Benchmark: Lexen + Parsen einer generierten dBase-Datei (Standard 50k Zeilen)
+#
+# "before": fill() + zweiter nextToken()-Durchlauf für den Kommentar-Check
+# "after" : dBaseRunner.parse_tree() -> CommentCheckingTokenStream, ein Durchlauf
+#
+# Aufruf (aus src/):
+#     python test/bench_dbase_lexing.py [zeilen] [--lex-only]
+# ---------------------------------------------------------------------------
+import gc
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from antlr4 import InputStream, CommonTokenStream, Token
+
+from gen.dBaseLexer  import dBaseLexer
+from gen.dBaseParser import dBaseParser
+
+import dBaseRunner
+
+def generate_source(lines: int) -> str:
+    # Blöcke à 10 Zeilen: Zuweisungen, IF, FOR, Kommentare, Strings
+    block = (
+        "X{n} = {n} + 2 * 3 - 1\n"
+        "S{n} = \"text {n}\" + X{n}\n"
+        "/* kommentar {n} /* verschachtelt */ */\n"
+        "IF X{n} >= 10 .AND. X{n} < 100000\n"
+        "    WRITE S{n}\n"
+        "ENDIF\n"
+        "FOR I = 1 TO 3\n"
+        "    Y{n} = I * X{n}\n"
+        "ENDFOR\n"
+        "// zeilenkommentar {n}\n"
+    )
+    out = []
+    for n in range(lines // 10):
+        out.append(block.format(n=n))
+    return "".join(out)
+
+def run_before(pre: str, lex_only: bool):
+    lexer  = dBaseLexer(InputStream(pre))
+    tokens = CommonTokenStream(lexer)
+    tokens.fill()
+    if not lex_only:
+        dBaseParser(tokens).input_()
+    while True:
+        tok = lexer.nextToken()
+        if tok.type == Token.EOF:
+            if getattr(lexer, "_cmtDepth", 0) > 0:
+                raise dBaseRunner.UnterminatedBlockCommentError(lexer.line, lexer.column)
+            break
+
+def run_after(pre: str, lex_only: bool):
+    if lex_only:
+        tokens = dBaseRunner.CommentCheckingTokenStream(dBaseLexer(InputStream(pre)))
+        tokens.fill()
+        return
+    tree, clean = dBaseRunner.parse_tree(pre)
+    assert clean, "generierter Quelltext hat Syntaxfehler"
+
+def count_tokens(pre: str) -> int:
+    tokens = CommonTokenStream(dBaseLexer(InputStream(pre)))
+    tokens.fill()
+    return len(tokens.tokens)
+
+def measure(label: str, fn, pre: str, lex_only: bool, ntok: int):
+    gc.collect()
+    t0 = time.perf_counter()
+    fn(pre, lex_only)
+    dt = time.perf_counter() - t0
+    print(f"{label:<7} {ntok:>9} tokens  {dt:8.2f} s  {ntok / dt:>10.0f} tokens/s")
+    return dt
+
+def main():
+    args     = [a for a in sys.argv[1:] if not a.startswith("--")]
+    lex_only = "--lex-only" in sys.argv
+    lines    = int(args[0]) if args else 50_000
+
+    pre  = generate_source(lines)
+    ntok = count_tokens(pre)      # wärmt zugleich den Lexer-DFA für beide Läufe
+    print(f"{lines} Zeilen, {len(pre) / 1024:.0f} KiB, "
+          f"{'nur Lexer' if lex_only else 'Lexer + Parser'}")
+
+    before = measure("before", run_before, pre, lex_only, ntok)
+    after  = measure("after",  run_after,  pre, lex_only, ntok)
+    print(f"speedup {before / after:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# ---------------------------------------------------------------------------
+# Benchmark: WRITE-Durchsatz des dBase-Interpreters (Standard 200k Zeilen)
+#
+# "line"    : Sink mit limit=0, also ein Schreibvorgang pro WRITE (wie print)
+# "buffered": Sink mit Standard-Puffer, Blockschreiben
+# Ziel ist jeweils eine temporäre Datei (FileSink) bzw. --stdout für
+# StreamSink auf /dev/null.
+#
+# Aufruf (aus src/):
+#     python test/bench_dbase_write.py [--n 200000] [--stdout]
+# ---------------------------------------------------------------------------
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import dBaseRunner
+
+from dBaseRuntime import OutputSink, StreamSink, FileSink
+
+SOURCE = (
+    "FOR I = 1 TO {n}\n"
+    "    WRITE \"Zeile \" + I + \": \" + \"Bericht-Text mit etwas Inhalt\"\n"
+    "ENDFOR\n"
+)
+
+def run_case(prg: str, make_sink):
+    sink = make_sink()
+    t0 = time.perf_counter()
+    dBaseRunner.parse(prg, output=sink, use_cache=False)
+    sink.close()
+    return time.perf_counter() - t0, sink
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=200_000)
+    ap.add_argument("--stdout", action="store_true")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        prg = os.path.join(tmp, "bench.prg")
+        out = os.path.join(tmp, "bench.out")
+        with open(prg, "w", encoding="utf-8") as f:
+            f.write(SOURCE.format(n=args.n))
+
+        if args.stdout:
+            devnull = open(os.devnull, "w", encoding="utf-8")
+            cases = {
+                "line"    : lambda: StreamSink(devnull, limit=0),
+                "buffered": lambda: StreamSink(devnull),
+            }
+        else:
+            cases = {
+                "line"    : lambda: FileSink(out, limit=0),
+                "buffered": lambda: FileSink(out),
+            }
+
+        print(f"{args.n} WRITE-Zeilen -> {'stdout (/dev/null)' if args.stdout else 'Datei'}")
+        times = {}
+        for name, make_sink in cases.items():
+            dt, sink = run_case(prg, make_sink)
+            times[name] = dt
+            print(f"{name:<9} {dt:8.3f} s  {sink.lines_written / dt:>10.0f} lines/s  "
+                  f"{sink.bytes_written} bytes  {sink.flushes} flushes")
+        print(f"speedup {times['line'] / times['buffered']:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# ---------------------------------------------------------------------------
+# Benchmark: c6510_disasm.Disassembler auf einem vollen 64-KB-Abbild
+#
+# Abbild: Programm aus bench_mini_assembler.generate_source() ab $1000,
+# Rest Zufallsdaten. Gemessen werden
+#   analyze : rekursiver Abstieg ab $1000 (Code/Daten-Trennung, Labels)
+#   listing : Quelltext erzeugen (Analyse aus dem Cache)
+#   cached  : zweiter listing()-Aufruf auf denselben Bytes
+# Das Listing wird mit MiniAssembler zurückübersetzt und mit dem Abbild verglichen.
+#
+# Aufruf (aus src/):
+#     python test/bench_disasm.py [zeilen] [--illegal]
+# ---------------------------------------------------------------------------
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from c6510_spec     import C6510Spec
+from c6510_cpu      import SPEC_JSON
+from c6510_disasm   import Disassembler, CODE
+from mini_assembler import MiniAssembler
+
+from bench_mini_assembler import generate_source
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("lines", type=int, nargs="?", default=20_000)
+    ap.add_argument("--illegal", action="store_true", help="illegale Opcodes als Code verfolgen")
+    args = ap.parse_args()
+
+    spec = C6510Spec.from_json(SPEC_JSON)
+    code, org, _ = MiniAssembler(spec).assemble(generate_source(args.lines))
+    rnd  = random.Random(1)
+    head = bytes(rnd.randrange(256) for _ in range(org))
+    tail = bytes(rnd.randrange(256) for _ in range(max(0, 0x10000 - org - len(code))))
+    image = (head + code + tail)[:0x10000]
+
+    dis = Disassembler(spec, allow_illegal=args.illegal)
+    t0 = time.perf_counter(); an = dis.analyze(image, 0x0000, [org]); t_an = time.perf_counter() - t0
+    t0 = time.perf_counter(); src = dis.listing(image, 0x0000, [org]); t_ls = time.perf_counter() - t0
+    t0 = time.perf_counter(); dis.listing(image, 0x0000, [org]); t_c = time.perf_counter() - t0
+
+    back, _org, _ = MiniAssembler(spec).assemble(src)
+    assert back == image, "Listing assembliert nicht zu denselben Bytes"
+    print(f"{len(image)} Bytes, {an.kind.count(CODE)} Instruktionen, {len(an.labels)} Labels, "
+          f"{src.count(chr(10))} Zeilen")
+    print(f"analyze  {t_an * 1000:8.1f} ms")
+    print(f"listing  {t_ls * 1000:8.1f} ms")
+    print(f"cached   {t_c * 1000:8.1f} ms")
+    print(f"gesamt   {(t_an + t_ls) * 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# ---------------------------------------------------------------------------
+# Benchmark: Hexdump-Formatierung Byte-für-Byte gegen die Block-Engine
+# (hex_listing.HexDump: bytes.hex(" ") + Übersetzungstabelle pro Block).
+#
+#   dual  : format_dual_hex() - alte Schleife gegen HexDump.text()
+#   petscii: Zeilen mit PETSCII-Glyphen (Unicode, str.translate)
+#   window: virtuelle Ansicht - 60 sichtbare Zeilen an zufälliger Position
+# Jede Ausgabe wird mit der alten Schleife verglichen.
+#
+# Aufruf (aus src/):
+#     python test/bench_hex_dump.py [kbytes] [--repeat 5]
+# ---------------------------------------------------------------------------
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from hex_listing import HexDump, make_text_table, _is_printable_ascii, format_dual_hex
+
+GRAPHICS = {0x60 + i: ch for i, ch in enumerate("◆▒⎺⎻─⎼⎽▔┐┌└┘┼┤┴┬├─│█▄▌▐▀◥◤◣◢◻◼")}
+
+def glyph(b: int) -> str:
+    if 0x20 <= b <= 0x5F: return chr(b)
+    return GRAPHICS.get(b, "·")
+
+def old_dual_hex(data: bytes, base_addr: int = 0) -> str:
+    # bisherige Implementierung (Referenz)
+    lines = []
+    for i in range(0, len(data), 8):
+        chunk = data[i:i+8]
+        left4  = " ".join(f"{b:02X}" for b in chunk[:4])
+        right4 = " ".join(f"{b:02X}" for b in chunk[4:8])
+        if len(chunk) < 4:
+            left4 += " " * (3 * (4 - len(chunk))); right4 = ""
+        elif len(chunk) < 8:
+            right4 += " " * (3 * (4 - (len(chunk) - 4)))
+        hex_part = f"{left4} {right4}".rstrip()
+        ascii_part = "".join(chr(b) if _is_printable_ascii(b) else "." for b in chunk)
+        lines.append(f"{base_addr + i:04X}: {hex_part:<23}  {ascii_part}")
+    return "\n".join(lines)
+
+def old_petscii_rows(data: bytes, base_addr: int = 0):
+    rows = []
+    for i in range(0, len(data), 8):
+        chunk = data[i:i+8]
+        left = " ".join(f"{b:02X}" for b in chunk[:4]).ljust(11)
+        right = " ".join(f"{b:02X}" for b in chunk[4:8]).ljust(11)
+        txt = "".join(glyph(b) for b in chunk)
+        rows.append(f"{base_addr + i:04X}  {left} | {right}  {txt}")
+    return rows
+
+def best(fn, repeat: int) -> float:
+    t = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter(); fn(); t = min(t, time.perf_counter() - t0)
+    return t
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("kbytes", type=int, nargs="?", default=64)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    rnd  = random.Random(1)
+    data = bytes(rnd.randrange(256) for _ in range(args.kbytes * 1024 + 5))
+    table = make_text_table(glyph)
+    tmpl  = "{addr:04X}  {left:<11} | {right:<11}  {text}"
+
+    assert format_dual_hex(data, 0x0801) == old_dual_hex(data, 0x0801), "dual: Ausgabe weicht ab"
+    assert HexDump(data, 0x0801, template=tmpl, text_table=table).rows() == old_petscii_rows(data, 0x0801), \
+        "petscii: Ausgabe weicht ab"
+
+    print(f"{len(data)} Bytes, {(len(data) + 7) // 8} Zeilen")
+    t_old = best(lambda: old_dual_hex(data, 0x0801), args.repeat)
+    t_new = best(lambda: format_dual_hex(data, 0x0801), args.repeat)
+    print(f"dual     alt {t_old * 1000:8.1f} ms  neu {t_new * 1000:8.1f} ms  ({t_old / t_new:5.1f}x)")
+    t_old = best(lambda: old_petscii_rows(data, 0x0801), args.repeat)
+    t_new = best(lambda: HexDump(data, 0x0801, template=tmpl, text_table=table).rows(), args.repeat)
+    print(f"petscii  alt {t_old * 1000:8.1f} ms  neu {t_new * 1000:8.1f} ms  ({t_old / t_new:5.1f}x)")
+
+    dump = HexDump(data, 0x0801)
+    def window():
+        top = rnd.randrange(len(dump))
+        for r in range(top, min(top + 60, len(dump))): dump.row(r)
+    t_win = best(window, args.repeat * 20)
+    print(f"window   60 sichtbare Zeilen {t_win * 1000:8.2f} ms  (unabhängig von der Dateigröße)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# ---------------------------------------------------------------------------
+# Benchmark: MiniAssembler.assemble() auf einer generierten Quelle
+# (Standard 20k Zeilen: Labels, alle gängigen Adressierungsarten, Ausdrücke,
+# Vorwärtsreferenzen, .BYTE/.WORD).
+#
+# Aufruf (aus src/):
+#     python test/bench_mini_assembler.py [zeilen]
+# ---------------------------------------------------------------------------
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from c6510_spec     import C6510Spec
+from c6510_cpu      import SPEC_JSON
+from mini_assembler import MiniAssembler
+
+def generate_source(lines: int) -> str:
+    # Blöcke à 20 Zeilen
+    block = (
+        "l{n}:    LDA #<data{n}\n"
+        "        STA $FB\n"
+        "        LDA #>data{n}\n"
+        "        STA $FC\n"
+        "        LDY #$00\n"
+        "c{n}:    LDA ($FB),Y\n"
+        "        STA $0400+{n}*2&$3FF,X\n"
+        "        INY\n"
+        "        CPY #(8+2)*2\n"
+        "        BNE c{n}\n"
+        "        LDX data{n}+1\n"
+        "        LDA $D000,Y\n"
+        "        ADC ($20,X)\n"
+        "        ROL A\n"
+        "        JSR s{n}\n"
+        "        JMP n{n}\n"
+        "s{n}:    RTS\n"
+        "data{n}: .byte 1,2,3,\"TEXT\"\n"
+        "        .word l{n}, s{n}\n"
+        "n{n}:    NOP\n"
+    )
+    out = ["        .org $1000\n"]
+    for n in range(lines // 20):
+        out.append(block.format(n=n))
+    return "".join(out)
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    src  = generate_source(lines)
+    spec = C6510Spec.from_json(SPEC_JSON)
+
+    asm = MiniAssembler(spec)
+    t0 = time.perf_counter()
+    code, org, listing = asm.assemble(src)
+    dt = time.perf_counter() - t0
+    print(f"{lines} Zeilen -> {len(code)} Bytes ab ${org:04X} in {dt:.3f} s "
+          f"({lines / dt:.0f} Zeilen/s)")
+
+if __name__ == "__main__":
+    main()
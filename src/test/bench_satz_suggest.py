@@ -0,0 +1,73 @@
+# ---------------------------------------------------------------------------
+# Benchmark: Rechtschreibvorschläge in satz_analyse_de_v6 - alter Weg
+# (candidates() über das ganze Wörterbuch: Pool per List-Comprehension, dann
+# levenshtein() je Wort) gegen SuggestIndex (Stücke-Index, nur Treffer prüfen).
+#
+# Das Wörterbuch wird aus satz_de_woerterbuch.csv auf --words Einträge
+# aufgebläht (Komposita + Endungen), gesucht wird mit 1-2 Tippfehlern.
+# Geprüft wird, dass beide Wege dieselben Vorschläge liefern.
+#
+# Aufruf (aus src/):
+#     python test/bench_satz_suggest.py [--words 300000] [--queries 200]
+# ---------------------------------------------------------------------------
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pandas as pd
+import satz_analyse_de_v6 as satz
+
+def typo(word, rnd):
+    w = list(word); i = rnd.randrange(len(w)); op = rnd.randrange(3)
+    if op == 0: w[i] = rnd.choice("abcdefghijklmnopqrstuvwxyzäöüß")
+    elif op == 1 and len(w) > 1: del w[i]
+    else: w.insert(i, rnd.choice("aeiouäs"))
+    return "".join(w)
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--words", type=int, default=300000)
+    ap.add_argument("--queries", type=int, default=200)
+    ap.add_argument("--old", type=int, default=20, help="Anfragen für den alten Weg (langsam)")
+    args = ap.parse_args()
+    rnd = random.Random(4)
+
+    base = satz.build_vocab(pd.read_csv(os.path.join(os.path.dirname(satz.__file__), satz.DICT_PATH)))["all"]
+    nouns = [w for w in base if len(w) > 2]; endings = ["", "e", "en", "er", "es", "s", "n", "te", "ten"]
+    words = set(base)
+    while len(words) < args.words:
+        stem = rnd.choice(nouns) + rnd.choice(nouns) if rnd.random() < .7 else rnd.choice(nouns)
+        words.add(stem + rnd.choice(endings))
+    csv_path = os.path.join(tempfile.mkdtemp(), "woerterbuch.csv")
+    pd.DataFrame({"wort": sorted(words), "kategorie": "Substantiv"}).to_csv(csv_path, index=False)
+
+    t0 = time.perf_counter(); satz.SuggestIndex.load_or_build(words, csv_path); t_build = time.perf_counter() - t0
+    t0 = time.perf_counter(); index = satz.SuggestIndex.load_or_build(words, csv_path); t_load = time.perf_counter() - t0
+
+    sample = sorted(words)
+    queries = [typo(rnd.choice(sample), rnd) if n % 2 else typo(typo(rnd.choice(sample), rnd), rnd)
+               for n in range(args.queries)]
+    times = []
+    for q in queries:
+        t0 = time.perf_counter(); satz.candidates(q, index); times.append(time.perf_counter() - t0)
+    times.sort()
+
+    t0 = time.perf_counter()
+    old = [satz.candidates(q, list(words)) for q in queries[:args.old]]
+    t_old = (time.perf_counter() - t0) / max(args.old, 1)
+    for q, expected in zip(queries, old):
+        assert satz.candidates(q, index) == expected, q
+
+    print(f"{len(words)} Wörter, {args.queries} Anfragen")
+    print(f"Index bauen+ablegen {t_build:8.2f} s   laden {t_load:6.2f} s")
+    print(f"alt (Scan)          {t_old * 1000:8.1f} ms / Wort")
+    print(f"SuggestIndex        {sum(times) / len(times) * 1000:8.3f} ms / Wort   "
+          f"(p50 {times[len(times) // 2] * 1000:.3f}, p95 {times[int(len(times) * .95)] * 1000:.3f} ms)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# ---------------------------------------------------------------------------
+# Benchmark + Trefferprüfung: TranslatorDB.fuzzy_terms() (Übersetzer in
+# client.py) gegen eine einfache Levenshtein-Suche über alle Terme.
+#
+#   recall : kleine DB (--small Terme, kurze und lange Wörter), zufällige
+#            Anfragen mit 0-2 Tippfehlern; ohne FUZZY_POOL-Grenze muss
+#            fuzzy_terms() genau die Terme mit Distanz <= 2 finden, mit Grenze
+#            die ersten 10 wie die Brute-Force-Rangfolge
+#   timing : große DB (--terms Terme), Laufzeit je Anfrage
+#
+# client.py lässt sich nicht importieren (startet die Anwendung); geladen wird
+# nur der Übersetzer-Teil (normDB ... vor analyze_pe) samt SCHEMA.
+#
+# Aufruf (aus src/):
+#     python test/bench_translator_fuzzy.py [--small 3000] [--queries 500] [--terms 200000]
+# ---------------------------------------------------------------------------
+import argparse
+import os
+import random
+import sys
+import tempfile
+import textwrap
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+PRELUDE = (
+    "import os, re, sqlite3, hashlib, unicodedata, time, csv, json\n"
+    "from collections import OrderedDict\n"
+    "from dataclasses import dataclass\n"
+    "from typing import *\n"
+    "from PyQt5.QtCore import *\n"
+    "from PyQt5.QtGui import *\n"
+    "from PyQt5.QtWidgets import *\n"
+)
+
+def load_translator():
+    path = os.path.join(SRC, "client.py")
+    with open(path, encoding="utf-8") as f:
+        s = f.read()
+    schema = s[s.index('SCHEMA = """'):]; schema = schema[:schema.index('"""\n', 12) + 3]
+    code = textwrap.dedent(s[s.index("    def normDB(txt"):s.index("    def analyze_pe(file_path)")])
+    g = {}
+    exec(PRELUDE + schema, g)
+    exec(compile("from __future__ import annotations\n" + code, path, "exec"), g)
+    return g
+
+def levenshtein(a: str, b: str) -> int:
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        prev = cur
+    return prev[-1]
+
+LETTERS   = "abcdefghijklmnopqrstuvwxyzäöü"
+SYLLABLES = ["ha", "us", "ba", "um", "ein", "sch", "ung", "keit", "ver", "ge", "ber", "lich",
+             "st", "er", "en", "ra", "to", "mi", "nd", "wa", "ld", "fr", "ie", "de", "an", "zu"]
+
+def make_words(rnd, n: int):
+    words = {"the", "and", "cbdb", "a", "to", "ox"}
+    while len(words) < n:
+        if rnd.random() < .15:
+            words.add("".join(rnd.choice(LETTERS) for _ in range(rnd.randint(1, 6))))
+        else:
+            words.add("".join(rnd.choice(SYLLABLES) for _ in range(rnd.randint(2, 5))))
+    return sorted(words)
+
+def typo(word: str, rnd) -> str:
+    w = list(word); i = rnd.randrange(len(w) + 1); op = rnd.randrange(4)
+    if op == 0 and i < len(w): w[i] = rnd.choice(LETTERS)
+    elif op == 1 and i < len(w): del w[i]
+    elif op == 2 and i + 1 < len(w): w[i], w[i + 1] = w[i + 1], w[i]
+    else: w.insert(i, rnd.choice("aeiou"))
+    return "".join(w) or word
+
+def open_db(g, words):
+    db = g["TranslatorDB"]()
+    db.connect(os.path.join(tempfile.mkdtemp(), "fuzzy.db"))
+    db.drop_fts_triggers()
+    db.add_translations([("DEU", w, "ENU", "e_" + w) for w in words])
+    db.ensure_fts(rebuild=True)
+    return db
+
+def ranked(q: str, dist, limit: int = 10):
+    """Ergebnis von fuzzy_terms() per Brute Force (gleiche Rangfolge); dist: Wort -> Distanz."""
+    found = []
+    for w, d in dist.items():
+        if d == 0: rank = 0
+        elif w.startswith(q): rank = 1
+        elif d == 1: rank = 2
+        elif len(q) >= 3 and q in w: rank = 3      # Teilstring nur über Trigramme
+        elif d <= 2: rank = 4
+        else: continue
+        found.append((rank, min(d, 3), len(w), w))
+    return [w for *_key, w in sorted(found)[:limit]]
+
+def check_recall(g, rnd, n_words: int, n_queries: int):
+    words = make_words(rnd, n_words)
+    db = open_db(g, words)
+    queries = ["teh", "hte", "adn", "bbbdb", "o", "xo", 'ab"cd', 'sag "hal']
+    queries += [typo(typo(rnd.choice(words), rnd), rnd) if k % 2 else typo(rnd.choice(words), rnd)
+                for k in range(n_queries)]
+    missed = top_missed = 0
+    for q in queries:
+        # Kandidatenquellen vollständig? (ohne Begrenzung durch FUZZY_POOL)
+        db.FUZZY_POOL = 2 * len(words)
+        dist = {w: levenshtein(q, w) for w in words}
+        want = {w for w, d in dist.items() if d <= 2}
+        got = {row[2] for row in db.fuzzy_terms("DEU", q, limit=len(words)) if row[4] is not None}
+        if got != want:
+            missed += 1
+            if missed <= 5: print(f"  {q!r}: fehlt {sorted(want - got)[:5]}, zuviel {sorted(got - want)[:5]}")
+        # die ersten 10 mit der normalen Begrenzung
+        del db.FUZZY_POOL
+        if [row[2] for row in db.fuzzy_terms("DEU", q)] != ranked(q, dist):
+            top_missed += 1
+            if top_missed <= 5: print(f"  {q!r}: {[row[2] for row in db.fuzzy_terms('DEU', q)]} != {ranked(q, dist)}")
+    print(f"recall   {len(words)} Terme, {len(queries)} Anfragen, abweichend: {missed} (alle Treffer), "
+          f"{top_missed} (erste 10)")
+    db.close()
+    return missed == 0 and top_missed == 0
+
+def timing(g, rnd, n_terms: int, n_queries: int):
+    words = make_words(rnd, n_terms)
+    t0 = time.perf_counter(); db = open_db(g, words); t_build = time.perf_counter() - t0
+    for name, pick in (("kurz", lambda: rnd.choice([w for w in words[:5000] if len(w) <= 6])),
+                       ("lang", lambda: rnd.choice(words))):
+        queries = [typo(pick(), rnd) for _ in range(n_queries)]
+        times = []
+        for q in queries:
+            t0 = time.perf_counter(); db.fuzzy_terms("DEU", q); times.append(time.perf_counter() - t0)
+        times.sort()
+        print(f"timing   {name:<5} {sum(times) / len(times) * 1000:7.2f} ms / Anfrage   "
+              f"(p50 {times[len(times) // 2] * 1000:.2f}, p95 {times[int(len(times) * .95)] * 1000:.2f} ms)")
+    print(f"         {len(words)} Terme, Aufbau {t_build:.1f} s")
+    db.close()
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--small", type=int, default=3000)
+    ap.add_argument("--queries", type=int, default=500)
+    ap.add_argument("--terms", type=int, default=200_000)
+    args = ap.parse_args()
+    rnd = random.Random(7)
+    g = load_translator()
+    ok = check_recall(g, rnd, args.small, args.queries)
+    if args.terms:
+        timing(g, rnd, args.terms, 200)
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()